@@ -11,35 +11,86 @@ import asyncio
 from typing import TYPE_CHECKING
 
 from homeassistant.const import Platform
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_call_later
 
 from .artnet import ArtNetDMXHelper
+from .compiled_fixture import compile_fixture
 from .const import (
+    CONF_CHANNEL_COUNT,
+    CONF_FIXTURE_ID,
     CONF_FIXTURE_TYPE,
+    CONF_HELPER_RELEASE_DELAY,
+    CONF_MEMBERS,
     CONF_NAME,
+    CONF_SMOOTHING,
+    CONF_START_CHANNEL,
     CONF_TARGET_IP,
     CONF_UNIVERSE,
+    DATA_BLACKOUT,
+    DATA_EFFECT_ENGINE,
     DATA_ENTRY_DATA,
+    DATA_ENTRY_FIXTURES,
+    DATA_ENTRY_GROUP_MEMBERS,
     DATA_ENTRY_HELPER_KEYS,
     DATA_HELPER_LOCK,
     DATA_HELPER_REFCOUNTS,
+    DATA_HELPER_RELEASE_TIMERS,
+    DATA_MASTERS,
+    DATA_MOTION_FILTER,
+    DATA_PIXEL_PLAYERS,
     DATA_SHARED_HELPERS,
+    DATA_UNIVERSE_STORE,
+    DEFAULT_HELPER_RELEASE_DELAY,
+    DMX_MAX_VALUE,
     DOMAIN,
     LOGGER,
 )
-from .entry_fixtures import extract_fixture_records, fixture_label, fixture_title, get_fixture_entry
+from .entry_fixtures import (
+    extract_fixture_records,
+    fixture_device_key,
+    fixture_label,
+    fixture_title,
+    get_fixture_entry,
+    group_member_records,
+    is_group_entry,
+    is_master_entry,
+    is_rig_entry,
+)
+from .fixture_mapping import HomeAssistantError, load_fixture_mapping
+from .flight_recorder import attach_recorder
+from .masters import apply_master_levels, async_apply_master_levels, master_board
+from .motion import motion_filter
+from .output_thread import attach_output, detach_output
+from .pixel_media import stop_playback
+from .services import async_setup_services
+from .tracing import attach_tracer
+from .universe_store import UniverseStateStore
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 PLATFORMS: list[Platform] = [
     Platform.LIGHT,
     Platform.NUMBER,
     Platform.SELECT,
+    Platform.SENSOR,
+    Platform.SWITCH,
 ]
 
 
+async def async_setup(hass: HomeAssistant, _config: ConfigType) -> bool:
+    """Set up integration-wide services."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Migrate old entries to the fixture-first format."""
     if entry.version >= 3:
@@ -73,46 +124,234 @@ async def async_setup_entry(
     entry: ConfigEntry,
 ) -> bool:
     """Set up ArtNet DMX Controller from a config entry."""
+    if is_rig_entry(entry):
+        return await _async_setup_rig_entry(hass, entry)
+    if is_group_entry(entry):
+        return await _async_setup_group_entry(hass, entry)
+    if is_master_entry(entry):
+        return await _async_setup_master_entry(hass, entry)
+
     fixture_entry = get_fixture_entry(entry)
     target_ip = fixture_entry[CONF_TARGET_IP]
     universe = fixture_entry[CONF_UNIVERSE]
 
-    artnet_helper, helper_key = await _async_acquire_helper(hass, target_ip, universe)
+    artnet_helper, helper_key = await _async_acquire_helper(
+        hass, target_ip, universe, [fixture_entry]
+    )
 
     domain_data = hass.data.setdefault(DOMAIN, {})
     domain_data[entry.entry_id] = artnet_helper
     domain_data.setdefault(DATA_ENTRY_DATA, {})[entry.entry_id] = fixture_entry
-    domain_data.setdefault(DATA_ENTRY_HELPER_KEYS, {})[entry.entry_id] = helper_key
+    domain_data.setdefault(DATA_ENTRY_HELPER_KEYS, {})[entry.entry_id] = [helper_key]
+
+    _async_register_fixture_device(hass, entry, fixture_entry)
+
+    LOGGER.info(
+        "ArtNet DMX fixture configured for %s (Universe %s)",
+        target_ip,
+        universe,
+    )
+
+    # Forward the setup to the light platform
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    return True
+
+
+async def _async_setup_rig_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+) -> bool:
+    """Set up every fixture of a rig entry with a single platform pass."""
+    fixtures = extract_fixture_records(entry)
+    helper_keys = sorted(
+        {(fixture[CONF_TARGET_IP], int(fixture[CONF_UNIVERSE])) for fixture in fixtures}
+    )
+    helpers = await _async_acquire_helpers(hass, helper_keys, fixtures)
+
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data.setdefault(DATA_ENTRY_FIXTURES, {})[entry.entry_id] = [
+        (fixture, helpers[(fixture[CONF_TARGET_IP], int(fixture[CONF_UNIVERSE]))])
+        for fixture in fixtures
+    ]
+    domain_data.setdefault(DATA_ENTRY_HELPER_KEYS, {})[entry.entry_id] = helper_keys
+
+    for fixture in fixtures:
+        _async_register_fixture_device(hass, entry, fixture)
+
+    LOGGER.info(
+        "ArtNet DMX rig %s configured with %s fixtures on %s universes",
+        entry.title,
+        len(fixtures),
+        len(helper_keys),
+    )
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    return True
 
-    # Create/update a device registry entry so the integration appears under Devices
+
+async def _async_setup_group_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+) -> bool:
+    """
+    Set up a fixture group driving its member fixtures' universes.
+
+    Members are resolved from the other config entries' data, so a group does
+    not depend on its members being loaded first; it holds its own references
+    on the member universes' shared helpers.
+    """
+    members = entry.data.get(CONF_MEMBERS, [])
+    fixtures = group_member_records(
+        [
+            other
+            for other in hass.config_entries.async_entries(DOMAIN)
+            if other.entry_id != entry.entry_id
+        ],
+        members,
+    )
+    if len(fixtures) < len(members):
+        found = {fixture[CONF_FIXTURE_ID] for fixture in fixtures}
+        LOGGER.warning(
+            "Fixture group %s skips unknown members: %s",
+            entry.title,
+            ", ".join(member for member in members if member not in found),
+        )
+
+    helper_keys = sorted(
+        {(fixture[CONF_TARGET_IP], int(fixture[CONF_UNIVERSE])) for fixture in fixtures}
+    )
+    helpers = await _async_acquire_helpers(hass, helper_keys)
+
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data.setdefault(DATA_ENTRY_GROUP_MEMBERS, {})[entry.entry_id] = [
+        (fixture, helpers[(fixture[CONF_TARGET_IP], int(fixture[CONF_UNIVERSE]))])
+        for fixture in fixtures
+    ]
+    domain_data.setdefault(DATA_ENTRY_HELPER_KEYS, {})[entry.entry_id] = helper_keys
+
+    try:
+        dr.async_get(hass).async_get_or_create(
+            config_entry_id=entry.entry_id,
+            identifiers={(DOMAIN, entry.entry_id)},
+            manufacturer="Art-Net",
+            model="Fixture group",
+            name=entry.data.get(CONF_NAME) or entry.title,
+        )
+    except Exception:  # pragma: no cover - best effort for non-HA/unit-test stubs
+        LOGGER.debug(
+            "Could not register device for entry %s", entry.entry_id, exc_info=True
+        )
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    return True
+
+
+async def _async_setup_master_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+) -> bool:
+    """
+    Set up a grand master or submaster.
+
+    Masters hold no universes; they register on the master board and expose
+    a number entity whose level scales the intensity of the fixtures they
+    cover when frames are built. The level saved before a restart is
+    restored, and re-applied to fixtures already loaded.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    async with domain_data.setdefault(DATA_HELPER_LOCK, asyncio.Lock()):
+        universe_store = await _async_get_universe_store(hass)
+    board = master_board(hass)
+    universe_store.track_masters(board)
+    if entry.entry_id not in board:
+        members = entry.data.get(CONF_MEMBERS)
+        board.add(entry.entry_id, members, universe_store.master_level(entry.entry_id))
+        if board.level(entry.entry_id) < DMX_MAX_VALUE:
+            await async_apply_master_levels(hass, members or None)
+
+    try:
+        dr.async_get(hass).async_get_or_create(
+            config_entry_id=entry.entry_id,
+            identifiers={(DOMAIN, entry.entry_id)},
+            manufacturer="Art-Net",
+            model="Submaster" if entry.data.get(CONF_MEMBERS) else "Grand master",
+            name=entry.data.get(CONF_NAME) or entry.title,
+        )
+    except Exception:  # pragma: no cover - best effort for non-HA/unit-test stubs
+        LOGGER.debug(
+            "Could not register device for entry %s", entry.entry_id, exc_info=True
+        )
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    return True
+
+
+def _register_channel_roles(
+    hass: HomeAssistant,
+    fixtures: list[tuple[dict, ArtNetDMXHelper]],
+) -> list[ArtNetDMXHelper]:
+    """
+    Tell each fixture's universe which of its channels merge HTP across layers.
+
+    Fixtures set up while masters are loaded pick up their current levels;
+    the helpers whose levels changed are returned so their frames can be re-sent.
+    """
+    try:
+        mapping = load_fixture_mapping()
+    except HomeAssistantError:
+        LOGGER.exception("Failed to load fixture mapping; all channels merge LTP")
+        return []
+    for fixture, artnet_helper in fixtures:
+        compiled = compile_fixture(fixture, mapping)
+        if compiled is not None and hasattr(artnet_helper, "set_intensity_channels"):
+            artnet_helper.set_intensity_channels(
+                compiled.fixture_id,
+                compiled.intensity_channels,
+                compiled.level_channels,
+            )
+        if (
+            compiled is not None
+            and fixture.get(CONF_SMOOTHING)
+            and hasattr(artnet_helper, "set_motion_channels")
+        ):
+            motion_filter(hass).set_smoothing(
+                artnet_helper, compiled, float(fixture[CONF_SMOOTHING])
+            )
+    if DATA_MASTERS in hass.data.get(DOMAIN, {}):
+        return apply_master_levels(master_board(hass), fixtures)
+    return []
+
+
+def _async_register_fixture_device(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    fixture_entry: dict,
+) -> None:
+    """Create/update the device registry entry for one fixture."""
+    # Register devices up front so the integration appears under Devices
     # even if entities are disabled or not yet added.
     try:
         device_name = (
             fixture_entry.get(CONF_NAME)
-            or getattr(entry, "title", None)
+            or (None if is_rig_entry(entry) else getattr(entry, "title", None))
             or fixture_label(fixture_entry)
             or fixture_title(fixture_entry)
         )
         dr.async_get(hass).async_get_or_create(
             config_entry_id=entry.entry_id,
-            identifiers={(DOMAIN, entry.entry_id)},
+            identifiers={(DOMAIN, fixture_device_key(entry, fixture_entry))},
             manufacturer="Art-Net",
             model=fixture_entry.get(CONF_FIXTURE_TYPE) or "DMX Fixture",
             name=device_name,
         )
     except Exception:  # pragma: no cover - best effort for non-HA/unit-test stubs
-        LOGGER.debug("Could not register device for entry %s", entry.entry_id, exc_info=True)
-
-    LOGGER.info(
-        "ArtNet DMX fixture configured for %s (Universe %s)",
-        target_ip,
-        universe,
-    )
-
-    # Forward the setup to the light platform
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-
-    return True
+        LOGGER.debug(
+            "Could not register device for entry %s", entry.entry_id, exc_info=True
+        )
 
 
 async def async_unload_entry(
@@ -123,7 +362,12 @@ async def async_unload_entry(
     # Unload the platforms
     unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unloaded:
-        await _async_release_helper(hass, entry.entry_id)
+        release_delay = entry.options.get(
+            CONF_HELPER_RELEASE_DELAY, DEFAULT_HELPER_RELEASE_DELAY
+        )
+        await _async_release_helper(
+            hass, entry.entry_id, release_delay=float(release_delay)
+        )
     return unloaded
 
 
@@ -131,48 +375,262 @@ async def _async_acquire_helper(
     hass: HomeAssistant,
     target_ip: str,
     universe: int,
+    fixtures: list[dict] | None = None,
 ) -> tuple[ArtNetDMXHelper, tuple[str, int]]:
     """Get or create a shared helper for one Art-Net target and universe."""
+    helper_key = (target_ip, int(universe))
+    helpers = await _async_acquire_helpers(hass, [helper_key], fixtures)
+    return helpers[helper_key], helper_key
+
+
+async def _async_acquire_helpers(
+    hass: HomeAssistant,
+    helper_keys: list[tuple[str, int]],
+    fixtures: list[dict] | None = None,
+) -> dict[tuple[str, int], ArtNetDMXHelper]:
+    """
+    Get or create shared helpers for several targets under one lock hold.
+
+    The channel roles and master levels of `fixtures` (records on those
+    targets) are registered before new universes send their first frame, so
+    a dimmed rig does not flash at full on restart.
+    """
     domain_data = hass.data.setdefault(DOMAIN, {})
     shared_helpers = domain_data.setdefault(DATA_SHARED_HELPERS, {})
     helper_refcounts = domain_data.setdefault(DATA_HELPER_REFCOUNTS, {})
     helper_lock = domain_data.setdefault(DATA_HELPER_LOCK, asyncio.Lock())
-    helper_key = (target_ip, int(universe))
+    helpers: dict[tuple[str, int], ArtNetDMXHelper] = {}
+    new_helpers: list[ArtNetDMXHelper] = []
+
+    release_timers = domain_data.setdefault(DATA_HELPER_RELEASE_TIMERS, {})
 
     async with helper_lock:
-        artnet_helper = shared_helpers.get(helper_key)
-        if artnet_helper is None:
-            artnet_helper = ArtNetDMXHelper(hass=hass, target_ip=target_ip, universe=universe)
-            artnet_helper.setup_socket()
-            await artnet_helper.async_send_current_state()
-            shared_helpers[helper_key] = artnet_helper
-            helper_refcounts[helper_key] = 0
-        helper_refcounts[helper_key] += 1
+        universe_store = await _async_get_universe_store(hass)
+        for helper_key in helper_keys:
+            target_ip, universe = helper_key
+            # A lingering helper is reused with its socket and buffer intact.
+            cancel_release = release_timers.pop(helper_key, None)
+            if cancel_release is not None:
+                cancel_release()
+            artnet_helper = shared_helpers.get(helper_key)
+            if artnet_helper is None:
+                artnet_helper = ArtNetDMXHelper(
+                    hass=hass, target_ip=target_ip, universe=universe
+                )
+                # Resume the last persisted output before the first frame goes out.
+                universe_store.restore(helper_key, artnet_helper)
+                universe_store.track(helper_key, artnet_helper)
+                artnet_helper.setup_socket()
+                attach_output(hass, artnet_helper)
+                attach_tracer(hass, artnet_helper)
+                attach_recorder(hass, artnet_helper)
+                if domain_data.get(DATA_BLACKOUT):
+                    # Universes joining a blackout stay dark until it is released.
+                    artnet_helper.blackout_now()
+                new_helpers.append(artnet_helper)
+                shared_helpers[helper_key] = artnet_helper
+                helper_refcounts[helper_key] = 0
+            helper_refcounts[helper_key] += 1
+            helpers[helper_key] = artnet_helper
 
-    return artnet_helper, helper_key
+        changed = _register_channel_roles(
+            hass,
+            [
+                (
+                    fixture,
+                    helpers[(fixture[CONF_TARGET_IP], int(fixture[CONF_UNIVERSE]))],
+                )
+                for fixture in fixtures or ()
+            ],
+        )
+        to_send = {
+            id(artnet_helper): artnet_helper
+            for artnet_helper in (*new_helpers, *changed)
+        }
+        await asyncio.gather(
+            *(
+                artnet_helper.async_send_current_state()
+                for artnet_helper in to_send.values()
+            )
+        )
 
+    return helpers
 
-async def _async_release_helper(hass: HomeAssistant, entry_id: str) -> None:
-    """Release a shared helper reference for one fixture entry."""
+
+async def _async_get_universe_store(hass: HomeAssistant) -> UniverseStateStore:
+    """Return the loaded universe store, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_UNIVERSE_STORE not in domain_data:
+        universe_store = UniverseStateStore(hass)
+        await universe_store.async_load()
+        domain_data[DATA_UNIVERSE_STORE] = universe_store
+        # Register every master at its saved level before any universe sends a frame.
+        master_entries = [
+            entry
+            for entry in hass.config_entries.async_entries(DOMAIN)
+            if is_master_entry(entry) and getattr(entry, "disabled_by", None) is None
+        ]
+        if master_entries:
+            board = master_board(hass)
+            universe_store.track_masters(board)
+            for entry in master_entries:
+                if entry.entry_id not in board:
+                    level = universe_store.master_level(entry.entry_id)
+                    board.add(entry.entry_id, entry.data.get(CONF_MEMBERS), level)
+    return domain_data[DATA_UNIVERSE_STORE]
+
+
+async def _async_release_helper(
+    hass: HomeAssistant,
+    entry_id: str,
+    release_delay: float = DEFAULT_HELPER_RELEASE_DELAY,
+) -> None:
+    """Release the shared helper references held by one config entry."""
     domain_data = hass.data.get(DOMAIN, {})
-    helper_key = domain_data.get(DATA_ENTRY_HELPER_KEYS, {}).pop(entry_id, None)
-    domain_data.get(DATA_ENTRY_DATA, {}).pop(entry_id, None)
-    domain_data.pop(entry_id, None)
-    if helper_key is None:
-        return
+    if DATA_EFFECT_ENGINE in domain_data:
+        await domain_data[DATA_EFFECT_ENGINE].async_remove(entry_id)
+    helper_keys = domain_data.get(DATA_ENTRY_HELPER_KEYS, {}).pop(entry_id, None)
+    fixture_entry = domain_data.get(DATA_ENTRY_DATA, {}).pop(entry_id, None)
+    fixtures = domain_data.get(DATA_ENTRY_FIXTURES, {}).pop(entry_id, None) or []
+    domain_data.get(DATA_ENTRY_GROUP_MEMBERS, {}).pop(entry_id, None)
+    artnet_helper = domain_data.pop(entry_id, None)
+    if fixture_entry is not None and artnet_helper is not None:
+        fixtures = [(fixture_entry, artnet_helper)]
+    if DATA_PIXEL_PLAYERS in domain_data:
+        stop_playback(hass, [fixture[CONF_FIXTURE_ID] for fixture, _helper in fixtures])
+    if DATA_MOTION_FILTER in domain_data:
+        domain_data[DATA_MOTION_FILTER].remove(
+            fixture[CONF_FIXTURE_ID] for fixture, _helper in fixtures
+        )
+    for fixture, fixture_helper in fixtures:
+        if hasattr(fixture_helper, "clear_intensity_channels"):
+            fixture_helper.clear_intensity_channels(fixture[CONF_FIXTURE_ID])
+    masters = domain_data.get(DATA_MASTERS)
+    if masters is not None and entry_id in masters:
+        # Fixtures the master covered return to their remaining masters' level.
+        await async_apply_master_levels(hass, masters.remove(entry_id))
+    if helper_keys:
+        await _async_release_helper_keys(hass, helper_keys, release_delay=release_delay)
+
+
+async def _async_release_helper_keys(
+    hass: HomeAssistant,
+    helper_keys: list[tuple[str, int]],
+    release_delay: float = DEFAULT_HELPER_RELEASE_DELAY,
+) -> None:
+    """
+    Drop one reference per helper key.
 
-    shared_helpers = domain_data.get(DATA_SHARED_HELPERS, {})
+    Helpers nobody uses linger for `release_delay` seconds before their socket
+    is closed, so reloads and quick unload/load cycles reuse them.
+    """
+    domain_data = hass.data.get(DOMAIN, {})
     helper_refcounts = domain_data.get(DATA_HELPER_REFCOUNTS, {})
     helper_lock = domain_data.get(DATA_HELPER_LOCK)
     if helper_lock is None:
         return
 
     async with helper_lock:
-        if helper_key not in helper_refcounts:
-            return
-        helper_refcounts[helper_key] -= 1
-        if helper_refcounts[helper_key] <= 0:
-            artnet_helper = shared_helpers.pop(helper_key, None)
-            helper_refcounts.pop(helper_key, None)
-            if artnet_helper is not None:
-                artnet_helper.close_socket()
+        for helper_key in helper_keys:
+            if helper_key not in helper_refcounts:
+                continue
+            helper_refcounts[helper_key] -= 1
+            if helper_refcounts[helper_key] > 0:
+                continue
+            if release_delay <= 0:
+                _async_close_helper(hass, helper_key)
+                continue
+
+            @callback
+            def _async_release_expired(
+                _now: object, helper_key: tuple[str, int] = helper_key
+            ) -> None:
+                domain_data.get(DATA_HELPER_RELEASE_TIMERS, {}).pop(helper_key, None)
+                if domain_data.get(DATA_HELPER_REFCOUNTS, {}).get(helper_key, 0) <= 0:
+                    _async_close_helper(hass, helper_key)
+
+            release_timers = domain_data.setdefault(DATA_HELPER_RELEASE_TIMERS, {})
+            cancel_release = release_timers.pop(helper_key, None)
+            if cancel_release is not None:
+                cancel_release()
+            release_timers[helper_key] = async_call_later(
+                hass, release_delay, _async_release_expired
+            )
+
+
+@callback
+def _async_close_helper(hass: HomeAssistant, helper_key: tuple[str, int]) -> None:
+    """Close and forget one shared helper."""
+    domain_data = hass.data.get(DOMAIN, {})
+    artnet_helper = domain_data.get(DATA_SHARED_HELPERS, {}).pop(helper_key, None)
+    domain_data.get(DATA_HELPER_REFCOUNTS, {}).pop(helper_key, None)
+    if DATA_UNIVERSE_STORE in domain_data:
+        domain_data[DATA_UNIVERSE_STORE].untrack(helper_key)
+    if artnet_helper is not None:
+        detach_output(hass, artnet_helper)
+        artnet_helper.close_socket()
+
+
+async def async_repatch_fixture(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    updated_data: dict,
+) -> None:
+    """
+    Apply an edited fixture patch without tearing down its universe helper.
+
+    The fixture's current channel values are moved to the new address range in
+    the live buffer (or copied to the new universe) and the destination helper
+    stays referenced while the entry reloads, so the reload reuses the same
+    socket and buffer instead of sending a blank frame. Other fixtures on the
+    same universe keep their values.
+    """
+    old_fixture = get_fixture_entry(entry)
+    old_key = (old_fixture[CONF_TARGET_IP], int(old_fixture[CONF_UNIVERSE]))
+    new_key = (updated_data[CONF_TARGET_IP], int(updated_data[CONF_UNIVERSE]))
+    old_start = int(old_fixture[CONF_START_CHANNEL])
+    new_start = int(updated_data[CONF_START_CHANNEL])
+    count = int(old_fixture[CONF_CHANNEL_COUNT])
+    # Values only carry over when the channel layout is the same fixture type.
+    keep_values = old_fixture[CONF_FIXTURE_TYPE] == updated_data[CONF_FIXTURE_TYPE]
+
+    domain_data = hass.data.get(DOMAIN, {})
+    old_helper = None
+    if entry.entry_id in domain_data:
+        old_helper = domain_data.get(DATA_SHARED_HELPERS, {}).get(old_key)
+
+    pinned: list[tuple[str, int]] = []
+    if old_helper is not None:
+        new_helper, new_key = await _async_acquire_helper(hass, *new_key)
+        pinned.append(new_key)
+        if new_helper is old_helper and keep_values:
+            await old_helper.move_channels(old_start, new_start, count)
+        else:
+            block = old_helper.get_channel_block(old_start, count)
+            await old_helper.set_channels(
+                dict.fromkeys(range(old_start, old_start + count), 0)
+            )
+            if keep_values:
+                await new_helper.set_channels(
+                    {new_start + idx: value for idx, value in enumerate(block)}
+                )
+
+    hass.config_entries.async_update_entry(
+        entry,
+        data=updated_data,
+        title=fixture_title(updated_data),
+    )
+    try:
+        await hass.config_entries.async_reload(entry.entry_id)
+        # Loaded groups hold a copy of the member's old patch; rebuild them too.
+        group_members = domain_data.get(DATA_ENTRY_GROUP_MEMBERS, {})
+        for group_entry in (
+            hass.config_entries.async_entries(DOMAIN) if group_members else []
+        ):
+            if group_entry.entry_id in group_members and updated_data[
+                CONF_FIXTURE_ID
+            ] in group_entry.data.get(CONF_MEMBERS, []):
+                await hass.config_entries.async_reload(group_entry.entry_id)
+    finally:
+        if pinned:
+            await _async_release_helper_keys(hass, pinned)
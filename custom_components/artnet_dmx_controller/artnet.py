@@ -5,16 +5,27 @@ from __future__ import annotations
 import asyncio
 import socket
 import struct
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Any
 
+from .buffer import apply_channel_values, new_universe_buffer, scatter, write_block
+from .compositor import UniverseCompositor
 from .const import DEFAULT_PORT, DMX_CHANNELS, DMX_MAX_VALUE, DMX_MIN_CHANNEL, LOGGER
+from .output_metrics import OutputMetrics
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from homeassistant.core import HomeAssistant
 
+    from .flight_recorder import FlightRecorder
+    from .output_thread import FrameSlot
+    from .tracing import LatencyTracer, Trace
+
 # Art-Net constants
 ARTNET_HEADER = b"Art-Net\x00"
 ARTNET_OPCODE_OUTPUT = 0x5000  # OpOutput/OpDmx
+ARTNET_DATA_OFFSET = 18  # DMX data follows the 18-byte ArtDmx header
 
 
 class ArtNetDMXHelper:
@@ -42,7 +53,46 @@ class ArtNetDMXHelper:
         self.universe = universe
         self.port = port
         self._socket: socket.socket | None = None
-        self._dmx_data = bytearray(DMX_CHANNELS)  # DMX data buffer
+        self._dmx_data = (
+            new_universe_buffer()
+        )  # DMX data buffer (NumPy array when available)
+        # Called after every buffer change (used to persist universe state)
+        self.on_buffer_changed: Callable[[], None] | None = None
+        # Entities re-reading their state, keyed by the channels they follow
+        self._channel_listeners: dict[int, list[Callable[[], None]]] = {}
+        # Layers above the base buffer; created on first use
+        self._compositor: UniverseCompositor | None = None
+        # HTP channels and master-scaled channels registered per fixture id
+        self._intensity_owners: dict[str, tuple[tuple[int, ...], tuple[int, ...]]] = {}
+        # Master level (0-255) per fixture id; fixtures at full are not listed
+        self._fixture_levels: dict[str, int] = {}
+        # While set, every frame sent is all zeros; the buffer is left alone
+        self._blackout = False
+        self._zero_frame = bytes(DMX_CHANNELS)
+        self._zero_packet = self.construct_artnet_packet(self._zero_frame)
+        # While set, packets are published here for the output thread instead of sent
+        self._output_slot: FrameSlot | None = None
+        # Monotonic time the last frame was produced; the loop monitor reads it
+        self.last_frame_at: float | None = None
+        self.metrics = OutputMetrics()
+        # While set, writes handed over with a trace are timed through to the socket
+        self.tracer: LatencyTracer | None = None
+        self._trace: Trace | None = None
+        # While set, every frame handed over for sending is copied into its ring
+        self.recorder: FlightRecorder | None = None
+
+    def attach_output(self, slot: FrameSlot) -> None:
+        """Hand transmission to the output thread; packets are published into `slot`."""
+        self._output_slot = slot
+
+    def detach_output(self) -> None:
+        """Send packets from the event loop again."""
+        self._output_slot = None
+
+    def start_trace(self, trace: Trace) -> None:
+        """Time the next frame sent as part of `trace` while tracing is enabled."""
+        if self.tracer is not None:
+            self._trace = trace
 
     def setup_socket(self) -> None:
         """Set up the UDP socket for Art-Net communication."""
@@ -116,10 +166,33 @@ class ArtNetDMXHelper:
             dmx_data: DMX channel data to send
 
         """
+        self.last_frame_at = started = time.monotonic()
+        metrics = self.metrics
+        trace, self._trace = self._trace, None
+        if trace is not None:
+            trace.handed_over = started
+        output_slot = self._output_slot
+        if output_slot is not None:
+            # The output thread sends the latest packet on its own clock.
+            packet = (
+                self._zero_packet
+                if self._blackout
+                else self.construct_artnet_packet(dmx_data)
+            )
+            if self.recorder is not None:
+                self.recorder.record(packet, ARTNET_DATA_OFFSET)
+            if output_slot.publish(packet):
+                metrics.frames_coalesced += 1
+            if trace is not None and self.tracer is not None:
+                # The thread sends on its own clock; the trace ends at the hand-over.
+                self.tracer.finish(trace)
+            return
+
         if self._socket is None:
             self.setup_socket()
 
         if self._socket is None:
+            metrics.frames_suppressed += 1
             LOGGER.debug(
                 "Art-Net socket unavailable for %s:%s (Universe %s); skipping send",
                 self.target_ip,
@@ -133,24 +206,244 @@ class ArtNetDMXHelper:
         # Send using asyncio's loop to avoid blocking
         loop = asyncio.get_running_loop()
         try:
-            await loop.run_in_executor(
-                None,
-                self._socket.sendto,
-                packet,
-                (self.target_ip, self.port),
-            )
-            LOGGER.debug(
-                "Sent Art-Net packet to %s:%s (Universe %s)",
-                self.target_ip,
-                self.port,
-                self.universe,
-            )
+            if trace is None:
+                await loop.run_in_executor(None, self._sendto, packet)
+            else:
+                await loop.run_in_executor(None, self._sendto_traced, packet, trace)
         except OSError as err:
+            metrics.send_errors += 1
             LOGGER.error("Failed to send Art-Net packet: %s", err)
+        else:
+            resumed = time.monotonic()
+            metrics.record_send(len(packet), resumed - started)
+            if self.recorder is not None:
+                # Record what went on the wire: `_sendto` zeroes blackout packets.
+                self.recorder.record(
+                    self._zero_packet if self._blackout else packet, ARTNET_DATA_OFFSET
+                )
+            if trace is not None and self.tracer is not None:
+                trace.resumed = resumed
+                self.tracer.finish(trace)
+
+    def _sendto(self, packet: bytes) -> None:
+        """Put a packet on the wire, zeroed if a blackout began while it was queued."""
+        if self._blackout:
+            packet = self._zero_packet
+        sock = self._socket
+        if sock is not None:
+            sock.sendto(packet, (self.target_ip, self.port))
+
+    def _sendto_traced(self, packet: bytes, trace: Trace) -> None:
+        """Put a packet on the wire, stamping when the executor ran and when it left."""
+        trace.executor_started = time.monotonic()
+        self._sendto(packet)
+        trace.sent = time.monotonic()
+
+    @property
+    def blackout_active(self) -> bool:
+        """Return True while the universe is blacked out."""
+        return self._blackout
+
+    def blackout_now(self) -> None:
+        """
+        Black out the universe immediately.
+
+        The zero frame is written straight to the socket from the calling
+        thread instead of going through the executor, so it is not queued
+        behind pending sends; packets already queued are zeroed when they
+        reach the socket. The buffer is kept for `release_blackout`.
+        """
+        self._blackout = True
+        metrics = self.metrics
+        if self.recorder is not None:
+            self.recorder.record(self._zero_frame)
+        # Keep the output thread from resending the last lit frame.
+        if self._output_slot is not None and self._output_slot.publish(
+            self._zero_packet
+        ):
+            metrics.frames_coalesced += 1
+        if self._socket is None:
+            self.setup_socket()
+        if self._socket is None:
+            metrics.frames_suppressed += 1
+            return
+        started = time.monotonic()
+        try:
+            self._socket.sendto(self._zero_packet, (self.target_ip, self.port))
+        except OSError as err:
+            metrics.send_errors += 1
+            LOGGER.error("Failed to send blackout packet: %s", err)
+        else:
+            metrics.record_send(len(self._zero_packet), time.monotonic() - started)
+
+    async def release_blackout(self) -> None:
+        """End a blackout and send the current frame again."""
+        if not self._blackout:
+            return
+        self._blackout = False
+        await self.send_dmx_data(self._output_frame())
 
     async def async_send_current_state(self) -> None:
         """Send the current DMX buffer to the Art-Net target."""
-        await self.send_dmx_data(self._dmx_data)
+        await self.send_dmx_data(self._output_frame())
+
+    @property
+    def compositor(self) -> UniverseCompositor:
+        """Return the layer compositor, creating it on first use."""
+        if self._compositor is None:
+            self._compositor = UniverseCompositor()
+            self._apply_intensity_channels()
+        return self._compositor
+
+    def set_intensity_channels(
+        self,
+        owner: str,
+        channels: Iterable[int],
+        level_channels: Iterable[int] | None = None,
+    ) -> None:
+        """
+        Register the HTP (intensity) channels of one fixture on this universe.
+
+        `level_channels` are the channels its master level scales, all of
+        `channels` by default.
+        """
+        channels = tuple(channels)
+        self._intensity_owners[owner] = (
+            channels,
+            channels if level_channels is None else tuple(level_channels),
+        )
+        self._apply_intensity_channels()
+
+    def clear_intensity_channels(self, owner: str) -> None:
+        """Forget the HTP channels registered by one fixture."""
+        if self._intensity_owners.pop(owner, None) is not None:
+            self._apply_intensity_channels()
+
+    def set_fixture_level(self, owner: str, level: int) -> None:
+        """
+        Set the master level scaling one fixture's level channels.
+
+        Takes effect with the next frame; `level` 255 removes the scaling.
+        """
+        if level >= DMX_MAX_VALUE:
+            if self._fixture_levels.pop(owner, None) is None:
+                return
+        else:
+            self._fixture_levels[owner] = level
+        if self._compositor is not None or self._fixture_levels:
+            self._apply_intensity_channels()
+
+    def _apply_intensity_channels(self) -> None:
+        """Rebuild the compositor's HTP mask and master levels from every fixture."""
+        if self._compositor is None:
+            if not self._fixture_levels:
+                return
+            self._compositor = UniverseCompositor()
+        all_channels = range(DMX_MIN_CHANNEL, DMX_CHANNELS + 1)
+        self._compositor.set_intensity_channels(all_channels, intensity=False)
+        self._compositor.set_levels(all_channels, DMX_MAX_VALUE)
+        for owner, (channels, level_channels) in self._intensity_owners.items():
+            self._compositor.set_intensity_channels(channels)
+            if owner in self._fixture_levels:
+                self._compositor.set_levels(level_channels, self._fixture_levels[owner])
+
+    def _output_frame(self) -> bytes | bytearray:
+        """Return the frame to send: the base buffer merged with any layers."""
+        if self._blackout:
+            return self._zero_frame
+        if self._compositor is None:
+            return self._dmx_data
+        return self._compositor.compose(self._dmx_data)
+
+    def get_output_frame(self) -> bytes:
+        """Return a copy of the composed output frame."""
+        return bytes(self._output_frame())
+
+    async def set_layer_channels(
+        self, layer: str, channel_values: dict[int, int]
+    ) -> None:
+        """
+        Write channel values into a compositor layer and send the data.
+
+        Args:
+            layer: Layer name, e.g. `effects` or `override`
+            channel_values: Dictionary mapping channel numbers to values
+
+        """
+        self.compositor.set_values(layer, channel_values)
+        await self.send_dmx_data(self._output_frame())
+
+    async def set_layer_indexed(self, layer: str, indices: Any, values: Any) -> None:
+        """Scatter values into precomputed indices of a layer and send the data."""
+        self.compositor.scatter(layer, indices, values)
+        await self.send_dmx_data(self._output_frame())
+
+    async def release_layer(
+        self, layer: str, channels: Iterable[int] | None = None
+    ) -> None:
+        """Release some or all channels held by a layer and send the data."""
+        if self._compositor is None:
+            return
+        self._compositor.release(layer, channels)
+        await self.send_dmx_data(self._output_frame())
+
+    def set_motion_channels(self, indices: Any) -> None:
+        """
+        Route buffer indices through the motion filter stage of the compositor.
+
+        The filtered values start at the current unfiltered output, so
+        enabling the filter does not move anything.
+        """
+        compositor = self.compositor
+        compositor.set_motion_indices(indices)
+        compositor.compose(self._dmx_data)
+        compositor.set_motion_values(compositor.motion_targets())
+
+    def clear_motion_channels(self) -> None:
+        """Remove the motion filter stage; the next frame sends unfiltered values."""
+        if self._compositor is not None:
+            self._compositor.set_motion_indices(())
+
+    def motion_targets(self) -> Any:
+        """Return the unfiltered motion channel values of the last composed frame."""
+        if self._compositor is None:
+            return []
+        return self._compositor.motion_targets()
+
+    async def set_motion_values(self, values: Any) -> None:
+        """Set the filtered values of the motion channels and send the data."""
+        self.compositor.set_motion_values(values)
+        await self.send_dmx_data(self._output_frame())
+
+    async def park_channels(self, channel_values: dict[int, int]) -> None:
+        """
+        Pin channels to fixed values above every writer and send the data.
+
+        Parked values are applied as the last step of every frame, so entity,
+        service and layer writes keep updating the buffer underneath them.
+        """
+        self.compositor.park(channel_values)
+        self._notify_buffer_changed()
+        await self.send_dmx_data(self._output_frame())
+
+    async def unpark_channels(self, channels: Iterable[int] | None = None) -> None:
+        """Release some or all parked channels and send the data."""
+        if self._compositor is None:
+            return
+        self._compositor.unpark(channels)
+        self._notify_buffer_changed()
+        await self.send_dmx_data(self._output_frame())
+
+    def get_parked(self) -> dict[int, int]:
+        """Return the parked `{channel: value}` pairs."""
+        if self._compositor is None:
+            return {}
+        return self._compositor.parked()
+
+    def restore_parked(self, channel_values: dict[int, int]) -> None:
+        """Re-park previously saved channels without sending."""
+        if channel_values:
+            self.compositor.park(channel_values)
 
     def get_channel_value(self, channel: int) -> int:
         """Return the current buffered DMX value for one channel."""
@@ -162,6 +455,89 @@ class ArtNetDMXHelper:
             raise ValueError(msg)
         return int(self._dmx_data[channel - 1])
 
+    def get_buffer(self) -> bytes:
+        """Return a copy of the whole universe buffer."""
+        return bytes(self._dmx_data)
+
+    def restore_buffer(self, dmx_data: bytes | bytearray) -> None:
+        """Replace the buffer with previously saved values without sending."""
+        write_block(self._dmx_data, 0, bytes(dmx_data[:DMX_CHANNELS]))
+
+    def add_channel_listener(
+        self, channels: Iterable[int], listener: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Call `listener` when any of `channels` is written; return a remover."""
+        channels = tuple(channels)
+        for channel in channels:
+            self._channel_listeners.setdefault(channel, []).append(listener)
+
+        def remove_listener() -> None:
+            for channel in channels:
+                listeners = self._channel_listeners[channel]
+                listeners.remove(listener)
+                if not listeners:
+                    del self._channel_listeners[channel]
+
+        return remove_listener
+
+    def _notify_buffer_changed(self, channels: Iterable[int] = ()) -> None:
+        """Inform the store and the listeners of `channels` of a buffer change."""
+        if self.on_buffer_changed is not None:
+            self.on_buffer_changed()
+        if not self._channel_listeners:
+            return
+        notified: dict[Callable[[], None], None] = {}
+        for channel in channels:
+            for listener in self._channel_listeners.get(channel, ()):
+                notified[listener] = None
+        for listener in notified:
+            listener()
+
+    def get_channel_block(self, start_channel: int, count: int) -> bytes:
+        """Return the buffered values of `count` channels from `start_channel`."""
+        self._validate_block(start_channel, count)
+        return bytes(self._dmx_data[start_channel - 1 : start_channel - 1 + count])
+
+    async def move_channels(
+        self, source_start: int, target_start: int, count: int
+    ) -> None:
+        """
+        Move a block of channel values within the universe and send one frame.
+
+        The vacated source channels are zeroed; all other channels keep their
+        current values, so fixtures sharing the universe are not disturbed.
+
+        Args:
+            source_start: First channel of the block to move (1-512)
+            target_start: First channel of the destination block (1-512)
+            count: Number of channels in the block
+
+        """
+        self._validate_block(source_start, count)
+        self._validate_block(target_start, count)
+        block = bytes(self._dmx_data[source_start - 1 : source_start - 1 + count])
+        write_block(self._dmx_data, source_start - 1, bytes(count))
+        write_block(self._dmx_data, target_start - 1, block)
+        self._notify_buffer_changed(
+            (
+                *range(source_start, source_start + count),
+                *range(target_start, target_start + count),
+            )
+        )
+        await self.send_dmx_data(self._output_frame())
+
+    def _validate_block(self, start_channel: int, count: int) -> None:
+        """Raise if a channel block does not fit inside the universe."""
+        if (
+            count < 0
+            or not DMX_MIN_CHANNEL <= start_channel <= DMX_CHANNELS - count + 1
+        ):
+            msg = (
+                f"Channel block {start_channel}+{count} must fit between "
+                f"{DMX_MIN_CHANNEL} and {DMX_CHANNELS}"
+            )
+            raise ValueError(msg)
+
     async def set_channel(self, channel: int, value: int) -> None:
         """
         Set a single DMX channel value and send the data.
@@ -183,26 +559,32 @@ class ArtNetDMXHelper:
 
         # DMX channels are 1-indexed, but our array is 0-indexed
         self._dmx_data[channel - 1] = value
-        await self.send_dmx_data(self._dmx_data)
+        self._notify_buffer_changed((channel,))
+        await self.send_dmx_data(self._output_frame())
 
     async def set_channels(self, channel_values: dict[int, int]) -> None:
         """
         Set multiple DMX channel values and send the data.
 
+        The whole mapping is validated before anything is written.
+
         Args:
             channel_values: Dictionary mapping channel numbers to values
 
         """
-        for channel, value in channel_values.items():
-            if not DMX_MIN_CHANNEL <= channel <= DMX_CHANNELS:
-                msg = (
-                    f"Channel must be between {DMX_MIN_CHANNEL} and "
-                    f"{DMX_CHANNELS}, got {channel}"
-                )
-                raise ValueError(msg)
-            if not 0 <= value <= DMX_MAX_VALUE:
-                msg = f"Value must be between 0 and {DMX_MAX_VALUE}, got {value}"
-                raise ValueError(msg)
-            self._dmx_data[channel - 1] = value
+        apply_channel_values(self._dmx_data, channel_values)
+        self._notify_buffer_changed(channel_values)
+        await self.send_dmx_data(self._output_frame())
 
-        await self.send_dmx_data(self._dmx_data)
+    async def set_indexed(self, indices: Any, values: Any) -> None:
+        """
+        Scatter values into precomputed buffer indices and send the data.
+
+        Args:
+            indices: 0-based index array from `buffer.channel_indices`
+            values: Scalar or per-index values, clamped to 0-255
+
+        """
+        scatter(self._dmx_data, indices, values)
+        self._notify_buffer_changed(index + 1 for index in indices)
+        await self.send_dmx_data(self._output_frame())
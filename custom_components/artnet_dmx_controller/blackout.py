@@ -0,0 +1,74 @@
+"""
+Rig-wide blackout (panic) handling.
+
+A blackout zeroes the output of every shared universe helper in one tight
+loop that writes prebuilt zero packets straight to the sockets, bypassing the
+executor queue, entity writers and any time-based output. The universe
+buffers are left untouched, so releasing the blackout sends the pre-blackout
+look again (plus anything written while blacked out).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import DATA_BLACKOUT, DATA_SHARED_HELPERS, DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+# Worst-case time to put every zero frame on the wire before a warning is logged.
+BLACKOUT_LATENCY_TARGET = 0.005
+
+SIGNAL_BLACKOUT_CHANGED = f"{DOMAIN}_blackout_changed"
+
+
+def blackout_active(hass: HomeAssistant) -> bool:
+    """Return True while the rig is blacked out."""
+    return bool(hass.data.get(DOMAIN, {}).get(DATA_BLACKOUT))
+
+
+def async_blackout(hass: HomeAssistant) -> dict[str, Any]:
+    """
+    Black out every universe now and return how long it took.
+
+    Runs synchronously in the event loop, so nothing else can send between
+    the first and the last zero frame.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    helpers = list(domain_data.get(DATA_SHARED_HELPERS, {}).values())
+    domain_data[DATA_BLACKOUT] = True
+
+    started = time.perf_counter()
+    for artnet_helper in helpers:
+        artnet_helper.blackout_now()
+    elapsed = time.perf_counter() - started
+
+    if elapsed > BLACKOUT_LATENCY_TARGET:
+        LOGGER.warning(
+            "Blackout of %s universes took %.1f ms (target %.1f ms)",
+            len(helpers),
+            elapsed * 1000,
+            BLACKOUT_LATENCY_TARGET * 1000,
+        )
+    else:
+        LOGGER.info("Blacked out %s universes in %.2f ms", len(helpers), elapsed * 1000)
+    async_dispatcher_send(hass, SIGNAL_BLACKOUT_CHANGED)
+    return {"universes": len(helpers), "latency_ms": round(elapsed * 1000, 3)}
+
+
+async def async_release_blackout(hass: HomeAssistant) -> None:
+    """End a blackout and send every universe's current frame again."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data[DATA_BLACKOUT] = False
+    await asyncio.gather(
+        *(
+            artnet_helper.release_blackout()
+            for artnet_helper in domain_data.get(DATA_SHARED_HELPERS, {}).values()
+        )
+    )
+    async_dispatcher_send(hass, SIGNAL_BLACKOUT_CHANGED)
@@ -0,0 +1,152 @@
+"""
+Universe buffer storage with an optional NumPy backend.
+
+When NumPy is importable, universe buffers are `uint8` arrays and bulk writes
+are single fancy-index scatter operations with vectorized clamping. Without
+NumPy the same functions fall back to a plain `bytearray` and Python loops, so
+the integration behaves identically either way.
+
+Index arrays hold 0-based buffer positions. They are built (and validated)
+once by `channel_indices`, typically when a fixture is compiled, so the hot
+write path does not re-check addresses.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from .const import DMX_CHANNELS, DMX_MAX_VALUE, DMX_MIN_CHANNEL
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None
+
+HAS_NUMPY = np is not None
+
+# Below this many channels a Python loop beats building NumPy arrays.
+VECTORIZE_MIN_CHANNELS = 32
+
+
+def new_universe_buffer(use_numpy: bool = HAS_NUMPY) -> Any:
+    """Return a zeroed buffer for one DMX universe."""
+    if use_numpy and np is not None:
+        return np.zeros(DMX_CHANNELS, dtype=np.uint8)
+    return bytearray(DMX_CHANNELS)
+
+
+def is_numpy_buffer(buffer: Any) -> bool:
+    """Return True when `buffer` uses the NumPy backend."""
+    return np is not None and isinstance(buffer, np.ndarray)
+
+
+def channel_indices(channels: Iterable[int], use_numpy: bool = HAS_NUMPY) -> Any:
+    """
+    Validate absolute DMX channels (1-512) and return their buffer indices.
+
+    Raises `ValueError` on the first channel outside the universe.
+    """
+    indices = []
+    for channel in channels:
+        if not DMX_MIN_CHANNEL <= channel <= DMX_CHANNELS:
+            msg = (
+                f"Channel must be between {DMX_MIN_CHANNEL} and "
+                f"{DMX_CHANNELS}, got {channel}"
+            )
+            raise ValueError(msg)
+        indices.append(int(channel) - 1)
+    if use_numpy and np is not None:
+        return np.asarray(indices, dtype=np.intp)
+    return tuple(indices)
+
+
+def write_block(buffer: Any, start_index: int, data: bytes | bytearray) -> None:
+    """Copy raw bytes into the buffer starting at a 0-based index."""
+    if is_numpy_buffer(buffer):
+        buffer[start_index : start_index + len(data)] = np.frombuffer(
+            bytes(data), dtype=np.uint8
+        )
+    else:
+        buffer[start_index : start_index + len(data)] = data
+
+
+def scatter(buffer: Any, indices: Any, values: Any) -> None:
+    """
+    Write `values` to the buffer positions in `indices`, clamped to 0-255.
+
+    `values` may be a scalar or a sequence/array matching `indices`.
+    """
+    if is_numpy_buffer(buffer):
+        buffer[indices] = np.clip(np.asarray(values), 0, DMX_MAX_VALUE)
+        return
+    if hasattr(values, "__len__"):
+        for index, value in zip(indices, values, strict=True):
+            buffer[index] = min(max(int(value), 0), DMX_MAX_VALUE)
+        return
+    value = min(max(int(values), 0), DMX_MAX_VALUE)
+    for index in indices:
+        buffer[index] = value
+
+
+def concat_indices(index_arrays: Iterable[Any]) -> Any:
+    """Join several index arrays into one, preserving order."""
+    arrays = list(index_arrays)
+    if arrays and is_numpy_buffer(arrays[0]):
+        return np.concatenate(arrays)
+    return tuple(index for array in arrays for index in array)
+
+
+def tiled_values(parts: Iterable[tuple[Iterable[int], int]]) -> Any:
+    """
+    Return per-index values for a concatenated index array.
+
+    Each `(pattern, count)` part repeats `pattern` `count` times, e.g. one RGB
+    triple for every fixture of a group.
+    """
+    if np is not None:
+        return np.concatenate(
+            [
+                np.tile(np.asarray(list(pattern), dtype=np.int64), count)
+                for pattern, count in parts
+            ]
+        )
+    return [
+        value for pattern, count in parts for _ in range(count) for value in pattern
+    ]
+
+
+def apply_channel_values(buffer: Any, channel_values: dict[int, int]) -> None:
+    """
+    Validate and write a `{channel: value}` mapping into the buffer.
+
+    Nothing is written when any channel or value is out of range; the
+    `ValueError` names the first offending pair.
+    """
+    if is_numpy_buffer(buffer) and len(channel_values) >= VECTORIZE_MIN_CHANNELS:
+        count = len(channel_values)
+        channels = np.fromiter(channel_values.keys(), dtype=np.intp, count=count)
+        values = np.fromiter(channel_values.values(), dtype=np.int64, count=count)
+        bad_channels = (channels < DMX_MIN_CHANNEL) | (channels > DMX_CHANNELS)
+        bad_values = (values < 0) | (values > DMX_MAX_VALUE)
+        if bad_channels.any() or bad_values.any():
+            _validate_channel_values(channel_values)
+        buffer[channels - 1] = values
+        return
+    _validate_channel_values(channel_values)
+    for channel, value in channel_values.items():
+        buffer[channel - 1] = value
+
+
+def _validate_channel_values(channel_values: dict[int, int]) -> None:
+    """Raise `ValueError` for the first invalid channel or value, if any."""
+    for channel, value in channel_values.items():
+        if not DMX_MIN_CHANNEL <= channel <= DMX_CHANNELS:
+            msg = (
+                f"Channel must be between {DMX_MIN_CHANNEL} and "
+                f"{DMX_CHANNELS}, got {channel}"
+            )
+            raise ValueError(msg)
+        if not 0 <= value <= DMX_MAX_VALUE:
+            msg = f"Value must be between 0 and {DMX_MAX_VALUE}, got {value}"
+            raise ValueError(msg)
@@ -0,0 +1,57 @@
+"""
+Entity state following writes made under the entity.
+
+Groups and services write straight into the universe buffer, under the
+per-fixture entities owning those channels. `ChannelStateMixin` registers an
+entity for its own channels only, re-reads its state from the buffer when a
+write elsewhere changes them and publishes it through the state throttle.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+from homeassistant.core import callback
+
+from .state_throttle import ThrottledStateMixin
+
+
+class ChannelStateMixin(ThrottledStateMixin, ABC):
+    """
+    Entity mixin following writes other sources make to the entity's channels.
+
+    Entities keep `_channel_values`, the `{channel: value}` pairs their state
+    stands for, and implement `_read_channels` to rebuild their state (and
+    `_channel_values`) from the buffer. An entity's own writes update
+    `_channel_values` first, so they cause no re-read.
+    """
+
+    _artnet_helper: Any
+    _channel_values: dict[int, int]
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for writes to the entity's channels."""
+        await super().async_added_to_hass()
+        if hasattr(self._artnet_helper, "add_channel_listener"):
+            self.async_on_remove(
+                self._artnet_helper.add_channel_listener(
+                    tuple(self._channel_values), self._async_channels_changed
+                )
+            )
+
+    @callback
+    def _async_channels_changed(self) -> None:
+        """Re-read the entity's state when its channels no longer match it."""
+        get_channel_value = self._artnet_helper.get_channel_value
+        if all(
+            get_channel_value(channel) == value
+            for channel, value in self._channel_values.items()
+        ):
+            return
+        self._read_channels()
+        self.async_write_throttled_state()
+
+    @abstractmethod
+    def _read_channels(self) -> None:
+        """Rebuild the entity's state and `_channel_values` from the buffer."""
@@ -0,0 +1,152 @@
+"""
+Compiled fixture layouts.
+
+A `CompiledFixture` resolves a patched fixture's channel names (and the pixel
+block of pixel fixtures) to absolute DMX channels once, at setup, and caches
+buffer index arrays for the channel sets that writers use, so group writes and
+frame updates are single scatter operations on the universe buffer.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .buffer import channel_indices
+from .channel_math import absolute_channel
+from .compositor import DIMMER_CHANNEL_NAME, is_intensity_channel
+from .const import (
+    CONF_FIXTURE_ID,
+    CONF_FIXTURE_TYPE,
+    CONF_LOCATION,
+    CONF_ORIENTATION,
+    CONF_START_CHANNEL,
+)
+
+
+class CompiledFixture:
+    """Absolute channel layout of one patched fixture."""
+
+    __slots__ = (
+        "_indices",
+        "channels",
+        "fixture_id",
+        "fixture_specie",
+        "location",
+        "orientation",
+        "pairs",
+        "pan_range",
+        "pixel_channels",
+        "pixel_order",
+        "tilt_range",
+    )
+
+    def __init__(self, fixture: dict[str, Any], fixture_def: dict[str, Any]) -> None:
+        start_channel = int(fixture[CONF_START_CHANNEL])
+        self.fixture_id: str = fixture[CONF_FIXTURE_ID]
+        self.fixture_specie: str | None = fixture_def.get("fixture_specie")
+        self.channels: dict[str, int] = {
+            channel["name"]: absolute_channel(start_channel, int(channel["offset"]))
+            for channel in fixture_def.get("channels", [])
+            if channel.get("name")
+        }
+        # 16-bit pairs keyed by base name, e.g. "pan" -> (pan_msb, pan_lsb)
+        self.pairs: dict[str, tuple[int, int]] = {
+            name[:-4]: (channel, self.channels[f"{name[:-4]}_lsb"])
+            for name, channel in self.channels.items()
+            if name.endswith("_msb") and f"{name[:-4]}_lsb" in self.channels
+        }
+        self.location = _location(fixture.get(CONF_LOCATION))
+        orientation = fixture.get(CONF_ORIENTATION)
+        self.orientation: dict[str, Any] = (
+            dict(orientation) if isinstance(orientation, dict) else {}
+        )
+        # Mechanical pan/tilt travel in degrees, from the fixture profile.
+        self.pan_range: float | None = fixture_def.get("pan_range")
+        self.tilt_range: float | None = fixture_def.get("tilt_range")
+        # Pixel fixtures: the absolute channel of every pixel component, pixel by pixel.
+        self.pixel_order: str = (
+            fixture_def.get("pixel_order", "") if "pixel_count" in fixture_def else ""
+        )
+        self.pixel_channels: list[int] = []
+        pixel_width = int(fixture_def.get("pixel_count", 0)) * len(self.pixel_order)
+        if pixel_width:
+            first = absolute_channel(
+                start_channel, int(fixture_def.get("pixel_offset", 1))
+            )
+            self.pixel_channels = list(
+                range(first, absolute_channel(first, pixel_width) + 1)
+            )
+        self._indices: dict[tuple[str, ...], Any] = {}
+
+    @property
+    def pixel_count(self) -> int:
+        """Return the number of pixels (0 for fixtures without a pixel block)."""
+        return (
+            len(self.pixel_channels) // len(self.pixel_order) if self.pixel_order else 0
+        )
+
+    @property
+    def intensity_channels(self) -> list[int]:
+        """Return the channels merging HTP across layers, pixel colours included."""
+        return [
+            channel
+            for name, channel in self.channels.items()
+            if is_intensity_channel(name)
+        ] + self.pixel_channels
+
+    @property
+    def level_channels(self) -> list[int]:
+        """
+        Return the channels a master level scales.
+
+        A dimmer already scales the light of the colour channels behind it, so
+        only fixtures without one have their colour channels scaled.
+        """
+        if DIMMER_CHANNEL_NAME in self.channels:
+            return [self.channels[DIMMER_CHANNEL_NAME]]
+        return self.intensity_channels
+
+    def has(self, *names: str) -> bool:
+        """Return True when the fixture has every named channel."""
+        return all(name in self.channels for name in names)
+
+    def indices(self, *names: str) -> Any:
+        """Return the (cached) buffer index array of the named channels, in order."""
+        if names not in self._indices:
+            self._indices[names] = channel_indices(
+                self.channels[name] for name in names
+            )
+        return self._indices[names]
+
+
+def _location(location: Any) -> tuple[float, float, float] | None:
+    """Return a patch `location` as `(x, y, z)`, or None when missing or malformed."""
+    if not isinstance(location, dict):
+        return None
+    try:
+        return tuple(float(location.get(axis, 0.0)) for axis in ("x", "y", "z"))
+    except (TypeError, ValueError):
+        return None
+
+
+def compile_fixture(
+    fixture: dict[str, Any], mapping: dict[str, Any]
+) -> CompiledFixture | None:
+    """Compile one fixture record against the fixture mapping, if its model is known."""
+    fixture_def = mapping.get("fixtures", {}).get(fixture[CONF_FIXTURE_TYPE])
+    if not fixture_def:
+        return None
+    return CompiledFixture(fixture, fixture_def)
+
+
+def compile_fixtures(
+    fixtures: list[tuple[dict[str, Any], Any]],
+    mapping: dict[str, Any],
+) -> list[tuple[Any, CompiledFixture]]:
+    """Compile `(fixture, helper)` pairs to `(helper, compiled)`, skipping unknowns."""
+    compiled_pairs = []
+    for fixture, artnet_helper in fixtures:
+        compiled = compile_fixture(fixture, mapping)
+        if compiled is not None:
+            compiled_pairs.append((artnet_helper, compiled))
+    return compiled_pairs
@@ -0,0 +1,363 @@
+"""
+Layered frame compositor for one DMX universe.
+
+The helper's own buffer is the *base look*. Other writers (effects, manual
+overrides, ...) write into named layers stacked on top of it, and every frame
+is composed from the base and all layers:
+
+- intensity channels (`dim`, `red`, `green`, `blue`, ...) merge HTP: the
+  highest value of the base and any layer wins;
+- every other channel (position, colour wheel, gobo, ...) merges LTP: the
+  layer written most recently wins, falling back to the base look when no
+  layer holds the channel;
+- master levels (grand master and submasters) then scale each fixture's
+  dimmer, or its colour channels when it has no dimmer;
+- channels routed through the motion filter are replaced by its smoothed
+  values (the unfiltered values are kept as the filter's targets);
+- parked channels are applied last and win over everything.
+
+With NumPy all layer data lives in preallocated `(layers, 512)` arrays and
+`compose` only uses `out=` operations, so composing a frame allocates nothing.
+Without NumPy the same rules run as Python loops.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+from .buffer import HAS_NUMPY, np
+from .const import DMX_CHANNELS, DMX_MAX_VALUE, DMX_MIN_CHANNEL
+
+MAX_LAYERS = 16
+
+LAYER_BASE = "base"
+LAYER_EFFECTS = "effects"
+LAYER_OVERRIDE = "override"
+
+# Fixture channel scaled by master levels in place of the colour channels.
+DIMMER_CHANNEL_NAME = "dim"
+
+# Channel names merged highest-takes-precedence; all others are LTP.
+INTENSITY_CHANNEL_NAMES = frozenset(
+    {"dim", "red", "green", "blue", "white", "amber", "uv"}
+)
+
+
+def is_intensity_channel(name: str | None) -> bool:
+    """Return True when a fixture channel name merges HTP."""
+    return name in INTENSITY_CHANNEL_NAMES
+
+
+@lru_cache(maxsize=DMX_MAX_VALUE + 1)
+def scale_table(level: int) -> bytes:
+    """Return the 256-entry table scaling DMX values by `level`/255 (rounded)."""
+    return bytes(
+        (level * value + DMX_MAX_VALUE // 2) // DMX_MAX_VALUE
+        for value in range(DMX_MAX_VALUE + 1)
+    )
+
+
+# Every scale table stacked into one (level * 256 + value) lookup array.
+SCALE_LUT = (
+    np.frombuffer(
+        b"".join(scale_table(level) for level in range(DMX_MAX_VALUE + 1)),
+        dtype=np.uint8,
+    )
+    if HAS_NUMPY
+    else None
+)
+
+
+class UniverseCompositor:
+    """Merge a universe's base buffer with named HTP/LTP layers."""
+
+    def __init__(
+        self, max_layers: int = MAX_LAYERS, use_numpy: bool = HAS_NUMPY
+    ) -> None:
+        self._numpy = bool(use_numpy and np is not None)
+        self._max_layers = max_layers
+        self._layers: dict[str, int] = {}
+        self._active: set[int] = set()
+        self._sequence = 0
+        self._parked = 0
+        self._scaled = 0
+        self._motion_index: Any = None
+        if self._numpy:
+            self._values = np.zeros((max_layers, DMX_CHANNELS), dtype=np.uint8)
+            # Sequence number of each layer's last write per channel; -1 = not held.
+            self._stamps = np.full((max_layers, DMX_CHANNELS), -1, dtype=np.int64)
+            self._intensity = np.zeros(DMX_CHANNELS, dtype=bool)
+            self._park_values = np.zeros(DMX_CHANNELS, dtype=np.uint8)
+            self._park_mask = np.zeros(DMX_CHANNELS, dtype=bool)
+            self._motion_values = np.zeros(DMX_CHANNELS, dtype=np.uint8)
+            self._motion_targets = np.zeros(DMX_CHANNELS, dtype=np.uint8)
+            self._motion_mask = np.zeros(DMX_CHANNELS, dtype=bool)
+            self._levels = np.full(DMX_CHANNELS, DMX_MAX_VALUE, dtype=np.uint8)
+            # Row offset of each channel's scale table in SCALE_LUT.
+            self._level_offsets = np.full(
+                DMX_CHANNELS, DMX_MAX_VALUE * 256, dtype=np.intp
+            )
+            # Scratch space reused by every compose() call.
+            self._frame = np.zeros(DMX_CHANNELS, dtype=np.uint8)
+            self._htp = np.zeros(DMX_CHANNELS, dtype=np.uint8)
+            self._latest = np.zeros(DMX_CHANNELS, dtype=np.int64)
+            self._winner = np.zeros(DMX_CHANNELS, dtype=np.intp)
+            self._unheld = np.zeros(DMX_CHANNELS, dtype=bool)
+            self._columns = np.arange(DMX_CHANNELS, dtype=np.intp)
+            self._lut_index = np.zeros(DMX_CHANNELS, dtype=np.intp)
+        else:
+            self._values = [bytearray(DMX_CHANNELS) for _ in range(max_layers)]
+            self._stamps = [[-1] * DMX_CHANNELS for _ in range(max_layers)]
+            self._intensity = [False] * DMX_CHANNELS
+            self._park_values = bytearray(DMX_CHANNELS)
+            self._park_mask = [False] * DMX_CHANNELS
+            self._motion_values = bytearray(DMX_CHANNELS)
+            self._motion_targets = bytearray(DMX_CHANNELS)
+            self._motion_mask = [False] * DMX_CHANNELS
+            self._levels = bytearray([DMX_MAX_VALUE]) * DMX_CHANNELS
+            self._frame = bytearray(DMX_CHANNELS)
+
+    @property
+    def active(self) -> bool:
+        """Return True when any layer, master level, motion filter or park applies."""
+        return (
+            bool(self._active)
+            or self._parked > 0
+            or self._scaled > 0
+            or self._motion_index is not None
+        )
+
+    def layers(self) -> list[str]:
+        """Return the names of layers currently holding channels."""
+        return [name for name, row in self._layers.items() if row in self._active]
+
+    def set_intensity_channels(
+        self, channels: Iterable[int], intensity: bool = True
+    ) -> None:
+        """Mark absolute channels as HTP (intensity) or LTP."""
+        for channel in channels:
+            self._intensity[_index(channel)] = intensity
+
+    def set_levels(self, channels: Iterable[int], level: int) -> None:
+        """Scale absolute channels by a master `level` (0-255, 255 = unscaled)."""
+        if not 0 <= level <= DMX_MAX_VALUE:
+            msg = f"Level must be between 0 and {DMX_MAX_VALUE}, got {level}"
+            raise ValueError(msg)
+        for channel in channels:
+            index = _index(channel)
+            self._levels[index] = level
+            if self._numpy:
+                self._level_offsets[index] = level * 256
+        self._scaled = int(sum(level < DMX_MAX_VALUE for level in self._levels))
+
+    def set_values(self, layer: str, channel_values: dict[int, int]) -> None:
+        """Write absolute channel values into a layer, validating them first."""
+        for channel, value in channel_values.items():
+            _index(channel)
+            if not 0 <= value <= DMX_MAX_VALUE:
+                msg = f"Value must be between 0 and {DMX_MAX_VALUE}, got {value}"
+                raise ValueError(msg)
+        row = self._row(layer)
+        self._sequence += 1
+        values = self._values[row]
+        stamps = self._stamps[row]
+        for channel, value in channel_values.items():
+            values[channel - 1] = value
+            stamps[channel - 1] = self._sequence
+        if channel_values:
+            self._active.add(row)
+
+    def scatter(self, layer: str, indices: Any, values: Any) -> None:
+        """Write values into precomputed buffer indices of a layer (clamped)."""
+        row = self._row(layer)
+        self._sequence += 1
+        if self._numpy:
+            self._values[row, indices] = np.clip(np.asarray(values), 0, DMX_MAX_VALUE)
+            self._stamps[row, indices] = self._sequence
+        else:
+            if not hasattr(values, "__len__"):
+                values = [values] * len(indices)
+            for index, value in zip(indices, values, strict=True):
+                self._values[row][index] = min(max(int(value), 0), DMX_MAX_VALUE)
+                self._stamps[row][index] = self._sequence
+        if len(indices):
+            self._active.add(row)
+
+    def release(self, layer: str, channels: Iterable[int] | None = None) -> None:
+        """Drop a layer's hold on some channels, or on all of them."""
+        row = self._layers.get(layer)
+        if row is None:
+            return
+        if channels is None:
+            indices = range(DMX_CHANNELS)
+        else:
+            indices = [_index(channel) for channel in channels]
+        if self._numpy:
+            selection = slice(None) if channels is None else list(indices)
+            self._values[row, selection] = 0
+            self._stamps[row, selection] = -1
+            held = bool((self._stamps[row] >= 0).any())
+        else:
+            for index in indices:
+                self._values[row][index] = 0
+                self._stamps[row][index] = -1
+            held = any(stamp >= 0 for stamp in self._stamps[row])
+        if not held:
+            self._active.discard(row)
+
+    def park(self, channel_values: dict[int, int]) -> None:
+        """Pin absolute channels to fixed values above every layer."""
+        for channel, value in channel_values.items():
+            index = _index(channel)
+            if not 0 <= value <= DMX_MAX_VALUE:
+                msg = f"Value must be between 0 and {DMX_MAX_VALUE}, got {value}"
+                raise ValueError(msg)
+            self._park_values[index] = value
+            self._park_mask[index] = True
+        self._parked = int(sum(bool(parked) for parked in self._park_mask))
+
+    def unpark(self, channels: Iterable[int] | None = None) -> None:
+        """Release parked channels, or all of them."""
+        indices = (
+            range(DMX_CHANNELS)
+            if channels is None
+            else [_index(channel) for channel in channels]
+        )
+        for index in indices:
+            self._park_mask[index] = False
+            self._park_values[index] = 0
+        self._parked = int(sum(bool(parked) for parked in self._park_mask))
+
+    def set_motion_indices(self, indices: Any) -> None:
+        """
+        Route buffer indices through the motion filter stage.
+
+        The order of `indices` is the order of `motion_targets` and
+        `set_motion_values`. An empty selection removes the stage.
+        """
+        for index in range(DMX_CHANNELS):
+            self._motion_mask[index] = False
+        if not len(indices):
+            self._motion_index = None
+            return
+        if self._numpy:
+            self._motion_index = np.asarray(indices, dtype=np.intp)
+        else:
+            self._motion_index = tuple(int(index) for index in indices)
+        for index in self._motion_index:
+            self._motion_mask[index] = True
+
+    def set_motion_values(self, values: Any) -> None:
+        """Set the filtered motion channel values, in `set_motion_indices` order."""
+        if self._motion_index is None:
+            return
+        if self._numpy:
+            self._motion_values[self._motion_index] = values
+            return
+        for index, value in zip(self._motion_index, values, strict=True):
+            self._motion_values[index] = int(value)
+
+    def motion_targets(self) -> Any:
+        """Return the unfiltered motion channel values of the last `compose`."""
+        if self._motion_index is None:
+            return []
+        if self._numpy:
+            return self._motion_targets[self._motion_index]
+        return [self._motion_targets[index] for index in self._motion_index]
+
+    def parked(self) -> dict[int, int]:
+        """Return the parked `{channel: value}` pairs."""
+        return {
+            index + 1: int(self._park_values[index])
+            for index in range(DMX_CHANNELS)
+            if self._park_mask[index]
+        }
+
+    def compose(self, base: Any) -> Any:
+        """
+        Return the output frame for `base` merged with every layer.
+
+        The returned buffer is reused by the next call; callers that keep it
+        must copy it. When nothing is layered or parked, `base` itself is
+        returned.
+        """
+        if not self.active:
+            return base
+        if self._numpy:
+            return self._compose_numpy(base)
+        return self._compose_python(base)
+
+    def _compose_numpy(self, base: Any) -> Any:
+        frame = self._frame
+        # LTP: the most recent write across layers, the base where none holds it.
+        np.max(self._stamps, axis=0, out=self._latest)
+        np.argmax(self._stamps, axis=0, out=self._winner)
+        np.multiply(self._winner, DMX_CHANNELS, out=self._winner)
+        np.add(self._winner, self._columns, out=self._winner)
+        np.take(self._values.reshape(-1), self._winner, out=frame)
+        np.less(self._latest, 0, out=self._unheld)
+        np.copyto(frame, base, where=self._unheld)
+        # HTP: the highest of the base and every layer on intensity channels.
+        np.max(self._values, axis=0, out=self._htp)
+        np.maximum(self._htp, base, out=self._htp)
+        np.copyto(frame, self._htp, where=self._intensity)
+        if self._scaled:
+            np.add(self._level_offsets, frame, out=self._lut_index)
+            np.take(SCALE_LUT, self._lut_index, out=frame)
+        if self._motion_index is not None:
+            np.copyto(self._motion_targets, frame, where=self._motion_mask)
+            np.copyto(frame, self._motion_values, where=self._motion_mask)
+        if self._parked:
+            np.copyto(frame, self._park_values, where=self._park_mask)
+        return frame
+
+    def _compose_python(self, base: Any) -> Any:
+        frame = self._frame
+        rows = sorted(self._active)
+        for index in range(DMX_CHANNELS):
+            value = base[index]
+            if self._intensity[index]:
+                for row in rows:
+                    value = max(value, self._values[row][index])
+            else:
+                latest = -1
+                for row in rows:
+                    stamp = self._stamps[row][index]
+                    if stamp > latest:
+                        latest = stamp
+                        value = self._values[row][index]
+            level = self._levels[index]
+            if level != DMX_MAX_VALUE:
+                value = scale_table(level)[value]
+            if self._motion_mask[index]:
+                self._motion_targets[index] = value
+                value = self._motion_values[index]
+            if self._park_mask[index]:
+                value = self._park_values[index]
+            frame[index] = value
+        return frame
+
+    def _row(self, layer: str) -> int:
+        """Return the stack row of a layer, allocating it on first use."""
+        if layer == LAYER_BASE:
+            msg = "The base look is the helper buffer, not a compositor layer"
+            raise ValueError(msg)
+        if layer not in self._layers:
+            if len(self._layers) >= self._max_layers:
+                msg = f"No more than {self._max_layers} layers per universe"
+                raise ValueError(msg)
+            self._layers[layer] = len(self._layers)
+        return self._layers[layer]
+
+
+def _index(channel: int) -> int:
+    """Validate an absolute channel and return its buffer index."""
+    if not DMX_MIN_CHANNEL <= channel <= DMX_CHANNELS:
+        msg = (
+            f"Channel must be between {DMX_MIN_CHANNEL} and "
+            f"{DMX_CHANNELS}, got {channel}"
+        )
+        raise ValueError(msg)
+    return channel - 1
@@ -8,21 +8,36 @@ from typing import Any
 import voluptuous as vol
 from homeassistant import config_entries
 
+from . import async_repatch_fixture
 from .const import (
+    CONF_FIXTURE_ID,
     CONF_FIXTURE_TYPE,
+    CONF_FIXTURES,
+    CONF_HELPER_RELEASE_DELAY,
+    CONF_MEMBERS,
     CONF_NAME,
     CONF_START_CHANNEL,
     CONF_TARGET_IP,
     CONF_UNIVERSE,
+    DEFAULT_HELPER_RELEASE_DELAY,
     DEFAULT_UNIVERSE,
     DOMAIN,
     MAX_UNIVERSE,
 )
 from .entry_fixtures import (
     build_fixture_entry_data,
+    build_group_entry_data,
+    build_master_entry_data,
+    build_rig_entry_data,
     fixture_title,
     get_fixture_entry,
+    group_unique_id,
+    is_group_entry,
+    is_master_entry,
+    is_rig_entry,
+    master_unique_id,
     normalize_fixture_entry_data,
+    rig_unique_id,
     validate_fixture_channels,
     validate_fixture_overlap,
 )
@@ -113,6 +128,50 @@ class ArtNetDMXControllerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def async_step_import(
+        self,
+        import_data: dict[str, Any],
+    ) -> config_entries.ConfigFlowResult:
+        """
+        Create a fixture, rig, group or master entry from validated service data.
+
+        Importing a patch under the name of an existing rig re-patches that
+        rig: its fixtures are replaced and the entry is reloaded.
+        """
+        if is_rig_entry(import_data):
+            entry_data = build_rig_entry_data(
+                import_data[CONF_NAME], import_data[CONF_FIXTURES]
+            )
+            await self.async_set_unique_id(rig_unique_id(entry_data[CONF_NAME]))
+            rig_entry = self.hass.config_entries.async_entry_for_domain_unique_id(
+                DOMAIN, self.unique_id
+            )
+            if rig_entry is not None:
+                return self.async_update_reload_and_abort(
+                    rig_entry,
+                    title=fixture_title(entry_data),
+                    data=entry_data,
+                    reason="rig_updated",
+                )
+        elif is_group_entry(import_data):
+            entry_data = build_group_entry_data(
+                import_data[CONF_NAME], import_data[CONF_MEMBERS]
+            )
+            await self.async_set_unique_id(group_unique_id(entry_data[CONF_NAME]))
+        elif is_master_entry(import_data):
+            entry_data = build_master_entry_data(
+                import_data[CONF_NAME], import_data[CONF_MEMBERS]
+            )
+            await self.async_set_unique_id(master_unique_id(entry_data[CONF_NAME]))
+        else:
+            entry_data = normalize_fixture_entry_data(import_data)
+            await self.async_set_unique_id(entry_data[CONF_FIXTURE_ID])
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(
+            title=fixture_title(entry_data),
+            data=entry_data,
+        )
+
 
 class OptionsFlowHandler(config_entries.OptionsFlow):
     """Handle options for ArtNet DMX Controller config entries."""
@@ -124,6 +183,15 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_init(self, user_input=None):
         """Present available options actions."""
+        if (
+            is_rig_entry(self._entry)
+            or is_group_entry(self._entry)
+            or is_master_entry(self._entry)
+        ):
+            # Rig fixtures are re-patched by importing an updated patch file
+            # under the same rig name; groups and masters follow their
+            # members' patch.
+            return await self.async_step_runtime_options(user_input)
         return self.async_show_menu(
             step_id="init",
             menu_options=["runtime_options", "fixture_options"],
@@ -139,8 +207,15 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         opts = self._entry.options or {}
         data_schema = vol.Schema(
             {
-                vol.Optional("default_transition", default=opts.get("default_transition", 0)):
-                vol.All(vol.Coerce(int), vol.Range(min=0)),
+                vol.Optional(
+                    "default_transition", default=opts.get("default_transition", 0)
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_HELPER_RELEASE_DELAY,
+                    default=opts.get(
+                        CONF_HELPER_RELEASE_DELAY, DEFAULT_HELPER_RELEASE_DELAY
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
             }
         )
 
@@ -168,6 +243,8 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     name=user_input.get(CONF_NAME),
                     fixture_id=fixture["id"],
                     location=fixture.get("location"),
+                    orientation=fixture.get("orientation"),
+                    smoothing=fixture.get("smoothing"),
                 )
                 try:
                     ipaddress.ip_address(updated_entry[CONF_TARGET_IP])
@@ -187,12 +264,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
                 if not errors:
                     updated_data = normalize_fixture_entry_data(updated_entry)
-                    self.hass.config_entries.async_update_entry(
-                        self._entry,
-                        data=updated_data,
-                        title=fixture_title(updated_data),
-                    )
-                    await self.hass.config_entries.async_reload(self._entry.entry_id)
+                    await async_repatch_fixture(self.hass, self._entry, updated_data)
                     return self.async_create_entry(title="", data=self._entry.options)
 
         data_schema = vol.Schema(
@@ -16,19 +16,50 @@ CONF_START_CHANNEL = "start_channel"
 CONF_CHANNEL_COUNT = "channel_count"
 CONF_NAME = "name"
 CONF_LOCATION = "location"
+CONF_ORIENTATION = "orientation"
+CONF_SMOOTHING = "smoothing"
+CONF_ENTRY_TYPE = "entry_type"
+CONF_FIXTURES = "fixtures"
+CONF_HELPER_RELEASE_DELAY = "helper_release_delay"
+CONF_MEMBERS = "members"
+
+# Config entry types (entries without CONF_ENTRY_TYPE are single fixtures)
+ENTRY_TYPE_GROUP = "group"
+ENTRY_TYPE_MASTER = "master"
+ENTRY_TYPE_RIG = "rig"
 
 # Runtime storage keys
+DATA_AIM_SOLVERS = "aim_solvers"
+DATA_BLACKOUT = "blackout"
+DATA_EFFECT_ENGINE = "effect_engine"
 DATA_ENTRY_DATA = "entry_data"
+DATA_ENTRY_FIXTURES = "entry_fixtures"
+DATA_ENTRY_GROUP_MEMBERS = "entry_group_members"
 DATA_ENTRY_HELPER_KEYS = "entry_helper_keys"
+DATA_FLIGHT_RECORDER = "flight_recorder"
 DATA_HELPER_LOCK = "helper_lock"
 DATA_HELPER_REFCOUNTS = "helper_refcounts"
+DATA_HELPER_RELEASE_TIMERS = "helper_release_timers"
+DATA_LATENCY_TRACER = "latency_tracer"
+DATA_LOOP_MONITOR = "loop_monitor"
+DATA_MASTERS = "masters"
+DATA_MOTION_FILTER = "motion_filter"
+DATA_OUTPUT_THREAD = "output_thread"
+DATA_PIXEL_MAPS = "pixel_maps"
+DATA_PIXEL_PLAYERS = "pixel_players"
+DATA_SENSOR_OWNERS = "sensor_owners"
 DATA_SHARED_HELPERS = "shared_helpers"
+DATA_UNIVERSE_STORE = "universe_store"
 
 # Default values
 DEFAULT_UNIVERSE = 0
+DEFAULT_HELPER_RELEASE_DELAY = 10  # seconds a released helper lingers before closing
 
 # DMX constants
 DMX_CHANNELS = 512
 DMX_MAX_VALUE = 255
 DMX_MIN_CHANNEL = 1
 MAX_UNIVERSE = 32767
+
+# Pixel components in the order of pixel arrays; profiles list theirs in `pixel_order`.
+PIXEL_COMPONENTS = "rgbw"
@@ -0,0 +1,65 @@
+"""Diagnostics support for ArtNet DMX Controller."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .const import (
+    DATA_EFFECT_ENGINE,
+    DATA_ENTRY_HELPER_KEYS,
+    DATA_FLIGHT_RECORDER,
+    DATA_SHARED_HELPERS,
+    DOMAIN,
+)
+from .loop_monitor import lag_monitor
+from .output_thread import output_thread
+from .tracing import latency_tracer
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """
+    Return the entry's configuration and the output health of its universes.
+
+    Masters hold no universes of their own and report every universe.
+    """
+    domain_data = hass.data.get(DOMAIN, {})
+    shared_helpers = domain_data.get(DATA_SHARED_HELPERS, {})
+    helper_keys = domain_data.get(DATA_ENTRY_HELPER_KEYS, {}).get(
+        entry.entry_id
+    ) or sorted(shared_helpers)
+    universes = {}
+    for target_ip, universe in helper_keys:
+        artnet_helper = shared_helpers.get((target_ip, universe))
+        if artnet_helper is not None:
+            recorder = artnet_helper.recorder
+            universes[f"{target_ip}/{universe}"] = {
+                **artnet_helper.metrics.as_dict(),
+                "blackout": artnet_helper.blackout_active,
+                "recorded_frames": len(recorder) if recorder is not None else None,
+            }
+    running_output = output_thread(hass)
+    effect_engine = domain_data.get(DATA_EFFECT_ENGINE)
+    tracer = latency_tracer(hass)
+    return {
+        "entry": {
+            "title": entry.title,
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "universes": universes,
+        "event_loop": lag_monitor(hass).as_dict(),
+        "output_thread": running_output.stats.as_dict()
+        if running_output is not None
+        else None,
+        "render_worker": effect_engine.render_worker
+        if effect_engine is not None
+        else False,
+        "latency_tracing": tracer.as_dict() if tracer is not None else None,
+        "flight_recorder_frames": domain_data.get(DATA_FLIGHT_RECORDER),
+    }
@@ -7,9 +7,11 @@ them to the underlying ArtNet helper via `set_channels` when available.
 from __future__ import annotations
 
 import asyncio
+import time
 from typing import Any
 
 from .channel_math import clamp_dmx_value
+from .tracing import Trace
 
 
 class DMXWriter:
@@ -26,9 +28,18 @@ class DMXWriter:
         self._pending: dict[int, int] = {}
         self._lock = asyncio.Lock()
         self._flush_scheduled = False
-
-    async def set_channel(self, channel: int, value: int) -> None:
-        """Enqueue a single channel update and schedule a flush."""
+        # Trace of the first traced write in the pending batch
+        self._trace: Trace | None = None
+
+    async def set_channel(
+        self, channel: int, value: int, traced_at: float | None = None
+    ) -> None:
+        """
+        Enqueue a single channel update and schedule a flush.
+
+        `traced_at` is the monotonic time the calling entity started the
+        write, passed while latency tracing is enabled.
+        """
         v = clamp_dmx_value(int(value))
         # If helper does not support bulk `set_channels`, forward immediately
         if not hasattr(self._helper, "set_channels"):
@@ -36,14 +47,20 @@ class DMXWriter:
             return
 
         self._pending[channel] = v
+        if traced_at is not None and self._trace is None:
+            self._trace = Trace(traced_at, time.monotonic())
 
-        if not self._flush_scheduled:
+        if self._flush_scheduled:
+            self._count_coalesced()
+        else:
             self._flush_scheduled = True
             # schedule a short debounce to allow batching in the same loop turn
             asyncio.create_task(self._flush_debounced())
 
-    async def set_channels(self, channel_values: dict[int, int]) -> None:
-        """Enqueue multiple channel updates and schedule a flush."""
+    async def set_channels(
+        self, channel_values: dict[int, int], traced_at: float | None = None
+    ) -> None:
+        """Enqueue channel updates and schedule a flush; see `set_channel`."""
         # If helper supports bulk, enqueue for batch; otherwise forward immediately
         if not hasattr(self._helper, "set_channels"):
             for ch, val in channel_values.items():
@@ -52,26 +69,44 @@ class DMXWriter:
 
         for ch, val in channel_values.items():
             self._pending[ch] = clamp_dmx_value(int(val))
+        if traced_at is not None and self._trace is None:
+            self._trace = Trace(traced_at, time.monotonic())
 
-        if not self._flush_scheduled:
+        if self._flush_scheduled:
+            self._count_coalesced()
+        else:
             self._flush_scheduled = True
             asyncio.create_task(self._flush_debounced())
 
+    def _count_coalesced(self) -> None:
+        """Count a write merged into an already pending frame on the helper."""
+        metrics = getattr(self._helper, "metrics", None)
+        if metrics is not None:
+            metrics.frames_coalesced += 1
+
     async def _flush_debounced(self) -> None:
         """Flush pending updates after yielding to the event loop."""
         # yield control so callers in the same loop tick can accumulate updates
         await asyncio.sleep(0)
+        trace = self._trace
+        if trace is not None:
+            trace.flushed = time.monotonic()
 
         async with self._lock:
+            if trace is not None:
+                trace.locked = time.monotonic()
             pending = dict(self._pending)
             self._pending.clear()
             self._flush_scheduled = False
+            self._trace = None
 
         if not pending:
             return
 
         # Prefer a bulk `set_channels` if available on the helper
         if hasattr(self._helper, "set_channels"):
+            if trace is not None and hasattr(self._helper, "start_trace"):
+                self._helper.start_trace(trace)
             await self._helper.set_channels(pending)
         else:
             # Fallback to single-channel writes
@@ -0,0 +1,620 @@
+"""
+Effect engine evaluating dynamic looks once per output tick.
+
+An `Effect` is compiled once from its fixtures: per universe it holds the
+buffer index array of the channels it drives and one phase offset per
+fixture. Every tick the engine renders each running effect over those arrays
+(one vectorized pass with NumPy) and writes the result into the compositor's
+`effects` layer with one scatter and one frame per universe. Intensity and
+colour merge HTP with the base look and positions LTP, so stopping an effect
+hands every channel back to whatever the base or other layers hold.
+
+Spatial layouts derive each fixture's phase from its patch `location` once,
+at compile time, so a wave sweeping across the room costs the same array
+operation per tick as one following member order.
+
+The ticker only runs while at least one effect is running, and reports its
+ticks to the loop lag monitor while it does.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .buffer import HAS_NUMPY, concat_indices, np
+from .compositor import LAYER_EFFECTS
+from .const import DATA_EFFECT_ENGINE, DMX_MAX_VALUE, DOMAIN, LOGGER
+from .loop_monitor import lag_monitor
+from .render_worker import RenderWorker, RenderWorkerError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+    from .artnet import ArtNetDMXHelper
+    from .compiled_fixture import CompiledFixture
+    from .loop_monitor import LoopLagMonitor
+
+EFFECT_TICK_RATE = 40  # frames per second while effects run
+LAG_TICKER = "effects"  # the ticker's name in the loop lag monitor
+
+EFFECT_OFF = "off"
+EFFECT_SINE = "sine"
+EFFECT_SAW = "saw"
+EFFECT_SQUARE = "square"
+EFFECT_STROBE = "strobe"
+EFFECT_CHASE = "chase"
+EFFECT_CIRCLE = "circle"
+
+# Intensity waves driving `dim`.
+WAVE_EFFECTS = (EFFECT_SINE, EFFECT_SAW, EFFECT_SQUARE, EFFECT_STROBE)
+EFFECTS = (*WAVE_EFFECTS, EFFECT_CHASE, EFFECT_CIRCLE)
+
+# How fixture phases are laid out: by member order, swept along one axis of
+# the patch `location`, or radially from the centre of the fixtures.
+LAYOUT_ORDER = "order"
+LAYOUT_SWEEP_X = "sweep_x"
+LAYOUT_SWEEP_Y = "sweep_y"
+LAYOUT_SWEEP_Z = "sweep_z"
+LAYOUT_RADIAL = "radial"
+SPATIAL_LAYOUTS = (LAYOUT_SWEEP_X, LAYOUT_SWEEP_Y, LAYOUT_SWEEP_Z, LAYOUT_RADIAL)
+LAYOUTS = (LAYOUT_ORDER, *SPATIAL_LAYOUTS)
+
+STROBE_DUTY = 0.15
+
+# Colours stepped through by the chase, as (red, green, blue).
+CHASE_PALETTE = (
+    (255, 0, 0),
+    (255, 255, 0),
+    (0, 255, 0),
+    (0, 255, 255),
+    (0, 0, 255),
+    (255, 0, 255),
+)
+
+_RGB_CHANNELS = ("red", "green", "blue")
+_PAN_TILT_CHANNELS = ("pan_msb", "pan_lsb", "tilt_msb", "tilt_lsb")
+_HALF_16BIT = 32767.5
+
+
+def effect_supported(kind: str, fixture: CompiledFixture) -> bool:
+    """Return True when an effect kind can drive a compiled fixture."""
+    if kind in WAVE_EFFECTS:
+        return fixture.has("dim")
+    if kind == EFFECT_CHASE:
+        return fixture.has(*_RGB_CHANNELS)
+    if kind == EFFECT_CIRCLE:
+        return fixture.has(*_PAN_TILT_CHANNELS)
+    return False
+
+
+def available_effects(fixtures: list[CompiledFixture]) -> list[str]:
+    """Return the effect kinds at least one of `fixtures` supports."""
+    return [
+        kind
+        for kind in EFFECTS
+        if any(effect_supported(kind, fixture) for fixture in fixtures)
+    ]
+
+
+def available_layouts(fixtures: list[CompiledFixture]) -> list[str]:
+    """Return the phase layouts usable with `fixtures`; spatial ones need locations."""
+    if any(fixture.location is not None for fixture in fixtures):
+        return list(LAYOUTS)
+    return [LAYOUT_ORDER]
+
+
+def spatial_phases(
+    fixtures: list[CompiledFixture], layout: str, spread: float = 1.0
+) -> dict[str, float]:
+    """
+    Return per-fixture phases for a spatial layout.
+
+    Positions are normalized to 0-1 across the fixtures (projection on the
+    axis for sweeps, distance from the centre of their bounding box for
+    radial) and delay the phase by up to `spread` cycles, so the effect
+    travels towards the far end or outwards. Fixtures without a location
+    sit at the start.
+    """
+    located = [fixture for fixture in fixtures if fixture.location is not None]
+    if not located:
+        return {}
+    if layout == LAYOUT_RADIAL:
+        coordinates = list(zip(*(fixture.location for fixture in located), strict=True))
+        centre = [(min(values) + max(values)) / 2 for values in coordinates]
+        positions = {
+            fixture.fixture_id: math.dist(fixture.location, centre)
+            for fixture in located
+        }
+        low = 0.0
+    else:
+        axis = SPATIAL_LAYOUTS.index(layout)
+        positions = {fixture.fixture_id: fixture.location[axis] for fixture in located}
+        low = min(positions.values())
+    extent = max(positions.values()) - low
+    if extent <= 0:
+        return {fixture_id: 0.0 for fixture_id in positions}
+    return {
+        fixture_id: -(position - low) / extent * spread
+        for fixture_id, position in positions.items()
+    }
+
+
+class Effect:
+    """
+    One effect compiled against its fixtures' universes.
+
+    `speed` is in cycles per second, `size` scales the output (0-1) and
+    `spread` (0-1) spaces the fixtures' phases across one cycle, in member
+    order or by location for a spatial `layout`; `phases` overrides that with
+    explicit per-fixture phases.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        fixtures: list[tuple[ArtNetDMXHelper, CompiledFixture]],
+        speed: float = 1.0,
+        size: float = 1.0,
+        spread: float = 1.0,
+        phases: dict[str, float] | None = None,
+        layout: str = LAYOUT_ORDER,
+        use_numpy: bool = HAS_NUMPY,
+    ) -> None:
+        self.kind = kind
+        self.speed = float(speed)
+        self.size = float(size)
+        self.layout = layout
+        self._numpy = bool(use_numpy and np is not None)
+        self._palette = (
+            np.asarray(CHASE_PALETTE, dtype=np.float64)
+            if self._numpy
+            else CHASE_PALETTE
+        )
+        driven = [
+            (artnet_helper, fixture)
+            for artnet_helper, fixture in fixtures
+            if effect_supported(kind, fixture)
+        ]
+        if phases is None and layout in SPATIAL_LAYOUTS:
+            phases = spatial_phases(
+                [fixture for _helper, fixture in driven], layout, spread
+            )
+        if phases is None:
+            phases = {
+                fixture.fixture_id: position / len(driven) * spread
+                for position, (_helper, fixture) in enumerate(driven)
+            }
+        # Kept so `program` can rebuild the effect against universe slots
+        self._driven = driven
+        self._phases = phases
+        by_helper: dict[
+            int, tuple[ArtNetDMXHelper, list[CompiledFixture], list[float]]
+        ] = {}
+        for artnet_helper, fixture in driven:
+            phase = phases.get(fixture.fixture_id, 0.0)
+            _helper, members, member_phases = by_helper.setdefault(
+                id(artnet_helper), (artnet_helper, [], [])
+            )
+            members.append(fixture)
+            member_phases.append(phase)
+        # (helper, index array, per-fixture phases, dimmer count) per universe
+        self._universes: list[tuple[ArtNetDMXHelper, Any, Any, int]] = [
+            (
+                artnet_helper,
+                self._indices(members),
+                np.asarray(member_phases, dtype=np.float64)
+                if self._numpy
+                else member_phases,
+                sum(1 for fixture in members if fixture.has("dim")),
+            )
+            for artnet_helper, members, member_phases in by_helper.values()
+        ]
+
+    @property
+    def channel_count(self) -> int:
+        """Return the number of channels the effect drives."""
+        return sum(len(indices) for _helper, indices, _phases, _dims in self._universes)
+
+    def helpers(self) -> list[ArtNetDMXHelper]:
+        """Return the universes the effect writes to."""
+        return [
+            artnet_helper for artnet_helper, _indices, _phases, _dims in self._universes
+        ]
+
+    def channels(self, artnet_helper: ArtNetDMXHelper) -> list[int]:
+        """Return the absolute channels the effect drives on one universe."""
+        for helper, indices, _phases, _dims in self._universes:
+            if helper is artnet_helper:
+                return [int(index) + 1 for index in indices]
+        return []
+
+    def indices(self, artnet_helper: ArtNetDMXHelper) -> Any:
+        """Return the buffer index array the effect drives on one universe."""
+        for helper, indices, _phases, _dims in self._universes:
+            if helper is artnet_helper:
+                return indices
+        return ()
+
+    def program(self, slots: dict[int, int]) -> Effect:
+        """
+        Return a picklable copy rendering into universe slots instead of helpers.
+
+        `slots` maps helper identities to slot numbers; the copy's `render`
+        yields `(slot, indices, values)` for a render worker.
+        """
+        return Effect(
+            self.kind,
+            [
+                (slots[id(artnet_helper)], fixture)
+                for artnet_helper, fixture in self._driven
+            ],
+            speed=self.speed,
+            size=self.size,
+            phases=self._phases,
+            layout=self.layout,
+            use_numpy=self._numpy,
+        )
+
+    def render(self, elapsed: float) -> list[tuple[ArtNetDMXHelper, Any, Any]]:
+        """Return `(helper, indices, values)` per universe at `elapsed` seconds."""
+        return [
+            (artnet_helper, indices, self._render(self._cycle(elapsed, phases), dims))
+            for artnet_helper, indices, phases, dims in self._universes
+        ]
+
+    def _indices(self, fixtures: list[CompiledFixture]) -> Any:
+        """Return the index array of the driven channels, grouped by role."""
+        if self.kind in WAVE_EFFECTS:
+            return concat_indices([fixture.indices("dim") for fixture in fixtures])
+        if self.kind == EFFECT_CHASE:
+            # All RGB triples, then the dimmers of the fixtures that have one.
+            return concat_indices(
+                [fixture.indices(*_RGB_CHANNELS) for fixture in fixtures]
+                + [fixture.indices("dim") for fixture in fixtures if fixture.has("dim")]
+            )
+        # Circle: all pan MSBs, pan LSBs, tilt MSBs, then tilt LSBs.
+        return concat_indices(
+            [
+                fixture.indices(name)
+                for name in _PAN_TILT_CHANNELS
+                for fixture in fixtures
+            ]
+        )
+
+    def _cycle(self, elapsed: float, phases: Any) -> Any:
+        """Return each fixture's position within the current cycle (0-1)."""
+        offset = elapsed * self.speed
+        if self._numpy:
+            return np.mod(phases + offset, 1.0)
+        return [(phase + offset) % 1.0 for phase in phases]
+
+    def _render(self, cycle: Any, dims: int) -> Any:
+        if self.kind in WAVE_EFFECTS:
+            return self._wave(cycle)
+        if self.kind == EFFECT_CHASE:
+            return self._chase(cycle, dims)
+        return self._circle(cycle)
+
+    def _wave(self, cycle: Any) -> Any:
+        level = self.size * DMX_MAX_VALUE
+        duty = STROBE_DUTY if self.kind == EFFECT_STROBE else 0.5
+        if self._numpy:
+            if self.kind == EFFECT_SINE:
+                shape = 0.5 - 0.5 * np.cos(2 * np.pi * cycle)
+            elif self.kind == EFFECT_SAW:
+                shape = cycle
+            else:
+                shape = cycle < duty
+            return np.rint(shape * level).astype(np.int64)
+        if self.kind == EFFECT_SINE:
+            return [
+                round((0.5 - 0.5 * math.cos(2 * math.pi * value)) * level)
+                for value in cycle
+            ]
+        if self.kind == EFFECT_SAW:
+            return [round(value * level) for value in cycle]
+        return [round(level) if value < duty else 0 for value in cycle]
+
+    def _chase(self, cycle: Any, dims: int) -> Any:
+        steps = len(CHASE_PALETTE)
+        level = round(self.size * DMX_MAX_VALUE)
+        if self._numpy:
+            colours = np.rint(
+                self._palette[(cycle * steps).astype(np.intp)] * self.size
+            ).astype(np.int64)
+            return np.concatenate(
+                (colours.reshape(-1), np.full(dims, level, dtype=np.int64))
+            )
+        values = [
+            round(channel * self.size)
+            for value in cycle
+            for channel in self._palette[int(value * steps)]
+        ]
+        return values + [level] * dims
+
+    def _circle(self, cycle: Any) -> Any:
+        radius = _HALF_16BIT * self.size
+        if self._numpy:
+            angle = 2 * np.pi * cycle
+            pan = np.rint(_HALF_16BIT + radius * np.cos(angle)).astype(np.int64)
+            tilt = np.rint(_HALF_16BIT + radius * np.sin(angle)).astype(np.int64)
+            return np.concatenate((pan >> 8, pan & 0xFF, tilt >> 8, tilt & 0xFF))
+        pan = [
+            round(_HALF_16BIT + radius * math.cos(2 * math.pi * value))
+            for value in cycle
+        ]
+        tilt = [
+            round(_HALF_16BIT + radius * math.sin(2 * math.pi * value))
+            for value in cycle
+        ]
+        return (
+            [value >> 8 for value in pan]
+            + [value & 0xFF for value in pan]
+            + [value >> 8 for value in tilt]
+            + [value & 0xFF for value in tilt]
+        )
+
+
+class EffectControls:
+    """
+    Effect parameters of one fixture group, set through its entities.
+
+    Every change recompiles the group's effect and restarts it in place,
+    keeping its timing so parameter moves do not jump.
+    """
+
+    def __init__(
+        self,
+        engine: EffectEngine,
+        effect_id: str,
+        fixtures: list[tuple[ArtNetDMXHelper, CompiledFixture]],
+    ) -> None:
+        self._engine = engine
+        self._effect_id = effect_id
+        self._fixtures = fixtures
+        self.available = available_effects([fixture for _helper, fixture in fixtures])
+        self.layouts = available_layouts([fixture for _helper, fixture in fixtures])
+        self.kind = EFFECT_OFF
+        self.layout = LAYOUT_ORDER
+        self.speed = 1.0
+        self.size = 1.0
+        self.spread = 1.0
+
+    async def async_update(self, **changes: Any) -> None:
+        """Apply parameter changes (`kind`, `layout`, `speed`, `size`, `spread`)."""
+        for name, value in changes.items():
+            setattr(self, name, value)
+        if self.kind == EFFECT_OFF:
+            await self._engine.async_stop(self._effect_id)
+            return
+        await self._engine.async_start(
+            self._effect_id,
+            Effect(
+                self.kind,
+                self._fixtures,
+                speed=self.speed,
+                size=self.size,
+                spread=self.spread,
+                layout=self.layout,
+            ),
+        )
+
+
+class EffectEngine:
+    """
+    Run effects at `EFFECT_TICK_RATE` while any is running.
+
+    Effects render in the event loop unless a render worker is enabled, in
+    which case they render in its process and the loop only copies the
+    finished channels out.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, monitor: LoopLagMonitor | None = None
+    ) -> None:
+        self._hass = hass
+        # Measures event-loop lag from the ticks while the ticker runs.
+        self._monitor = monitor
+        self._effects: dict[str, tuple[Effect, float]] = {}
+        self._controls: dict[str, EffectControls] = {}
+        self._cancel_ticker: Callable[[], None] | None = None
+        self._tick_lock = asyncio.Lock()
+        self._render_worker: RenderWorker | None = None
+        self._cancel_worker_stop: Callable[[], None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return True while the ticker runs."""
+        return self._cancel_ticker is not None
+
+    @property
+    def render_worker(self) -> bool:
+        """Return True while effects render in a worker process."""
+        return self._render_worker is not None
+
+    async def async_set_render_worker(self, enabled: bool) -> None:
+        """Start or stop the render worker; it also stops with Home Assistant."""
+        if enabled and self._render_worker is None:
+            self._render_worker = await self._hass.async_add_executor_job(RenderWorker)
+            self._cancel_worker_stop = self._hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP, self._async_stop_render_worker
+            )
+            LOGGER.info("Effects render in a worker process")
+        elif not enabled and self._render_worker is not None:
+            if self._cancel_worker_stop is not None:
+                self._cancel_worker_stop()
+            await self._async_stop_render_worker()
+            LOGGER.info("Effects render in the event loop")
+
+    async def _async_stop_render_worker(self, _event: Any = None) -> None:
+        self._cancel_worker_stop = None
+        async with self._tick_lock:
+            worker, self._render_worker = self._render_worker, None
+        if worker is not None:
+            await self._hass.async_add_executor_job(worker.close)
+
+    def effect(self, effect_id: str) -> Effect | None:
+        """Return a running effect."""
+        running = self._effects.get(effect_id)
+        return running[0] if running else None
+
+    async def async_start(self, effect_id: str, effect: Effect) -> None:
+        """Start (or replace) an effect; a replaced effect keeps its timing."""
+        previous = self._effects.get(effect_id)
+        started = previous[1] if previous else time.monotonic()
+        if previous is not None:
+            await self._async_release(previous[0], keep=effect)
+        if not effect.channel_count:
+            self._effects.pop(effect_id, None)
+            self._update_ticker()
+            return
+        self._effects[effect_id] = (effect, started)
+        self._update_ticker()
+
+    async def async_stop(self, effect_id: str) -> None:
+        """Stop an effect and release its channels from the effects layer."""
+        running = self._effects.pop(effect_id, None)
+        self._update_ticker()
+        if running is not None:
+            await self._async_release(running[0])
+
+    def controls(
+        self,
+        effect_id: str,
+        fixtures: list[tuple[ArtNetDMXHelper, CompiledFixture]],
+    ) -> EffectControls:
+        """Return the effect controls of a group, creating them on first use."""
+        if effect_id not in self._controls:
+            self._controls[effect_id] = EffectControls(self, effect_id, fixtures)
+        return self._controls[effect_id]
+
+    async def async_remove(self, effect_id: str) -> None:
+        """Stop a group's effect and forget its controls."""
+        self._controls.pop(effect_id, None)
+        await self.async_stop(effect_id)
+
+    async def async_tick(self, now: float | None = None) -> None:
+        """Render every running effect and send one frame per universe."""
+        if self._tick_lock.locked():
+            # The previous frame is still being rendered or sent; skip rather
+            # than queue.
+            return
+        now = time.monotonic() if now is None else now
+        async with self._tick_lock:
+            writes: dict[int, tuple[ArtNetDMXHelper, list[Any], list[Any]]] = {}
+            for artnet_helper, indices, values in await self._async_render(now):
+                _helper, index_parts, value_parts = writes.setdefault(
+                    id(artnet_helper), (artnet_helper, [], [])
+                )
+                index_parts.append(indices)
+                value_parts.append(values)
+            await asyncio.gather(
+                *(
+                    artnet_helper.set_layer_indexed(
+                        LAYER_EFFECTS,
+                        concat_indices(index_parts),
+                        _concat_values(value_parts),
+                    )
+                    for artnet_helper, index_parts, value_parts in writes.values()
+                )
+            )
+
+    async def _async_render(self, now: float) -> list[tuple[ArtNetDMXHelper, Any, Any]]:
+        """Render every running effect, in the worker process when one runs."""
+        running = [
+            (effect, now - started) for effect, started in self._effects.values()
+        ]
+        if self._render_worker is not None:
+            try:
+                rendered = await self._render_worker.async_render(running)
+            except RenderWorkerError as err:
+                LOGGER.warning(
+                    "Render worker failed, rendering effects in the event loop: %s", err
+                )
+                worker, self._render_worker = self._render_worker, None
+                if self._cancel_worker_stop is not None:
+                    self._cancel_worker_stop()
+                    self._cancel_worker_stop = None
+                await self._hass.async_add_executor_job(worker.close)
+            else:
+                # Drop the frame if effects started or stopped while it rendered.
+                current = [effect for effect, _started in self._effects.values()]
+                return (
+                    rendered
+                    if current == [effect for effect, _elapsed in running]
+                    else []
+                )
+        return [
+            write for effect, elapsed in running for write in effect.render(elapsed)
+        ]
+
+    def _helper_keys(self) -> set[tuple[str, int]]:
+        """Return the universes the running effects write to."""
+        return {
+            (artnet_helper.target_ip, artnet_helper.universe)
+            for effect, _started in self._effects.values()
+            for artnet_helper in effect.helpers()
+        }
+
+    @callback
+    def _async_ticker(self, _now: Any) -> None:
+        if self._monitor is not None:
+            self._monitor.tick(LAG_TICKER)
+        self._hass.async_create_task(self.async_tick())
+
+    def _update_ticker(self) -> None:
+        """Run the ticker exactly while effects are running."""
+        if self._effects and self._cancel_ticker is None:
+            self._cancel_ticker = async_track_time_interval(
+                self._hass, self._async_ticker, timedelta(seconds=1 / EFFECT_TICK_RATE)
+            )
+            if self._monitor is not None:
+                self._monitor.async_add_ticker(
+                    LAG_TICKER, EFFECT_TICK_RATE, self._helper_keys
+                )
+            LOGGER.debug("Effect ticker started")
+        elif not self._effects and self._cancel_ticker is not None:
+            self._cancel_ticker()
+            self._cancel_ticker = None
+            if self._monitor is not None:
+                self._monitor.async_remove_ticker(LAG_TICKER)
+            LOGGER.debug("Effect ticker stopped")
+
+    async def _async_release(self, effect: Effect, keep: Effect | None = None) -> None:
+        """Release an effect's channels, except those `keep` drives on one universe."""
+        releases = []
+        for artnet_helper in effect.helpers():
+            channels = set(effect.channels(artnet_helper))
+            if keep is not None:
+                channels -= set(keep.channels(artnet_helper))
+            if channels:
+                releases.append(
+                    artnet_helper.release_layer(LAYER_EFFECTS, sorted(channels))
+                )
+        await asyncio.gather(*releases)
+
+
+def effect_engine(hass: HomeAssistant) -> EffectEngine:
+    """Return the integration's effect engine, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_EFFECT_ENGINE not in domain_data:
+        domain_data[DATA_EFFECT_ENGINE] = EffectEngine(hass, lag_monitor(hass))
+    return domain_data[DATA_EFFECT_ENGINE]
+
+
+def _concat_values(parts: list[Any]) -> Any:
+    if len(parts) == 1:
+        return parts[0]
+    if np is not None and all(isinstance(part, np.ndarray) for part in parts):
+        return np.concatenate(parts)
+    return [int(value) for part in parts for value in part]
@@ -6,21 +6,34 @@ from copy import deepcopy
 from typing import Any
 from uuid import uuid4
 
-from .channel_math import absolute_channel
+from homeassistant.util import slugify
+
+from .channel_math import absolute_channel, validate_dmx_value, value_from_label
 from .const import (
     CONF_CHANNEL_COUNT,
+    CONF_ENTRY_TYPE,
     CONF_FIXTURE_ID,
     CONF_FIXTURE_TYPE,
+    CONF_FIXTURES,
     CONF_LOCATION,
+    CONF_MEMBERS,
     CONF_NAME,
+    CONF_ORIENTATION,
+    CONF_SMOOTHING,
     CONF_START_CHANNEL,
     CONF_TARGET_IP,
     CONF_UNIVERSE,
+    DATA_ENTRY_DATA,
+    DATA_ENTRY_FIXTURES,
+    DATA_ENTRY_GROUP_MEMBERS,
+    DOMAIN,
+    ENTRY_TYPE_GROUP,
+    ENTRY_TYPE_MASTER,
+    ENTRY_TYPE_RIG,
 )
 from .fixture_mapping import HomeAssistantError
 
-
-LEGACY_CONF_FIXTURES = "fixtures"
+LEGACY_CONF_FIXTURES = CONF_FIXTURES
 
 
 def build_fixture_entry_data(
@@ -32,6 +45,8 @@ def build_fixture_entry_data(
     name: str | None = None,
     fixture_id: str | None = None,
     location: dict[str, Any] | None = None,
+    orientation: dict[str, Any] | None = None,
+    smoothing: float | None = None,
 ) -> dict[str, Any]:
     """Return normalized fixture-entry data."""
     fixture: dict[str, Any] = {
@@ -46,9 +61,80 @@ def build_fixture_entry_data(
         fixture[CONF_NAME] = name.strip()
     if location is not None:
         fixture[CONF_LOCATION] = deepcopy(location)
+    if orientation is not None:
+        fixture[CONF_ORIENTATION] = deepcopy(orientation)
+    if smoothing:
+        fixture[CONF_SMOOTHING] = float(smoothing)
     return fixture
 
 
+def build_rig_entry_data(name: str, fixtures: list[dict[str, Any]]) -> dict[str, Any]:
+    """Return rig-entry data hosting many fixture records in one config entry."""
+    return {
+        CONF_ENTRY_TYPE: ENTRY_TYPE_RIG,
+        CONF_NAME: name.strip(),
+        CONF_FIXTURES: [normalize_fixture_entry_data(fixture) for fixture in fixtures],
+    }
+
+
+def rig_unique_id(name: str) -> str:
+    """Return the config-entry unique id of the rig named `name`."""
+    return f"rig_{slugify(name.strip())}"
+
+
+def build_group_entry_data(name: str, members: list[str]) -> dict[str, Any]:
+    """Return fixture-group entry data referencing member fixtures by id."""
+    return {
+        CONF_ENTRY_TYPE: ENTRY_TYPE_GROUP,
+        CONF_NAME: name.strip(),
+        CONF_MEMBERS: list(dict.fromkeys(str(member) for member in members)),
+    }
+
+
+def group_unique_id(name: str) -> str:
+    """Return the config-entry unique id of the fixture group named `name`."""
+    return f"group_{slugify(name.strip())}"
+
+
+def build_master_entry_data(
+    name: str, members: list[str] | None = None
+) -> dict[str, Any]:
+    """
+    Return master-entry data.
+
+    A master without members is a grand master scaling every fixture; with
+    members it is a submaster scaling only those fixture ids.
+    """
+    return {
+        CONF_ENTRY_TYPE: ENTRY_TYPE_MASTER,
+        CONF_NAME: name.strip(),
+        CONF_MEMBERS: list(dict.fromkeys(str(member) for member in members or [])),
+    }
+
+
+def master_unique_id(name: str) -> str:
+    """Return the config-entry unique id of the master named `name`."""
+    return f"master_{slugify(name.strip())}"
+
+
+def is_group_entry(entry_or_data: Any) -> bool:
+    """Return True when a config entry is a fixture group."""
+    data = entry_or_data.data if hasattr(entry_or_data, "data") else entry_or_data
+    return data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_GROUP
+
+
+def is_master_entry(entry_or_data: Any) -> bool:
+    """Return True when a config entry is a grand master or submaster."""
+    data = entry_or_data.data if hasattr(entry_or_data, "data") else entry_or_data
+    return data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_MASTER
+
+
+def is_rig_entry(entry_or_data: Any) -> bool:
+    """Return True when a config entry hosts a whole rig of fixtures."""
+    data = entry_or_data.data if hasattr(entry_or_data, "data") else entry_or_data
+    return data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_RIG
+
+
 def normalize_fixture_entry_data(data: dict[str, Any]) -> dict[str, Any]:
     """Normalize config-entry data into the fixture-first format."""
     normalized = dict(data)
@@ -67,8 +153,9 @@ def normalize_fixture_entry_data(data: dict[str, Any]) -> dict[str, Any]:
             normalized.pop(CONF_NAME, None)
     else:
         normalized.pop(CONF_NAME, None)
-    if CONF_LOCATION in normalized:
-        normalized[CONF_LOCATION] = deepcopy(normalized[CONF_LOCATION])
+    for key in (CONF_LOCATION, CONF_ORIENTATION):
+        if key in normalized:
+            normalized[key] = deepcopy(normalized[key])
     return normalized
 
 
@@ -88,6 +175,13 @@ def extract_fixture_records(entry_or_data: Any) -> list[dict[str, Any]]:
     if not isinstance(fixtures, list):
         return []
 
+    if is_rig_entry(data):
+        return [
+            normalize_fixture_entry_data(fixture)
+            for fixture in fixtures
+            if isinstance(fixture, dict)
+        ]
+
     target_ip = data.get(CONF_TARGET_IP)
     universe = data.get(CONF_UNIVERSE)
     if target_ip is None or universe is None:
@@ -110,9 +204,13 @@ def extract_fixture_records(entry_or_data: Any) -> list[dict[str, Any]]:
                 fixture_type=str(fixture[CONF_FIXTURE_TYPE]),
                 start_channel=int(fixture[CONF_START_CHANNEL]),
                 channel_count=int(fixture[CONF_CHANNEL_COUNT]),
-                name=fixture.get(CONF_NAME) if isinstance(fixture.get(CONF_NAME), str) else data.get(CONF_NAME),
+                name=fixture.get(CONF_NAME)
+                if isinstance(fixture.get(CONF_NAME), str)
+                else data.get(CONF_NAME),
                 fixture_id=fixture.get(CONF_FIXTURE_ID),
                 location=fixture.get(CONF_LOCATION),
+                orientation=fixture.get(CONF_ORIENTATION),
+                smoothing=fixture.get(CONF_SMOOTHING),
             )
         )
     return records
@@ -127,6 +225,33 @@ def get_fixture_entry(entry_or_data: Any) -> dict[str, Any]:
     return deepcopy(records[0])
 
 
+def with_fixture_smoothing(
+    entry_or_data: Any, fixture_id: str, smoothing: float
+) -> dict[str, Any]:
+    """Return entry data with one fixture's smoothing time set; 0 removes it."""
+    data = entry_or_data.data if hasattr(entry_or_data, "data") else entry_or_data
+
+    def _with_smoothing(fixture: dict[str, Any]) -> dict[str, Any]:
+        fixture = dict(fixture)
+        if smoothing > 0:
+            fixture[CONF_SMOOTHING] = float(smoothing)
+        else:
+            fixture.pop(CONF_SMOOTHING, None)
+        return fixture
+
+    if is_rig_entry(data):
+        return {
+            **data,
+            CONF_FIXTURES: [
+                _with_smoothing(fixture)
+                if fixture.get(CONF_FIXTURE_ID) == fixture_id
+                else fixture
+                for fixture in data.get(CONF_FIXTURES, [])
+            ],
+        }
+    return _with_smoothing(data)
+
+
 def fixture_label(entry_or_data: Any, fallback: str | None = None) -> str | None:
     """Return display label for a fixture entry."""
     data = entry_or_data.data if hasattr(entry_or_data, "data") else entry_or_data
@@ -136,10 +261,135 @@ def fixture_label(entry_or_data: Any, fallback: str | None = None) -> str | None
 def fixture_title(entry_or_data: Any) -> str:
     """Return a Home Assistant config-entry title for a fixture entry."""
     data = entry_or_data.data if hasattr(entry_or_data, "data") else entry_or_data
+    if is_rig_entry(data):
+        count = len(data.get(CONF_FIXTURES, []))
+        return f"{data.get(CONF_NAME) or 'DMX Rig'} ({count} fixtures)"
+    if is_group_entry(data):
+        count = len(data.get(CONF_MEMBERS, []))
+        return f"{data.get(CONF_NAME) or 'Fixture group'} (group of {count})"
+    if is_master_entry(data):
+        members = data.get(CONF_MEMBERS, [])
+        role = f"submaster of {len(members)}" if members else "grand master"
+        return f"{data.get(CONF_NAME) or 'Master'} ({role})"
     label = fixture_label(data) or "DMX Fixture"
     return f"{label} ({data[CONF_TARGET_IP]} U:{data[CONF_UNIVERSE]} CH:{data[CONF_START_CHANNEL]})"
 
 
+def fixture_device_key(entry: Any, fixture: dict[str, Any]) -> str:
+    """Return the device identifier used for one fixture of a config entry."""
+    if is_rig_entry(entry):
+        return f"{entry.entry_id}_{fixture[CONF_FIXTURE_ID]}"
+    return entry.entry_id
+
+
+def runtime_fixtures(hass: Any, entry: Any) -> list[tuple[dict[str, Any], Any]]:
+    """
+    Return `(fixture, artnet_helper)` pairs set up for a config entry.
+
+    Rig entries register their pairs at setup time; single-fixture entries
+    store their helper directly under the entry id. Fixture groups and
+    masters own no fixtures of their own (see `runtime_group_members`).
+    """
+    if is_group_entry(entry) or is_master_entry(entry):
+        return []
+    domain_data = hass.data[DOMAIN]
+    fixtures = domain_data.get(DATA_ENTRY_FIXTURES, {}).get(entry.entry_id)
+    if fixtures is not None:
+        return fixtures
+    return [(get_fixture_entry(entry), domain_data[entry.entry_id])]
+
+
+def group_member_records(
+    entries: list[Any], members: list[str]
+) -> list[dict[str, Any]]:
+    """Return the fixture records of a group's members in member order."""
+    records: dict[str, dict[str, Any]] = {}
+    for entry in entries:
+        for fixture in extract_fixture_records(entry):
+            records[fixture[CONF_FIXTURE_ID]] = fixture
+    return [records[member] for member in members if member in records]
+
+
+def runtime_group_members(hass: Any, entry: Any) -> list[tuple[dict[str, Any], Any]]:
+    """Return `(fixture, artnet_helper)` pairs of a set-up fixture group."""
+    return hass.data[DOMAIN].get(DATA_ENTRY_GROUP_MEMBERS, {}).get(entry.entry_id, [])
+
+
+def runtime_fixture_index(hass: Any) -> dict[str, tuple[dict[str, Any], Any]]:
+    """Return every set-up fixture keyed by fixture id, paired with its helper."""
+    domain_data = hass.data.get(DOMAIN, {})
+    index: dict[str, tuple[dict[str, Any], Any]] = {}
+    for entry_id, fixture in domain_data.get(DATA_ENTRY_DATA, {}).items():
+        artnet_helper = domain_data.get(entry_id)
+        if artnet_helper is not None:
+            index[fixture[CONF_FIXTURE_ID]] = (fixture, artnet_helper)
+    for fixtures in domain_data.get(DATA_ENTRY_FIXTURES, {}).values():
+        for fixture, artnet_helper in fixtures:
+            index[fixture[CONF_FIXTURE_ID]] = (fixture, artnet_helper)
+    return index
+
+
+def resolve_fixture_channel_values(
+    fixture: dict[str, Any],
+    fixture_def: dict[str, Any],
+    values: dict[Any, Any],
+) -> dict[int, int]:
+    """
+    Translate fixture-relative channel values into absolute DMX channel values.
+
+    Channels are addressed by mapping name (`dim`), by 1-based offset, or by
+    the base name of a 16-bit pair (`pan`, taking 0-65535). Channels with a
+    `value_map` also accept one of its labels. Raises `HomeAssistantError`
+    naming the fixture on the first invalid address or value.
+    """
+    fixture_id = fixture[CONF_FIXTURE_ID]
+    start_channel = int(fixture[CONF_START_CHANNEL])
+    channel_count = int(fixture[CONF_CHANNEL_COUNT])
+    channels = fixture_def.get("channels", [])
+    name_map = {channel.get("name"): channel for channel in channels}
+    offset_map = {int(channel["offset"]): channel for channel in channels}
+
+    resolved: dict[int, int] = {}
+    for key, value in values.items():
+        if isinstance(key, int) or str(key).isdigit():
+            offset = int(key)
+            if not 1 <= offset <= channel_count:
+                msg = (
+                    f"Fixture {fixture_id} has no channel offset {offset} "
+                    f"(1..{channel_count})"
+                )
+                raise HomeAssistantError(msg)
+            channel_def = offset_map.get(offset, {})
+        elif key in name_map:
+            channel_def = name_map[key]
+            offset = int(channel_def["offset"])
+        elif f"{key}_msb" in name_map and f"{key}_lsb" in name_map:
+            if not isinstance(value, int) or not 0 <= value <= 65535:
+                msg = (
+                    f"Fixture {fixture_id} channel '{key}' takes 0..65535, got {value}"
+                )
+                raise HomeAssistantError(msg)
+            msb_offset = int(name_map[f"{key}_msb"]["offset"])
+            lsb_offset = int(name_map[f"{key}_lsb"]["offset"])
+            resolved[absolute_channel(start_channel, msb_offset)] = (value >> 8) & 0xFF
+            resolved[absolute_channel(start_channel, lsb_offset)] = value & 0xFF
+            continue
+        else:
+            msg = f"Fixture {fixture_id} has no channel '{key}'"
+            raise HomeAssistantError(msg)
+
+        try:
+            if isinstance(value, str):
+                value = value_from_label(channel_def.get("value_map", {}), value)
+            resolved[absolute_channel(start_channel, offset)] = validate_dmx_value(
+                value
+            )
+        except HomeAssistantError as err:
+            msg = f"Fixture {fixture_id} channel '{key}': {err}"
+            raise HomeAssistantError(msg) from err
+    return resolved
+
+
 def fixture_channels(entry_or_data: Any) -> list[int]:
     """Return all absolute channels belonging to a fixture entry."""
     data = entry_or_data.data if hasattr(entry_or_data, "data") else entry_or_data
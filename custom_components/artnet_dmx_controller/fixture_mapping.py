@@ -13,6 +13,8 @@ import json
 import os
 from typing import Any
 
+from .const import PIXEL_COMPONENTS
+
 try:
     from homeassistant.exceptions import HomeAssistantError
 except Exception:  # pragma: no cover - allow running tests outside HA
@@ -80,6 +82,17 @@ def _validate_fixture_mapping(data: Any) -> None:
         if not isinstance(channel_count, int) or channel_count <= 0:
             raise HomeAssistantError(f"Fixture '{fixture_key}' has invalid 'channel_count' (must be positive integer)")
 
+        for range_key in ("pan_range", "tilt_range"):
+            if range_key in fixture_def and (
+                isinstance(fixture_def[range_key], bool)
+                or not isinstance(fixture_def[range_key], (int, float))
+                or fixture_def[range_key] <= 0
+            ):
+                raise HomeAssistantError(
+                    f"Fixture '{fixture_key}' has invalid '{range_key}' "
+                    "(must be a positive number of degrees)"
+                )
+
         if "channels" not in fixture_def:
             raise HomeAssistantError(f"Fixture '{fixture_key}' missing required 'channels' array")
         channels = fixture_def["channels"]
@@ -114,6 +127,52 @@ def _validate_fixture_mapping(data: Any) -> None:
                     f"Fixture '{fixture_key}' channel '{ch.get('name')}' 'hidden_by_default' must be boolean"
                 )
 
+        if "pixel_count" in fixture_def:
+            _validate_pixels(fixture_key, fixture_def, seen_offsets)
+
+
+def _validate_pixels(
+    fixture_key: str, fixture_def: dict[str, Any], named_offsets: set[int]
+) -> None:
+    """Validate the pixel block of a pixel fixture profile."""
+    pixel_count = fixture_def["pixel_count"]
+    if (
+        isinstance(pixel_count, bool)
+        or not isinstance(pixel_count, int)
+        or pixel_count <= 0
+    ):
+        raise HomeAssistantError(
+            f"Fixture '{fixture_key}' has invalid 'pixel_count' "
+            "(must be positive integer)"
+        )
+    order = fixture_def.get("pixel_order")
+    if (
+        not isinstance(order, str)
+        or len(set(order)) != len(order)
+        or not set("rgb") <= set(order) <= set(PIXEL_COMPONENTS)
+    ):
+        raise HomeAssistantError(
+            f"Fixture '{fixture_key}' has invalid 'pixel_order' "
+            "(each of r, g, b and optionally w, once)"
+        )
+    first = fixture_def.get("pixel_offset", 1)
+    last = first + pixel_count * len(order) - 1 if isinstance(first, int) else 0
+    if (
+        isinstance(first, bool)
+        or not isinstance(first, int)
+        or first < 1
+        or last > fixture_def["channel_count"]
+    ):
+        raise HomeAssistantError(
+            f"Fixture '{fixture_key}' pixels do not fit its channels "
+            f"(offsets {first}..{last}, channel_count {fixture_def['channel_count']})"
+        )
+    overlap = sorted(offset for offset in named_offsets if first <= offset <= last)
+    if overlap:
+        raise HomeAssistantError(
+            f"Fixture '{fixture_key}' channel offset {overlap[0]} overlaps its pixels"
+        )
+
 
 __all__ = ["HomeAssistantError", "load_fixture_mapping"]
 
@@ -0,0 +1,185 @@
+"""
+Flight recorder of the frames sent to every universe.
+
+While enabled, every universe helper keeps a `FlightRecorder`: a ring of the
+last N frames it handed to the socket (or to the output thread), with the
+wall-clock time of each. The ring is allocated once and overwritten in place,
+so recording a frame is one 512-byte copy and one float store.
+
+`dump_flight_recorder` writes every ring, oldest frame first, to one compact
+binary file for offline analysis. The file starts with a header (the
+`FILE_HEADER` struct: magic, version and universe count). Each universe
+follows as a `UNIVERSE_HEADER` (target IP, universe, frame count) and its
+frames, each a little-endian double timestamp and the 512 channel values.
+`read_flight_recording` parses it back.
+"""
+
+from __future__ import annotations
+
+import struct
+import time
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .const import (
+    DATA_FLIGHT_RECORDER,
+    DATA_SHARED_HELPERS,
+    DMX_CHANNELS,
+    DOMAIN,
+    LOGGER,
+)
+from .fixture_mapping import HomeAssistantError
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .artnet import ArtNetDMXHelper
+
+DEFAULT_RECORDED_FRAMES = 400  # ten seconds at 40 frames per second
+MAX_RECORDED_FRAMES = 12000  # five minutes at 40 frames per second, ~6 MB per universe
+DEFAULT_RECORDING_FILE = "artnet_dmx_flight_recording.bin"
+
+MAGIC = b"ADMXFR"
+VERSION = 1
+FILE_HEADER = struct.Struct("<6sHH")  # magic, version, universe count
+UNIVERSE_HEADER = struct.Struct("<16sHI")  # target IP, universe, frame count
+TIMESTAMP = struct.Struct("<d")  # Unix time the frame was sent
+
+
+class FlightRecorder:
+    """Preallocated ring of the last frames sent to one universe."""
+
+    def __init__(self, frames: int = DEFAULT_RECORDED_FRAMES) -> None:
+        self.capacity = frames
+        self._frames = bytearray(frames * DMX_CHANNELS)
+        self._view = memoryview(self._frames)
+        self._times = array("d", bytes(8 * frames))
+        self._next = 0
+        self.recorded = 0
+
+    def record(self, packet: bytes, offset: int = 0) -> None:
+        """Copy the 512 channel values at `offset` of a packet over the oldest frame."""
+        position = self._next
+        start = position * DMX_CHANNELS
+        self._view[start : start + DMX_CHANNELS] = packet[
+            offset : offset + DMX_CHANNELS
+        ]
+        self._times[position] = time.time()
+        self._next = position + 1 if position + 1 < self.capacity else 0
+        self.recorded += 1
+
+    def __len__(self) -> int:
+        return min(self.recorded, self.capacity)
+
+    def snapshot(self) -> tuple[bytes, bytes]:
+        """Return the timestamps and frames, oldest first, as packed bytes."""
+        if self.recorded < self.capacity:
+            return self._times[: self._next].tobytes(), bytes(
+                self._view[: self._next * DMX_CHANNELS]
+            )
+        split = self._next * DMX_CHANNELS
+        return (
+            self._times[self._next :].tobytes() + self._times[: self._next].tobytes(),
+            bytes(self._view[split:]) + bytes(self._view[:split]),
+        )
+
+
+def attach_recorder(hass: HomeAssistant, artnet_helper: ArtNetDMXHelper) -> None:
+    """Record a new helper's frames while the flight recorder is enabled."""
+    frames = hass.data.get(DOMAIN, {}).get(DATA_FLIGHT_RECORDER)
+    artnet_helper.recorder = FlightRecorder(frames) if frames else None
+
+
+def async_set_flight_recorder(
+    hass: HomeAssistant, enabled: bool, frames: int = DEFAULT_RECORDED_FRAMES
+) -> None:
+    """
+    Record the last `frames` frames of every universe, or stop and drop them.
+
+    Changing `frames` while enabled starts new, empty rings.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if enabled and domain_data.get(DATA_FLIGHT_RECORDER) == frames:
+        return
+    if enabled:
+        domain_data[DATA_FLIGHT_RECORDER] = frames
+    else:
+        domain_data.pop(DATA_FLIGHT_RECORDER, None)
+    for artnet_helper in domain_data.get(DATA_SHARED_HELPERS, {}).values():
+        attach_recorder(hass, artnet_helper)
+    if enabled:
+        LOGGER.info(
+            "Flight recorder keeps the last %s frames of every universe", frames
+        )
+    else:
+        LOGGER.info("Flight recorder stopped")
+
+
+async def async_dump_flight_recorder(
+    hass: HomeAssistant, file_path: str
+) -> dict[str, Any]:
+    """Write the recorded frames to `file_path` and return what was written."""
+    if not hass.data.get(DOMAIN, {}).get(DATA_FLIGHT_RECORDER):
+        msg = "The flight recorder is not enabled"
+        raise HomeAssistantError(msg)
+    # Copy the rings in the event loop, where frames are recorded, so no frame is torn.
+    universes = [
+        (
+            target_ip,
+            universe,
+            len(artnet_helper.recorder),
+            *artnet_helper.recorder.snapshot(),
+        )
+        for (target_ip, universe), artnet_helper in sorted(
+            hass.data[DOMAIN].get(DATA_SHARED_HELPERS, {}).items()
+        )
+        if getattr(artnet_helper, "recorder", None) is not None
+    ]
+    await hass.async_add_executor_job(write_flight_recording, file_path, universes)
+    return {
+        "file": file_path,
+        "universes": len(universes),
+        "frames": sum(count for _ip, _universe, count, _times, _frames in universes),
+    }
+
+
+def write_flight_recording(
+    file_path: str, universes: list[tuple[str, int, int, bytes, bytes]]
+) -> None:
+    """Write `(target_ip, universe, count, times, frames)` snapshots to a file."""
+    with Path(file_path).open("wb") as recording:
+        recording.write(FILE_HEADER.pack(MAGIC, VERSION, len(universes)))
+        for target_ip, universe, count, times, frames in universes:
+            recording.write(UNIVERSE_HEADER.pack(target_ip.encode(), universe, count))
+            for index in range(count):
+                recording.write(
+                    times[index * TIMESTAMP.size : (index + 1) * TIMESTAMP.size]
+                )
+                recording.write(
+                    frames[index * DMX_CHANNELS : (index + 1) * DMX_CHANNELS]
+                )
+
+
+def read_flight_recording(
+    file_path: str,
+) -> dict[tuple[str, int], list[tuple[float, bytes]]]:
+    """Return each universe's `(timestamp, frame)` pairs, oldest first."""
+    data = Path(file_path).read_bytes()
+    magic, version, universe_count = FILE_HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        msg = f"{file_path} is not a version {VERSION} flight recording"
+        raise ValueError(msg)
+    offset = FILE_HEADER.size
+    recording: dict[tuple[str, int], list[tuple[float, bytes]]] = {}
+    for _universe in range(universe_count):
+        target_ip, universe, count = UNIVERSE_HEADER.unpack_from(data, offset)
+        offset += UNIVERSE_HEADER.size
+        frames = []
+        for _frame in range(count):
+            (timestamp,) = TIMESTAMP.unpack_from(data, offset)
+            offset += TIMESTAMP.size
+            frames.append((timestamp, data[offset : offset + DMX_CHANNELS]))
+            offset += DMX_CHANNELS
+        recording[(target_ip.rstrip(b"\0").decode(), universe)] = frames
+    return recording
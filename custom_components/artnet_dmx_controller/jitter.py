@@ -0,0 +1,58 @@
+"""
+Jitter statistics of periodic work.
+
+`JitterStats` keeps running statistics of how far the intervals between the
+cycles of a periodic task stray from its nominal period, without storing
+samples. The output thread records its send cycles in it and the loop lag
+monitor the ticks of the event-loop tickers.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+# A cycle starting later than this fraction of a period counts as late.
+LATE_FRACTION = 0.5
+
+
+class JitterStats:
+    """Running statistics of cycle intervals against a nominal period."""
+
+    def __init__(self, period: float) -> None:
+        self.period = period
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every recorded interval."""
+        self.cycles = 0
+        self.late = 0
+        self.skipped = 0
+        self.max_jitter = 0.0
+        self._mean = 0.0
+        self._squares = 0.0
+
+    def record(self, interval: float) -> None:
+        """Record the time between two consecutive cycles."""
+        jitter = abs(interval - self.period)
+        self.cycles += 1
+        if jitter > self.period * LATE_FRACTION:
+            self.late += 1
+        self.max_jitter = max(self.max_jitter, jitter)
+        # Welford's update keeps the mean and variance without storing samples.
+        delta = jitter - self._mean
+        self._mean += delta / self.cycles
+        self._squares += delta * (jitter - self._mean)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics in milliseconds."""
+        deviation = math.sqrt(self._squares / self.cycles) if self.cycles else 0.0
+        return {
+            "period_ms": round(self.period * 1000, 3),
+            "cycles": self.cycles,
+            "late": self.late,
+            "skipped": self.skipped,
+            "mean_jitter_ms": round(self._mean * 1000, 3),
+            "max_jitter_ms": round(self.max_jitter * 1000, 3),
+            "stdev_jitter_ms": round(deviation * 1000, 3),
+        }
@@ -2,17 +2,42 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import TYPE_CHECKING, Any, ClassVar
 
-from homeassistant.components.light import ATTR_BRIGHTNESS, ATTR_RGB_COLOR, LightEntity
+from homeassistant.components.light import (
+    ATTR_BRIGHTNESS,
+    ATTR_RGB_COLOR,
+    ATTR_RGBW_COLOR,
+    LightEntity,
+)
 from homeassistant.components.light.const import ColorMode
 from homeassistant.helpers.device_registry import DeviceInfo
 
+from .buffer import concat_indices, tiled_values
 from .channel_math import absolute_channel, clamp_dmx_value
-from .const import CONF_FIXTURE_ID, CONF_FIXTURE_TYPE, CONF_NAME, CONF_START_CHANNEL, DOMAIN, LOGGER
+from .channel_state import ChannelStateMixin
+from .compiled_fixture import CompiledFixture, compile_fixture
+from .const import (
+    CONF_FIXTURE_ID,
+    CONF_FIXTURE_TYPE,
+    CONF_MEMBERS,
+    CONF_NAME,
+    CONF_START_CHANNEL,
+    DOMAIN,
+    LOGGER,
+)
 from .dmx_writer import DMXWriter
-from .entry_fixtures import get_fixture_entry
+from .entry_fixtures import (
+    fixture_device_key,
+    is_rig_entry,
+    runtime_fixtures,
+    runtime_group_members,
+)
 from .fixture_mapping import HomeAssistantError, load_fixture_mapping
+from .pixels import PixelMap, pixel_pattern
+from .state_throttle import ThrottledStateMixin
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -22,6 +47,16 @@ if TYPE_CHECKING:
     from .artnet import ArtNetDMXHelper
 
 
+_RGB_CHANNELS = ("red", "green", "blue")
+
+
+def _traced_at(artnet_helper: ArtNetDMXHelper) -> float | None:
+    """Return the time a call started while latency tracing is enabled, else None."""
+    if getattr(artnet_helper, "tracer", None) is None:
+        return None
+    return time.monotonic()
+
+
 def _humanize(text: str | None) -> str | None:
     """Convert underscore-separated text to title case."""
     if not text:
@@ -34,93 +69,23 @@ async def async_setup_entry(
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up ArtNet DMX light entities from one fixture entry."""
-    artnet_helper: ArtNetDMXHelper = hass.data[DOMAIN][entry.entry_id]
-    dmx_writer = DMXWriter(artnet_helper)
+    """Set up ArtNet DMX light entities for the fixtures of one entry."""
     entities: list[LightEntity] = []
+    writers: dict[int, DMXWriter] = {}
 
     try:
-        fixture = get_fixture_entry(entry)
         mapping = load_fixture_mapping()
-        fixture_type = fixture[CONF_FIXTURE_TYPE]
-        start_channel = int(fixture[CONF_START_CHANNEL])
-        fixture_id = fixture[CONF_FIXTURE_ID]
-        fixture_def = mapping.get("fixtures", {}).get(fixture_type)
-        if not fixture_def:
-            LOGGER.warning("Fixture type %s not found for entry %s", fixture_type, entry.entry_id)
-            return
-
-        fixture_label = (
-            fixture.get(CONF_NAME)
-            or fixture_def.get("label")
-            or getattr(entry, "title", None)
-            or fixture_type
-            or entry.entry_id
-        )
-        channels = fixture_def.get("channels", [])
-        fixture_specie = fixture_def.get("fixture_specie")
-        name_map = {channel.get("name"): channel for channel in channels}
-
-        rgb_group = None
-        if all(name in name_map for name in ("red", "green", "blue")):
-            rgb_group = {
-                "red": int(name_map["red"]["offset"]),
-                "green": int(name_map["green"]["offset"]),
-                "blue": int(name_map["blue"]["offset"]),
-                "dim": int(name_map["dim"]["offset"]) if "dim" in name_map else None,
-            }
-
-        bit16_pairs: dict[str, tuple[int, int]] = {}
-        for name, channel_def in name_map.items():
-            if not name or not name.endswith("_msb"):
-                continue
-            base_name = name[:-4]
-            lsb_name = f"{base_name}_lsb"
-            if lsb_name in name_map:
-                bit16_pairs[base_name] = (int(channel_def["offset"]), int(name_map[lsb_name]["offset"]))
-
-        handled_offsets: set[int] = set()
-
-        for msb_offset, lsb_offset in bit16_pairs.values():
-            handled_offsets.update({msb_offset, lsb_offset})
-
-        if fixture_specie == "parcan" and rgb_group is not None:
-            handled_offsets.update({rgb_group["red"], rgb_group["green"], rgb_group["blue"]})
-            if rgb_group["dim"] is not None:
-                handled_offsets.add(rgb_group["dim"])
-            entities.append(
-                ArtNetDMXRGBLight(
-                    artnet_helper=artnet_helper,
-                    red_channel=absolute_channel(start_channel, rgb_group["red"]),
-                    green_channel=absolute_channel(start_channel, rgb_group["green"]),
-                    blue_channel=absolute_channel(start_channel, rgb_group["blue"]),
-                    dim_channel=(
-                        absolute_channel(start_channel, rgb_group["dim"])
-                        if rgb_group["dim"] is not None
-                        else None
-                    ),
-                    entry_id=entry.entry_id,
-                    fixture_id=fixture_id,
-                    channel_name=fixture_type,
-                    dmx_writer=dmx_writer,
-                    fixture_label=fixture_label,
-                )
-            )
-        elif fixture_specie == "moving_head" and "dim" in name_map:
-            dim_channel = name_map["dim"]
-            handled_offsets.add(int(dim_channel["offset"]))
-            entities.append(
-                ArtNetDMXLight(
-                    artnet_helper=artnet_helper,
-                    channel=absolute_channel(start_channel, int(dim_channel["offset"])),
-                    entry_id=entry.entry_id,
-                    fixture_id=fixture_id,
-                    channel_name=dim_channel.get("name"),
-                    hidden_by_default=bool(dim_channel.get("hidden_by_default", False)),
-                    dmx_writer=dmx_writer,
-                    fixture_label=fixture_label,
+        for fixture, artnet_helper in runtime_fixtures(hass, entry):
+            if id(artnet_helper) not in writers:
+                writers[id(artnet_helper)] = DMXWriter(artnet_helper)
+            entities.extend(
+                _fixture_light_entities(
+                    entry, fixture, mapping, artnet_helper, writers[id(artnet_helper)]
                 )
             )
+        members = runtime_group_members(hass, entry)
+        if members:
+            entities.extend(_group_light_entities(entry, members, mapping))
     except HomeAssistantError:
         LOGGER.exception("Failed to load fixture mapping for light platform")
 
@@ -128,7 +93,168 @@ async def async_setup_entry(
         async_add_entities(entities)
 
 
-class ArtNetDMXLight(LightEntity):
+def _fixture_light_entities(
+    entry: ConfigEntry,
+    fixture: dict[str, Any],
+    mapping: dict[str, Any],
+    artnet_helper: ArtNetDMXHelper,
+    dmx_writer: DMXWriter,
+) -> list[LightEntity]:
+    """Build the primary light entity for one fixture."""
+    entities: list[LightEntity] = []
+    fixture_type = fixture[CONF_FIXTURE_TYPE]
+    start_channel = int(fixture[CONF_START_CHANNEL])
+    fixture_id = fixture[CONF_FIXTURE_ID]
+    device_key = fixture_device_key(entry, fixture)
+    fixture_def = mapping.get("fixtures", {}).get(fixture_type)
+    if not fixture_def:
+        LOGGER.warning(
+            "Fixture type %s not found for entry %s", fixture_type, entry.entry_id
+        )
+        return entities
+
+    fixture_label = (
+        fixture.get(CONF_NAME)
+        or fixture_def.get("label")
+        or (None if is_rig_entry(entry) else getattr(entry, "title", None))
+        or fixture_type
+        or entry.entry_id
+    )
+    channels = fixture_def.get("channels", [])
+    fixture_specie = fixture_def.get("fixture_specie")
+    if "pixel_count" in fixture_def:
+        compiled = CompiledFixture(fixture, fixture_def)
+        entities.append(
+            ArtNetDMXPixelLight(
+                pixel_map=PixelMap([(artnet_helper, compiled)]),
+                artnet_helper=artnet_helper,
+                fixture=compiled,
+                entry_id=entry.entry_id,
+                device_key=device_key,
+                fixture_label=fixture_label,
+            )
+        )
+        return entities
+    name_map = {channel.get("name"): channel for channel in channels}
+
+    rgb_group = None
+    if all(name in name_map for name in ("red", "green", "blue")):
+        rgb_group = {
+            "red": int(name_map["red"]["offset"]),
+            "green": int(name_map["green"]["offset"]),
+            "blue": int(name_map["blue"]["offset"]),
+            "dim": int(name_map["dim"]["offset"]) if "dim" in name_map else None,
+        }
+
+    bit16_pairs: dict[str, tuple[int, int]] = {}
+    for name, channel_def in name_map.items():
+        if not name or not name.endswith("_msb"):
+            continue
+        base_name = name[:-4]
+        lsb_name = f"{base_name}_lsb"
+        if lsb_name in name_map:
+            bit16_pairs[base_name] = (
+                int(channel_def["offset"]),
+                int(name_map[lsb_name]["offset"]),
+            )
+
+    handled_offsets: set[int] = set()
+
+    for msb_offset, lsb_offset in bit16_pairs.values():
+        handled_offsets.update({msb_offset, lsb_offset})
+
+    if fixture_specie == "parcan" and rgb_group is not None:
+        handled_offsets.update(
+            {rgb_group["red"], rgb_group["green"], rgb_group["blue"]}
+        )
+        if rgb_group["dim"] is not None:
+            handled_offsets.add(rgb_group["dim"])
+        entities.append(
+            ArtNetDMXRGBLight(
+                artnet_helper=artnet_helper,
+                red_channel=absolute_channel(start_channel, rgb_group["red"]),
+                green_channel=absolute_channel(start_channel, rgb_group["green"]),
+                blue_channel=absolute_channel(start_channel, rgb_group["blue"]),
+                dim_channel=(
+                    absolute_channel(start_channel, rgb_group["dim"])
+                    if rgb_group["dim"] is not None
+                    else None
+                ),
+                entry_id=entry.entry_id,
+                device_key=device_key,
+                fixture_id=fixture_id,
+                channel_name=fixture_type,
+                dmx_writer=dmx_writer,
+                fixture_label=fixture_label,
+            )
+        )
+    elif fixture_specie == "moving_head" and "dim" in name_map:
+        dim_channel = name_map["dim"]
+        handled_offsets.add(int(dim_channel["offset"]))
+        entities.append(
+            ArtNetDMXLight(
+                artnet_helper=artnet_helper,
+                channel=absolute_channel(start_channel, int(dim_channel["offset"])),
+                entry_id=entry.entry_id,
+                device_key=device_key,
+                fixture_id=fixture_id,
+                channel_name=dim_channel.get("name"),
+                hidden_by_default=bool(dim_channel.get("hidden_by_default", False)),
+                dmx_writer=dmx_writer,
+                fixture_label=fixture_label,
+            )
+        )
+    return entities
+
+
+def _group_light_entities(
+    entry: ConfigEntry,
+    members: list[tuple[dict[str, Any], ArtNetDMXHelper]],
+    mapping: dict[str, Any],
+) -> list[LightEntity]:
+    """Build the single light entity driving every member of a fixture group."""
+    dim_members: dict[int, list[CompiledFixture]] = {}
+    rgb_members: dict[int, list[CompiledFixture]] = {}
+    helpers: dict[int, ArtNetDMXHelper] = {}
+    first_member: tuple[ArtNetDMXHelper, CompiledFixture] | None = None
+    for fixture, artnet_helper in members:
+        compiled = compile_fixture(fixture, mapping)
+        if compiled is None or not (
+            compiled.has("dim") or compiled.has(*_RGB_CHANNELS)
+        ):
+            continue
+        helpers[id(artnet_helper)] = artnet_helper
+        first_member = first_member or (artnet_helper, compiled)
+        if compiled.has("dim"):
+            dim_members.setdefault(id(artnet_helper), []).append(compiled)
+        if compiled.has(*_RGB_CHANNELS):
+            rgb_members.setdefault(id(artnet_helper), []).append(compiled)
+
+    universes: list[tuple[ArtNetDMXHelper, Any, int, int]] = []
+    for helper_id, artnet_helper in helpers.items():
+        dims = dim_members.get(helper_id, [])
+        rgbs = rgb_members.get(helper_id, [])
+        indices = concat_indices(
+            [compiled.indices("dim") for compiled in dims]
+            + [compiled.indices(*_RGB_CHANNELS) for compiled in rgbs]
+        )
+        universes.append((artnet_helper, indices, len(dims), len(rgbs)))
+
+    if first_member is None:
+        return []
+    return [
+        ArtNetDMXGroupLight(
+            universes=universes,
+            first_member=first_member,
+            entry_id=entry.entry_id,
+            supports_rgb=bool(rgb_members),
+            group_label=entry.data.get(CONF_NAME) or entry.title,
+            member_count=len(entry.data.get(CONF_MEMBERS, [])),
+        )
+    ]
+
+
+class ArtNetDMXLight(ChannelStateMixin, LightEntity):
     """Representation of a single DMX light channel."""
 
     _attr_has_entity_name = True
@@ -146,6 +272,7 @@ class ArtNetDMXLight(LightEntity):
         hidden_by_default: bool = False,
         dmx_writer: DMXWriter | None = None,
         fixture_label: str | None = None,
+        device_key: str | None = None,
     ) -> None:
         self._artnet_helper = artnet_helper
         self._dmx_writer = dmx_writer
@@ -163,13 +290,17 @@ class ArtNetDMXLight(LightEntity):
             self._attr_name = f"DMX Channel {channel}"
         self._attr_entity_registry_enabled_default = not bool(hidden_by_default)
         self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
+            identifiers={(DOMAIN, device_key or entry_id)},
             name=fixture_label or f"{entry_id} Fixture",
         )
         self._attr_icon = "mdi:lightbulb"
-        initial_value = _channel_value(artnet_helper, channel)
-        self._is_on = initial_value > 0
-        self._brightness = initial_value
+        self._read_channels()
+
+    def _read_channels(self) -> None:
+        value = _channel_value(self._artnet_helper, self._channel)
+        self._is_on = value > 0
+        self._brightness = value
+        self._channel_values = {self._channel: value}
 
     @property
     def is_on(self) -> bool:
@@ -180,26 +311,32 @@ class ArtNetDMXLight(LightEntity):
         return self._brightness
 
     async def async_turn_on(self, **kwargs: Any) -> None:
+        traced_at = _traced_at(self._artnet_helper)
         brightness = kwargs.get(ATTR_BRIGHTNESS, 255)
         self._brightness = clamp_dmx_value(brightness)
         self._is_on = True
+        self._channel_values = {self._channel: int(self._brightness)}
         if self._dmx_writer is not None:
-            await self._dmx_writer.set_channel(self._channel, int(self._brightness))
+            await self._dmx_writer.set_channel(
+                self._channel, int(self._brightness), traced_at=traced_at
+            )
         else:
             await self._artnet_helper.set_channel(self._channel, int(self._brightness))
-        self.async_write_ha_state()
+        self.async_write_throttled_state()
 
     async def async_turn_off(self, **_kwargs: Any) -> None:
+        traced_at = _traced_at(self._artnet_helper)
         self._brightness = 0
         self._is_on = False
+        self._channel_values = {self._channel: 0}
         if self._dmx_writer is not None:
-            await self._dmx_writer.set_channel(self._channel, 0)
+            await self._dmx_writer.set_channel(self._channel, 0, traced_at=traced_at)
         else:
             await self._artnet_helper.set_channel(self._channel, 0)
-        self.async_write_ha_state()
+        self.async_write_throttled_state()
 
 
-class ArtNetDMXRGBLight(LightEntity):
+class ArtNetDMXRGBLight(ChannelStateMixin, LightEntity):
     """Composite RGB light backed by three DMX channels and optional dim channel."""
 
     _attr_has_entity_name = True
@@ -219,6 +356,7 @@ class ArtNetDMXRGBLight(LightEntity):
         channel_name: str | None = None,
         dmx_writer: DMXWriter | None = None,
         fixture_label: str | None = None,
+        device_key: str | None = None,
     ) -> None:
         self._artnet_helper = artnet_helper
         self._dmx_writer = dmx_writer
@@ -238,15 +376,25 @@ class ArtNetDMXRGBLight(LightEntity):
         else:
             self._attr_name = f"DMX RGB {self._red}"
         self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
+            identifiers={(DOMAIN, device_key or entry_id)},
             name=fixture_label or f"{entry_id} Fixture",
         )
         self._attr_icon = "mdi:led-strip-variant"
+        self._read_channels()
+
+    def _read_channels(self) -> None:
+        artnet_helper = self._artnet_helper
         red_value = _channel_value(artnet_helper, self._red)
         green_value = _channel_value(artnet_helper, self._green)
         blue_value = _channel_value(artnet_helper, self._blue)
+        self._channel_values = {
+            self._red: red_value,
+            self._green: green_value,
+            self._blue: blue_value,
+        }
         if self._dim is not None:
             self._brightness = _channel_value(artnet_helper, self._dim)
+            self._channel_values[self._dim] = self._brightness
         else:
             self._brightness = max(red_value, green_value, blue_value)
         self._rgb: tuple[int, int, int] = (red_value, green_value, blue_value)
@@ -265,6 +413,7 @@ class ArtNetDMXRGBLight(LightEntity):
         return self._rgb
 
     async def async_turn_on(self, **kwargs: Any) -> None:
+        traced_at = _traced_at(self._artnet_helper)
         rgb = kwargs.get(ATTR_RGB_COLOR)
         brightness = kwargs.get(ATTR_BRIGHTNESS)
 
@@ -284,33 +433,251 @@ class ArtNetDMXRGBLight(LightEntity):
         payload = {self._red: red, self._green: green, self._blue: blue}
         if self._dim is not None:
             payload[self._dim] = int(clamp_dmx_value(self._brightness))
+        self._channel_values = payload
 
         if self._dmx_writer is not None:
-            await self._dmx_writer.set_channels(payload)
+            await self._dmx_writer.set_channels(payload, traced_at=traced_at)
         else:
             for channel, value in payload.items():
                 await self._artnet_helper.set_channel(channel, value)
 
         self._is_on = True
-        try:
-            self.async_write_ha_state()
-        except RuntimeError:
-            pass
+        self.async_write_throttled_state()
 
     async def async_turn_off(self, **_kwargs: Any) -> None:
+        traced_at = _traced_at(self._artnet_helper)
         payload = {self._red: 0, self._green: 0, self._blue: 0}
         if self._dim is not None:
             payload[self._dim] = 0
+        self._channel_values = payload
         if self._dmx_writer is not None:
-            await self._dmx_writer.set_channels(payload)
+            await self._dmx_writer.set_channels(payload, traced_at=traced_at)
         else:
             for channel, value in payload.items():
                 await self._artnet_helper.set_channel(channel, value)
         self._is_on = False
-        try:
-            self.async_write_ha_state()
-        except RuntimeError:
-            pass
+        self.async_write_throttled_state()
+
+
+class ArtNetDMXGroupLight(ThrottledStateMixin, LightEntity):
+    """
+    Light driving every member of a fixture group with one write per universe.
+
+    Each universe's member channels are precompiled into one index array
+    (all `dim` channels, then all RGB triples), so a change is a single
+    vectorized scatter and one frame per universe instead of a service call
+    fanned out to every member light.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        universes: list[tuple[ArtNetDMXHelper, Any, int, int]],
+        first_member: tuple[ArtNetDMXHelper, CompiledFixture],
+        entry_id: str,
+        supports_rgb: bool = False,
+        group_label: str | None = None,
+        member_count: int = 0,
+    ) -> None:
+        self._universes = universes
+        self._attr_unique_id = f"{entry_id}_group_light"
+        self._attr_name = _humanize(group_label) or f"DMX Group {entry_id}"
+        if supports_rgb:
+            self._attr_color_mode = ColorMode.RGB
+            self._attr_supported_color_modes = {ColorMode.RGB}
+        else:
+            self._attr_color_mode = ColorMode.BRIGHTNESS
+            self._attr_supported_color_modes = {ColorMode.BRIGHTNESS}
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            name=group_label or f"{entry_id} Group",
+        )
+        self._attr_extra_state_attributes = {"member_count": member_count}
+        self._attr_icon = "mdi:lightbulb-group"
+        # Initial state follows the first member fixture.
+        first_helper, first_fixture = first_member
+        rgb_values = (
+            tuple(
+                _channel_value(first_helper, first_fixture.channels[name])
+                for name in _RGB_CHANNELS
+            )
+            if first_fixture.has(*_RGB_CHANNELS)
+            else (0, 0, 0)
+        )
+        self._rgb: tuple[int, int, int] = (
+            rgb_values if any(rgb_values) else (255, 255, 255)
+        )
+        self._brightness = (
+            _channel_value(first_helper, first_fixture.channels["dim"])
+            if first_fixture.has("dim")
+            else max(rgb_values)
+        )
+        self._is_on = self._brightness > 0
+
+    @property
+    def is_on(self) -> bool:
+        return self._is_on
+
+    @property
+    def brightness(self) -> int:
+        return self._brightness
+
+    @property
+    def rgb_color(self) -> tuple[int, int, int] | None:
+        if self._attr_color_mode != ColorMode.RGB:
+            return None
+        return self._rgb
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        rgb = kwargs.get(ATTR_RGB_COLOR)
+        brightness = kwargs.get(ATTR_BRIGHTNESS)
+
+        if brightness is not None:
+            self._brightness = clamp_dmx_value(int(brightness))
+        elif self._brightness == 0:
+            self._brightness = 255
+
+        if rgb is not None:
+            self._rgb = (int(rgb[0]), int(rgb[1]), int(rgb[2]))
+
+        scale = self._brightness / 255.0
+        scaled = tuple(
+            clamp_dmx_value(int(component * scale)) for component in self._rgb
+        )
+        await self._async_write_universes(int(self._brightness), scaled)
+        self._is_on = True
+        self.async_write_throttled_state()
+
+    async def async_turn_off(self, **_kwargs: Any) -> None:
+        await self._async_write_universes(0, (0, 0, 0))
+        self._is_on = False
+        self.async_write_throttled_state()
+
+    async def _async_write_universes(
+        self, dim_value: int, rgb_values: tuple[int, ...]
+    ) -> None:
+        """Scatter the whole group's payload with one write per universe."""
+        await asyncio.gather(
+            *(
+                artnet_helper.set_indexed(
+                    indices,
+                    tiled_values((((dim_value,), dim_count), (rgb_values, rgb_count))),
+                )
+                for artnet_helper, indices, dim_count, rgb_count in self._universes
+            )
+        )
+
+
+class ArtNetDMXPixelLight(ChannelStateMixin, LightEntity):
+    """
+    One light for every pixel of a pixel fixture.
+
+    The colour is filled into the fixture's pixel array and sent as one
+    vectorized write; per-pixel content comes from the `set_pixels` service.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        pixel_map: PixelMap,
+        artnet_helper: ArtNetDMXHelper,
+        fixture: CompiledFixture,
+        entry_id: str,
+        device_key: str | None = None,
+        fixture_label: str | None = None,
+    ) -> None:
+        self._pixel_map = pixel_map
+        self._artnet_helper = artnet_helper
+        self._rgbw = "w" in fixture.pixel_order
+        self._components = "rgbw" if self._rgbw else "rgb"
+        # Buffer channel of each component of the first pixel
+        order = fixture.pixel_order
+        self._first_pixel = dict(
+            zip(order, fixture.pixel_channels[: len(order)], strict=True)
+        )
+        self._attr_unique_id = f"{entry_id}_{fixture.fixture_id}_pixels"
+        self._attr_name = f"{_humanize(fixture_label) or fixture_label or 'DMX'} Pixels"
+        self._attr_color_mode = ColorMode.RGBW if self._rgbw else ColorMode.RGB
+        self._attr_supported_color_modes = {self._attr_color_mode}
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device_key or entry_id)},
+            name=fixture_label or f"{entry_id} Fixture",
+        )
+        self._attr_extra_state_attributes = {"pixel_count": fixture.pixel_count}
+        self._attr_icon = "mdi:led-strip-variant"
+        self._read_channels()
+
+    def _read_channels(self) -> None:
+        # State follows the first pixel.
+        first_pixel = {
+            component: _channel_value(self._artnet_helper, channel)
+            for component, channel in self._first_pixel.items()
+        }
+        color = tuple(first_pixel.get(component, 0) for component in self._components)
+        self._brightness = max(color)
+        self._color: tuple[int, ...] = color if any(color) else (255,) * len(color)
+        self._is_on = self._brightness > 0
+        self._channel_values = {
+            channel: first_pixel[component]
+            for component, channel in self._first_pixel.items()
+        }
+
+    def _write_first_pixel(self, color: list[int]) -> None:
+        """Remember the first pixel's channel values for a colour being written."""
+        written = dict(zip(self._components, color, strict=True))
+        self._channel_values = {
+            channel: written.get(component, 0)
+            for component, channel in self._first_pixel.items()
+        }
+
+    @property
+    def is_on(self) -> bool:
+        return self._is_on
+
+    @property
+    def brightness(self) -> int:
+        return self._brightness
+
+    @property
+    def rgb_color(self) -> tuple[int, int, int] | None:
+        return None if self._rgbw else self._color
+
+    @property
+    def rgbw_color(self) -> tuple[int, int, int, int] | None:
+        return self._color if self._rgbw else None
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        color = kwargs.get(ATTR_RGBW_COLOR if self._rgbw else ATTR_RGB_COLOR)
+        brightness = kwargs.get(ATTR_BRIGHTNESS)
+
+        if brightness is not None:
+            self._brightness = clamp_dmx_value(int(brightness))
+        elif self._brightness == 0:
+            self._brightness = 255
+
+        if color is not None:
+            self._color = tuple(int(component) for component in color)
+
+        scale = self._brightness / 255.0
+        scaled = [clamp_dmx_value(int(component * scale)) for component in self._color]
+        self._write_first_pixel(scaled)
+        await self._pixel_map.async_set_pixels(
+            pixel_pattern([scaled], len(self._pixel_map))
+        )
+        self._is_on = True
+        self.async_write_throttled_state()
+
+    async def async_turn_off(self, **_kwargs: Any) -> None:
+        self._write_first_pixel([0] * len(self._components))
+        await self._pixel_map.async_set_pixels(
+            pixel_pattern([(0, 0, 0)], len(self._pixel_map))
+        )
+        self._is_on = False
+        self.async_write_throttled_state()
 
 
 def _channel_value(artnet_helper: ArtNetDMXHelper, channel: int) -> int:
@@ -0,0 +1,322 @@
+"""
+Event-loop lag monitoring tied to DMX output health.
+
+Every time-based output (effects, motion filtering) is driven by a ticker on
+Home Assistant's event loop, so when the loop stalls frames stop and
+fixtures freeze or time out. The `LoopLagMonitor` has no timer of its own:
+it runs only while at least one ticker does, and each ticker reports its
+ticks to it. A tick arriving later than the ticker's period after the
+previous one was held up by the loop: the frame due then went out late and
+every period the stall swallowed was missed. Both are charged to the
+universes that ticker drives. The output thread keeps sending on its own
+clock, so it only posts a probe into the loop each cycle; probes measure
+lag but no universe misses frames to it.
+
+While any ticker runs, a watchdog thread notices a tick that is overdue and
+samples what the loop thread is executing at that moment, so the warning
+logged afterwards names the callback that held the loop. Statistics are
+published to the diagnostic sensors every `PUBLISH_INTERVAL` seconds, never
+per frame.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_LOOP_MONITOR, DOMAIN, LOGGER
+from .jitter import LATE_FRACTION, JitterStats
+
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Callable, Iterable
+
+    from homeassistant.core import HomeAssistant
+
+# Frame rate the lag statistics are kept against; every ticker runs at it by default.
+FRAME_RATE = 40
+
+# Lag at which a stall is logged; asyncio's own slow-callback threshold.
+LAG_WARNING = 0.1
+
+# Seconds between sensor updates, and at least between two stall warnings.
+PUBLISH_INTERVAL = 5.0
+WARNING_INTERVAL = 60.0
+
+# Innermost frames of the loop thread's stack kept as stall context.
+STACK_DEPTH = 8
+
+SIGNAL_LOOP_HEALTH = f"{DOMAIN}_loop_health"
+
+
+@dataclass
+class UniverseHealth:
+    """Frames one universe lost to event-loop stalls."""
+
+    missed: int = 0
+    late: int = 0
+    # Time of the last tick charged, so two tickers driving the universe never
+    # charge one stall twice.
+    charged_until: float = 0.0
+
+
+@dataclass
+class _Ticker:
+    """A running ticker's period, the universes it drives and when it last ticked."""
+
+    period: float
+    universes: Callable[[], Iterable[tuple[str, int]]]
+    last: float | None = None
+    probe_pending: bool = False
+
+
+class LoopLagMonitor:
+    """Measure event-loop lag from the output tickers; charge it to their universes."""
+
+    def __init__(
+        self, hass: HomeAssistant, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._hass = hass
+        self._clock = clock
+        self._period = 1.0 / FRAME_RATE
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._tickers: dict[str, _Ticker] = {}
+        self._cancel_stop: Callable[[], None] | None = None
+        # Lifetime lag statistics, the current window's and the last published window's.
+        self.stats = JitterStats(self._period)
+        self.window = JitterStats(self._period)
+        self.last_window = self.window.as_dict()
+        self.universes: dict[tuple[str, int], UniverseHealth] = {}
+        self.last_stall: dict[str, Any] | None = None
+        self._published = 0.0
+        self._warned: float | None = None
+        self._unreported = 0
+        # Watchdog state: the loop thread, the time of the last tick and the
+        # stack sampled while the next tick was overdue.
+        self._loop_thread: int | None = None
+        self._beat = 0.0
+        self._stall_context: tuple[float, str] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        """Return True while any ticker reports to the monitor."""
+        return bool(self._tickers)
+
+    @callback
+    def async_add_ticker(
+        self,
+        name: str,
+        rate: float,
+        universes: Callable[[], Iterable[tuple[str, int]]] = tuple,
+    ) -> None:
+        """
+        Measure a ticker running at `rate` and driving `universes()`.
+
+        The first ticker added starts the monitor.
+        """
+        if not self._tickers:
+            self._async_start()
+        self._tickers[name] = _Ticker(1.0 / rate, universes)
+
+    @callback
+    def async_remove_ticker(self, name: str) -> None:
+        """Stop measuring a ticker; the monitor stops with the last one."""
+        if self._tickers.pop(name, None) is not None and not self._tickers:
+            self._async_halt()
+
+    @callback
+    def tick(self, name: str) -> None:
+        """Measure how late a ticker's tick fired; called by it on every tick."""
+        ticker = self._tickers.get(name)
+        if ticker is None:
+            return
+        now = self._clock()
+        previous, ticker.last = ticker.last, now
+        previous_beat, self._beat = self._beat, now
+        if previous is None:
+            return
+        period = ticker.period
+        lag = max(now - previous - period, 0.0)
+        # A tick `lag` late ends an interval of one period plus the lag.
+        self.stats.record(self._period + lag)
+        self.window.record(self._period + lag)
+        missed = int(lag / period)
+        if missed:
+            self.stats.skipped += missed
+            self.window.skipped += missed
+        if lag > period * LATE_FRACTION:
+            charged = self._charge_universes(ticker, previous, now)
+            # Report a stall once, from the first tick of any ticker after it.
+            if lag >= LAG_WARNING and now - previous_beat >= LAG_WARNING:
+                self._report_stall(name, previous_beat, lag, missed, charged)
+        if now - self._published >= PUBLISH_INTERVAL:
+            self._publish(now)
+
+    def tick_threadsafe(self, name: str) -> None:
+        """Post a tick into the loop from another thread, at most one at a time."""
+        ticker = self._tickers.get(name)
+        loop = self._loop
+        if ticker is None or loop is None or ticker.probe_pending:
+            return
+        ticker.probe_pending = True
+        loop.call_soon_threadsafe(self._async_probe, name)
+
+    @callback
+    def _async_probe(self, name: str) -> None:
+        ticker = self._tickers.get(name)
+        if ticker is not None:
+            ticker.probe_pending = False
+            self.tick(name)
+
+    def _async_start(self) -> None:
+        self._loop = self._hass.loop
+        self._loop_thread = threading.get_ident()
+        self._beat = self._published = self._clock()
+        self._stall_context = None
+        self._stop = threading.Event()
+        self._watchdog = threading.Thread(
+            target=self._watch,
+            args=(self._stop,),
+            name="artnet-loop-watchdog",
+            daemon=True,
+        )
+        self._watchdog.start()
+        self._cancel_stop = self._hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_on_stop
+        )
+        LOGGER.debug("Event loop lag monitor started")
+
+    def _async_halt(self) -> None:
+        if self._cancel_stop is not None:
+            self._cancel_stop()
+            self._cancel_stop = None
+        self._stop_watchdog()
+        self._publish(self._clock())
+        LOGGER.debug("Event loop lag monitor stopped")
+
+    async def _async_on_stop(self, _event: Any) -> None:
+        self._cancel_stop = None
+        self._tickers.clear()
+        self._stop_watchdog()
+
+    def _stop_watchdog(self) -> None:
+        self._stop.set()
+        self._watchdog = None
+
+    def _publish(self, now: float) -> None:
+        self._published = now
+        self.last_window = self.window.as_dict()
+        self.window.reset()
+        async_dispatcher_send(self._hass, SIGNAL_LOOP_HEALTH)
+
+    def _charge_universes(
+        self, ticker: _Ticker, previous: float, now: float
+    ) -> list[tuple[str, int]]:
+        """Charge a late tick to its ticker's universes; return those charged."""
+        period = ticker.period
+        charged = []
+        for helper_key in ticker.universes():
+            health = self.universes.setdefault(helper_key, UniverseHealth())
+            # Frames another ticker already charged for this stall are not
+            # charged again.
+            lag = now - max(previous, health.charged_until) - period
+            health.charged_until = now
+            if lag > period * LATE_FRACTION:
+                health.late += 1
+                health.missed += int(lag / period)
+                charged.append(helper_key)
+        return charged
+
+    def _report_stall(
+        self,
+        ticker: str,
+        stalled_at: float,
+        lag: float,
+        missed: int,
+        universes: list[tuple[str, int]],
+    ) -> None:
+        """Remember a stall and log it, at most once per `WARNING_INTERVAL`."""
+        sampled = self._stall_context
+        context = (
+            sampled[1] if sampled is not None and sampled[0] == stalled_at else None
+        )
+        self.last_stall = {
+            "at": dt_util.utcnow().isoformat(),
+            "ticker": ticker,
+            "lag_ms": round(lag * 1000, 1),
+            "missed_frames": missed,
+            "universes": [
+                f"{target_ip}/{universe}" for target_ip, universe in sorted(universes)
+            ],
+            "context": context,
+        }
+        now = self._clock()
+        if self._warned is not None and now - self._warned < WARNING_INTERVAL:
+            self._unreported += 1
+            return
+        self._warned = now
+        suppressed, self._unreported = self._unreported, 0
+        LOGGER.warning(
+            "Event loop stalled for %.0f ms; %s %s frames missed on %s universes%s. "
+            "Loop was running:\n%s",
+            lag * 1000,
+            missed,
+            ticker,
+            len(universes),
+            f" ({suppressed} more stalls since the last warning)" if suppressed else "",
+            context or "  (not sampled)",
+        )
+
+    def _watch(self, stop: threading.Event) -> None:
+        """Sample the loop thread while a tick is overdue; runs in the watchdog."""
+        while not stop.wait(LAG_WARNING / 2):
+            self._sample_stall()
+
+    def _sample_stall(self) -> None:
+        """Keep the loop thread's stack if no tick arrived for `LAG_WARNING` seconds."""
+        beat = self._beat
+        sampled = self._stall_context
+        if self._clock() - beat < LAG_WARNING or (
+            sampled is not None and sampled[0] == beat
+        ):
+            return
+        frame = sys._current_frames().get(self._loop_thread)  # noqa: SLF001
+        if frame is not None:
+            self._stall_context = (
+                beat,
+                "".join(traceback.format_stack(frame, limit=STACK_DEPTH)),
+            )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return lifetime lag statistics, the running tickers and the last stall."""
+        return {
+            **self.stats.as_dict(),
+            "tickers": sorted(self._tickers),
+            "last_stall": self.last_stall,
+            "universes": {
+                f"{target_ip}/{universe}": {
+                    "missed_frames": health.missed,
+                    "late_frames": health.late,
+                }
+                for (target_ip, universe), health in self.universes.items()
+            },
+        }
+
+
+def lag_monitor(hass: HomeAssistant) -> LoopLagMonitor:
+    """Return the integration's loop lag monitor, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_LOOP_MONITOR not in domain_data:
+        domain_data[DATA_LOOP_MONITOR] = LoopLagMonitor(hass)
+    return domain_data[DATA_LOOP_MONITOR]
@@ -0,0 +1,118 @@
+"""
+Grand master and submaster levels.
+
+Masters never rewrite channel values. Each fixture gets one combined level
+(the product of every master covering it) that its universe compositor
+applies to the fixture's dimmer (or, without one, its colour channels) while
+building a frame, through precomputed 256-entry scale tables. Moving a master
+only recomputes the levels of the fixtures it covers and re-sends their
+universes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+from .compositor import scale_table
+from .const import CONF_FIXTURE_ID, DATA_MASTERS, DMX_MAX_VALUE, DOMAIN
+from .entry_fixtures import runtime_fixture_index
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+class MasterBoard:
+    """Levels of every loaded master and the fixtures each one covers."""
+
+    def __init__(self) -> None:
+        self._levels: dict[str, int] = {}
+        # Fixture ids per master; None for a grand master covering everything.
+        self._members: dict[str, frozenset[str] | None] = {}
+        # Called with the master id and level after every change (persists levels)
+        self.on_level_changed: Callable[[str, int], None] | None = None
+
+    def __contains__(self, master_id: object) -> bool:
+        return master_id in self._members
+
+    def add(
+        self, master_id: str, members: Iterable[str] | None, level: int = DMX_MAX_VALUE
+    ) -> None:
+        """Register a master; without members it is a grand master."""
+        members = frozenset(members or ())
+        self._members[master_id] = members or None
+        self._levels[master_id] = level
+
+    def remove(self, master_id: str) -> frozenset[str] | None:
+        """Forget a master and return the fixture ids it covered (None = all)."""
+        self._levels.pop(master_id, None)
+        return self._members.pop(master_id, None)
+
+    def level(self, master_id: str) -> int:
+        """Return a master's level (0-255)."""
+        return self._levels.get(master_id, DMX_MAX_VALUE)
+
+    def set_level(self, master_id: str, level: int) -> frozenset[str] | None:
+        """Set a master's level and return the fixture ids it covers (None = all)."""
+        if not 0 <= level <= DMX_MAX_VALUE:
+            msg = f"Level must be between 0 and {DMX_MAX_VALUE}, got {level}"
+            raise ValueError(msg)
+        self._levels[master_id] = level
+        if self.on_level_changed is not None:
+            self.on_level_changed(master_id, level)
+        return self._members.get(master_id)
+
+    def fixture_level(self, fixture_id: str) -> int:
+        """Return the combined level of every master covering a fixture."""
+        level = DMX_MAX_VALUE
+        for master_id, members in self._members.items():
+            if members is None or fixture_id in members:
+                level = scale_table(self._levels[master_id])[level]
+        return level
+
+
+def master_board(hass: HomeAssistant) -> MasterBoard:
+    """Return the integration's master board, creating it on first use."""
+    return hass.data.setdefault(DOMAIN, {}).setdefault(DATA_MASTERS, MasterBoard())
+
+
+def apply_master_levels(
+    board: MasterBoard,
+    fixtures: Iterable[tuple[dict[str, Any], Any]],
+) -> list[Any]:
+    """
+    Push combined master levels to the helpers of `(fixture, helper)` pairs.
+
+    Returns the distinct helpers touched; their next frame carries the levels.
+    """
+    helpers: dict[int, Any] = {}
+    for fixture, artnet_helper in fixtures:
+        if not hasattr(artnet_helper, "set_fixture_level"):
+            continue
+        fixture_id = fixture[CONF_FIXTURE_ID]
+        artnet_helper.set_fixture_level(fixture_id, board.fixture_level(fixture_id))
+        helpers[id(artnet_helper)] = artnet_helper
+    return list(helpers.values())
+
+
+async def async_apply_master_levels(
+    hass: HomeAssistant,
+    fixture_ids: Iterable[str] | None = None,
+) -> None:
+    """
+    Re-apply master levels to loaded fixtures and send one frame per universe.
+
+    Only the given fixture ids are updated; None updates every fixture.
+    """
+    index = runtime_fixture_index(hass)
+    if fixture_ids is not None:
+        index = {
+            fixture_id: index[fixture_id]
+            for fixture_id in fixture_ids
+            if fixture_id in index
+        }
+    helpers = apply_master_levels(master_board(hass), index.values())
+    await asyncio.gather(
+        *(artnet_helper.async_send_current_state() for artnet_helper in helpers)
+    )
@@ -0,0 +1,293 @@
+"""
+Pan/tilt motion smoothing.
+
+Fixtures with a smoothing time route their 16-bit `pan`/`tilt` pairs through
+the compositor's motion stage: whatever entities, services, groups or layers
+write becomes the pair's *target*, and on every output tick the filter moves
+the sent position towards it with a critically damped spring (no overshoot,
+settling in roughly the smoothing time). All filtered pairs of all universes
+are stepped together in one array operation per tick, and only universes
+whose positions changed send a frame.
+
+The ticker runs while any fixture is filtered, and reports its ticks to the
+loop lag monitor while it does.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .buffer import HAS_NUMPY, channel_indices, concat_indices, np
+from .const import DATA_MOTION_FILTER, DOMAIN, LOGGER
+from .loop_monitor import lag_monitor
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from homeassistant.core import HomeAssistant
+
+    from .artnet import ArtNetDMXHelper
+    from .compiled_fixture import CompiledFixture
+    from .loop_monitor import LoopLagMonitor
+
+MOTION_TICK_RATE = 40  # frames per second while fixtures are filtered
+LAG_TICKER = "motion"  # the ticker's name in the loop lag monitor
+
+# Pairs the filter smooths, by base name.
+MOTION_PAIRS = ("pan", "tilt")
+
+# Longest step taken after a stalled tick, in seconds.
+_MAX_STEP = 0.1
+_MAX_16BIT = 65535
+
+
+def motion_pairs(fixture: CompiledFixture) -> list[tuple[int, int]]:
+    """Return a fixture's `(msb, lsb)` channels of the pairs the filter smooths."""
+    return [fixture.pairs[name] for name in MOTION_PAIRS if name in fixture.pairs]
+
+
+class MotionFilter:
+    """Critically damped pan/tilt smoothing, stepped once per tick for all fixtures."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        use_numpy: bool = HAS_NUMPY,
+        monitor: LoopLagMonitor | None = None,
+    ) -> None:
+        self._hass = hass
+        # Measures event-loop lag from the ticks while the ticker runs.
+        self._monitor = monitor
+        self._numpy = bool(use_numpy and np is not None)
+        # fixture id -> (helper, channel pairs, smoothing time in seconds)
+        self._fixtures: dict[
+            str, tuple[ArtNetDMXHelper, list[tuple[int, int]], float]
+        ] = {}
+        # (helper, first row, pair count) per universe
+        self._universes: list[tuple[ArtNetDMXHelper, int, int]] = []
+        self._position: Any = []
+        self._velocity: Any = []
+        self._omega: Any = []
+        self._sent: Any = []
+        self._last_tick: float | None = None
+        self._cancel_ticker: Callable[[], None] | None = None
+        self._tick_lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Return True while the ticker runs."""
+        return self._cancel_ticker is not None
+
+    def smoothing(self, fixture_id: str) -> float:
+        """Return a fixture's smoothing time in seconds (0 when unfiltered)."""
+        filtered = self._fixtures.get(fixture_id)
+        return filtered[2] if filtered else 0.0
+
+    def set_smoothing(
+        self, artnet_helper: ArtNetDMXHelper, fixture: CompiledFixture, seconds: float
+    ) -> None:
+        """Filter a fixture's pan/tilt with a smoothing time, or stop with 0."""
+        pairs = motion_pairs(fixture)
+        if seconds > 0 and pairs:
+            self._fixtures[fixture.fixture_id] = (artnet_helper, pairs, float(seconds))
+        elif self._fixtures.pop(fixture.fixture_id, None) is None:
+            return
+        self._rebuild({id(artnet_helper): artnet_helper})
+
+    def remove(self, fixture_ids: Iterable[str]) -> None:
+        """Stop filtering fixtures, e.g. when their entry unloads."""
+        released = {}
+        for fixture_id in fixture_ids:
+            filtered = self._fixtures.pop(fixture_id, None)
+            if filtered is not None:
+                released[id(filtered[0])] = filtered[0]
+        if released:
+            self._rebuild(released)
+
+    async def async_tick(self, now: float | None = None) -> None:
+        """Step every filtered pair towards its target; send universes that moved."""
+        if self._tick_lock.locked() or not self._universes:
+            return
+        now = time.monotonic() if now is None else now
+        step = min(
+            max(now - (self._last_tick if self._last_tick is not None else now), 0.0),
+            _MAX_STEP,
+        )
+        self._last_tick = now
+        targets = self._targets()
+        if self._numpy:
+            sent = self._step_numpy(targets, step)
+        else:
+            sent = self._step_python(targets, step)
+        writes = []
+        for artnet_helper, first, count in self._universes:
+            rows = slice(first, first + count)
+            if self._numpy:
+                if np.array_equal(sent[rows], self._sent[rows]):
+                    continue
+                values = np.concatenate((sent[rows] >> 8, sent[rows] & 0xFF))
+            else:
+                if sent[rows] == self._sent[rows]:
+                    continue
+                values = [value >> 8 for value in sent[rows]] + [
+                    value & 0xFF for value in sent[rows]
+                ]
+            writes.append(artnet_helper.set_motion_values(values))
+        self._sent = sent
+        if writes:
+            async with self._tick_lock:
+                await asyncio.gather(*writes)
+
+    def _targets(self) -> Any:
+        """Return every pair's 16-bit target, read from its universe's last frame."""
+        parts = []
+        for artnet_helper, _first, count in self._universes:
+            raw = artnet_helper.motion_targets()
+            if self._numpy:
+                raw = np.asarray(raw, dtype=np.float64)
+                parts.append(raw[:count] * 256 + raw[count:])
+            else:
+                raw = [int(value) for value in raw]
+                parts.append([raw[row] << 8 | raw[count + row] for row in range(count)])
+        if self._numpy:
+            return np.concatenate(parts)
+        return [target for part in parts for target in part]
+
+    def _step_numpy(self, targets: Any, step: float) -> Any:
+        # Critically damped spring step, with a polynomial approximation of
+        # exp(-omega * step).
+        x = self._omega * step
+        decay = 1.0 / (1.0 + x + 0.48 * x * x + 0.235 * x * x * x)
+        change = self._position - targets
+        temp = (self._velocity + self._omega * change) * step
+        self._velocity = (self._velocity - self._omega * temp) * decay
+        self._position = targets + (change + temp) * decay
+        return np.clip(np.rint(self._position), 0, _MAX_16BIT).astype(np.int64)
+
+    def _step_python(self, targets: list[int], step: float) -> list[int]:
+        sent = []
+        for row, target in enumerate(targets):
+            omega = self._omega[row]
+            x = omega * step
+            decay = 1.0 / (1.0 + x + 0.48 * x * x + 0.235 * x * x * x)
+            change = self._position[row] - target
+            temp = (self._velocity[row] + omega * change) * step
+            self._velocity[row] = (self._velocity[row] - omega * temp) * decay
+            self._position[row] = target + (change + temp) * decay
+            sent.append(max(0, min(_MAX_16BIT, round(self._position[row]))))
+        return sent
+
+    def _rebuild(self, changed: dict[int, ArtNetDMXHelper]) -> None:
+        """
+        Recompile the per-universe motion channels and filter state.
+
+        Universes in `changed` restart from their current unfiltered output;
+        the others keep their position and velocity.
+        """
+        previous = {
+            id(artnet_helper): (first, count)
+            for artnet_helper, first, count in self._universes
+            if id(artnet_helper) not in changed
+        }
+        by_helper: dict[
+            int, tuple[ArtNetDMXHelper, list[tuple[int, int]], list[float]]
+        ] = {}
+        for artnet_helper, pairs, seconds in self._fixtures.values():
+            _helper, helper_pairs, omegas = by_helper.setdefault(
+                id(artnet_helper), (artnet_helper, [], [])
+            )
+            helper_pairs.extend(pairs)
+            # Less than 10 % of a step remains after `seconds`.
+            omegas.extend([4.0 / seconds] * len(pairs))
+
+        position: list[float] = []
+        velocity: list[float] = []
+        omega: list[float] = []
+        universes = []
+        for key, (artnet_helper, pairs, omegas) in by_helper.items():
+            if key not in previous:
+                indices = concat_indices(
+                    [
+                        channel_indices([msb for msb, _lsb in pairs], self._numpy),
+                        channel_indices([lsb for _msb, lsb in pairs], self._numpy),
+                    ]
+                )
+                artnet_helper.set_motion_channels(indices)
+                raw = [int(value) for value in artnet_helper.motion_targets()]
+                position.extend(
+                    float(raw[row] << 8 | raw[len(pairs) + row])
+                    for row in range(len(pairs))
+                )
+                velocity.extend([0.0] * len(pairs))
+            else:
+                first, count = previous[key]
+                position.extend(
+                    float(value) for value in self._position[first : first + count]
+                )
+                velocity.extend(
+                    float(value) for value in self._velocity[first : first + count]
+                )
+            universes.append((artnet_helper, len(omega), len(pairs)))
+            omega.extend(omegas)
+        for key, artnet_helper in changed.items():
+            if key not in by_helper:
+                artnet_helper.clear_motion_channels()
+
+        self._universes = universes
+        if self._numpy:
+            self._position = np.asarray(position, dtype=np.float64)
+            self._velocity = np.asarray(velocity, dtype=np.float64)
+            self._omega = np.asarray(omega, dtype=np.float64)
+            self._sent = np.clip(np.rint(self._position), 0, _MAX_16BIT).astype(
+                np.int64
+            )
+        else:
+            self._position, self._velocity, self._omega = position, velocity, omega
+            self._sent = [round(value) for value in position]
+        self._update_ticker()
+
+    def _helper_keys(self) -> list[tuple[str, int]]:
+        """Return the universes with filtered fixtures."""
+        return [
+            (helper.target_ip, helper.universe)
+            for helper, _first, _count in self._universes
+        ]
+
+    @callback
+    def _async_ticker(self, _now: Any) -> None:
+        if self._monitor is not None:
+            self._monitor.tick(LAG_TICKER)
+        self._hass.async_create_task(self.async_tick())
+
+    def _update_ticker(self) -> None:
+        """Run the ticker exactly while fixtures are filtered."""
+        if self._universes and self._cancel_ticker is None:
+            self._last_tick = None
+            self._cancel_ticker = async_track_time_interval(
+                self._hass, self._async_ticker, timedelta(seconds=1 / MOTION_TICK_RATE)
+            )
+            if self._monitor is not None:
+                self._monitor.async_add_ticker(
+                    LAG_TICKER, MOTION_TICK_RATE, self._helper_keys
+                )
+            LOGGER.debug("Motion filter ticker started")
+        elif not self._universes and self._cancel_ticker is not None:
+            self._cancel_ticker()
+            self._cancel_ticker = None
+            if self._monitor is not None:
+                self._monitor.async_remove_ticker(LAG_TICKER)
+            LOGGER.debug("Motion filter ticker stopped")
+
+
+def motion_filter(hass: HomeAssistant) -> MotionFilter:
+    """Return the integration's motion filter, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_MOTION_FILTER not in domain_data:
+        domain_data[DATA_MOTION_FILTER] = MotionFilter(hass, monitor=lag_monitor(hass))
+    return domain_data[DATA_MOTION_FILTER]
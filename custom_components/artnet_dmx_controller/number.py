@@ -2,17 +2,41 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+from typing import TYPE_CHECKING, Any
 
-from homeassistant.components.number import NumberEntity
+from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 
+from .buffer import channel_indices, tiled_values
 from .channel_math import absolute_channel
-from .const import CONF_FIXTURE_ID, CONF_FIXTURE_TYPE, CONF_NAME, CONF_START_CHANNEL, DOMAIN, LOGGER
+from .channel_state import ChannelStateMixin
+from .compiled_fixture import CompiledFixture, compile_fixtures
+from .const import (
+    CONF_FIXTURE_ID,
+    CONF_FIXTURE_TYPE,
+    CONF_MEMBERS,
+    CONF_NAME,
+    CONF_START_CHANNEL,
+    DOMAIN,
+    LOGGER,
+)
 from .dmx_writer import DMXWriter
-from .entry_fixtures import get_fixture_entry
+from .effects import effect_engine
+from .entry_fixtures import (
+    fixture_device_key,
+    is_master_entry,
+    is_rig_entry,
+    runtime_fixtures,
+    runtime_group_members,
+    with_fixture_smoothing,
+)
 from .fixture_mapping import HomeAssistantError, load_fixture_mapping
+from .masters import async_apply_master_levels, master_board
+from .motion import motion_filter, motion_pairs
+from .point_at import PointAtSolver, PointAtTarget
+from .state_throttle import ThrottledStateMixin
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -20,6 +44,22 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .artnet import ArtNetDMXHelper
+    from .effects import EffectControls
+    from .masters import MasterBoard
+    from .motion import MotionFilter
+
+
+# Channels driven by the group light rather than a group number.
+_GROUP_LIGHT_CHANNELS = frozenset({"dim", "red", "green", "blue"})
+
+
+# Effect parameters as (min, max, step, unit, icon) by name; size and spread
+# are percentages.
+_EFFECT_PARAMETERS = {
+    "speed": (0.05, 10.0, 0.05, "Hz", "mdi:speedometer"),
+    "size": (0, 100, 1, "%", "mdi:arrow-expand-vertical"),
+    "spread": (0, 100, 1, "%", "mdi:arrow-expand-horizontal"),
+}
 
 
 def _humanize(text: str | None) -> str | None:
@@ -33,105 +73,244 @@ async def async_setup_entry(
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up configuration number entities for one fixture entry."""
-    artnet_helper: ArtNetDMXHelper = hass.data[DOMAIN][entry.entry_id]
-    dmx_writer = DMXWriter(artnet_helper)
+    """Set up configuration number entities for the fixtures of one entry."""
     entities: list[NumberEntity] = []
+    writers: dict[int, DMXWriter] = {}
+
+    if is_master_entry(entry):
+        entities.append(
+            ArtNetDMXMasterNumber(
+                master_board(hass),
+                entry.entry_id,
+                entry.data.get(CONF_NAME) or entry.title,
+                is_grand_master=not entry.data.get(CONF_MEMBERS),
+            )
+        )
 
     try:
-        fixture = get_fixture_entry(entry)
         mapping = load_fixture_mapping()
-        fixture_type = fixture[CONF_FIXTURE_TYPE]
-        start_channel = int(fixture[CONF_START_CHANNEL])
-        fixture_id = fixture[CONF_FIXTURE_ID]
-        fixture_def = mapping.get("fixtures", {}).get(fixture_type)
-        if not fixture_def:
-            LOGGER.warning("Fixture type %s not found for entry %s", fixture_type, entry.entry_id)
-            return
-
-        fixture_label = (
-            fixture.get(CONF_NAME)
-            or fixture_def.get("label")
-            or getattr(entry, "title", None)
-            or fixture_type
-            or entry.entry_id
+        for fixture, artnet_helper in runtime_fixtures(hass, entry):
+            if id(artnet_helper) not in writers:
+                writers[id(artnet_helper)] = DMXWriter(artnet_helper)
+            entities.extend(
+                _fixture_number_entities(
+                    entry,
+                    fixture,
+                    mapping,
+                    artnet_helper,
+                    writers[id(artnet_helper)],
+                    motion_filter(hass),
+                )
+            )
+        members = runtime_group_members(hass, entry)
+        if members:
+            entities.extend(_group_number_entities(entry, members, mapping))
+            compiled = compile_fixtures(members, mapping)
+            group_label = entry.data.get(CONF_NAME) or entry.title
+            controls = effect_engine(hass).controls(entry.entry_id, compiled)
+            if controls.available:
+                entities.extend(
+                    ArtNetDMXGroupEffectNumber(
+                        controls, entry.entry_id, group_label, parameter
+                    )
+                    for parameter in _EFFECT_PARAMETERS
+                )
+            solver = PointAtSolver(compiled)
+            if len(solver):
+                target = PointAtTarget(solver)
+                entities.extend(
+                    ArtNetDMXGroupAimNumber(target, entry.entry_id, group_label, axis)
+                    for axis in "xyz"
+                )
+    except HomeAssistantError:
+        LOGGER.exception("Failed to load fixture mapping for number platform")
+
+    if entities:
+        async_add_entities(entities)
+
+
+def _fixture_number_entities(
+    entry: ConfigEntry,
+    fixture: dict[str, Any],
+    mapping: dict[str, Any],
+    artnet_helper: ArtNetDMXHelper,
+    dmx_writer: DMXWriter,
+    motion: MotionFilter | None = None,
+) -> list[NumberEntity]:
+    """Build the configuration number entities for one fixture."""
+    entities: list[NumberEntity] = []
+    fixture_type = fixture[CONF_FIXTURE_TYPE]
+    start_channel = int(fixture[CONF_START_CHANNEL])
+    fixture_id = fixture[CONF_FIXTURE_ID]
+    device_key = fixture_device_key(entry, fixture)
+    fixture_def = mapping.get("fixtures", {}).get(fixture_type)
+    if not fixture_def:
+        LOGGER.warning(
+            "Fixture type %s not found for entry %s", fixture_type, entry.entry_id
+        )
+        return entities
+
+    fixture_label = (
+        fixture.get(CONF_NAME)
+        or fixture_def.get("label")
+        or (None if is_rig_entry(entry) else getattr(entry, "title", None))
+        or fixture_type
+        or entry.entry_id
+    )
+    channels = fixture_def.get("channels", [])
+    fixture_specie = fixture_def.get("fixture_specie")
+    name_map = {channel.get("name"): channel for channel in channels}
+    handled_offsets: set[int] = set()
+
+    rgb_offsets: set[int] = set()
+    if fixture_specie == "parcan" and all(
+        name in name_map for name in ("red", "green", "blue")
+    ):
+        rgb_offsets = {
+            int(name_map["red"]["offset"]),
+            int(name_map["green"]["offset"]),
+            int(name_map["blue"]["offset"]),
+        }
+        if "dim" in name_map:
+            rgb_offsets.add(int(name_map["dim"]["offset"]))
+
+    moving_head_primary_offset = None
+    if fixture_specie == "moving_head" and "dim" in name_map:
+        moving_head_primary_offset = int(name_map["dim"]["offset"])
+
+    for name, channel_def in name_map.items():
+        if not name or not name.endswith("_msb"):
+            continue
+        base_name = name[:-4]
+        lsb_name = f"{base_name}_lsb"
+        if lsb_name not in name_map:
+            continue
+        handled_offsets.update(
+            {int(channel_def["offset"]), int(name_map[lsb_name]["offset"])}
         )
-        channels = fixture_def.get("channels", [])
-        fixture_specie = fixture_def.get("fixture_specie")
-        name_map = {channel.get("name"): channel for channel in channels}
-        handled_offsets: set[int] = set()
-
-        rgb_offsets: set[int] = set()
-        if fixture_specie == "parcan" and all(name in name_map for name in ("red", "green", "blue")):
-            rgb_offsets = {
-                int(name_map["red"]["offset"]),
-                int(name_map["green"]["offset"]),
-                int(name_map["blue"]["offset"]),
-            }
-            if "dim" in name_map:
-                rgb_offsets.add(int(name_map["dim"]["offset"]))
-
-        moving_head_primary_offset = None
-        if fixture_specie == "moving_head" and "dim" in name_map:
-            moving_head_primary_offset = int(name_map["dim"]["offset"])
 
-        for name, channel_def in name_map.items():
-            if not name or not name.endswith("_msb"):
-                continue
-            base_name = name[:-4]
-            lsb_name = f"{base_name}_lsb"
-            if lsb_name not in name_map:
-                continue
-            handled_offsets.update({int(channel_def["offset"]), int(name_map[lsb_name]["offset"])})
+        entities.append(
+            ArtNetDMX16BitNumber(
+                artnet_helper=artnet_helper,
+                dmx_writer=dmx_writer,
+                msb_channel=absolute_channel(start_channel, int(channel_def["offset"])),
+                lsb_channel=absolute_channel(
+                    start_channel, int(name_map[lsb_name]["offset"])
+                ),
+                entry_id=entry.entry_id,
+                device_key=device_key,
+                fixture_id=fixture_id,
+                channel_name=base_name,
+                hidden_by_default=bool(
+                    channel_def.get("hidden_by_default", False)
+                    or name_map[lsb_name].get("hidden_by_default", False)
+                ),
+                fixture_label=fixture_label,
+            )
+        )
 
+    if motion is not None and hasattr(artnet_helper, "set_motion_channels"):
+        compiled = CompiledFixture(fixture, fixture_def)
+        if motion_pairs(compiled):
             entities.append(
-                ArtNetDMX16BitNumber(
-                    artnet_helper=artnet_helper,
-                    dmx_writer=dmx_writer,
-                    msb_channel=absolute_channel(start_channel, int(channel_def["offset"])),
-                    lsb_channel=absolute_channel(start_channel, int(name_map[lsb_name]["offset"])),
-                    entry_id=entry.entry_id,
-                    fixture_id=fixture_id,
-                    channel_name=base_name,
-                    hidden_by_default=bool(
-                        channel_def.get("hidden_by_default", False)
-                        or name_map[lsb_name].get("hidden_by_default", False)
-                    ),
-                    fixture_label=fixture_label,
+                ArtNetDMXMotionSmoothingNumber(
+                    motion, artnet_helper, compiled, entry, device_key, fixture_label
                 )
             )
 
-        for channel in channels:
-            offset = int(channel["offset"])
-            if offset in handled_offsets:
-                continue
-            if "value_map" in channel:
-                continue
-            if offset in rgb_offsets:
+    for channel in channels:
+        offset = int(channel["offset"])
+        if offset in handled_offsets:
+            continue
+        if "value_map" in channel:
+            continue
+        if offset in rgb_offsets:
+            continue
+        if (
+            moving_head_primary_offset is not None
+            and offset == moving_head_primary_offset
+        ):
+            continue
+
+        entities.append(
+            ArtNetDMXNumber(
+                artnet_helper=artnet_helper,
+                dmx_writer=dmx_writer,
+                channel=absolute_channel(start_channel, offset),
+                entry_id=entry.entry_id,
+                device_key=device_key,
+                fixture_id=fixture_id,
+                channel_name=channel.get("name"),
+                hidden_by_default=bool(channel.get("hidden_by_default", False)),
+                fixture_label=fixture_label,
+            )
+        )
+    return entities
+
+
+def _group_number_entities(
+    entry: ConfigEntry,
+    members: list[tuple[dict[str, Any], ArtNetDMXHelper]],
+    mapping: dict[str, Any],
+) -> list[NumberEntity]:
+    """
+    Build one number entity per channel shared by every member of a group.
+
+    16-bit pairs are matched by their base name (`pan`, `tilt`). Channels the
+    group light drives and `value_map` channels are left out.
+    """
+    shared: dict[str, list[tuple[ArtNetDMXHelper, int, int | None]]] | None = None
+    for fixture, artnet_helper in members:
+        fixture_def = mapping.get("fixtures", {}).get(fixture[CONF_FIXTURE_TYPE])
+        if not fixture_def:
+            continue
+        start_channel = int(fixture[CONF_START_CHANNEL])
+        name_map = {
+            channel.get("name"): channel for channel in fixture_def.get("channels", [])
+        }
+        fixture_channels: dict[str, tuple[int, int | None]] = {}
+        for name, channel_def in name_map.items():
+            if not name or name in _GROUP_LIGHT_CHANNELS or "value_map" in channel_def:
                 continue
-            if moving_head_primary_offset is not None and offset == moving_head_primary_offset:
+            if name.endswith("_lsb") and f"{name[:-4]}_msb" in name_map:
                 continue
-
-            entities.append(
-                ArtNetDMXNumber(
-                    artnet_helper=artnet_helper,
-                    dmx_writer=dmx_writer,
-                    channel=absolute_channel(start_channel, offset),
-                    entry_id=entry.entry_id,
-                    fixture_id=fixture_id,
-                    channel_name=channel.get("name"),
-                    hidden_by_default=bool(channel.get("hidden_by_default", False)),
-                    fixture_label=fixture_label,
+            offset = absolute_channel(start_channel, int(channel_def["offset"]))
+            if name.endswith("_msb") and f"{name[:-4]}_lsb" in name_map:
+                lsb_offset = int(name_map[f"{name[:-4]}_lsb"]["offset"])
+                fixture_channels[name[:-4]] = (
+                    offset,
+                    absolute_channel(start_channel, lsb_offset),
                 )
-            )
-    except HomeAssistantError:
-        LOGGER.exception("Failed to load fixture mapping for number platform")
-
-    if entities:
-        async_add_entities(entities)
+            else:
+                fixture_channels[name] = (offset, None)
+
+        if shared is None:
+            shared = {name: [] for name in fixture_channels}
+        for name in list(shared):
+            channel = fixture_channels.get(name)
+            targets = shared[name]
+            # A channel is only shared when every member has it at the same resolution.
+            if channel is None or (
+                targets and (targets[0][2] is None) != (channel[1] is None)
+            ):
+                del shared[name]
+                continue
+            targets.append((artnet_helper, *channel))
+
+    group_label = entry.data.get(CONF_NAME) or entry.title
+    return [
+        ArtNetDMXGroupNumber(
+            targets=targets,
+            entry_id=entry.entry_id,
+            channel_name=name,
+            group_label=group_label,
+        )
+        for name, targets in (shared or {}).items()
+        if targets
+    ]
 
 
-class ArtNetDMX16BitNumber(NumberEntity):
+class ArtNetDMX16BitNumber(ChannelStateMixin, NumberEntity):
     """Number entity for a 16-bit DMX value backed by MSB/LSB channels."""
 
     _attr_has_entity_name = True
@@ -151,6 +330,7 @@ class ArtNetDMX16BitNumber(NumberEntity):
         channel_name: str | None = None,
         hidden_by_default: bool = False,
         fixture_label: str | None = None,
+        device_key: str | None = None,
     ) -> None:
         self._artnet_helper = artnet_helper
         self._dmx_writer = dmx_writer
@@ -170,11 +350,11 @@ class ArtNetDMX16BitNumber(NumberEntity):
         self._attr_entity_registry_enabled_default = not bool(hidden_by_default)
         self._attr_entity_category = EntityCategory.CONFIG
         self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
+            identifiers={(DOMAIN, device_key or entry_id)},
             name=fixture_label or f"{entry_id} Fixture",
         )
         self._attr_icon = "mdi:tune-vertical"
-        self._native_value = float(self._read_value())
+        self._read_channels()
 
     @property
     def native_value(self) -> float:
@@ -184,24 +364,23 @@ class ArtNetDMX16BitNumber(NumberEntity):
         numeric_value = max(0, min(65535, int(round(value))))
         msb = (numeric_value >> 8) & 0xFF
         lsb = numeric_value & 0xFF
+        self._channel_values = {self._msb: msb, self._lsb: lsb}
         if self._dmx_writer is not None:
             await self._dmx_writer.set_channels({self._msb: msb, self._lsb: lsb})
         else:
             await self._artnet_helper.set_channel(self._msb, msb)
             await self._artnet_helper.set_channel(self._lsb, lsb)
         self._native_value = float(numeric_value)
-        try:
-            self.async_write_ha_state()
-        except RuntimeError:
-            pass
+        self.async_write_throttled_state()
 
-    def _read_value(self) -> int:
+    def _read_channels(self) -> None:
         msb = _channel_value(self._artnet_helper, self._msb)
         lsb = _channel_value(self._artnet_helper, self._lsb)
-        return (msb << 8) | lsb
+        self._channel_values = {self._msb: msb, self._lsb: lsb}
+        self._native_value = float((msb << 8) | lsb)
 
 
-class ArtNetDMXNumber(NumberEntity):
+class ArtNetDMXNumber(ChannelStateMixin, NumberEntity):
     """Number entity for a single 8-bit DMX configuration channel."""
 
     _attr_has_entity_name = True
@@ -220,6 +399,7 @@ class ArtNetDMXNumber(NumberEntity):
         channel_name: str | None = None,
         hidden_by_default: bool = False,
         fixture_label: str | None = None,
+        device_key: str | None = None,
     ) -> None:
         self._artnet_helper = artnet_helper
         self._dmx_writer = dmx_writer
@@ -238,27 +418,271 @@ class ArtNetDMXNumber(NumberEntity):
         self._attr_entity_registry_enabled_default = not bool(hidden_by_default)
         self._attr_entity_category = EntityCategory.CONFIG
         self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
+            identifiers={(DOMAIN, device_key or entry_id)},
             name=fixture_label or f"{entry_id} Fixture",
         )
         self._attr_icon = "mdi:tune"
-        self._native_value = float(_channel_value(self._artnet_helper, self._channel))
+        self._read_channels()
 
     @property
     def native_value(self) -> float:
         return self._native_value
 
+    def _read_channels(self) -> None:
+        value = _channel_value(self._artnet_helper, self._channel)
+        self._channel_values = {self._channel: value}
+        self._native_value = float(value)
+
     async def async_set_native_value(self, value: float) -> None:
         numeric_value = max(0, min(255, int(round(value))))
+        self._channel_values = {self._channel: numeric_value}
         if self._dmx_writer is not None:
             await self._dmx_writer.set_channel(self._channel, numeric_value)
         else:
             await self._artnet_helper.set_channel(self._channel, numeric_value)
         self._native_value = float(numeric_value)
-        try:
-            self.async_write_ha_state()
-        except RuntimeError:
-            pass
+        self.async_write_throttled_state()
+
+
+class ArtNetDMXGroupNumber(ThrottledStateMixin, NumberEntity):
+    """
+    Number entity setting one channel on every member of a fixture group.
+
+    8-bit channels take 0-255 and 16-bit pairs 0-65535. The member channels
+    of each universe are precompiled into one index array (all MSBs, then all
+    LSBs), so a change is one vectorized scatter and one frame per universe.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_native_min_value = 0
+    _attr_native_step = 1
+
+    def __init__(
+        self,
+        targets: list[tuple[ArtNetDMXHelper, int, int | None]],
+        entry_id: str,
+        channel_name: str,
+        group_label: str | None = None,
+    ) -> None:
+        self._is_16bit = targets[0][2] is not None
+        by_helper: dict[int, tuple[ArtNetDMXHelper, list[int], list[int]]] = {}
+        for artnet_helper, msb, lsb in targets:
+            _helper, msbs, lsbs = by_helper.setdefault(
+                id(artnet_helper), (artnet_helper, [], [])
+            )
+            msbs.append(msb)
+            if lsb is not None:
+                lsbs.append(lsb)
+        self._universes = [
+            (artnet_helper, channel_indices(msbs + lsbs), len(msbs))
+            for artnet_helper, msbs, lsbs in by_helper.values()
+        ]
+        self._attr_native_max_value = 65535 if self._is_16bit else 255
+        self._attr_unique_id = f"{entry_id}_group_number_{channel_name}"
+        human_label = _humanize(group_label) or group_label
+        human_channel = _humanize(channel_name) or channel_name
+        self._attr_name = (
+            f"{human_label} {human_channel}" if human_label else human_channel
+        )
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            name=group_label or f"{entry_id} Group",
+        )
+        self._attr_icon = "mdi:tune-vertical" if self._is_16bit else "mdi:tune"
+        artnet_helper, msb, lsb = targets[0]
+        value = _channel_value(artnet_helper, msb)
+        if lsb is not None:
+            value = (value << 8) | _channel_value(artnet_helper, lsb)
+        self._native_value = float(value)
+
+    @property
+    def native_value(self) -> float:
+        return self._native_value
+
+    async def async_set_native_value(self, value: float) -> None:
+        numeric_value = max(0, min(int(self._attr_native_max_value), int(round(value))))
+        await asyncio.gather(
+            *(
+                artnet_helper.set_indexed(
+                    indices,
+                    tiled_values(
+                        (
+                            (((numeric_value >> 8) & 0xFF,), count),
+                            ((numeric_value & 0xFF,), count),
+                        )
+                    )
+                    if self._is_16bit
+                    else numeric_value,
+                )
+                for artnet_helper, indices, count in self._universes
+            )
+        )
+        self._native_value = float(numeric_value)
+        self.async_write_throttled_state()
+
+
+class ArtNetDMXMasterNumber(ThrottledStateMixin, NumberEntity):
+    """
+    Number entity for a grand master or submaster level (0-255).
+
+    Moving it scales the intensity channels of the covered fixtures when
+    frames are built; no channel value is rewritten.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_native_min_value = 0
+    _attr_native_max_value = 255
+    _attr_native_step = 1
+
+    def __init__(
+        self,
+        board: MasterBoard,
+        entry_id: str,
+        master_label: str,
+        is_grand_master: bool = False,
+    ) -> None:
+        self._board = board
+        self._master_id = entry_id
+        self._attr_unique_id = f"{entry_id}_master"
+        self._attr_name = "Grand master" if is_grand_master else "Submaster"
+        self._attr_icon = "mdi:brightness-percent"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            name=master_label,
+        )
+
+    @property
+    def native_value(self) -> float:
+        return float(self._board.level(self._master_id))
+
+    async def async_set_native_value(self, value: float) -> None:
+        level = max(0, min(255, int(round(value))))
+        covered = self._board.set_level(self._master_id, level)
+        await async_apply_master_levels(self.hass, covered)
+        self.async_write_throttled_state()
+
+
+class ArtNetDMXGroupEffectNumber(NumberEntity):
+    """Number entity for one parameter of a fixture group's effect."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self, controls: EffectControls, entry_id: str, group_label: str, parameter: str
+    ) -> None:
+        self._controls = controls
+        self._parameter = parameter
+        minimum, maximum, step, unit, icon = _EFFECT_PARAMETERS[parameter]
+        self._percent = unit == "%"
+        self._attr_native_min_value = minimum
+        self._attr_native_max_value = maximum
+        self._attr_native_step = step
+        self._attr_native_unit_of_measurement = unit
+        self._attr_icon = icon
+        self._attr_unique_id = f"{entry_id}_effect_{parameter}"
+        self._attr_name = f"Effect {parameter}"
+        self._attr_entity_category = EntityCategory.CONFIG
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            name=group_label,
+        )
+
+    @property
+    def native_value(self) -> float:
+        value = getattr(self._controls, self._parameter)
+        return round(value * 100) if self._percent else value
+
+    async def async_set_native_value(self, value: float) -> None:
+        await self._controls.async_update(
+            **{self._parameter: value / 100 if self._percent else float(value)}
+        )
+        self.async_write_ha_state()
+
+
+class ArtNetDMXGroupAimNumber(NumberEntity):
+    """Number entity for one coordinate of the point a group's moving heads aim at."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_native_min_value = -100
+    _attr_native_max_value = 100
+    _attr_native_step = 0.01
+    _attr_mode = NumberMode.BOX
+    _attr_icon = "mdi:crosshairs-gps"
+
+    def __init__(
+        self, target: PointAtTarget, entry_id: str, group_label: str, axis: str
+    ) -> None:
+        self._target = target
+        self._axis = axis
+        self._attr_unique_id = f"{entry_id}_aim_{axis}"
+        self._attr_name = f"Aim {axis}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            name=group_label,
+        )
+
+    @property
+    def native_value(self) -> float:
+        return self._target.position["xyz".index(self._axis)]
+
+    async def async_set_native_value(self, value: float) -> None:
+        await self._target.async_move(**{self._axis: float(value)})
+        self.async_write_ha_state()
+
+
+class ArtNetDMXMotionSmoothingNumber(NumberEntity):
+    """
+    Number entity for a fixture's pan/tilt smoothing time (0 turns it off).
+
+    The time is saved in the fixture's config-entry record, which setup applies
+    before the universe's first frame after a restart.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_native_min_value = 0
+    _attr_native_max_value = 5
+    _attr_native_step = 0.05
+    _attr_native_unit_of_measurement = "s"
+    _attr_icon = "mdi:sine-wave"
+
+    def __init__(
+        self,
+        motion: MotionFilter,
+        artnet_helper: ArtNetDMXHelper,
+        fixture: CompiledFixture,
+        entry: ConfigEntry,
+        device_key: str,
+        fixture_label: str,
+    ) -> None:
+        self._motion = motion
+        self._artnet_helper = artnet_helper
+        self._fixture = fixture
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_{fixture.fixture_id}_motion_smoothing"
+        self._attr_name = f"{_humanize(fixture_label) or fixture_label} smoothing"
+        self._attr_entity_category = EntityCategory.CONFIG
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device_key)},
+            name=fixture_label,
+        )
+
+    @property
+    def native_value(self) -> float:
+        return self._motion.smoothing(self._fixture.fixture_id)
+
+    async def async_set_native_value(self, value: float) -> None:
+        seconds = max(0.0, float(value))
+        self._motion.set_smoothing(self._artnet_helper, self._fixture, seconds)
+        self.hass.config_entries.async_update_entry(
+            self._entry,
+            data=with_fixture_smoothing(self._entry, self._fixture.fixture_id, seconds),
+        )
+        self.async_write_ha_state()
 
 
 def _channel_value(artnet_helper: ArtNetDMXHelper, channel: int) -> int:
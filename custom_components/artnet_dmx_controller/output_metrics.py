@@ -0,0 +1,129 @@
+"""
+Per-universe output counters.
+
+Every helper keeps one `OutputMetrics`: frames sent, coalesced and
+suppressed, bytes sent, send errors and the send latency of every frame.
+Everything lives in fixed-size fields and a preallocated histogram, so a
+frame only bumps integers and one histogram bucket; nothing grows while the
+rig runs. Latencies land in logarithmic buckets four to an octave, which is
+enough to read p50 and p99 to within a fifth of their value without keeping
+any samples.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from typing import Any
+
+# Upper edges of the latency buckets in seconds: 1 us to ~1 s, four per octave.
+LATENCY_EDGES = tuple(1e-6 * 2 ** (step / 4) for step in range(81))
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 3)
+
+
+class LatencyHistogram:
+    """Latencies counted in preallocated logarithmic buckets."""
+
+    __slots__ = ("count", "last", "max", "_buckets")
+
+    def __init__(self) -> None:
+        self._buckets = array("Q", bytes(8 * (len(LATENCY_EDGES) + 1)))
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every latency."""
+        self.count = 0
+        self.last: float | None = None
+        self.max = 0.0
+        for bucket in range(len(self._buckets)):
+            self._buckets[bucket] = 0
+
+    def record(self, seconds: float) -> None:
+        """Count one latency."""
+        self.count += 1
+        self.last = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self._buckets[bisect_right(LATENCY_EDGES, seconds)] += 1
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the upper bucket edge below which `fraction` of the latencies fall."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bucket, count in enumerate(self._buckets):
+            seen += count
+            if seen >= rank and count:
+                return LATENCY_EDGES[min(bucket, len(LATENCY_EDGES) - 1)]
+        return LATENCY_EDGES[-1]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the count and percentiles in milliseconds."""
+        return {
+            "count": self.count,
+            "p50_ms": _ms(self.percentile(0.5)),
+            "p90_ms": _ms(self.percentile(0.9)),
+            "p99_ms": _ms(self.percentile(0.99)),
+            "max_ms": _ms(self.max) if self.count else None,
+        }
+
+
+class OutputMetrics:
+    """Counters of the frames one universe sent."""
+
+    __slots__ = (
+        "bytes_sent",
+        "frames_coalesced",
+        "frames_sent",
+        "frames_suppressed",
+        "latency",
+        "send_errors",
+    )
+
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero every counter."""
+        self.frames_sent = 0
+        # Frames merged into a later one before they went out.
+        self.frames_coalesced = 0
+        # Frames never sent because no socket was available. Frames zeroed by
+        # a blackout still go out and count as sent.
+        self.frames_suppressed = 0
+        self.bytes_sent = 0
+        self.send_errors = 0
+        self.latency.reset()
+
+    @property
+    def last_latency(self) -> float | None:
+        """Return the send latency of the last frame, in seconds."""
+        return self.latency.last
+
+    def record_send(self, size: int, latency: float) -> None:
+        """Count one frame sent `latency` seconds after it was handed over."""
+        self.frames_sent += 1
+        self.bytes_sent += size
+        self.latency.record(latency)
+
+    def latency_percentile(self, fraction: float) -> float | None:
+        """Return the bucket edge below which `fraction` of send latencies fall."""
+        return self.latency.percentile(fraction)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters, with latencies in milliseconds."""
+        return {
+            "frames_sent": self.frames_sent,
+            "frames_coalesced": self.frames_coalesced,
+            "frames_suppressed": self.frames_suppressed,
+            "bytes_sent": self.bytes_sent,
+            "send_errors": self.send_errors,
+            "last_latency_ms": _ms(self.latency.last),
+            "p50_latency_ms": _ms(self.latency.percentile(0.5)),
+            "p99_latency_ms": _ms(self.latency.percentile(0.99)),
+        }
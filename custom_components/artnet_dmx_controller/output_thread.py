@@ -0,0 +1,266 @@
+"""
+Art-Net output on a dedicated thread with its own clock.
+
+Normally every frame is sent when the event loop gets to it, so anything
+that holds the loop (a slow integration, a recorder commit) delays DMX
+output and shows as stutter. With the output thread enabled, helpers only
+publish their finished packets into a per-universe `FrameSlot` and return;
+the thread owns the socket and transmits the latest packet of every universe
+at a fixed rate, scheduled on `time.monotonic` deadlines independent of the
+loop. Unchanged frames are resent every cycle, as Art-Net nodes expect a
+steady refresh.
+
+A `FrameSlot` is a lock-protected double buffer: the loop copies a packet
+into the back buffer and the thread swaps it to the front before sending, so
+neither side ever waits for the other's I/O and a packet is never sent half
+written. `JitterStats` records how far each cycle strays from its period.
+While it runs, the thread posts a probe into the loop once per cycle so the
+loop lag monitor keeps measuring lag when no loop ticker runs.
+"""
+
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+
+from .const import DATA_OUTPUT_THREAD, DATA_SHARED_HELPERS, DOMAIN, LOGGER
+from .jitter import JitterStats
+from .loop_monitor import lag_monitor
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+    from .artnet import ArtNetDMXHelper
+    from .output_metrics import OutputMetrics
+
+DEFAULT_OUTPUT_RATE = 40.0  # frames per second per universe
+MAX_OUTPUT_RATE = 44.0  # DMX512 cannot refresh a full universe faster
+LAG_TICKER = "output"  # the thread's name in the loop lag monitor
+
+
+class FrameSlot:
+    """Double-buffered latest packet of one universe."""
+
+    def __init__(
+        self, address: tuple[str, int], metrics: OutputMetrics | None = None
+    ) -> None:
+        self.address = address
+        # Counters of the universe's helper; the thread records its sends there.
+        self.metrics = metrics
+        self._lock = threading.Lock()
+        self._front: bytearray | None = None
+        self._back = bytearray()
+        self._fresh = False
+
+    def publish(self, packet: bytes | bytearray) -> bool:
+        """
+        Copy a finished packet into the back buffer; called from the event loop.
+
+        Returns True when it replaced a packet the thread had not sent yet.
+        """
+        with self._lock:
+            replaced = self._fresh
+            self._back[:] = packet
+            self._fresh = True
+        return replaced
+
+    def take(self) -> bytearray | None:
+        """Return the latest packet, swapping in a new one; called from the thread."""
+        with self._lock:
+            if self._fresh:
+                if self._front is None:
+                    self._front = bytearray()
+                self._front, self._back = self._back, self._front
+                self._fresh = False
+        return self._front
+
+
+class OutputThread:
+    """Transmits every attached universe's latest packet at a fixed rate."""
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_OUTPUT_RATE,
+        clock: Callable[[], float] = time.monotonic,
+        on_cycle: Callable[[], None] | None = None,
+    ) -> None:
+        self.rate = float(rate)
+        self._period = 1.0 / self.rate
+        self._clock = clock
+        # Called from the thread after every cycle (used to probe the event loop's lag).
+        self._on_cycle = on_cycle
+        self._slots: dict[int, FrameSlot] = {}
+        self._slots_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._socket: socket.socket | None = None
+        self.stats = JitterStats(self._period)
+
+    @property
+    def running(self) -> bool:
+        """Return True while the thread runs."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def attach(self, artnet_helper: ArtNetDMXHelper) -> FrameSlot:
+        """Route a helper's output through the thread."""
+        slot = FrameSlot(
+            (artnet_helper.target_ip, artnet_helper.port), artnet_helper.metrics
+        )
+        with self._slots_lock:
+            self._slots[id(artnet_helper)] = slot
+        artnet_helper.attach_output(slot)
+        return slot
+
+    def detach(self, artnet_helper: ArtNetDMXHelper) -> None:
+        """Return a helper's output to the event loop."""
+        with self._slots_lock:
+            self._slots.pop(id(artnet_helper), None)
+        artnet_helper.detach_output()
+
+    def start(self) -> None:
+        """Open the socket and start transmitting."""
+        if self.running:
+            return
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._stop.clear()
+        self.stats.reset()
+        self._thread = threading.Thread(
+            target=self._run, name="artnet-output", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop transmitting and close the socket; blocks until the thread exits."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def _run(self) -> None:
+        deadline = self._clock()
+        previous: float | None = None
+        while not self._stop.is_set():
+            now = self._clock()
+            if previous is not None:
+                self.stats.record(now - previous)
+            previous = now
+            self._transmit()
+            if self._on_cycle is not None:
+                self._on_cycle()
+            deadline += self._period
+            now = self._clock()
+            if now > deadline + self._period:
+                # Fell more than a cycle behind: skip the missed cycles, keep the phase.
+                missed = int((now - deadline) / self._period)
+                self.stats.skipped += missed
+                deadline += missed * self._period
+            self._stop.wait(max(deadline - now, 0.0))
+
+    def _transmit(self) -> None:
+        with self._slots_lock:
+            slots = list(self._slots.values())
+        for slot in slots:
+            packet = slot.take()
+            if packet is None:
+                continue
+            started = self._clock()
+            try:
+                self._socket.sendto(packet, slot.address)
+            except OSError as err:
+                if slot.metrics is not None:
+                    slot.metrics.send_errors += 1
+                LOGGER.debug(
+                    "Output thread failed to send to %s:%s: %s", *slot.address, err
+                )
+            else:
+                if slot.metrics is not None:
+                    slot.metrics.record_send(len(packet), self._clock() - started)
+
+
+def attach_output(hass: HomeAssistant, artnet_helper: ArtNetDMXHelper) -> None:
+    """Route a new helper through the output thread when it runs."""
+    running = hass.data.get(DOMAIN, {}).get(DATA_OUTPUT_THREAD)
+    if running is not None:
+        running[0].attach(artnet_helper)
+
+
+def detach_output(hass: HomeAssistant, artnet_helper: ArtNetDMXHelper) -> None:
+    """Take a closing helper off the output thread."""
+    running = hass.data.get(DOMAIN, {}).get(DATA_OUTPUT_THREAD)
+    if running is not None:
+        running[0].detach(artnet_helper)
+
+
+def output_thread(hass: HomeAssistant) -> OutputThread | None:
+    """Return the running output thread, if any."""
+    running = hass.data.get(DOMAIN, {}).get(DATA_OUTPUT_THREAD)
+    return running[0] if running is not None else None
+
+
+async def async_set_output_thread(
+    hass: HomeAssistant,
+    enabled: bool,
+    rate: float = DEFAULT_OUTPUT_RATE,
+) -> dict[str, Any]:
+    """
+    Start, restart at a new rate, or stop the output thread.
+
+    Returns the jitter statistics of the thread that ran until now, if any.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    helpers = list(domain_data.get(DATA_SHARED_HELPERS, {}).values())
+    previous = output_thread(hass)
+    stats = previous.stats.as_dict() if previous is not None else {}
+    if previous is not None and (not enabled or previous.rate != rate):
+        await _async_stop_output(hass)
+        if not enabled:
+            for artnet_helper in helpers:
+                await artnet_helper.async_send_current_state()
+            LOGGER.info("Art-Net output runs on the event loop")
+            return stats
+    if enabled and DATA_OUTPUT_THREAD not in domain_data:
+        monitor = lag_monitor(hass)
+        monitor.async_add_ticker(LAG_TICKER, rate)
+        output = OutputThread(
+            rate, on_cycle=partial(monitor.tick_threadsafe, LAG_TICKER)
+        )
+        for artnet_helper in helpers:
+            output.attach(artnet_helper)
+            await artnet_helper.async_send_current_state()
+        output.start()
+
+        async def _async_on_stop(_event: Any) -> None:
+            await _async_stop_output(hass, stopping=True)
+
+        cancel_stop = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, _async_on_stop
+        )
+        domain_data[DATA_OUTPUT_THREAD] = (output, cancel_stop)
+        LOGGER.info(
+            "Art-Net output runs on its own thread at %s frames per second", rate
+        )
+    return stats
+
+
+async def _async_stop_output(hass: HomeAssistant, stopping: bool = False) -> None:
+    """Stop the output thread and hand every helper back to the event loop."""
+    running = hass.data.get(DOMAIN, {}).pop(DATA_OUTPUT_THREAD, None)
+    if running is None:
+        return
+    output, cancel_stop = running
+    if not stopping:
+        cancel_stop()
+    lag_monitor(hass).async_remove_ticker(LAG_TICKER)
+    for artnet_helper in list(hass.data[DOMAIN].get(DATA_SHARED_HELPERS, {}).values()):
+        output.detach(artnet_helper)
+    await hass.async_add_executor_job(output.stop)
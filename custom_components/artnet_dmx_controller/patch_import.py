@@ -0,0 +1,210 @@
+"""
+Patch-file import helpers.
+
+A patch file describes a whole rig as a JSON list of fixture records in the
+`docs/fixtures.json` format:
+
+    {"id": ..., "name": ..., "fixture": ..., "base_channel": ..., "location": {...}}
+
+Moving heads may add an `orientation` object calibrating how they are mounted
+(see `point_at`) and a `smoothing` time in seconds for their pan/tilt (see
+`motion`).
+
+Records may also carry their own `target_ip` and `universe`; otherwise the
+defaults passed by the caller are used. All records are validated against the
+fixture mapping, each other and the already configured entries in one pass
+before anything is created.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import json
+from typing import Any
+
+from .const import (
+    CONF_CHANNEL_COUNT,
+    CONF_FIXTURE_ID,
+    CONF_START_CHANNEL,
+    CONF_TARGET_IP,
+    CONF_UNIVERSE,
+    DMX_CHANNELS,
+    MAX_UNIVERSE,
+)
+from .entry_fixtures import build_fixture_entry_data, extract_fixture_records
+from .fixture_mapping import HomeAssistantError
+
+PATCH_ID = "id"
+PATCH_NAME = "name"
+PATCH_FIXTURE = "fixture"
+PATCH_BASE_CHANNEL = "base_channel"
+PATCH_LOCATION = "location"
+PATCH_ORIENTATION = "orientation"
+PATCH_SMOOTHING = "smoothing"
+
+
+def load_patch_file(file_path: str) -> list[dict[str, Any]]:
+    """
+    Read a patch file and return its raw fixture records.
+
+    Raises `HomeAssistantError` when the file is missing or not a JSON list.
+    """
+    try:
+        with open(file_path, encoding="utf-8") as fh:
+            data = json.load(fh)
+    except FileNotFoundError as err:
+        raise HomeAssistantError(f"Patch file not found: {file_path}") from err
+    except json.JSONDecodeError as err:
+        raise HomeAssistantError(
+            f"Malformed JSON in patch file {file_path}: {err}"
+        ) from err
+
+    if not isinstance(data, list):
+        raise HomeAssistantError("Patch file must contain a JSON list of fixtures")
+    return data
+
+
+def build_patch_entries(
+    records: list[Any],
+    mapping: dict[str, Any],
+    target_ip: str | None = None,
+    universe: int | None = None,
+    existing_entries: list[Any] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Validate patch records and return fixture-entry data for each of them.
+
+    All problems are collected and raised together in a single
+    `HomeAssistantError`, so a broken patch never creates a partial rig.
+    """
+    fixtures_def = mapping.get("fixtures", {})
+    problems: list[str] = []
+    candidates: list[dict[str, Any]] = []
+
+    for idx, record in enumerate(records):
+        label = f"#{idx}"
+        if not isinstance(record, dict):
+            problems.append(f"{label}: record must be an object")
+            continue
+        label = f"#{idx} ({record.get(PATCH_ID) or record.get(PATCH_NAME) or '?'})"
+
+        fixture_type = record.get(PATCH_FIXTURE)
+        fixture_def = fixtures_def.get(fixture_type)
+        if fixture_def is None:
+            problems.append(f"{label}: unknown fixture type {fixture_type!r}")
+            continue
+
+        record_ip = record.get(CONF_TARGET_IP, target_ip)
+        try:
+            ipaddress.ip_address(str(record_ip))
+        except ValueError:
+            problems.append(f"{label}: invalid target IP {record_ip!r}")
+            continue
+
+        try:
+            record_universe = int(
+                record.get(CONF_UNIVERSE, universe if universe is not None else 0)
+            )
+            start_channel = int(record[PATCH_BASE_CHANNEL])
+        except (KeyError, TypeError, ValueError):
+            problems.append(
+                f"{label}: missing or invalid '{PATCH_BASE_CHANNEL}'/'{CONF_UNIVERSE}'"
+            )
+            continue
+        if not 0 <= record_universe <= MAX_UNIVERSE:
+            problems.append(f"{label}: universe {record_universe} out of range")
+            continue
+
+        channel_count = int(fixture_def["channel_count"])
+        end_channel = start_channel + channel_count - 1
+        if start_channel < 1 or end_channel > DMX_CHANNELS:
+            problems.append(
+                f"{label}: channels {start_channel}..{end_channel} exceed the universe"
+            )
+            continue
+
+        location = record.get(PATCH_LOCATION)
+        if location is not None and not isinstance(location, dict):
+            problems.append(f"{label}: 'location' must be an object")
+            continue
+        orientation = record.get(PATCH_ORIENTATION)
+        if orientation is not None and not isinstance(orientation, dict):
+            problems.append(f"{label}: 'orientation' must be an object")
+            continue
+        smoothing = record.get(PATCH_SMOOTHING)
+        if smoothing is not None and (
+            isinstance(smoothing, bool)
+            or not isinstance(smoothing, (int, float))
+            or smoothing < 0
+        ):
+            problems.append(f"{label}: 'smoothing' must be a number of seconds")
+            continue
+
+        name = record.get(PATCH_NAME)
+        candidates.append(
+            build_fixture_entry_data(
+                target_ip=str(record_ip),
+                universe=record_universe,
+                fixture_type=str(fixture_type),
+                start_channel=start_channel,
+                channel_count=channel_count,
+                name=name if isinstance(name, str) else None,
+                fixture_id=str(record[PATCH_ID]) if record.get(PATCH_ID) else None,
+                location=location,
+                orientation=orientation,
+                smoothing=smoothing,
+            )
+        )
+
+    problems.extend(_find_patch_conflicts(candidates, existing_entries or []))
+    if problems:
+        raise HomeAssistantError("Invalid patch: " + "; ".join(problems))
+    return candidates
+
+
+def _find_patch_conflicts(
+    candidates: list[dict[str, Any]],
+    existing_entries: list[Any],
+) -> list[str]:
+    """Return duplicate-id and channel-overlap problems for a set of candidates."""
+    problems: list[str] = []
+
+    existing_records = [
+        record
+        for entry in existing_entries
+        for record in extract_fixture_records(entry)
+    ]
+    seen_ids = {record[CONF_FIXTURE_ID] for record in existing_records}
+    for candidate in candidates:
+        fixture_id = candidate[CONF_FIXTURE_ID]
+        if fixture_id in seen_ids:
+            problems.append(f"duplicate fixture id {fixture_id!r}")
+        seen_ids.add(fixture_id)
+
+    # Sort every claimed range per (target, universe) once and sweep it, instead
+    # of checking each candidate against every other fixture.
+    ranges: dict[tuple[str, int], list[tuple[int, int, str, bool]]] = {}
+    for record, is_candidate in [(r, False) for r in existing_records] + [
+        (c, True) for c in candidates
+    ]:
+        start = int(record[CONF_START_CHANNEL])
+        end = start + int(record[CONF_CHANNEL_COUNT]) - 1
+        key = (record[CONF_TARGET_IP], int(record[CONF_UNIVERSE]))
+        ranges.setdefault(key, []).append(
+            (start, end, record[CONF_FIXTURE_ID], is_candidate)
+        )
+
+    for (ip, universe), claimed in ranges.items():
+        claimed.sort()
+        last_end, last_id, last_is_candidate = 0, None, False
+        for start, end, fixture_id, is_candidate in claimed:
+            if start <= last_end and (is_candidate or last_is_candidate):
+                problems.append(
+                    f"{fixture_id!r} overlaps {last_id!r} on {ip} universe {universe}"
+                )
+            if end > last_end:
+                last_end, last_id, last_is_candidate = end, fixture_id, is_candidate
+    return problems
+
+
+__all__ = ["build_patch_entries", "load_patch_file"]
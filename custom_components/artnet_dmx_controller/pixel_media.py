@@ -0,0 +1,291 @@
+"""
+Images and animations on pixel fixtures.
+
+An `ImageMapper` places every pixel of a `PixelMap` on a 2-D canvas once: the
+selected pixel fixtures are stacked top to bottom in patch order, each running
+left to right (`rows`), or with every other fixture reversed for zig-zag wired
+walls (`serpentine`). For each image size the nearest image pixel of every LED
+is looked up once and cached, so sampling a frame is one gather and sending
+it is one scatter per universe; pixel fixtures never straddle universes, so
+the output splits into each helper's own 512-channel frame.
+
+Frame sources decode lazily, one frame at a time: `.npy` files are
+memory-mapped (an `(H, W, C)` image or an `(F, H, W, C)` stack) and images
+or animated GIFs are read with Pillow when it is installed. A `PixelPlayer`
+streams a source onto its fixtures at the file's frame durations or a fixed
+rate, reading and sampling each frame in the executor.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .buffer import HAS_NUMPY, np
+from .compositor import LAYER_BASE
+from .const import DATA_PIXEL_PLAYERS, DOMAIN, LOGGER
+from .fixture_mapping import HomeAssistantError
+
+try:
+    from PIL import Image, UnidentifiedImageError
+except ImportError:  # pragma: no cover - exercised only without Pillow
+    Image = None
+    UnidentifiedImageError = OSError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from homeassistant.core import HomeAssistant
+
+    from .pixels import PixelMap
+
+LAYOUT_ROWS = "rows"
+LAYOUT_SERPENTINE = "serpentine"
+IMAGE_LAYOUTS = (LAYOUT_ROWS, LAYOUT_SERPENTINE)
+
+# Frame rate of sources without frame durations (.npy stacks, still images).
+DEFAULT_FPS = 25.0
+
+# Lookups kept per mapper, by image size.
+LOOKUP_CACHE_SIZE = 8
+
+
+class ImageMapper:
+    """Nearest-neighbour sampling of 2-D images onto the pixels of a `PixelMap`."""
+
+    def __init__(
+        self,
+        pixel_map: PixelMap,
+        layout: str = LAYOUT_ROWS,
+        use_numpy: bool = HAS_NUMPY,
+    ) -> None:
+        self.pixel_map = pixel_map
+        self._numpy = bool(use_numpy and np is not None)
+        # Canvas position of every pixel, as fractions of the image width and height.
+        columns: list[float] = []
+        rows: list[float] = []
+        fixture_count = len(pixel_map.fixture_pixel_counts)
+        for row, count in enumerate(pixel_map.fixture_pixel_counts):
+            positions = [(pixel + 0.5) / count for pixel in range(count)]
+            if layout == LAYOUT_SERPENTINE and row % 2:
+                positions.reverse()
+            columns.extend(positions)
+            rows.extend([(row + 0.5) / fixture_count] * count)
+        if self._numpy:
+            self._columns = np.asarray(columns, dtype=np.float64)
+            self._rows = np.asarray(rows, dtype=np.float64)
+        else:
+            self._columns, self._rows = columns, rows
+        self._lookups: dict[tuple[int, int], Any] = {}
+
+    def lookup(self, height: int, width: int) -> Any:
+        """Return the flat image index each pixel samples at this image size."""
+        key = (height, width)
+        if key not in self._lookups:
+            if self._numpy:
+                row = np.minimum((self._rows * height).astype(np.intp), height - 1)
+                column = np.minimum((self._columns * width).astype(np.intp), width - 1)
+                self._lookups[key] = row * width + column
+            else:
+                self._lookups[key] = [
+                    min(int(row * height), height - 1) * width
+                    + min(int(column * width), width - 1)
+                    for row, column in zip(self._rows, self._columns, strict=True)
+                ]
+            if len(self._lookups) > LOOKUP_CACHE_SIZE:
+                del self._lookups[next(iter(self._lookups))]
+        return self._lookups[key]
+
+    def sample(self, image: Any) -> Any:
+        """
+        Return the pixel rows sampled from an image.
+
+        Images are `(H, W)` grey, `(H, W, 3)` RGB or `(H, W, 4)` RGBW arrays,
+        or nested rows of grey values or colour tuples without NumPy.
+        """
+        if self._numpy:
+            image = np.asarray(image)
+            if image.ndim == 2:
+                image = image[:, :, None].repeat(3, axis=2)
+            if (
+                image.ndim != 3
+                or image.shape[2] not in (3, 4)
+                or not image.shape[0]
+                or not image.shape[1]
+            ):
+                msg = (
+                    "Images must be (height, width[, 3 or 4]) arrays, "
+                    f"got shape {image.shape}"
+                )
+                raise ValueError(msg)
+            height, width, depth = image.shape
+            return image.reshape(height * width, depth)[self.lookup(height, width)]
+        height, width = len(image), len(image[0]) if image else 0
+        if not width:
+            msg = "Images must have at least one row and column"
+            raise ValueError(msg)
+        pixels = [
+            image[index // width][index % width] for index in self.lookup(height, width)
+        ]
+        return [
+            (pixel,) * 3 if isinstance(pixel, int) else tuple(pixel) for pixel in pixels
+        ]
+
+    async def async_show(self, image: Any, layer: str = LAYER_BASE) -> None:
+        """Sample an image onto the pixels and send them, one frame per universe."""
+        await self.pixel_map.async_set_pixels(self.sample(image), layer=layer)
+
+
+class NpyFrames:
+    """Frames of a memory-mapped `.npy` image or image stack."""
+
+    def __init__(self, path: str) -> None:
+        if np is None:
+            msg = "NumPy is required to play .npy files"
+            raise HomeAssistantError(msg)
+        try:
+            self._array = np.load(path, mmap_mode="r", allow_pickle=False)
+        except FileNotFoundError as err:
+            raise HomeAssistantError(f"Image file not found: {path}") from err
+        except ValueError as err:
+            raise HomeAssistantError(f"Unreadable .npy file {path}: {err}") from err
+        if self._array.ndim not in (2, 3, 4) or (
+            self._array.ndim == 4 and self._array.shape[3] not in (3, 4)
+        ):
+            msg = (
+                f"{path} must hold an image or a stack of images, "
+                f"got shape {self._array.shape}"
+            )
+            raise HomeAssistantError(msg)
+        # A 3-D array is one colour image unless its last axis cannot be colour.
+        stacked = self._array.ndim == 4 or (
+            self._array.ndim == 3 and self._array.shape[2] not in (3, 4)
+        )
+        self.frame_count = self._array.shape[0] if stacked else 1
+        self._stacked = stacked
+
+    def frame(self, index: int) -> Any:
+        """Read one frame from disk."""
+        return np.asarray(self._array[index] if self._stacked else self._array)
+
+    def duration(self, _index: int) -> float | None:
+        return None
+
+    def close(self) -> None:
+        self._array = None
+
+
+class ImageFrames:
+    """Frames of an image or animation, decoded one at a time with Pillow."""
+
+    def __init__(self, path: str, use_numpy: bool = HAS_NUMPY) -> None:
+        if Image is None:
+            msg = "Pillow is required to play image files; use .npy files without it"
+            raise HomeAssistantError(msg)
+        try:
+            self._image = Image.open(path)
+        except FileNotFoundError as err:
+            raise HomeAssistantError(f"Image file not found: {path}") from err
+        except UnidentifiedImageError as err:
+            raise HomeAssistantError(f"Unsupported image file {path}") from err
+        self._numpy = bool(use_numpy and np is not None)
+        self.frame_count = int(getattr(self._image, "n_frames", 1))
+
+    def frame(self, index: int) -> Any:
+        """Decode one frame."""
+        self._image.seek(index)
+        rgb = self._image.convert("RGB")
+        if self._numpy:
+            return np.asarray(rgb)
+        data = list(rgb.getdata())
+        return [
+            data[row * rgb.width : (row + 1) * rgb.width] for row in range(rgb.height)
+        ]
+
+    def duration(self, index: int) -> float | None:
+        """Return a frame's display time in seconds, when the file has one."""
+        self._image.seek(index)
+        duration = self._image.info.get("duration")
+        return duration / 1000 if duration else None
+
+    def close(self) -> None:
+        self._image.close()
+
+
+def open_frames(path: str, use_numpy: bool = HAS_NUMPY) -> NpyFrames | ImageFrames:
+    """Open a frame source for a file without decoding any frame."""
+    if Path(path).suffix.lower() == ".npy":
+        return NpyFrames(path)
+    return ImageFrames(path, use_numpy)
+
+
+class PixelPlayer:
+    """Streams a frame source onto pixel fixtures."""
+
+    def __init__(
+        self,
+        mapper: ImageMapper,
+        source: NpyFrames | ImageFrames,
+        fps: float | None = None,
+        loop: bool = False,
+        layer: str = LAYER_BASE,
+    ) -> None:
+        self.mapper = mapper
+        self.source = source
+        self.fps = fps
+        self.loop = loop
+        self.layer = layer
+
+    def _load(self, index: int) -> tuple[Any, float]:
+        """Read and sample one frame; runs in the executor."""
+        pixels = self.mapper.sample(self.source.frame(index))
+        duration = (
+            1 / self.fps if self.fps else self.source.duration(index) or 1 / DEFAULT_FPS
+        )
+        return pixels, duration
+
+    async def async_run(self, hass: HomeAssistant) -> None:
+        """Play the source to its end (or forever when looping), then close it."""
+        index = 0
+        try:
+            while True:
+                started = time.monotonic()
+                pixels, duration = await hass.async_add_executor_job(self._load, index)
+                await self.mapper.pixel_map.async_set_pixels(pixels, layer=self.layer)
+                index += 1
+                if index >= self.source.frame_count:
+                    if not self.loop or self.source.frame_count == 1:
+                        return
+                    index = 0
+                await asyncio.sleep(max(duration - (time.monotonic() - started), 0.0))
+        finally:
+            await hass.async_add_executor_job(self.source.close)
+
+
+def async_play(hass: HomeAssistant, player: PixelPlayer) -> asyncio.Task:
+    """Start a player, stopping any playback on the same fixtures."""
+    fixture_ids = player.mapper.pixel_map.fixture_ids
+    stop_playback(hass, fixture_ids)
+    task = hass.async_create_background_task(
+        player.async_run(hass), f"{DOMAIN} pixel playback"
+    )
+    players = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_PIXEL_PLAYERS, {})
+    key = tuple(fixture_ids)
+    players[key] = task
+    task.add_done_callback(
+        lambda _task: players.pop(key, None) if players.get(key) is task else None
+    )
+    LOGGER.debug("Pixel playback started on %s", ", ".join(fixture_ids))
+    return task
+
+
+def stop_playback(hass: HomeAssistant, fixture_ids: Iterable[str] | None = None) -> int:
+    """Cancel playback on any of `fixture_ids`, or everywhere; return the count."""
+    players = hass.data.get(DOMAIN, {}).get(DATA_PIXEL_PLAYERS, {})
+    selected = None if fixture_ids is None else set(fixture_ids)
+    stopped = [key for key in players if selected is None or selected.intersection(key)]
+    for key in stopped:
+        players.pop(key).cancel()
+    return len(stopped)
@@ -0,0 +1,244 @@
+"""
+Pixel-mapped LED fixtures.
+
+Pixel fixture profiles (`fixture_specie` `pixel`) describe a block of
+`pixel_count` pixels with the components of `pixel_order` (e.g. `rgb`, `grb`
+or `rgbw`) instead of one named channel per component. A `PixelMap` lays the
+pixels of a set of pixel fixtures end to end in one contiguous `(N, 4)` RGBW
+array and precompiles, per universe, the buffer index of every pixel
+component together with the array position it reads. Writing the pixels is
+one gather and one scatter per universe however many pixels there are, so a
+gradient across a thousand pixels is a single vectorized write per universe.
+
+Without NumPy the pixel array is a flat `bytearray` of `N * 4` RGBW values
+and the same mapping runs as Python loops.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from .buffer import HAS_NUMPY, channel_indices, np
+from .compiled_fixture import compile_fixtures
+from .compositor import LAYER_BASE
+from .const import DATA_PIXEL_MAPS, DMX_MAX_VALUE, DOMAIN, PIXEL_COMPONENTS
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .artnet import ArtNetDMXHelper
+    from .compiled_fixture import CompiledFixture
+
+MODE_GRADIENT = "gradient"
+MODE_REPEAT = "repeat"
+PIXEL_MODES = (MODE_GRADIENT, MODE_REPEAT)
+
+# Pixel maps kept per integration for the set_pixels service.
+PIXEL_MAP_CACHE_SIZE = 16
+
+_WIDTH = len(PIXEL_COMPONENTS)
+
+
+def is_pixel_fixture(fixture: CompiledFixture) -> bool:
+    """Return True for fixtures with a pixel block."""
+    return fixture.pixel_count > 0
+
+
+def pixel_pattern(
+    colors: Sequence[Sequence[int]],
+    count: int,
+    mode: str = MODE_GRADIENT,
+    use_numpy: bool = HAS_NUMPY,
+) -> Any:
+    """
+    Return `count` RGBW pixels spreading `colors` along a strip.
+
+    `gradient` blends linearly from the first colour to the last across all
+    pixels; `repeat` tiles the colours pixel by pixel. RGB colours get a white
+    component of 0. The result is a `(count, 4)` array, or a list of rows
+    without NumPy.
+    """
+    stops = [
+        [min(max(int(value), 0), DMX_MAX_VALUE) for value in color][:_WIDTH]
+        for color in colors
+    ]
+    stops = [stop + [0] * (_WIDTH - len(stop)) for stop in stops]
+    if use_numpy and np is not None:
+        table = np.asarray(stops, dtype=np.float64)
+        if mode == MODE_REPEAT or len(stops) == 1:
+            return table[np.arange(count) % len(stops)].astype(np.uint8)
+        positions = np.linspace(0.0, len(stops) - 1, count)
+        lower = np.minimum(positions.astype(np.intp), len(stops) - 2)
+        fraction = (positions - lower)[:, None]
+        return np.rint(
+            table[lower] * (1.0 - fraction) + table[lower + 1] * fraction
+        ).astype(np.uint8)
+    if mode == MODE_REPEAT or len(stops) == 1:
+        return [stops[pixel % len(stops)] for pixel in range(count)]
+    rows = []
+    for pixel in range(count):
+        position = pixel * (len(stops) - 1) / (count - 1) if count > 1 else 0.0
+        lower = min(int(position), len(stops) - 2)
+        fraction = position - lower
+        rows.append(
+            [
+                round(low * (1.0 - fraction) + high * fraction)
+                for low, high in zip(stops[lower], stops[lower + 1], strict=True)
+            ]
+        )
+    return rows
+
+
+class PixelMap:
+    """Contiguous RGBW pixel array of pixel fixtures, mapped into their universes."""
+
+    def __init__(
+        self,
+        fixtures: list[tuple[ArtNetDMXHelper, CompiledFixture]],
+        use_numpy: bool = HAS_NUMPY,
+    ) -> None:
+        self._numpy = bool(use_numpy and np is not None)
+        fixtures = [
+            (artnet_helper, fixture)
+            for artnet_helper, fixture in fixtures
+            if is_pixel_fixture(fixture)
+        ]
+        self.fixture_ids = [fixture.fixture_id for _helper, fixture in fixtures]
+        self.fixture_pixel_counts = [
+            fixture.pixel_count for _helper, fixture in fixtures
+        ]
+
+        by_helper: dict[int, tuple[ArtNetDMXHelper, list[int], list[int]]] = {}
+        first_pixel = 0
+        for artnet_helper, fixture in fixtures:
+            _helper, channels, sources = by_helper.setdefault(
+                id(artnet_helper), (artnet_helper, [], [])
+            )
+            channels.extend(fixture.pixel_channels)
+            columns = [
+                PIXEL_COMPONENTS.index(component) for component in fixture.pixel_order
+            ]
+            sources.extend(
+                (first_pixel + pixel) * _WIDTH + column
+                for pixel in range(fixture.pixel_count)
+                for column in columns
+            )
+            first_pixel += fixture.pixel_count
+        self.pixel_count = first_pixel
+
+        # Pixel components in RGBW order, one row per pixel.
+        self.pixels: Any = (
+            np.zeros((self.pixel_count, _WIDTH), dtype=np.uint8)
+            if self._numpy
+            else bytearray(self.pixel_count * _WIDTH)
+        )
+        # (helper, buffer index array, pixel array position of each index) per universe
+        self._universes = [
+            (
+                artnet_helper,
+                channel_indices(channels),
+                np.asarray(sources, dtype=np.intp) if self._numpy else tuple(sources),
+            )
+            for artnet_helper, channels, sources in by_helper.values()
+        ]
+
+    def __len__(self) -> int:
+        return self.pixel_count
+
+    def set_pixels(self, values: Any, start: int = 0) -> None:
+        """
+        Copy RGB or RGBW rows into the pixel array from pixel `start` on.
+
+        Rows past the last pixel are ignored; RGB rows leave white at 0.
+        """
+        if self._numpy:
+            values = np.asarray(values)
+            if values.ndim != 2 or values.shape[1] not in (3, _WIDTH):
+                msg = (
+                    "Pixels must be rows of 3 or 4 components, "
+                    f"got shape {values.shape}"
+                )
+                raise ValueError(msg)
+            rows = values[: max(self.pixel_count - start, 0)]
+            stop = start + len(rows)
+            self.pixels[start:stop, : rows.shape[1]] = np.clip(rows, 0, DMX_MAX_VALUE)
+            if rows.shape[1] < _WIDTH:
+                self.pixels[start:stop, rows.shape[1] :] = 0
+            return
+        # Rows beyond the last pixel are dropped.
+        for pixel, row in zip(range(start, self.pixel_count), values, strict=False):
+            if len(row) not in (3, _WIDTH):
+                msg = f"Pixels must be rows of 3 or 4 components, got {len(row)}"
+                raise ValueError(msg)
+            components = [min(max(int(value), 0), DMX_MAX_VALUE) for value in row]
+            self.pixels[pixel * _WIDTH : (pixel + 1) * _WIDTH] = bytes(
+                components + [0] * (_WIDTH - len(row))
+            )
+
+    def pixel(self, index: int) -> tuple[int, ...]:
+        """Return one pixel's RGBW components."""
+        if self._numpy:
+            return tuple(int(value) for value in self.pixels[index])
+        return tuple(self.pixels[index * _WIDTH : (index + 1) * _WIDTH])
+
+    def writes(self) -> list[tuple[ArtNetDMXHelper, Any, Any]]:
+        """Return `(helper, indices, values)` carrying the pixels into each universe."""
+        if self._numpy:
+            flat = self.pixels.reshape(-1)
+            return [
+                (artnet_helper, indices, flat[sources])
+                for artnet_helper, indices, sources in self._universes
+            ]
+        return [
+            (artnet_helper, indices, [self.pixels[source] for source in sources])
+            for artnet_helper, indices, sources in self._universes
+        ]
+
+    async def async_write(self, layer: str = LAYER_BASE) -> None:
+        """Send the pixel array to every universe, one frame each."""
+        if layer == LAYER_BASE:
+            await asyncio.gather(
+                *(
+                    artnet_helper.set_indexed(indices, values)
+                    for artnet_helper, indices, values in self.writes()
+                )
+            )
+            return
+        await asyncio.gather(
+            *(
+                artnet_helper.set_layer_indexed(layer, indices, values)
+                for artnet_helper, indices, values in self.writes()
+            )
+        )
+
+    async def async_set_pixels(
+        self, values: Any, start: int = 0, layer: str = LAYER_BASE
+    ) -> None:
+        """Copy rows into the pixel array and send it."""
+        self.set_pixels(values, start)
+        await self.async_write(layer)
+
+
+def pixel_map(
+    hass: HomeAssistant,
+    fixtures: list[tuple[dict[str, Any], ArtNetDMXHelper]],
+    mapping: dict[str, Any],
+) -> PixelMap:
+    """
+    Return the cached pixel map for a selection of runtime fixtures.
+
+    Maps are keyed by the identity of the fixture records and helpers, so
+    reloading or repatching a fixture compiles a fresh one.
+    """
+    maps = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_PIXEL_MAPS, {})
+    key = tuple((id(fixture), id(artnet_helper)) for fixture, artnet_helper in fixtures)
+    if key in maps:
+        return maps[key][1]
+    pixels = PixelMap(compile_fixtures(fixtures, mapping))
+    # Keep the records alive with the map so their ids cannot be reused.
+    maps[key] = (fixtures, pixels)
+    if len(maps) > PIXEL_MAP_CACHE_SIZE:
+        del maps[next(iter(maps))]
+    return pixels
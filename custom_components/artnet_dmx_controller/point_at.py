@@ -0,0 +1,305 @@
+"""
+Point-at targeting for moving heads.
+
+A `PointAtSolver` compiles a set of moving heads once: their locations,
+mounting calibration and pan/tilt ranges become arrays, so aiming every head
+at a target in room coordinates is one vectorized pass (with NumPy) and one
+scatter per universe. Recent solutions are cached by target, so a follow-spot
+returning to a mark costs a lookup.
+
+Targets use the coordinates of the patch `location` records (z pointing
+up). A head's optional `orientation` record calibrates its mounting:
+
+- `rotation`: the direction pan centre faces, in degrees counter-clockwise
+  from the +x axis;
+- `mount`: `floor` (default, base down) or `hanging` (base up);
+- `pan_offset`, `tilt_offset`: degrees added to the solution;
+- `invert_pan`, `invert_tilt`: reverse the direction of travel.
+
+Pan and tilt centre (32768) point along `rotation` and straight out of the
+base; the profile's `pan_range`/`tilt_range` give the full travel in degrees.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from .buffer import HAS_NUMPY, concat_indices, np
+from .compiled_fixture import compile_fixtures
+from .compositor import LAYER_BASE
+from .const import DATA_AIM_SOLVERS, DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .artnet import ArtNetDMXHelper
+    from .compiled_fixture import CompiledFixture
+
+DEFAULT_PAN_RANGE = 540.0
+DEFAULT_TILT_RANGE = 270.0
+
+MOUNT_FLOOR = "floor"
+MOUNT_HANGING = "hanging"
+
+# Solutions kept per solver, and solvers kept per integration.
+SOLUTION_CACHE_SIZE = 64
+SOLVER_CACHE_SIZE = 16
+
+_PAN_TILT_CHANNELS = ("pan_msb", "pan_lsb", "tilt_msb", "tilt_lsb")
+# Per-head solver inputs, one column each.
+_COLUMNS = (
+    "x",
+    "y",
+    "z",
+    "cos",
+    "sin",
+    "mount",
+    "pan_sign",
+    "tilt_sign",
+    "pan_offset",
+    "tilt_offset",
+    "pan_range",
+    "tilt_range",
+)
+_CENTRE_16BIT = 32768
+_STEPS_16BIT = 65536
+_MAX_16BIT = 65535
+
+
+def can_point(fixture: CompiledFixture) -> bool:
+    """Return True for fixtures with a location and 16-bit pan/tilt."""
+    return fixture.location is not None and fixture.has(*_PAN_TILT_CHANNELS)
+
+
+class PointAtSolver:
+    """Pan/tilt solutions for a fixed set of moving heads."""
+
+    def __init__(
+        self,
+        heads: list[tuple[ArtNetDMXHelper, CompiledFixture]],
+        use_numpy: bool = HAS_NUMPY,
+    ) -> None:
+        self._numpy = bool(use_numpy and np is not None)
+        heads = [
+            (artnet_helper, fixture)
+            for artnet_helper, fixture in heads
+            if can_point(fixture)
+        ]
+        self.fixture_ids = [fixture.fixture_id for _helper, fixture in heads]
+
+        by_helper: dict[
+            int, tuple[ArtNetDMXHelper, list[int], list[CompiledFixture]]
+        ] = {}
+        columns: dict[str, list[float]] = {name: [] for name in _COLUMNS}
+        for row, (artnet_helper, fixture) in enumerate(heads):
+            _helper, rows, fixtures = by_helper.setdefault(
+                id(artnet_helper), (artnet_helper, [], [])
+            )
+            rows.append(row)
+            fixtures.append(fixture)
+            orientation = fixture.orientation
+            rotation = math.radians(float(orientation.get("rotation", 0.0)))
+            for name, value in zip("xyz", fixture.location, strict=True):
+                columns[name].append(value)
+            columns["cos"].append(math.cos(rotation))
+            columns["sin"].append(math.sin(rotation))
+            columns["mount"].append(
+                -1.0 if orientation.get("mount") == MOUNT_HANGING else 1.0
+            )
+            columns["pan_sign"].append(-1.0 if orientation.get("invert_pan") else 1.0)
+            columns["tilt_sign"].append(-1.0 if orientation.get("invert_tilt") else 1.0)
+            columns["pan_offset"].append(float(orientation.get("pan_offset", 0.0)))
+            columns["tilt_offset"].append(float(orientation.get("tilt_offset", 0.0)))
+            columns["pan_range"].append(float(fixture.pan_range or DEFAULT_PAN_RANGE))
+            columns["tilt_range"].append(
+                float(fixture.tilt_range or DEFAULT_TILT_RANGE)
+            )
+
+        if self._numpy:
+            self._columns = {
+                name: np.asarray(values, dtype=np.float64)
+                for name, values in columns.items()
+            }
+        else:
+            self._columns = columns
+        # (helper, pan/tilt index array, solver rows) per universe
+        self._universes = [
+            (
+                artnet_helper,
+                concat_indices(
+                    [fixture.indices(*_PAN_TILT_CHANNELS) for fixture in fixtures]
+                ),
+                np.asarray(rows, dtype=np.intp) if self._numpy else rows,
+            )
+            for artnet_helper, rows, fixtures in by_helper.values()
+        ]
+        self._cache: OrderedDict[
+            tuple[float, float, float], list[tuple[ArtNetDMXHelper, Any, Any]]
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.fixture_ids)
+
+    @property
+    def centre(self) -> tuple[float, float, float]:
+        """Return the floor point below the middle of the heads."""
+        if not self.fixture_ids:
+            return (0.0, 0.0, 0.0)
+        x, y = (self._columns[name] for name in "xy")
+        return ((min(x) + max(x)) / 2, (min(y) + max(y)) / 2, 0.0)
+
+    def solve(
+        self, x: float, y: float, z: float
+    ) -> list[tuple[ArtNetDMXHelper, Any, Any]]:
+        """Return `(helper, indices, values)` aiming every head at `(x, y, z)`."""
+        key = (round(float(x), 6), round(float(y), 6), round(float(z), 6))
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        pan, tilt = self._solve_numpy(*key) if self._numpy else self._solve_python(*key)
+        writes = [
+            (artnet_helper, indices, self._channel_values(pan, tilt, rows))
+            for artnet_helper, indices, rows in self._universes
+        ]
+        self._cache[key] = writes
+        if len(self._cache) > SOLUTION_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return writes
+
+    def _channel_values(self, pan: Any, tilt: Any, rows: Any) -> Any:
+        """Return pan/tilt MSB/LSB values of `rows`, in fixture index order."""
+        if self._numpy:
+            pan, tilt = pan[rows], tilt[rows]
+            return np.stack(
+                (pan >> 8, pan & 0xFF, tilt >> 8, tilt & 0xFF), axis=1
+            ).reshape(-1)
+        return [
+            value
+            for row in rows
+            for value in (
+                pan[row] >> 8,
+                pan[row] & 0xFF,
+                tilt[row] >> 8,
+                tilt[row] & 0xFF,
+            )
+        ]
+
+    def _solve_numpy(self, x: float, y: float, z: float) -> tuple[Any, Any]:
+        c = self._columns
+        dx, dy, dz = x - c["x"], y - c["y"], z - c["z"]
+        # Into each head's frame: pan centre along +x, base normal along +z.
+        local_x = c["cos"] * dx + c["sin"] * dy
+        local_y = (c["cos"] * dy - c["sin"] * dx) * c["mount"]
+        local_z = dz * c["mount"]
+        pan = np.degrees(np.arctan2(local_y, local_x))
+        tilt = np.degrees(np.arctan2(np.hypot(local_x, local_y), local_z))
+        # Swing through the opposite side where pan would leave its travel.
+        flip = np.abs(pan) > c["pan_range"] / 2
+        pan = np.where(flip, pan - np.copysign(180.0, pan), pan)
+        tilt = np.where(flip, -tilt, tilt)
+        pan = pan * c["pan_sign"] + c["pan_offset"]
+        tilt = tilt * c["tilt_sign"] + c["tilt_offset"]
+        return (
+            np.clip(
+                np.rint(_CENTRE_16BIT + pan / c["pan_range"] * _STEPS_16BIT),
+                0,
+                _MAX_16BIT,
+            ).astype(np.int64),
+            np.clip(
+                np.rint(_CENTRE_16BIT + tilt / c["tilt_range"] * _STEPS_16BIT),
+                0,
+                _MAX_16BIT,
+            ).astype(np.int64),
+        )
+
+    def _solve_python(
+        self, x: float, y: float, z: float
+    ) -> tuple[list[int], list[int]]:
+        pans: list[int] = []
+        tilts: list[int] = []
+        for row in range(len(self.fixture_ids)):
+            c = {name: values[row] for name, values in self._columns.items()}
+            dx, dy, dz = x - c["x"], y - c["y"], z - c["z"]
+            local_x = c["cos"] * dx + c["sin"] * dy
+            local_y = (c["cos"] * dy - c["sin"] * dx) * c["mount"]
+            local_z = dz * c["mount"]
+            pan = math.degrees(math.atan2(local_y, local_x))
+            tilt = math.degrees(math.atan2(math.hypot(local_x, local_y), local_z))
+            if abs(pan) > c["pan_range"] / 2:
+                pan -= math.copysign(180.0, pan)
+                tilt = -tilt
+            pan = pan * c["pan_sign"] + c["pan_offset"]
+            tilt = tilt * c["tilt_sign"] + c["tilt_offset"]
+            pans.append(_to_16bit(pan, c["pan_range"]))
+            tilts.append(_to_16bit(tilt, c["tilt_range"]))
+        return pans, tilts
+
+
+class PointAtTarget:
+    """Target shared by a group's aim entities; moving it re-aims every head."""
+
+    def __init__(self, solver: PointAtSolver) -> None:
+        self.solver = solver
+        self.position = solver.centre
+
+    async def async_move(self, **axes: float) -> None:
+        """Move the target along `x`, `y` and/or `z` and aim the heads at it."""
+        position = dict(zip("xyz", self.position, strict=True))
+        position.update(axes)
+        self.position = (position["x"], position["y"], position["z"])
+        await async_point_at(self.solver, self.position)
+
+
+async def async_point_at(
+    solver: PointAtSolver,
+    target: tuple[float, float, float],
+    layer: str = LAYER_BASE,
+) -> None:
+    """Aim every head of `solver` at `target`, one frame per universe."""
+    writes = solver.solve(*target)
+    if layer == LAYER_BASE:
+        await asyncio.gather(
+            *(
+                artnet_helper.set_indexed(indices, values)
+                for artnet_helper, indices, values in writes
+            )
+        )
+        return
+    await asyncio.gather(
+        *(
+            artnet_helper.set_layer_indexed(layer, indices, values)
+            for artnet_helper, indices, values in writes
+        )
+    )
+
+
+def point_at_solver(
+    hass: HomeAssistant,
+    fixtures: list[tuple[dict[str, Any], ArtNetDMXHelper]],
+    mapping: dict[str, Any],
+) -> PointAtSolver:
+    """
+    Return the cached solver for a selection of runtime fixtures.
+
+    Solvers are keyed by the identity of the fixture records and helpers, so
+    reloading or repatching a fixture compiles a fresh one.
+    """
+    solvers = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_AIM_SOLVERS, {})
+    key = tuple((id(fixture), id(artnet_helper)) for fixture, artnet_helper in fixtures)
+    if key in solvers:
+        return solvers[key][1]
+    solver = PointAtSolver(compile_fixtures(fixtures, mapping))
+    # Keep the records alive with the solver so their ids cannot be reused.
+    solvers[key] = (fixtures, solver)
+    if len(solvers) > SOLVER_CACHE_SIZE:
+        del solvers[next(iter(solvers))]
+    return solver
+
+
+def _to_16bit(degrees: float, travel: float) -> int:
+    return max(
+        0, min(_MAX_16BIT, round(_CENTRE_16BIT + degrees / travel * _STEPS_16BIT))
+    )
@@ -0,0 +1,286 @@
+"""
+Effect rendering in a worker process.
+
+Effects are computed in Python, so their cost grows with the fixtures they
+drive; over hundreds of fixtures a tick can hold the event loop for
+milliseconds, 40 times a second. A `RenderWorker` moves that work into a
+dedicated process. It owns one `multiprocessing.shared_memory` block holding
+a 512-byte frame per universe slot, and the process renders picklable
+programs (effects compiled against slot numbers instead of helpers) straight
+into it. Programs cross the process boundary once; each tick only sends
+their tokens and elapsed times down a pipe. The event loop waits for the
+reply on the pipe without a thread and copies the driven channels out of the
+block, one indexed write per universe.
+
+The process is started with `spawn`, so it never inherits Home Assistant's
+threads, and renders one frame at a time; the effect engine skips a tick that
+finds the previous one still rendering.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import traceback
+from multiprocessing.shared_memory import SharedMemory
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
+
+from .buffer import HAS_NUMPY, np
+from .const import DMX_CHANNELS, LOGGER
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+
+    from .artnet import ArtNetDMXHelper
+    from .effects import Effect
+
+# Universe frames allocated up front; the block doubles when more are driven.
+DEFAULT_SLOTS = 8
+
+# Seconds to wait for a frame before the worker is considered hung.
+RENDER_TIMEOUT = 1.0
+
+# Worker process state: the attached block as (name, block, frames view), and
+# the programs it has received, by token.
+_attached: list[Any] = []
+_programs: dict[int, Effect] = {}
+
+
+class RenderWorkerError(Exception):
+    """The render worker failed, hung or exited."""
+
+
+def _frames(block: SharedMemory, slots: int, use_numpy: bool) -> Any:
+    """Return a `(slots, 512)` view of a shared block, or its flat memoryview."""
+    if use_numpy:
+        return np.ndarray((slots, DMX_CHANNELS), dtype=np.uint8, buffer=block.buf)
+    return block.buf
+
+
+def attach(name: str, slots: int) -> Any:
+    """Attach the worker process to a shared block, reusing the current one."""
+    if _attached and _attached[0] == name:
+        return _attached[2]
+    if _attached:
+        block = _attached[1]
+        # Drop the frames view first; a block with views on it cannot close.
+        _attached.clear()
+        block.close()
+    block = SharedMemory(name=name)
+    _attached.extend((name, block, _frames(block, slots, HAS_NUMPY)))
+    return _attached[2]
+
+
+def render_frames(
+    name: str,
+    slots: int,
+    added: dict[int, Effect],
+    retired: list[int],
+    jobs: list[tuple[int, float]],
+) -> None:
+    """
+    Render `(token, elapsed)` jobs into the shared frames; runs in the worker.
+
+    `added` are new programs by token and `retired` the tokens of programs no
+    longer running.
+    """
+    frames = attach(name, slots)
+    for token in retired:
+        _programs.pop(token, None)
+    _programs.update(added)
+    for token, elapsed in jobs:
+        for slot, indices, values in _programs[token].render(elapsed):
+            if HAS_NUMPY:
+                frames[slot, indices] = values
+                continue
+            base = slot * DMX_CHANNELS
+            for index, value in zip(indices, values, strict=True):
+                frames[base + int(index)] = int(value)
+
+
+def serve(conn: Connection) -> None:
+    """Render frames requested on `conn` until it closes; the worker process's main."""
+    conn.send(None)
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+        try:
+            render_frames(*request)
+        except Exception:  # noqa: BLE001 - reported to the event loop
+            conn.send(traceback.format_exc())
+        else:
+            conn.send(None)
+    _attached.clear()
+    _programs.clear()
+
+
+class RenderWorker:
+    """
+    A render process and the shared universe frames it draws into.
+
+    Construction starts the process and waits until it runs, so it blocks
+    and belongs in the executor.
+    """
+
+    def __init__(self, slots: int = DEFAULT_SLOTS, use_numpy: bool = HAS_NUMPY) -> None:
+        self._numpy = bool(use_numpy and np is not None)
+        self._block: SharedMemory | None = None
+        self._allocate(slots)
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(
+            target=serve, args=(child_conn,), name="artnet-render", daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+        if not self._conn.poll(30) or self._conn.recv() is not None:
+            self.close()
+            msg = "Render worker did not start"
+            raise RenderWorkerError(msg)
+        # Slot of every helper, keyed by helper identity.
+        self._slots: dict[int, int] = {}
+        # Per effect the worker holds a program for, keyed by effect identity: the
+        # effect, its token and, per universe, where its channels sit in the block.
+        self._tokens: dict[
+            int, tuple[Effect, int, list[tuple[ArtNetDMXHelper, Any, Any]]]
+        ] = {}
+        self._next_token = 0
+
+    @property
+    def slot_count(self) -> int:
+        """Return the number of universe frames in the shared block."""
+        return self._slot_count
+
+    def _allocate(self, slots: int) -> None:
+        previous = self._block
+        self._block = SharedMemory(create=True, size=slots * DMX_CHANNELS)
+        self._slot_count = slots
+        self._frames = _frames(self._block, slots, self._numpy)
+        if previous is not None:
+            previous.close()
+            previous.unlink()
+
+    def _assign_slots(self, effect: Effect) -> None:
+        """Give every universe of an effect a slot, growing the block when full."""
+        for artnet_helper in effect.helpers():
+            self._slots.setdefault(id(artnet_helper), len(self._slots))
+        if len(self._slots) > self._slot_count:
+            slots = self._slot_count
+            while slots < len(self._slots):
+                slots *= 2
+            self._allocate(slots)
+            LOGGER.debug("Render worker grew to %s universe frames", slots)
+
+    async def _async_request(self, request: tuple[Any, ...]) -> None:
+        """Send one request and wait for its reply without blocking the loop."""
+        loop = asyncio.get_running_loop()
+        replied = loop.create_future()
+        fileno = self._conn.fileno()
+        loop.add_reader(fileno, lambda: replied.done() or replied.set_result(None))
+        try:
+            self._conn.send(request)
+            await asyncio.wait_for(replied, RENDER_TIMEOUT)
+            error = self._conn.recv()
+        except (OSError, EOFError, TimeoutError) as err:
+            raise RenderWorkerError(
+                f"Render worker stopped responding: {err!r}"
+            ) from err
+        finally:
+            loop.remove_reader(fileno)
+        if error is not None:
+            raise RenderWorkerError(error)
+
+    async def async_render(
+        self, effects: list[tuple[Effect, float]]
+    ) -> list[tuple[ArtNetDMXHelper, Any, Any]]:
+        """
+        Render `(effect, elapsed)` pairs in the worker.
+
+        Returns `(helper, indices, values)` per effect universe, like
+        `Effect.render`, with the values copied out of the shared frames.
+        """
+        live = {id(effect) for effect, _elapsed in effects}
+        retired = [
+            self._tokens.pop(key)[1]
+            for key in [key for key in self._tokens if key not in live]
+        ]
+        if not self._tokens:
+            self._slots.clear()
+        added: dict[int, Effect] = {}
+        sent: dict[int, tuple[Effect, int, list[tuple[ArtNetDMXHelper, Any, Any]]]] = {}
+        jobs = []
+        for effect, elapsed in effects:
+            known = self._tokens.get(id(effect))
+            if known is None or known[0] is not effect:
+                self._assign_slots(effect)
+                self._next_token += 1
+                known = sent[id(effect)] = (
+                    effect,
+                    self._next_token,
+                    self._readers(effect),
+                )
+                added[known[1]] = effect.program(self._slots)
+            jobs.append((known[1], elapsed))
+        await self._async_request(
+            (self._block.name, self._slot_count, added, retired, jobs)
+        )
+        # Later frames send these programs as tokens alone.
+        self._tokens.update(sent)
+        if self._numpy:
+            flat = self._frames.reshape(-1)
+            return [
+                (artnet_helper, indices, flat[positions])
+                for effect, _elapsed in effects
+                for artnet_helper, indices, positions in self._tokens[id(effect)][2]
+            ]
+        return [
+            (artnet_helper, indices, list(positions(self._frames)))
+            for effect, _elapsed in effects
+            for artnet_helper, indices, positions in self._tokens[id(effect)][2]
+        ]
+
+    def _readers(self, effect: Effect) -> list[tuple[ArtNetDMXHelper, Any, Any]]:
+        """
+        Return `(helper, indices, positions)` per universe of an effect.
+
+        `positions` locate its channels in the flat block: an index array, or
+        an item getter without NumPy.
+        """
+        readers = []
+        for artnet_helper in effect.helpers():
+            indices = effect.indices(artnet_helper)
+            base = self._slots[id(artnet_helper)] * DMX_CHANNELS
+            if self._numpy:
+                positions = np.asarray(indices, dtype=np.intp) + base
+            else:
+                offsets = [base + int(index) for index in indices]
+                if len(offsets) == 1:
+                    # A one-item getter returns the item itself, not a tuple.
+                    positions = lambda frames, offset=offsets[0]: (frames[offset],)  # noqa: E731
+                else:
+                    positions = itemgetter(*offsets)
+            readers.append((artnet_helper, indices, positions))
+        return readers
+
+    def close(self) -> None:
+        """Stop the process and free the shared block; blocks."""
+        if self._process.is_alive():
+            try:
+                self._conn.send(None)
+            except OSError:
+                pass
+            self._process.join(RENDER_TIMEOUT)
+        if self._process.is_alive():
+            self._process.kill()
+            self._process.join()
+        self._conn.close()
+        self._frames = None
+        if self._block is not None:
+            self._block.close()
+            self._block.unlink()
+            self._block = None
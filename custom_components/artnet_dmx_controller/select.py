@@ -9,9 +9,24 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 
 from .channel_math import clamp_dmx_value, label_from_value, value_from_label
-from .const import CONF_FIXTURE_ID, CONF_FIXTURE_TYPE, CONF_NAME, CONF_START_CHANNEL, DOMAIN, LOGGER
+from .channel_state import ChannelStateMixin
+from .compiled_fixture import compile_fixtures
+from .const import (
+    CONF_FIXTURE_ID,
+    CONF_FIXTURE_TYPE,
+    CONF_NAME,
+    CONF_START_CHANNEL,
+    DOMAIN,
+    LOGGER,
+)
 from .dmx_writer import DMXWriter
-from .entry_fixtures import get_fixture_entry
+from .effects import EFFECT_OFF, effect_engine
+from .entry_fixtures import (
+    fixture_device_key,
+    is_rig_entry,
+    runtime_fixtures,
+    runtime_group_members,
+)
 from .fixture_mapping import HomeAssistantError, load_fixture_mapping
 
 if TYPE_CHECKING:
@@ -20,6 +35,7 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .artnet import ArtNetDMXHelper
+    from .effects import EffectControls
 
 
 def _humanize(text: str | None) -> str | None:
@@ -33,47 +49,36 @@ async def async_setup_entry(
     entry: "ConfigEntry",
     async_add_entities: "AddEntitiesCallback",
 ) -> None:
-    """Set up select entities for one ArtNet fixture entry."""
-    artnet_helper: "ArtNetDMXHelper" = hass.data[DOMAIN][entry.entry_id]
-    dmx_writer = DMXWriter(artnet_helper)
-    entities: list[ArtNetDMXSelect] = []
+    """Set up select entities for the fixtures of one ArtNet entry."""
+    entities: list[SelectEntity] = []
+    writers: dict[int, DMXWriter] = {}
 
     try:
-        fixture = get_fixture_entry(entry)
         mapping = load_fixture_mapping()
-        fixture_type = fixture[CONF_FIXTURE_TYPE]
-        start_channel = int(fixture[CONF_START_CHANNEL])
-        fixture_id = fixture[CONF_FIXTURE_ID]
-        fixture_def = mapping.get("fixtures", {}).get(fixture_type)
-        if not fixture_def:
-            LOGGER.warning("Fixture type %s not found for entry %s", fixture_type, entry.entry_id)
-            return
-
-        fixture_label = (
-            fixture.get(CONF_NAME)
-            or fixture_def.get("label")
-            or getattr(entry, "title", None)
-            or fixture_type
-            or entry.entry_id
-        )
-
-        for channel in fixture_def.get("channels", []):
-            if "value_map" not in channel:
-                continue
-            offset = int(channel["offset"])
-            entities.append(
-                ArtNetDMXSelect(
-                    artnet_helper=artnet_helper,
-                    dmx_writer=dmx_writer,
-                    channel=start_channel + offset - 1,
-                    entry_id=entry.entry_id,
-                    fixture_id=fixture_id,
-                    channel_name=channel.get("name"),
-                    value_map=channel.get("value_map", {}),
-                    hidden_by_default=bool(channel.get("hidden_by_default", False)),
-                    fixture_label=fixture_label,
+        for fixture, artnet_helper in runtime_fixtures(hass, entry):
+            if id(artnet_helper) not in writers:
+                writers[id(artnet_helper)] = DMXWriter(artnet_helper)
+            entities.extend(
+                _fixture_select_entities(
+                    entry, fixture, mapping, artnet_helper, writers[id(artnet_helper)]
                 )
             )
+        members = runtime_group_members(hass, entry)
+        if members:
+            controls = effect_engine(hass).controls(
+                entry.entry_id, compile_fixtures(members, mapping)
+            )
+            if controls.available:
+                group_label = entry.data.get(CONF_NAME) or entry.title
+                entities.append(
+                    ArtNetDMXGroupEffectSelect(controls, entry.entry_id, group_label)
+                )
+                if len(controls.layouts) > 1:
+                    entities.append(
+                        ArtNetDMXGroupEffectLayoutSelect(
+                            controls, entry.entry_id, group_label
+                        )
+                    )
     except HomeAssistantError:
         LOGGER.exception("Failed to load fixture mapping for select platform")
 
@@ -81,7 +86,56 @@ async def async_setup_entry(
         async_add_entities(entities)
 
 
-class ArtNetDMXSelect(SelectEntity):
+def _fixture_select_entities(
+    entry: "ConfigEntry",
+    fixture: dict[str, Any],
+    mapping: dict[str, Any],
+    artnet_helper: "ArtNetDMXHelper",
+    dmx_writer: DMXWriter,
+) -> list["ArtNetDMXSelect"]:
+    """Build the value-map select entities for one fixture."""
+    entities: list[ArtNetDMXSelect] = []
+    fixture_type = fixture[CONF_FIXTURE_TYPE]
+    start_channel = int(fixture[CONF_START_CHANNEL])
+    fixture_id = fixture[CONF_FIXTURE_ID]
+    device_key = fixture_device_key(entry, fixture)
+    fixture_def = mapping.get("fixtures", {}).get(fixture_type)
+    if not fixture_def:
+        LOGGER.warning(
+            "Fixture type %s not found for entry %s", fixture_type, entry.entry_id
+        )
+        return entities
+
+    fixture_label = (
+        fixture.get(CONF_NAME)
+        or fixture_def.get("label")
+        or (None if is_rig_entry(entry) else getattr(entry, "title", None))
+        or fixture_type
+        or entry.entry_id
+    )
+
+    for channel in fixture_def.get("channels", []):
+        if "value_map" not in channel:
+            continue
+        offset = int(channel["offset"])
+        entities.append(
+            ArtNetDMXSelect(
+                artnet_helper=artnet_helper,
+                dmx_writer=dmx_writer,
+                channel=start_channel + offset - 1,
+                entry_id=entry.entry_id,
+                device_key=device_key,
+                fixture_id=fixture_id,
+                channel_name=channel.get("name"),
+                value_map=channel.get("value_map", {}),
+                hidden_by_default=bool(channel.get("hidden_by_default", False)),
+                fixture_label=fixture_label,
+            )
+        )
+    return entities
+
+
+class ArtNetDMXSelect(ChannelStateMixin, SelectEntity):
     """Select entity for DMX channels with discrete value maps."""
 
     _attr_has_entity_name = True
@@ -97,6 +151,7 @@ class ArtNetDMXSelect(SelectEntity):
         hidden_by_default: bool = False,
         dmx_writer: DMXWriter | None = None,
         fixture_label: str | None = None,
+        device_key: str | None = None,
     ) -> None:
         self._artnet_helper = artnet_helper
         self._dmx_writer = dmx_writer
@@ -115,20 +170,24 @@ class ArtNetDMXSelect(SelectEntity):
             self._attr_name = f"DMX Channel {channel}"
         self._attr_entity_registry_enabled_default = not bool(hidden_by_default)
         self._attr_entity_category = EntityCategory.CONFIG
-        current_value = _channel_value(artnet_helper, channel)
-        current_label = label_from_value(self._value_map, current_value)
         self._synthetic_options: dict[str, int] = {}
-        if current_label is None:
-            current_label = f"Value {current_value}"
-            self._synthetic_options[current_label] = current_value
-        self._current = current_label
+        self._read_channels()
         self._is_on = False
         self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
+            identifiers={(DOMAIN, device_key or entry_id)},
             name=fixture_label or f"{entry_id} Fixture",
         )
         self._attr_icon = "mdi:format-list-bulleted"
 
+    def _read_channels(self) -> None:
+        current_value = _channel_value(self._artnet_helper, self._channel)
+        current_label = label_from_value(self._value_map, current_value)
+        if current_label is None:
+            current_label = f"Value {current_value}"
+            self._synthetic_options[current_label] = current_value
+        self._current = current_label
+        self._channel_values = {self._channel: current_value}
+
     @property
     def options(self) -> list[str]:
         options = list(self._value_map.values())
@@ -150,15 +209,13 @@ class ArtNetDMXSelect(SelectEntity):
             value = clamp_dmx_value(value)
         except Exception:
             return
+        self._channel_values = {self._channel: int(value)}
         if self._dmx_writer is not None:
             await self._dmx_writer.set_channel(self._channel, int(value))
         else:
             await self._artnet_helper.set_channel(self._channel, int(value))
         self._current = option
-        try:
-            self.async_write_ha_state()
-        except RuntimeError:
-            pass
+        self.async_write_throttled_state()
 
     @property
     def is_on(self) -> bool:
@@ -166,17 +223,68 @@ class ArtNetDMXSelect(SelectEntity):
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
         self._is_on = True
-        try:
-            self.async_write_ha_state()
-        except RuntimeError:
-            pass
+        self.async_write_throttled_state()
 
     async def async_turn_off(self, **_kwargs: Any) -> None:
         self._is_on = False
-        try:
-            self.async_write_ha_state()
-        except RuntimeError:
-            pass
+        self.async_write_throttled_state()
+
+
+class ArtNetDMXGroupEffectSelect(SelectEntity):
+    """Select entity choosing the effect a fixture group runs."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_name = "Effect"
+    _attr_icon = "mdi:auto-fix"
+
+    def __init__(
+        self, controls: EffectControls, entry_id: str, group_label: str
+    ) -> None:
+        self._controls = controls
+        self._attr_unique_id = f"{entry_id}_effect"
+        self._attr_options = [EFFECT_OFF, *controls.available]
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            name=group_label,
+        )
+
+    @property
+    def current_option(self) -> str:
+        return self._controls.kind
+
+    async def async_select_option(self, option: str) -> None:
+        await self._controls.async_update(kind=option)
+        self.async_write_ha_state()
+
+
+class ArtNetDMXGroupEffectLayoutSelect(SelectEntity):
+    """Select entity laying a group's effect out by member order or location."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_name = "Effect layout"
+    _attr_icon = "mdi:axis-arrow"
+
+    def __init__(
+        self, controls: EffectControls, entry_id: str, group_label: str
+    ) -> None:
+        self._controls = controls
+        self._attr_unique_id = f"{entry_id}_effect_layout"
+        self._attr_options = list(controls.layouts)
+        self._attr_entity_category = EntityCategory.CONFIG
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            name=group_label,
+        )
+
+    @property
+    def current_option(self) -> str:
+        return self._controls.layout
+
+    async def async_select_option(self, option: str) -> None:
+        await self._controls.async_update(layout=option)
+        self.async_write_ha_state()
 
 
 def _channel_value(artnet_helper, channel: int) -> int:
@@ -0,0 +1,301 @@
+"""Sensor platform for ArtNet DMX Controller."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.const import UnitOfTime
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
+from homeassistant.helpers.entity import EntityCategory
+
+from .const import (
+    DATA_ENTRY_HELPER_KEYS,
+    DATA_SENSOR_OWNERS,
+    DATA_SHARED_HELPERS,
+    DOMAIN,
+)
+from .loop_monitor import (
+    PUBLISH_INTERVAL,
+    SIGNAL_LOOP_HEALTH,
+    LoopLagMonitor,
+    lag_monitor,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .output_metrics import OutputMetrics
+
+# Counters are read every publish interval rather than per frame.
+SCAN_INTERVAL = timedelta(seconds=PUBLISH_INTERVAL)
+
+# Owner key of the integration-wide event-loop lag sensor.
+LOOP_LAG = "loop_lag"
+
+SIGNAL_SENSOR_OWNERS = f"{DOMAIN}_sensor_owners"
+
+OUTPUT_DEVICE = DeviceInfo(
+    identifiers={(DOMAIN, "output")},
+    manufacturer="Art-Net",
+    model="Output health",
+    name="Art-Net DMX output",
+)
+
+
+def universe_device(helper_key: tuple[str, int]) -> DeviceInfo:
+    """Return the device the integration creates for one universe's diagnostics."""
+    target_ip, universe = helper_key
+    return DeviceInfo(
+        identifiers={(DOMAIN, f"universe_{target_ip}_{universe}")},
+        manufacturer="Art-Net",
+        model="Universe",
+        name=f"Universe {universe} on {target_ip}",
+    )
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """
+    Set up diagnostic sensors for the universes an entry drives.
+
+    Each universe's sensors are added once, by the first loaded entry driving
+    it, on a device of their own; the event-loop lag sensor goes with the first
+    such entry, on the output device. When that entry unloads, another entry
+    driving the universe takes its sensors over.
+    """
+    owners = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_SENSOR_OWNERS, {})
+    monitor = lag_monitor(hass)
+
+    @callback
+    def _async_claim() -> None:
+        helper_keys = (
+            hass.data[DOMAIN].get(DATA_ENTRY_HELPER_KEYS, {}).get(entry.entry_id)
+        )
+        if not helper_keys:
+            return
+        entities: list[SensorEntity] = []
+        if LOOP_LAG not in owners:
+            owners[LOOP_LAG] = entry.entry_id
+            entities.append(ArtNetDMXLoopLagSensor(monitor, OUTPUT_DEVICE))
+        for helper_key in sorted(helper_keys):
+            if helper_key in owners:
+                continue
+            owners[helper_key] = entry.entry_id
+            device_info = universe_device(helper_key)
+            entities.extend(
+                ArtNetDMXUniverseFramesSensor(monitor, device_info, helper_key, kind)
+                for kind in ("missed", "late")
+            )
+            entities.extend(
+                sensor_class(monitor, device_info, helper_key)
+                for sensor_class in (
+                    ArtNetDMXFramesSentSensor,
+                    ArtNetDMXSendErrorsSensor,
+                    ArtNetDMXSendLatencySensor,
+                )
+            )
+        if entities:
+            async_add_entities(entities)
+
+    @callback
+    def _async_release() -> None:
+        released = [key for key, owner in owners.items() if owner == entry.entry_id]
+        for key in released:
+            del owners[key]
+        if released:
+            async_dispatcher_send(hass, SIGNAL_SENSOR_OWNERS)
+
+    _async_claim()
+    entry.async_on_unload(_async_release)
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_SENSOR_OWNERS, _async_claim)
+    )
+
+
+class _ArtNetDMXHealthSensor(SensorEntity):
+    """Diagnostic sensor polled every publish interval."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, monitor: LoopLagMonitor, device_info: DeviceInfo) -> None:
+        self._monitor = monitor
+        self._attr_device_info = device_info
+
+
+class ArtNetDMXLoopLagSensor(_ArtNetDMXHealthSensor):
+    """Worst event-loop lag over the monitor's last publish interval."""
+
+    _attr_should_poll = False
+    _attr_name = "Event loop lag"
+    _attr_icon = "mdi:timer-alert-outline"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 1
+
+    def __init__(self, monitor: LoopLagMonitor, device_info: DeviceInfo) -> None:
+        super().__init__(monitor, device_info)
+        self._attr_unique_id = f"{DOMAIN}_loop_lag"
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_LOOP_HEALTH, self.async_write_ha_state
+            )
+        )
+
+    @property
+    def native_value(self) -> float:
+        return self._monitor.last_window["max_jitter_ms"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        window = self._monitor.last_window
+        totals = self._monitor.stats
+        last_stall = self._monitor.last_stall or {}
+        return {
+            "mean_lag_ms": window["mean_jitter_ms"],
+            "stdev_lag_ms": window["stdev_jitter_ms"],
+            "late_ticks": totals.late,
+            "skipped_ticks": totals.skipped,
+            "last_stall_at": last_stall.get("at"),
+            "last_stall_ms": last_stall.get("lag_ms"),
+        }
+
+
+class ArtNetDMXUniverseFramesSensor(_ArtNetDMXHealthSensor):
+    """Frames one universe missed, or sent late, because the event loop stalled."""
+
+    _attr_icon = "mdi:filmstrip-box-multiple"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = "frames"
+
+    def __init__(
+        self,
+        monitor: LoopLagMonitor,
+        device_info: DeviceInfo,
+        helper_key: tuple[str, int],
+        kind: str,
+    ) -> None:
+        super().__init__(monitor, device_info)
+        target_ip, universe = helper_key
+        self._helper_key = helper_key
+        self._kind = kind
+        self._attr_name = f"{kind.capitalize()} frames"
+        self._attr_unique_id = f"universe_{target_ip}_{universe}_{kind}_frames"
+
+    @property
+    def native_value(self) -> int:
+        health = self._monitor.universes.get(self._helper_key)
+        if health is None:
+            return 0
+        return health.missed if self._kind == "missed" else health.late
+
+
+class _ArtNetDMXUniverseOutputSensor(_ArtNetDMXHealthSensor):
+    """Output counters of one universe, read from its shared helper."""
+
+    _suffix: str
+
+    def __init__(
+        self,
+        monitor: LoopLagMonitor,
+        device_info: DeviceInfo,
+        helper_key: tuple[str, int],
+    ) -> None:
+        super().__init__(monitor, device_info)
+        target_ip, universe = helper_key
+        self._helper_key = helper_key
+        self._attr_name = self._suffix.replace("_", " ").capitalize()
+        self._attr_unique_id = f"universe_{target_ip}_{universe}_{self._suffix}"
+
+    def _metrics(self) -> OutputMetrics | None:
+        """Return the counters of the universe's helper, if it is open."""
+        artnet_helper = (
+            self.hass.data.get(DOMAIN, {})
+            .get(DATA_SHARED_HELPERS, {})
+            .get(self._helper_key)
+        )
+        return getattr(artnet_helper, "metrics", None)
+
+
+class ArtNetDMXFramesSentSensor(_ArtNetDMXUniverseOutputSensor):
+    """Frames one universe put on the wire."""
+
+    _suffix = "frames_sent"
+    _attr_icon = "mdi:counter"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = "frames"
+
+    @property
+    def native_value(self) -> int | None:
+        metrics = self._metrics()
+        return None if metrics is None else metrics.frames_sent
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        metrics = self._metrics()
+        if metrics is None:
+            return {}
+        return {
+            "bytes_sent": metrics.bytes_sent,
+            "frames_coalesced": metrics.frames_coalesced,
+            "frames_suppressed": metrics.frames_suppressed,
+        }
+
+
+class ArtNetDMXSendErrorsSensor(_ArtNetDMXUniverseOutputSensor):
+    """Frames one universe failed to send."""
+
+    _suffix = "send_errors"
+    _attr_icon = "mdi:alert-circle-outline"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    @property
+    def native_value(self) -> int | None:
+        metrics = self._metrics()
+        return None if metrics is None else metrics.send_errors
+
+
+class ArtNetDMXSendLatencySensor(_ArtNetDMXUniverseOutputSensor):
+    """99th percentile time from handing a frame over to it leaving the socket."""
+
+    _suffix = "send_latency"
+    _attr_icon = "mdi:timer-outline"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 3
+
+    @property
+    def native_value(self) -> float | None:
+        metrics = self._metrics()
+        return None if metrics is None else metrics.as_dict()["p99_latency_ms"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        metrics = self._metrics()
+        if metrics is None:
+            return {}
+        counters = metrics.as_dict()
+        return {
+            "p50_latency_ms": counters["p50_latency_ms"],
+            "last_latency_ms": counters["last_latency_ms"],
+        }
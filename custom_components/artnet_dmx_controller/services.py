@@ -0,0 +1,759 @@
+"""Integration-level services for ArtNet DMX Controller."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.core import ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers import config_validation as cv
+
+from .blackout import async_blackout, async_release_blackout
+from .compositor import LAYER_BASE, LAYER_EFFECTS, LAYER_OVERRIDE
+from .const import (
+    CONF_CHANNEL_COUNT,
+    CONF_FIXTURE_ID,
+    CONF_FIXTURE_TYPE,
+    CONF_NAME,
+    CONF_START_CHANNEL,
+    CONF_TARGET_IP,
+    CONF_UNIVERSE,
+    DATA_SHARED_HELPERS,
+    DEFAULT_UNIVERSE,
+    DMX_CHANNELS,
+    DMX_MAX_VALUE,
+    DMX_MIN_CHANNEL,
+    DOMAIN,
+    LOGGER,
+    MAX_UNIVERSE,
+)
+from .effects import effect_engine
+from .entry_fixtures import (
+    build_group_entry_data,
+    build_master_entry_data,
+    build_rig_entry_data,
+    group_member_records,
+    resolve_fixture_channel_values,
+    rig_unique_id,
+    runtime_fixture_index,
+)
+from .fixture_mapping import HomeAssistantError, load_fixture_mapping
+from .flight_recorder import (
+    DEFAULT_RECORDED_FRAMES,
+    DEFAULT_RECORDING_FILE,
+    MAX_RECORDED_FRAMES,
+    async_dump_flight_recorder,
+    async_set_flight_recorder,
+)
+from .output_thread import DEFAULT_OUTPUT_RATE, MAX_OUTPUT_RATE, async_set_output_thread
+from .patch_import import build_patch_entries, load_patch_file
+from .pixel_media import (
+    IMAGE_LAYOUTS,
+    LAYOUT_ROWS,
+    ImageMapper,
+    PixelPlayer,
+    async_play,
+    open_frames,
+    stop_playback,
+)
+from .pixels import MODE_GRADIENT, PIXEL_MODES, pixel_map, pixel_pattern
+from .point_at import async_point_at, point_at_solver
+from .tracing import async_set_latency_tracing
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .pixels import PixelMap
+
+SERVICE_BLACKOUT = "blackout"
+SERVICE_CREATE_GROUP = "create_group"
+SERVICE_CREATE_MASTER = "create_master"
+SERVICE_DUMP_FLIGHT_RECORDER = "dump_flight_recorder"
+SERVICE_IMPORT_PATCH = "import_patch"
+SERVICE_PARK = "park"
+SERVICE_PLAY_PIXELS = "play_pixels"
+SERVICE_POINT_AT = "point_at"
+SERVICE_RELEASE_BLACKOUT = "release_blackout"
+SERVICE_RELEASE_LAYER = "release_layer"
+SERVICE_SET_CHANNELS = "set_channels"
+SERVICE_SET_FLIGHT_RECORDER = "set_flight_recorder"
+SERVICE_SET_LATENCY_TRACING = "set_latency_tracing"
+SERVICE_SET_OUTPUT_THREAD = "set_output_thread"
+SERVICE_SET_PIXELS = "set_pixels"
+SERVICE_SET_RENDER_WORKER = "set_render_worker"
+SERVICE_STOP_PIXELS = "stop_pixels"
+SERVICE_UNPARK = "unpark"
+
+ATTR_CHANNELS = "channels"
+ATTR_COLORS = "colors"
+ATTR_ENABLED = "enabled"
+ATTR_FILE = "file"
+ATTR_FIXTURES = "fixtures"
+ATTR_FPS = "fps"
+ATTR_FRAMES = "frames"
+ATTR_LAYER = "layer"
+ATTR_LAYOUT = "layout"
+ATTR_LOOP = "loop"
+ATTR_MODE = "mode"
+ATTR_RATE = "rate"
+ATTR_RIG_NAME = "rig_name"
+ATTR_X = "x"
+ATTR_Y = "y"
+ATTR_Z = "z"
+
+IMPORT_PATCH_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_FILE): cv.string,
+        vol.Optional(CONF_TARGET_IP): cv.string,
+        vol.Optional(ATTR_RIG_NAME): cv.string,
+        vol.Optional(CONF_UNIVERSE, default=DEFAULT_UNIVERSE): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=MAX_UNIVERSE)
+        ),
+    }
+)
+
+CREATE_GROUP_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME): cv.string,
+        vol.Required(ATTR_FIXTURES): vol.All(
+            cv.ensure_list, [cv.string], vol.Length(min=1)
+        ),
+    }
+)
+
+CREATE_MASTER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME): cv.string,
+        vol.Optional(ATTR_FIXTURES, default=list): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+_DMX_CHANNEL = vol.All(
+    vol.Coerce(int), vol.Range(min=DMX_MIN_CHANNEL, max=DMX_CHANNELS)
+)
+_UNIVERSE = vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_UNIVERSE))
+
+# Raw and fixture-relative channel values, shared by set_channels and park.
+_CHANNEL_VALUE_FIELDS = {
+    vol.Optional(CONF_TARGET_IP): cv.string,
+    vol.Optional(CONF_UNIVERSE, default=DEFAULT_UNIVERSE): _UNIVERSE,
+    vol.Optional(ATTR_CHANNELS): {
+        _DMX_CHANNEL: vol.All(vol.Coerce(int), vol.Range(min=0, max=DMX_MAX_VALUE))
+    },
+    vol.Optional(ATTR_FIXTURES): {
+        cv.string: {
+            vol.Any(vol.Coerce(int), cv.string): vol.Any(vol.Coerce(int), cv.string)
+        }
+    },
+}
+
+SET_CHANNELS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **_CHANNEL_VALUE_FIELDS,
+            vol.Optional(ATTR_LAYER, default=LAYER_BASE): vol.In(
+                [LAYER_BASE, LAYER_EFFECTS, LAYER_OVERRIDE]
+            ),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_CHANNELS, ATTR_FIXTURES),
+    cv.key_dependency(ATTR_CHANNELS, CONF_TARGET_IP),
+)
+
+PARK_SCHEMA = vol.All(
+    vol.Schema(_CHANNEL_VALUE_FIELDS),
+    cv.has_at_least_one_key(ATTR_CHANNELS, ATTR_FIXTURES),
+    cv.key_dependency(ATTR_CHANNELS, CONF_TARGET_IP),
+)
+
+UNPARK_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(CONF_TARGET_IP): cv.string,
+            vol.Optional(CONF_UNIVERSE): _UNIVERSE,
+            vol.Optional(ATTR_CHANNELS): vol.All(cv.ensure_list, [_DMX_CHANNEL]),
+            vol.Optional(ATTR_FIXTURES): vol.All(cv.ensure_list, [cv.string]),
+        }
+    ),
+    cv.key_dependency(CONF_UNIVERSE, CONF_TARGET_IP),
+    cv.key_dependency(ATTR_CHANNELS, CONF_TARGET_IP),
+)
+
+POINT_AT_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_X): vol.Coerce(float),
+        vol.Required(ATTR_Y): vol.Coerce(float),
+        vol.Required(ATTR_Z): vol.Coerce(float),
+        vol.Optional(ATTR_FIXTURES): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_LAYER, default=LAYER_BASE): vol.In(
+            [LAYER_BASE, LAYER_EFFECTS, LAYER_OVERRIDE]
+        ),
+    }
+)
+
+_PIXEL_COLOR = vol.All(
+    [vol.All(vol.Coerce(int), vol.Range(min=0, max=DMX_MAX_VALUE))],
+    vol.Length(min=3, max=4),
+)
+
+SET_PIXELS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_COLORS): vol.All([_PIXEL_COLOR], vol.Length(min=1)),
+        vol.Optional(ATTR_MODE, default=MODE_GRADIENT): vol.In(PIXEL_MODES),
+        vol.Optional(ATTR_FIXTURES): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_LAYER, default=LAYER_BASE): vol.In(
+            [LAYER_BASE, LAYER_EFFECTS, LAYER_OVERRIDE]
+        ),
+    }
+)
+
+PLAY_PIXELS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_FILE): cv.string,
+        vol.Optional(ATTR_FIXTURES): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_LAYOUT, default=LAYOUT_ROWS): vol.In(IMAGE_LAYOUTS),
+        vol.Optional(ATTR_FPS): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=100)),
+        vol.Optional(ATTR_LOOP, default=False): cv.boolean,
+        vol.Optional(ATTR_LAYER, default=LAYER_BASE): vol.In(
+            [LAYER_BASE, LAYER_EFFECTS, LAYER_OVERRIDE]
+        ),
+    }
+)
+
+STOP_PIXELS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_FIXTURES): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+SET_RENDER_WORKER_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENABLED): cv.boolean,
+    }
+)
+
+SET_LATENCY_TRACING_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENABLED): cv.boolean,
+    }
+)
+
+SET_FLIGHT_RECORDER_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENABLED): cv.boolean,
+        vol.Optional(ATTR_FRAMES, default=DEFAULT_RECORDED_FRAMES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_RECORDED_FRAMES)
+        ),
+    }
+)
+
+DUMP_FLIGHT_RECORDER_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_FILE, default=DEFAULT_RECORDING_FILE): cv.string,
+    }
+)
+
+SET_OUTPUT_THREAD_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENABLED): cv.boolean,
+        vol.Optional(ATTR_RATE, default=DEFAULT_OUTPUT_RATE): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=MAX_OUTPUT_RATE)
+        ),
+    }
+)
+
+RELEASE_LAYER_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_LAYER): vol.In([LAYER_EFFECTS, LAYER_OVERRIDE]),
+            vol.Optional(CONF_TARGET_IP): cv.string,
+            vol.Optional(CONF_UNIVERSE): _UNIVERSE,
+        }
+    ),
+    cv.key_dependency(CONF_UNIVERSE, CONF_TARGET_IP),
+)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services once per Home Assistant instance."""
+    if hass.services.has_service(DOMAIN, SERVICE_IMPORT_PATCH):
+        return
+
+    async def _async_import_patch(call: ServiceCall) -> ServiceResponse:
+        """Create fixture entries in bulk from a patch file."""
+        file_path = hass.config.path(call.data[ATTR_FILE])
+        if not hass.config.is_allowed_path(file_path):
+            raise HomeAssistantError(f"Access to {file_path} is not allowed")
+
+        records = await hass.async_add_executor_job(load_patch_file, file_path)
+        mapping = await hass.async_add_executor_job(load_fixture_mapping)
+        existing_entries = hass.config_entries.async_entries(DOMAIN)
+        if call.data.get(ATTR_RIG_NAME):
+            # A rig's own fixtures are replaced by the patch, not in its way.
+            rig_id = rig_unique_id(call.data[ATTR_RIG_NAME])
+            existing_entries = [
+                entry for entry in existing_entries if entry.unique_id != rig_id
+            ]
+        entries = build_patch_entries(
+            records,
+            mapping,
+            target_ip=call.data.get(CONF_TARGET_IP),
+            universe=call.data[CONF_UNIVERSE],
+            existing_entries=existing_entries,
+        )
+
+        updated: list[str] = []
+        if call.data.get(ATTR_RIG_NAME):
+            # One rig entry hosts the whole patch and sets it up in one platform pass.
+            result = await hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={"source": SOURCE_IMPORT},
+                data=build_rig_entry_data(call.data[ATTR_RIG_NAME], entries),
+            )
+            fixture_ids = [entry_data[CONF_FIXTURE_ID] for entry_data in entries]
+            created = (
+                fixture_ids if result.get("type") == FlowResultType.CREATE_ENTRY else []
+            )
+            if result.get("reason") == "rig_updated":
+                updated = fixture_ids
+        else:
+            results = await asyncio.gather(
+                *(
+                    hass.config_entries.flow.async_init(
+                        DOMAIN,
+                        context={"source": SOURCE_IMPORT},
+                        data=entry_data,
+                    )
+                    for entry_data in entries
+                )
+            )
+            created = [
+                entry_data[CONF_FIXTURE_ID]
+                for entry_data, result in zip(entries, results, strict=True)
+                if result.get("type") == FlowResultType.CREATE_ENTRY
+            ]
+        LOGGER.info(
+            "Imported %s of %s fixtures from %s",
+            len(created) + len(updated),
+            len(entries),
+            file_path,
+        )
+        response: dict[str, Any] = {"created": created, "updated": updated}
+        return response
+
+    def _validate_members(members: list[str]) -> None:
+        """Raise when any fixture id is not configured."""
+        known = {
+            fixture[CONF_FIXTURE_ID]
+            for fixture in group_member_records(
+                hass.config_entries.async_entries(DOMAIN), members
+            )
+        }
+        unknown = [member for member in members if member not in known]
+        if unknown:
+            msg = f"Unknown fixtures: {', '.join(unknown)}"
+            raise HomeAssistantError(msg)
+
+    async def _async_create_group(call: ServiceCall) -> None:
+        """Create a fixture group entry from configured fixture ids."""
+        members = list(dict.fromkeys(call.data[ATTR_FIXTURES]))
+        _validate_members(members)
+
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN,
+            context={"source": SOURCE_IMPORT},
+            data=build_group_entry_data(call.data[CONF_NAME], members),
+        )
+        if result.get("type") != FlowResultType.CREATE_ENTRY:
+            msg = f"Fixture group {call.data[CONF_NAME]} already exists"
+            raise HomeAssistantError(msg)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CREATE_GROUP,
+        _async_create_group,
+        schema=CREATE_GROUP_SCHEMA,
+    )
+
+    async def _async_create_master(call: ServiceCall) -> None:
+        """Create a grand master (no fixtures) or a submaster entry."""
+        members = list(dict.fromkeys(call.data[ATTR_FIXTURES]))
+        _validate_members(members)
+
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN,
+            context={"source": SOURCE_IMPORT},
+            data=build_master_entry_data(call.data[CONF_NAME], members),
+        )
+        if result.get("type") != FlowResultType.CREATE_ENTRY:
+            msg = f"Master {call.data[CONF_NAME]} already exists"
+            raise HomeAssistantError(msg)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CREATE_MASTER,
+        _async_create_master,
+        schema=CREATE_MASTER_SCHEMA,
+    )
+
+    async def _async_set_channels(call: ServiceCall) -> None:
+        """Write many raw or fixture-relative channels with one frame per universe."""
+        writes = await _async_resolve_channel_writes(hass, call.data)
+        layer = call.data[ATTR_LAYER]
+        if layer == LAYER_BASE:
+            await asyncio.gather(
+                *(
+                    artnet_helper.set_channels(channel_values)
+                    for artnet_helper, channel_values in writes
+                )
+            )
+            return
+        await asyncio.gather(
+            *(
+                artnet_helper.set_layer_channels(layer, channel_values)
+                for artnet_helper, channel_values in writes
+            )
+        )
+
+    async def _async_release_layer(call: ServiceCall) -> None:
+        """Release a compositor layer on one universe, one device or every universe."""
+        helpers = hass.data.get(DOMAIN, {}).get(DATA_SHARED_HELPERS, {})
+        target_ip = call.data.get(CONF_TARGET_IP)
+        universe = call.data.get(CONF_UNIVERSE)
+        await asyncio.gather(
+            *(
+                artnet_helper.release_layer(call.data[ATTR_LAYER])
+                for (helper_ip, helper_universe), artnet_helper in helpers.items()
+                if target_ip in (None, helper_ip)
+                and universe in (None, helper_universe)
+            )
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_CHANNELS,
+        _async_set_channels,
+        schema=SET_CHANNELS_SCHEMA,
+    )
+
+    async def _async_point_at(call: ServiceCall) -> None:
+        """Aim moving heads at a point in patch coordinates."""
+        fixture_index = runtime_fixture_index(hass)
+        fixture_ids = list(dict.fromkeys(call.data.get(ATTR_FIXTURES) or fixture_index))
+        unknown = [
+            fixture_id for fixture_id in fixture_ids if fixture_id not in fixture_index
+        ]
+        if unknown:
+            msg = f"Unknown fixtures: {', '.join(unknown)}"
+            raise HomeAssistantError(msg)
+        mapping = await hass.async_add_executor_job(load_fixture_mapping)
+        solver = point_at_solver(
+            hass, [fixture_index[fixture_id] for fixture_id in fixture_ids], mapping
+        )
+        if call.data.get(ATTR_FIXTURES):
+            unable = [
+                fixture_id
+                for fixture_id in fixture_ids
+                if fixture_id not in solver.fixture_ids
+            ]
+            if unable:
+                msg = (
+                    "Fixtures without a location or 16-bit pan/tilt: "
+                    f"{', '.join(unable)}"
+                )
+                raise HomeAssistantError(msg)
+        if not len(solver):
+            msg = "No moving head with a location is configured"
+            raise HomeAssistantError(msg)
+        target = (call.data[ATTR_X], call.data[ATTR_Y], call.data[ATTR_Z])
+        await async_point_at(solver, target, call.data[ATTR_LAYER])
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_POINT_AT, _async_point_at, schema=POINT_AT_SCHEMA
+    )
+
+    async def _async_resolve_pixels(data: dict[str, Any]) -> PixelMap:
+        """Return the pixel map of the selected (or all) pixel fixtures."""
+        fixture_index = runtime_fixture_index(hass)
+        fixture_ids = list(dict.fromkeys(data.get(ATTR_FIXTURES) or fixture_index))
+        unknown = [
+            fixture_id for fixture_id in fixture_ids if fixture_id not in fixture_index
+        ]
+        if unknown:
+            msg = f"Unknown fixtures: {', '.join(unknown)}"
+            raise HomeAssistantError(msg)
+        mapping = await hass.async_add_executor_job(load_fixture_mapping)
+        pixels = pixel_map(
+            hass, [fixture_index[fixture_id] for fixture_id in fixture_ids], mapping
+        )
+        if data.get(ATTR_FIXTURES):
+            unable = [
+                fixture_id
+                for fixture_id in fixture_ids
+                if fixture_id not in pixels.fixture_ids
+            ]
+            if unable:
+                msg = f"Fixtures without pixels: {', '.join(unable)}"
+                raise HomeAssistantError(msg)
+        if not len(pixels):
+            msg = "No pixel fixture is configured"
+            raise HomeAssistantError(msg)
+        return pixels
+
+    async def _async_set_pixels(call: ServiceCall) -> None:
+        """Fill pixel fixtures with a gradient or pattern, one write per universe."""
+        pixels = await _async_resolve_pixels(call.data)
+        stop_playback(hass, pixels.fixture_ids)
+        pixels.set_pixels(
+            pixel_pattern(call.data[ATTR_COLORS], len(pixels), call.data[ATTR_MODE])
+        )
+        await pixels.async_write(call.data[ATTR_LAYER])
+
+    async def _async_play_pixels(call: ServiceCall) -> None:
+        """Stream an image, animation or .npy frame stack onto pixel fixtures."""
+        file_path = hass.config.path(call.data[ATTR_FILE])
+        if not hass.config.is_allowed_path(file_path):
+            raise HomeAssistantError(f"Access to {file_path} is not allowed")
+        pixels = await _async_resolve_pixels(call.data)
+        source = await hass.async_add_executor_job(open_frames, file_path)
+        player = PixelPlayer(
+            ImageMapper(pixels, call.data[ATTR_LAYOUT]),
+            source,
+            fps=call.data.get(ATTR_FPS),
+            loop=call.data[ATTR_LOOP],
+            layer=call.data[ATTR_LAYER],
+        )
+        async_play(hass, player)
+
+    async def _async_stop_pixels(call: ServiceCall) -> None:
+        """Stop pixel playback on some fixtures or everywhere."""
+        stop_playback(hass, call.data.get(ATTR_FIXTURES))
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_PIXELS, _async_set_pixels, schema=SET_PIXELS_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_PLAY_PIXELS, _async_play_pixels, schema=PLAY_PIXELS_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_STOP_PIXELS, _async_stop_pixels, schema=STOP_PIXELS_SCHEMA
+    )
+
+    async def _async_set_render_worker(call: ServiceCall) -> None:
+        """Render effects in a worker process, or back in the event loop."""
+        await effect_engine(hass).async_set_render_worker(call.data[ATTR_ENABLED])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_RENDER_WORKER,
+        _async_set_render_worker,
+        schema=SET_RENDER_WORKER_SCHEMA,
+    )
+
+    async def _async_set_output_thread(call: ServiceCall) -> ServiceResponse:
+        """Send frames from a dedicated thread or the event loop; return the jitter."""
+        return await async_set_output_thread(
+            hass, call.data[ATTR_ENABLED], call.data[ATTR_RATE]
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_OUTPUT_THREAD,
+        _async_set_output_thread,
+        schema=SET_OUTPUT_THREAD_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def _async_set_latency_tracing(call: ServiceCall) -> ServiceResponse:
+        """Start tracing writes afresh, or stop; return the histograms so far."""
+        return async_set_latency_tracing(hass, call.data[ATTR_ENABLED])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_LATENCY_TRACING,
+        _async_set_latency_tracing,
+        schema=SET_LATENCY_TRACING_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def _async_set_flight_recorder(call: ServiceCall) -> None:
+        """Keep the last frames of every universe, or stop and drop them."""
+        async_set_flight_recorder(hass, call.data[ATTR_ENABLED], call.data[ATTR_FRAMES])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_FLIGHT_RECORDER,
+        _async_set_flight_recorder,
+        schema=SET_FLIGHT_RECORDER_SCHEMA,
+    )
+
+    async def _async_dump_flight_recorder(call: ServiceCall) -> ServiceResponse:
+        """Write the recorded frames of every universe to a binary file."""
+        file_path = hass.config.path(call.data[ATTR_FILE])
+        if not hass.config.is_allowed_path(file_path):
+            raise HomeAssistantError(f"Access to {file_path} is not allowed")
+        return await async_dump_flight_recorder(hass, file_path)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DUMP_FLIGHT_RECORDER,
+        _async_dump_flight_recorder,
+        schema=DUMP_FLIGHT_RECORDER_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def _async_park(call: ServiceCall) -> None:
+        """Pin raw or fixture-relative channels, one frame per universe."""
+        writes = await _async_resolve_channel_writes(hass, call.data)
+        await asyncio.gather(
+            *(
+                artnet_helper.park_channels(channel_values)
+                for artnet_helper, channel_values in writes
+            )
+        )
+
+    async def _async_unpark(call: ServiceCall) -> None:
+        """Release parked channels of fixtures, of one universe or everywhere."""
+        releases = _resolve_unpark(hass, call.data)
+        await asyncio.gather(
+            *(
+                artnet_helper.unpark_channels(channels)
+                for artnet_helper, channels in releases
+            )
+        )
+
+    hass.services.async_register(DOMAIN, SERVICE_PARK, _async_park, schema=PARK_SCHEMA)
+    hass.services.async_register(
+        DOMAIN, SERVICE_UNPARK, _async_unpark, schema=UNPARK_SCHEMA
+    )
+
+    async def _async_blackout(_call: ServiceCall) -> ServiceResponse:
+        """Zero every universe immediately."""
+        return async_blackout(hass)
+
+    async def _async_release_blackout(_call: ServiceCall) -> None:
+        """Restore every universe's output after a blackout."""
+        await async_release_blackout(hass)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BLACKOUT,
+        _async_blackout,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RELEASE_BLACKOUT,
+        _async_release_blackout,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RELEASE_LAYER,
+        _async_release_layer,
+        schema=RELEASE_LAYER_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_PATCH,
+        _async_import_patch,
+        schema=IMPORT_PATCH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+async def _async_resolve_channel_writes(
+    hass: HomeAssistant,
+    data: dict[str, Any],
+) -> list[tuple[Any, dict[int, int]]]:
+    """
+    Validate a `set_channels` call and group its values per universe helper.
+
+    Everything is resolved before anything is written, so an invalid address
+    anywhere in the call leaves every universe untouched.
+    """
+    writes: dict[int, tuple[Any, dict[int, int]]] = {}
+
+    if ATTR_CHANNELS in data:
+        helper_key = (data[CONF_TARGET_IP], data[CONF_UNIVERSE])
+        artnet_helper = (
+            hass.data.get(DOMAIN, {}).get(DATA_SHARED_HELPERS, {}).get(helper_key)
+        )
+        if artnet_helper is None:
+            msg = (
+                f"No fixture is configured on {helper_key[0]} universe {helper_key[1]}"
+            )
+            raise HomeAssistantError(msg)
+        writes[id(artnet_helper)] = (artnet_helper, dict(data[ATTR_CHANNELS]))
+
+    if data.get(ATTR_FIXTURES):
+        fixture_index = runtime_fixture_index(hass)
+        mapping = await hass.async_add_executor_job(load_fixture_mapping)
+        for fixture_id, values in data[ATTR_FIXTURES].items():
+            if fixture_id not in fixture_index:
+                msg = f"Unknown fixture {fixture_id}"
+                raise HomeAssistantError(msg)
+            fixture, artnet_helper = fixture_index[fixture_id]
+            fixture_def = mapping.get("fixtures", {}).get(
+                fixture[CONF_FIXTURE_TYPE], {}
+            )
+            channel_values = resolve_fixture_channel_values(
+                fixture, fixture_def, values
+            )
+            writes.setdefault(id(artnet_helper), (artnet_helper, {}))[1].update(
+                channel_values
+            )
+
+    return list(writes.values())
+
+
+def _resolve_unpark(
+    hass: HomeAssistant,
+    data: dict[str, Any],
+) -> list[tuple[Any, list[int] | None]]:
+    """
+    Return `(helper, channels)` pairs to unpark; `channels` None means all.
+
+    Without fixtures or channels every parked channel on the selected target
+    and universe (or on every universe) is released.
+    """
+    helpers = hass.data.get(DOMAIN, {}).get(DATA_SHARED_HELPERS, {})
+    releases: dict[int, tuple[Any, list[int] | None]] = {}
+
+    if ATTR_CHANNELS in data:
+        helper_key = (data[CONF_TARGET_IP], data.get(CONF_UNIVERSE, DEFAULT_UNIVERSE))
+        if helper_key not in helpers:
+            msg = (
+                f"No fixture is configured on {helper_key[0]} universe {helper_key[1]}"
+            )
+            raise HomeAssistantError(msg)
+        releases[id(helpers[helper_key])] = (
+            helpers[helper_key],
+            list(data[ATTR_CHANNELS]),
+        )
+
+    if data.get(ATTR_FIXTURES):
+        fixture_index = runtime_fixture_index(hass)
+        for fixture_id in data[ATTR_FIXTURES]:
+            if fixture_id not in fixture_index:
+                msg = f"Unknown fixture {fixture_id}"
+                raise HomeAssistantError(msg)
+            fixture, artnet_helper = fixture_index[fixture_id]
+            start = int(fixture[CONF_START_CHANNEL])
+            channels = range(start, start + int(fixture[CONF_CHANNEL_COUNT]))
+            releases.setdefault(id(artnet_helper), (artnet_helper, []))[1].extend(
+                channels
+            )
+
+    if ATTR_CHANNELS in data or data.get(ATTR_FIXTURES):
+        return list(releases.values())
+
+    target_ip = data.get(CONF_TARGET_IP)
+    universe = data.get(CONF_UNIVERSE)
+    return [
+        (artnet_helper, None)
+        for (helper_ip, helper_universe), artnet_helper in helpers.items()
+        if target_ip in (None, helper_ip) and universe in (None, helper_universe)
+    ]
@@ -0,0 +1,68 @@
+"""
+Rate-limited Home Assistant state publishing for DMX entities.
+
+DMX output runs at full rate, but publishing every intermediate value to the
+state machine (and recorder) during fades, effects or external input is
+wasteful. Entities publish through `async_write_throttled_state`, which writes
+immediately when the entity has been quiet for `STATE_WRITE_INTERVAL` seconds
+and otherwise schedules one trailing write, so the final value always lands.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+
+if TYPE_CHECKING:
+    from homeassistant.core import CALLBACK_TYPE
+
+STATE_WRITE_INTERVAL = 0.25  # seconds; at most 4 state writes per second per entity
+
+
+class ThrottledStateMixin:
+    """Entity mixin limiting how often state is written to Home Assistant."""
+
+    _state_write_interval: float = STATE_WRITE_INTERVAL
+    _last_state_write: float = float("-inf")
+    _cancel_state_write: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_write_throttled_state(self) -> None:
+        """Publish state now, or once the throttle interval has passed."""
+        if self._cancel_state_write is not None:
+            # A trailing write is pending and will publish the latest values.
+            return
+        remaining = self._state_write_interval - (
+            time.monotonic() - self._last_state_write
+        )
+        if remaining <= 0 or self.hass is None:
+            self._async_publish_state()
+            return
+        self._cancel_state_write = async_call_later(
+            self.hass, remaining, self._async_publish_pending
+        )
+
+    @callback
+    def _async_publish_pending(self, _now: object) -> None:
+        """Publish the state held back by the throttle."""
+        self._cancel_state_write = None
+        self._async_publish_state()
+
+    @callback
+    def _async_publish_state(self) -> None:
+        """Write the current state, ignoring entities not added to Home Assistant."""
+        self._last_state_write = time.monotonic()
+        try:
+            self.async_write_ha_state()
+        except RuntimeError:
+            pass
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop a pending trailing write when the entity goes away."""
+        if self._cancel_state_write is not None:
+            self._cancel_state_write()
+            self._cancel_state_write = None
+        await super().async_will_remove_from_hass()
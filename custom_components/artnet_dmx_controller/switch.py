@@ -0,0 +1,73 @@
+"""Switch platform for ArtNet DMX Controller."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.switch import SwitchEntity
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .blackout import (
+    SIGNAL_BLACKOUT_CHANGED,
+    async_blackout,
+    async_release_blackout,
+    blackout_active,
+)
+from .const import CONF_MEMBERS, CONF_NAME, DOMAIN
+from .entry_fixtures import is_master_entry
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+
+async def async_setup_entry(
+    _hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the blackout switch on grand master entries."""
+    if is_master_entry(entry) and not entry.data.get(CONF_MEMBERS):
+        async_add_entities(
+            [
+                ArtNetDMXBlackoutSwitch(
+                    entry.entry_id, entry.data.get(CONF_NAME) or entry.title
+                )
+            ]
+        )
+
+
+class ArtNetDMXBlackoutSwitch(SwitchEntity):
+    """Switch blacking out every universe while on."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_name = "Blackout"
+    _attr_icon = "mdi:lightbulb-off"
+
+    def __init__(self, entry_id: str, master_label: str) -> None:
+        self._attr_unique_id = f"{entry_id}_blackout"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            name=master_label,
+        )
+
+    async def async_added_to_hass(self) -> None:
+        # Follow blackouts started or released by services or other switches.
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_BLACKOUT_CHANGED, self.async_write_ha_state
+            )
+        )
+
+    @property
+    def is_on(self) -> bool:
+        return blackout_active(self.hass)
+
+    async def async_turn_on(self, **_kwargs: Any) -> None:
+        async_blackout(self.hass)
+
+    async def async_turn_off(self, **_kwargs: Any) -> None:
+        await async_release_blackout(self.hass)
@@ -0,0 +1,117 @@
+"""
+Opt-in latency tracing from a light call to the UDP send.
+
+While tracing is enabled, light entities stamp the monotonic time a call
+started and hand it to their `DMXWriter` with the write. The writer stamps
+the write as it queues it, when its debounced flush wakes up, and when the
+flush holds its lock. It then gives the resulting `Trace` to the helper,
+which stamps the frame as it leaves the event loop, as the executor starts
+the send and as the packet leaves the socket. A finished trace is split into
+stages and each stage is counted in its own `LatencyHistogram`, so tracing
+keeps no samples however long it runs.
+
+With tracing disabled nothing is stamped: helpers hold no tracer and the
+only cost is one attribute check per write.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+
+from .const import DATA_LATENCY_TRACER, DATA_SHARED_HELPERS, DOMAIN, LOGGER
+from .output_metrics import LatencyHistogram
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .artnet import ArtNetDMXHelper
+
+# Stages in the order a write passes them, each between two stamps of a `Trace`.
+STAGES = (
+    ("call", "origin", "enqueued"),  # entity work until the writer queues the write
+    ("debounce", "enqueued", "flushed"),  # waiting for the writer's flush to run
+    ("lock_wait", "flushed", "locked"),  # the flush waiting for the writer's lock
+    ("compose", "locked", "handed_over"),  # buffer write and layer composition
+    ("executor_hop", "handed_over", "executor_started"),  # queued for the executor
+    ("socket_send", "executor_started", "sent"),  # the sendto call
+    ("resume", "sent", "resumed"),  # back on the event loop after the send
+    ("total", "origin", "sent"),  # from the call to the packet leaving the socket
+)
+
+
+class Trace:
+    """Monotonic stamps of one traced write; unset stamps are None."""
+
+    __slots__ = (
+        "enqueued",
+        "executor_started",
+        "flushed",
+        "handed_over",
+        "locked",
+        "origin",
+        "resumed",
+        "sent",
+    )
+
+    def __init__(self, origin: float, enqueued: float) -> None:
+        self.origin = origin
+        self.enqueued = enqueued
+        self.flushed: float | None = None
+        self.locked: float | None = None
+        self.handed_over: float | None = None
+        self.executor_started: float | None = None
+        self.sent: float | None = None
+        self.resumed: float | None = None
+
+
+class LatencyTracer:
+    """Per-stage latency histograms of traced writes."""
+
+    def __init__(self) -> None:
+        self.stages = {stage: LatencyHistogram() for stage, _start, _end in STAGES}
+        self.started = time.monotonic()
+
+    def finish(self, trace: Trace) -> None:
+        """Count the stages of a finished trace; stages missing a stamp are skipped."""
+        for stage, start, end in STAGES:
+            started, ended = getattr(trace, start), getattr(trace, end)
+            if started is not None and ended is not None:
+                self.stages[stage].record(max(ended - started, 0.0))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return every stage's percentiles in milliseconds."""
+        return {
+            "traced_seconds": round(time.monotonic() - self.started, 1),
+            "stages": {
+                stage: histogram.as_dict() for stage, histogram in self.stages.items()
+            },
+        }
+
+
+def latency_tracer(hass: HomeAssistant) -> LatencyTracer | None:
+    """Return the running tracer, if tracing is enabled."""
+    return hass.data.get(DOMAIN, {}).get(DATA_LATENCY_TRACER)
+
+
+def attach_tracer(hass: HomeAssistant, artnet_helper: ArtNetDMXHelper) -> None:
+    """Trace a new helper's writes when tracing is enabled."""
+    artnet_helper.tracer = latency_tracer(hass)
+
+
+def async_set_latency_tracing(hass: HomeAssistant, enabled: bool) -> dict[str, Any]:
+    """
+    Enable tracing with empty histograms, or disable it.
+
+    Returns the histograms traced until now, if tracing was enabled.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    previous = domain_data.pop(DATA_LATENCY_TRACER, None)
+    tracer = LatencyTracer() if enabled else None
+    if tracer is not None:
+        domain_data[DATA_LATENCY_TRACER] = tracer
+    for artnet_helper in domain_data.get(DATA_SHARED_HELPERS, {}).values():
+        artnet_helper.tracer = tracer
+    if enabled != (previous is not None):
+        LOGGER.info("Latency tracing %s", "enabled" if enabled else "disabled")
+    return previous.as_dict() if previous is not None else {}
@@ -0,0 +1,166 @@
+"""
+Persistence of universe buffers across Home Assistant restarts.
+
+Helpers report every buffer change; the store coalesces them into at most one
+write every `SAVE_DELAY` seconds and restores the last saved buffer before a
+new helper sends its first frame, so restarts do not black out the rig.
+Master levels are saved too, so a dimmed rig restarts dimmed: the buffers
+hold unscaled values and would otherwise come back at full.
+Parked channels are saved alongside the buffers and re-parked on restore.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from .const import DMX_CHANNELS, DMX_MAX_VALUE, DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .artnet import ArtNetDMXHelper
+    from .masters import MasterBoard
+
+STORAGE_KEY = f"{DOMAIN}.universes"
+STORAGE_VERSION = 1
+SAVE_DELAY = 5
+
+
+def _storage_key(helper_key: tuple[str, int]) -> str:
+    """Return the JSON key used for one target/universe pair."""
+    return f"{helper_key[0]}/{helper_key[1]}"
+
+
+class UniverseStateStore:
+    """Debounced persistent storage for shared universe buffers."""
+
+    def __init__(self, hass: HomeAssistant, store: Any | None = None) -> None:
+        self._store = (
+            store if store is not None else Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        )
+        self._saved: dict[str, str] = {}
+        self._masters: dict[str, int] = {}
+        self._parked: dict[str, dict[str, int]] = {}
+        self._helpers: dict[tuple[str, int], ArtNetDMXHelper] = {}
+        self._save_scheduled = False
+
+    async def async_load(self) -> None:
+        """Load persisted buffers from disk."""
+        data = await self._store.async_load() or {}
+        universes = data.get("universes", {})
+        if isinstance(universes, dict):
+            self._saved = {str(key): str(value) for key, value in universes.items()}
+        masters = data.get("masters", {})
+        if isinstance(masters, dict):
+            self._masters = {
+                str(master_id): int(level)
+                for master_id, level in masters.items()
+                if isinstance(level, int) and 0 <= level <= DMX_MAX_VALUE
+            }
+        parked = data.get("parked", {})
+        if isinstance(parked, dict):
+            self._parked = {
+                str(key): dict(value)
+                for key, value in parked.items()
+                if isinstance(value, dict)
+            }
+
+    def restore(
+        self, helper_key: tuple[str, int], artnet_helper: ArtNetDMXHelper
+    ) -> bool:
+        """
+        Load one universe's saved buffer and parked channels into a helper.
+
+        Return True if a buffer was found.
+        """
+        parked = self._parked.get(_storage_key(helper_key))
+        if parked and hasattr(artnet_helper, "restore_parked"):
+            try:
+                artnet_helper.restore_parked(
+                    {int(channel): int(value) for channel, value in parked.items()}
+                )
+            except ValueError:
+                LOGGER.warning(
+                    "Ignoring corrupt parked channels for %s", _storage_key(helper_key)
+                )
+        saved = self._saved.get(_storage_key(helper_key))
+        if not saved:
+            return False
+        try:
+            buffer = bytes.fromhex(saved)
+        except ValueError:
+            LOGGER.warning(
+                "Ignoring corrupt saved DMX buffer for %s", _storage_key(helper_key)
+            )
+            return False
+        artnet_helper.restore_buffer(buffer[:DMX_CHANNELS])
+        return True
+
+    def track(
+        self, helper_key: tuple[str, int], artnet_helper: ArtNetDMXHelper
+    ) -> None:
+        """Persist a helper's buffer whenever it changes."""
+        self._helpers[helper_key] = artnet_helper
+        artnet_helper.on_buffer_changed = self.async_schedule_save
+
+    def untrack(self, helper_key: tuple[str, int]) -> None:
+        """Stop tracking a helper, keeping its last buffer for the next start."""
+        artnet_helper = self._helpers.pop(helper_key, None)
+        if artnet_helper is None:
+            return
+        artnet_helper.on_buffer_changed = None
+        self._snapshot(helper_key, artnet_helper)
+        self.async_schedule_save()
+
+    def master_level(self, master_id: str) -> int:
+        """Return a master's saved level, full when none was saved."""
+        return self._masters.get(master_id, DMX_MAX_VALUE)
+
+    def track_masters(self, board: MasterBoard) -> None:
+        """Persist master levels whenever one is set."""
+        board.on_level_changed = self.async_save_master_level
+
+    @callback
+    def async_save_master_level(self, master_id: str, level: int) -> None:
+        """Remember a master's level and schedule a write."""
+        self._masters[master_id] = level
+        self.async_schedule_save()
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule one coalesced write unless a write is already pending."""
+        if self._save_scheduled:
+            return
+        self._save_scheduled = True
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Snapshot all tracked buffers for the pending write."""
+        self._save_scheduled = False
+        for helper_key, artnet_helper in self._helpers.items():
+            self._snapshot(helper_key, artnet_helper)
+        return {
+            "universes": dict(self._saved),
+            "parked": dict(self._parked),
+            "masters": dict(self._masters),
+        }
+
+    def _snapshot(
+        self, helper_key: tuple[str, int], artnet_helper: ArtNetDMXHelper
+    ) -> None:
+        """Copy one helper's buffer and parked channels into the saved data."""
+        key = _storage_key(helper_key)
+        self._saved[key] = artnet_helper.get_buffer().hex()
+        parked = (
+            artnet_helper.get_parked() if hasattr(artnet_helper, "get_parked") else {}
+        )
+        if parked:
+            self._parked[key] = {
+                str(channel): value for channel, value in parked.items()
+            }
+        else:
+            self._parked.pop(key, None)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Measure blackout latency across many universes.
+
+Creates helpers with real UDP sockets sending to a local port and times
+`async_blackout` (every zero frame on the wire) over many runs, reporting
+the median and worst case against `BLACKOUT_LATENCY_TARGET`. Run from the
+repository root:
+
+    python scripts/benchmark_blackout.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import statistics
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper  # noqa: E402
+from custom_components.artnet_dmx_controller.blackout import (  # noqa: E402
+    BLACKOUT_LATENCY_TARGET,
+    async_blackout,
+    async_release_blackout,
+)
+
+UNIVERSE_COUNTS = (1, 8, 32)
+RUNS = 200
+
+
+async def _bench(count: int, port: int) -> list[float]:
+    helpers = {}
+    for universe in range(count):
+        helper = ArtNetDMXHelper(
+            hass=None, target_ip="127.0.0.1", universe=universe, port=port
+        )
+        helper.setup_socket()
+        await helper.set_channels({1: 255, 512: 255})
+        helpers[("127.0.0.1", universe)] = helper
+    hass = SimpleNamespace(data={"artnet_dmx_controller": {"shared_helpers": helpers}})
+
+    latencies = []
+    for _ in range(RUNS):
+        latencies.append(async_blackout(hass)["latency_ms"])
+        await async_release_blackout(hass)
+    for helper in helpers.values():
+        helper.close_socket()
+    return latencies
+
+
+async def main() -> None:
+    sink = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sink.bind(("127.0.0.1", 0))
+    sink.setblocking(False)  # noqa: FBT003
+    port = sink.getsockname()[1]
+    print(f"target: {BLACKOUT_LATENCY_TARGET * 1000:.1f} ms")
+    print(f"{'universes':>9} {'median':>9} {'worst':>9}")
+    for count in UNIVERSE_COUNTS:
+        latencies = await _bench(count, port)
+        median, worst = statistics.median(latencies), max(latencies)
+        print(f"{count:>9} {median:>7.3f}ms {worst:>7.3f}ms")
+    sink.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Compare bytearray and NumPy universe buffers for bulk channel updates.
+
+For updates of 10, 100 and 512 channels it times:
+
+- `dict`: a validated `{channel: value}` write, the path taken by
+  `ArtNetDMXHelper.set_channels` (entities, `set_channels` service);
+- `indexed`: a scatter into a precomputed index array, the path taken by
+  `ArtNetDMXHelper.set_indexed` (fixture groups and compiled fixtures).
+
+Only the buffer update is measured; packet construction and the socket send
+are identical for both backends. Run from the repository root:
+
+    python scripts/benchmark_buffer.py
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.artnet_dmx_controller import buffer  # noqa: E402
+
+UPDATE_SIZES = (10, 100, 512)
+REPEAT = 5
+
+
+def _time(statement, number: int) -> float:
+    """Return the best per-call time in microseconds."""
+    return min(timeit.repeat(statement, number=number, repeat=REPEAT)) / number * 1e6
+
+
+def _bench(size: int, use_numpy: bool) -> tuple[float, float]:
+    rng = random.Random(size)
+    channels = sorted(rng.sample(range(1, 513), size))
+    values = [rng.randrange(256) for _ in channels]
+    channel_values = dict(zip(channels, values, strict=True))
+    data = buffer.new_universe_buffer(use_numpy)
+    indices = buffer.channel_indices(channels, use_numpy)
+    indexed_values = buffer.tiled_values([(values, 1)]) if use_numpy else values
+    number = 20000 if size <= 100 else 5000
+
+    dict_us = _time(lambda: buffer.apply_channel_values(data, channel_values), number)
+    indexed_us = _time(lambda: buffer.scatter(data, indices, indexed_values), number)
+    return dict_us, indexed_us
+
+
+def main() -> None:
+    if not buffer.HAS_NUMPY:
+        print("NumPy is not installed; only the bytearray backend is available.")
+        return
+    print(
+        f"{'channels':>8} {'bytearray dict':>15} {'numpy dict':>11} "
+        f"{'bytearray idx':>14} {'numpy idx':>10}"
+    )
+    for size in UPDATE_SIZES:
+        byte_dict, byte_indexed = _bench(size, use_numpy=False)
+        numpy_dict, numpy_indexed = _bench(size, use_numpy=True)
+        print(
+            f"{size:>8} {byte_dict:>13.2f}us {numpy_dict:>9.2f}us "
+            f"{byte_indexed:>12.2f}us {numpy_indexed:>8.2f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Time composing output frames from layered universes.
+
+Builds 8 universes with 16 populated layers each (half the channels marked
+as intensity) and times one compose pass over all of them, for the NumPy
+and the pure-Python backend. With NumPy it also checks that composing does
+not allocate new arrays. Run from the repository root:
+
+    python scripts/benchmark_compositor.py
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.artnet_dmx_controller import buffer  # noqa: E402
+from custom_components.artnet_dmx_controller.compositor import (
+    UniverseCompositor,  # noqa: E402
+)
+
+UNIVERSES = 8
+LAYERS = 16
+REPEAT = 5
+
+
+def _universes(use_numpy: bool) -> list[tuple[UniverseCompositor, object]]:
+    rng = random.Random(LAYERS)
+    universes = []
+    for _ in range(UNIVERSES):
+        compositor = UniverseCompositor(max_layers=LAYERS, use_numpy=use_numpy)
+        compositor.set_intensity_channels(range(1, 513, 2))
+        for layer in range(LAYERS):
+            channels = rng.sample(range(1, 513), 128)
+            compositor.set_values(
+                f"layer_{layer}", {channel: rng.randrange(256) for channel in channels}
+            )
+        universes.append((compositor, buffer.new_universe_buffer(use_numpy)))
+    return universes
+
+
+def _compose_all(universes) -> None:
+    for compositor, base in universes:
+        compositor.compose(base)
+
+
+def main() -> None:
+    backends = [("python", False)] + ([("numpy", True)] if buffer.HAS_NUMPY else [])
+    print(f"{UNIVERSES} universes x {LAYERS} layers, one compose pass:")
+    for name, use_numpy in backends:
+        universes = _universes(use_numpy)
+        number = 2000 if use_numpy else 20
+        best = min(
+            timeit.repeat(
+                lambda universes=universes: _compose_all(universes),
+                number=number,
+                repeat=REPEAT,
+            )
+        )
+        print(f"{name:>8}: {best / number * 1e6:10.1f}us")
+        if use_numpy:
+            _compose_all(universes)
+            tracemalloc.start()
+            _compose_all(universes)
+            current, _peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{'':>8}  bytes still allocated after compose: {current}")
+
+
+if __name__ == "__main__":
+    main()
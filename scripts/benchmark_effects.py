@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Time one effect tick.
+
+Compiles a colour chase over 100 RGB parcans (400 channels) plus a pan/tilt
+circle over 25 moving heads (100 channels), and a sine sweep across the room
+over 200 located parcans, then times rendering each set for one tick with
+the NumPy and the pure-Python backend, against the frame budget at
+`EFFECT_TICK_RATE`. Run from the repository root:
+
+    python scripts/benchmark_effects.py
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.artnet_dmx_controller import buffer  # noqa: E402
+from custom_components.artnet_dmx_controller.compiled_fixture import (
+    compile_fixture,  # noqa: E402
+)
+from custom_components.artnet_dmx_controller.effects import (  # noqa: E402
+    EFFECT_TICK_RATE,
+    Effect,
+)
+from custom_components.artnet_dmx_controller.entry_fixtures import (
+    build_fixture_entry_data,  # noqa: E402
+)
+from custom_components.artnet_dmx_controller.fixture_mapping import (
+    load_fixture_mapping,  # noqa: E402
+)
+
+REPEAT = 5
+
+
+def _fixtures(fixture_type: str, count: int, footprint: int, universe: int) -> list:
+    mapping = load_fixture_mapping()
+    helper = object()
+    fixtures = []
+    for position in range(count):
+        fixture = build_fixture_entry_data(
+            "127.0.0.1",
+            universe + position * footprint // 510,
+            fixture_type,
+            1 + position * footprint % 510,
+            footprint,
+            fixture_id=f"{fixture_type}_{position}",
+            location={"x": position / count, "y": position % 10 / 10, "z": 0.0},
+        )
+        fixtures.append((helper, compile_fixture(fixture, mapping)))
+    return fixtures
+
+
+def _effects(use_numpy: bool) -> list[Effect]:
+    pars = _fixtures("parcan_rgb_gen", 100, 5, 0)
+    heads = _fixtures("head_el150", 25, 9, 2)
+    return [
+        Effect("chase", pars, use_numpy=use_numpy),
+        Effect("circle", heads, use_numpy=use_numpy),
+    ]
+
+
+def _sweep(use_numpy: bool) -> list[Effect]:
+    pars = _fixtures("parcan_rgb_gen", 200, 5, 0)
+    return [Effect("sine", pars, layout="sweep_x", use_numpy=use_numpy)]
+
+
+def _tick(effects: list[Effect]) -> None:
+    for effect in effects:
+        effect.render(1.234)
+
+
+def main() -> None:
+    backends = [("python", False)] + ([("numpy", True)] if buffer.HAS_NUMPY else [])
+    budget = 1e6 / EFFECT_TICK_RATE
+    for label, build in (("chase + circle", _effects), ("sweep_x sine", _sweep)):
+        print(f"{label}:")
+        for name, use_numpy in backends:
+            effects = build(use_numpy)
+            channels = sum(effect.channel_count for effect in effects)
+            number = 200
+            best = min(
+                timeit.repeat(
+                    lambda effects=effects: _tick(effects), number=number, repeat=REPEAT
+                )
+            )
+            per_tick = best / number * 1e6
+            share = per_tick / budget
+            print(
+                f"{name:>8}: {channels} channels, {per_tick:8.1f}us per tick "
+                f"({share:.1%} of the frame)"
+            )
+
+
+if __name__ == "__main__":
+    main()
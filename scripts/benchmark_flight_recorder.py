@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Measure what the flight recorder costs the send path and how fast it dumps.
+
+Times recording one frame into the ring next to building its Art-Net packet,
+then times a send through the helper with the recorder off and on. Finally
+it fills the rings of 64 universes and times snapshotting them and writing
+the recording file. Run from the repository root:
+
+    python scripts/benchmark_flight_recorder.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import tempfile
+import time
+import timeit
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.artnet_dmx_controller.artnet import (  # noqa: E402
+    ARTNET_DATA_OFFSET,
+    ArtNetDMXHelper,
+)
+from custom_components.artnet_dmx_controller.flight_recorder import (  # noqa: E402
+    DEFAULT_RECORDED_FRAMES,
+    FlightRecorder,
+    read_flight_recording,
+    write_flight_recording,
+)
+
+UNIVERSES = 64
+RUNS = 20000
+SENDS = 5000
+
+
+class NullSocket:
+    def sendto(self, packet: bytes, address: tuple[str, int]) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+def _record_cost() -> None:
+    helper = ArtNetDMXHelper(hass=SimpleNamespace(), target_ip="127.0.0.1", universe=0)
+    frame = bytes(range(256)) * 2
+    packet = helper.construct_artnet_packet(frame)
+    recorder = FlightRecorder()
+    record = (
+        timeit.timeit(lambda: recorder.record(packet, ARTNET_DATA_OFFSET), number=RUNS)
+        / RUNS
+    )
+    build = (
+        timeit.timeit(lambda: helper.construct_artnet_packet(frame), number=RUNS) / RUNS
+    )
+    print(
+        f"record: {record * 1e9:6.0f}ns per frame"
+        f" (building the packet: {build * 1e9:6.0f}ns)"
+    )
+
+
+async def _send_cost() -> None:
+    helper = ArtNetDMXHelper(hass=SimpleNamespace(), target_ip="127.0.0.1", universe=0)
+    helper._socket = NullSocket()  # noqa: SLF001
+    frame = bytes(512)
+    for label, recorder in (("off", None), ("on", FlightRecorder())):
+        helper.recorder = recorder
+        started = time.perf_counter()
+        for _send in range(SENDS):
+            await helper.send_dmx_data(frame)
+        per_frame = (time.perf_counter() - started) / SENDS
+        print(f"send with recorder {label:>3}: {per_frame * 1e6:6.1f}us per frame")
+
+
+def _dump_cost() -> None:
+    packet = bytes(ARTNET_DATA_OFFSET) + bytes(range(256)) * 2
+    recorders = []
+    for _universe in range(UNIVERSES):
+        recorder = FlightRecorder()
+        for _frame in range(DEFAULT_RECORDED_FRAMES + 7):
+            recorder.record(packet, ARTNET_DATA_OFFSET)
+        recorders.append(recorder)
+    started = time.perf_counter()
+    universes = [
+        ("127.0.0.1", universe, len(recorder), *recorder.snapshot())
+        for universe, recorder in enumerate(recorders)
+    ]
+    snapshot = time.perf_counter() - started
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = str(Path(directory) / "recording.bin")
+        started = time.perf_counter()
+        write_flight_recording(file_path, universes)
+        write = time.perf_counter() - started
+        size = Path(file_path).stat().st_size
+        frames = sum(
+            len(recorded) for recorded in read_flight_recording(file_path).values()
+        )
+    print(
+        f"dump: {UNIVERSES} universes x {DEFAULT_RECORDED_FRAMES} frames,"
+        f" snapshot {snapshot * 1e3:.1f} ms in the event loop,"
+        f" write {write * 1e3:.1f} ms in the executor,"
+        f" {size / 1e6:.1f} MB, {frames} frames read back"
+    )
+
+
+def main() -> None:
+    _record_cost()
+    asyncio.run(_send_cost())
+    _dump_cost()
+
+
+if __name__ == "__main__":
+    main()
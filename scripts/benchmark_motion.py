@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Time the pan/tilt motion filter.
+
+Filters 64 moving heads spread over two universes and times one filter tick
+while every head chases a moving target, for the NumPy and the pure-Python
+backend. Run from the repository root:
+
+    python scripts/benchmark_motion.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.artnet_dmx_controller import buffer, motion  # noqa: E402
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper  # noqa: E402
+from custom_components.artnet_dmx_controller.compiled_fixture import (
+    compile_fixture,  # noqa: E402
+)
+from custom_components.artnet_dmx_controller.entry_fixtures import (
+    build_fixture_entry_data,  # noqa: E402
+)
+from custom_components.artnet_dmx_controller.fixture_mapping import (
+    load_fixture_mapping,  # noqa: E402
+)
+
+HEADS = 64
+TICKS = 500
+REPEAT = 5
+
+
+async def _discard(_dmx_data: bytes) -> None:
+    return None
+
+
+async def _run(use_numpy: bool) -> float:
+    motion.async_track_time_interval = lambda hass, action, interval: lambda: None
+    mapping = load_fixture_mapping()
+    helpers = []
+    for universe in range(2):
+        helper = ArtNetDMXHelper(
+            hass=SimpleNamespace(), target_ip="127.0.0.1", universe=universe
+        )
+        helper.send_dmx_data = _discard
+        helpers.append(helper)
+    motion_filter = motion.MotionFilter(SimpleNamespace(), use_numpy=use_numpy)
+    for position in range(HEADS):
+        fixture = build_fixture_entry_data(
+            "127.0.0.1",
+            position // 32,
+            "head_el150",
+            1 + position % 32 * 9,
+            9,
+            fixture_id=f"head_{position}",
+        )
+        motion_filter.set_smoothing(
+            helpers[position // 32], compile_fixture(fixture, mapping), 0.5
+        )
+
+    clock = itertools.count()
+    best = float("inf")
+    for _ in range(REPEAT):
+        elapsed = 0.0
+        for tick in range(TICKS):
+            # A new coarse target every few ticks, as a noisy slider produces.
+            if tick % 4 == 0:
+                value = tick % 256
+                for helper in helpers:
+                    await helper.set_channels(
+                        {1 + head * 9: value for head in range(32)}
+                    )
+            start = time.perf_counter()
+            await motion_filter.async_tick(next(clock) / motion.MOTION_TICK_RATE)
+            elapsed += time.perf_counter() - start
+        best = min(best, elapsed)
+    return best
+
+
+def main() -> None:
+    backends = [("python", False)] + ([("numpy", True)] if buffer.HAS_NUMPY else [])
+    print(f"{HEADS} filtered heads over 2 universes, one tick:")
+    for name, use_numpy in backends:
+        best = asyncio.run(_run(use_numpy))
+        print(f"{name:>8}: {best / TICKS * 1e6:8.1f}us per tick")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Measure the per-frame cost of the output counters.
+
+Times `OutputMetrics.record_send`, which runs for every frame sent, against
+the DEBUG log call it replaced, with DEBUG logging off and on (to a null
+handler). Also times reading p50 and p99, which runs only when the sensors
+refresh. Run from the repository root:
+
+    python scripts/benchmark_output_metrics.py
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.artnet_dmx_controller.const import LOGGER  # noqa: E402
+from custom_components.artnet_dmx_controller.output_metrics import (
+    OutputMetrics,  # noqa: E402
+)
+
+RUNS = 200000
+
+
+def _time(label: str, func) -> None:
+    seconds = timeit.timeit(func, number=RUNS)
+    print(f"{label:>28}: {seconds / RUNS * 1e9:8.1f}ns per call")
+
+
+def main() -> None:
+    metrics = OutputMetrics()
+    _time("record_send", lambda: metrics.record_send(530, 0.00042))
+
+    def debug_log() -> None:
+        LOGGER.debug("Sent Art-Net packet to %s:%s (Universe %s)", "10.0.0.5", 6454, 0)
+
+    LOGGER.setLevel(logging.INFO)
+    _time("debug log, DEBUG off", debug_log)
+    LOGGER.setLevel(logging.DEBUG)
+    LOGGER.addHandler(logging.NullHandler())
+    LOGGER.propagate = False
+    _time("debug log, DEBUG on", debug_log)
+
+    seconds = timeit.timeit(lambda: metrics.as_dict(), number=RUNS // 100)
+    per_call = seconds / (RUNS // 100) * 1e6
+    print(f"{'as_dict with percentiles':>28}: {per_call:8.1f}us per call")
+
+
+if __name__ == "__main__":
+    main()
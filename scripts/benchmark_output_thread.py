@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Measure output jitter under synthetic event-loop stalls.
+
+Sends one universe at 40 frames per second to a local UDP receiver, first
+from an event-loop timer (the default path, through the executor) and then
+from the `OutputThread`, while the loop stalls for 60 ms every 250 ms. Stalls
+either sleep (like a blocking disk or database call, which releases the GIL)
+or spin on the CPU. The receiver timestamps every packet on arrival and
+reports the jitter of the inter-arrival times. Run from the repository root:
+
+    python scripts/benchmark_output_thread.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper  # noqa: E402
+from custom_components.artnet_dmx_controller.jitter import JitterStats  # noqa: E402
+from custom_components.artnet_dmx_controller.output_thread import (  # noqa: E402
+    DEFAULT_OUTPUT_RATE,
+    OutputThread,
+)
+
+DURATION = 3.0
+STALL_EVERY = 0.25
+STALL_FOR = 0.06
+
+
+def _receive(sock: socket.socket, stats: JitterStats, stop: threading.Event) -> None:
+    previous = None
+    while not stop.is_set():
+        try:
+            sock.recv(1024)
+        except TimeoutError:
+            continue
+        now = time.monotonic()
+        if previous is not None:
+            stats.record(now - previous)
+        previous = now
+
+
+def _stall(kind: str) -> None:
+    if kind == "sleep":
+        # Stands in for a blocking call made on the loop; releases the GIL.
+        threading.Event().wait(STALL_FOR)
+        return
+    stalled_until = time.monotonic() + STALL_FOR
+    while time.monotonic() < stalled_until:
+        pass
+
+
+async def _run(threaded: bool, kind: str, port: int) -> None:
+    helper = ArtNetDMXHelper(
+        hass=SimpleNamespace(), target_ip="127.0.0.1", universe=0, port=port
+    )
+    output = OutputThread(DEFAULT_OUTPUT_RATE) if threaded else None
+    if output is not None:
+        output.attach(helper)
+        output.start()
+    loop = asyncio.get_running_loop()
+    period = 1 / DEFAULT_OUTPUT_RATE
+    started = loop.time()
+
+    def stall() -> None:
+        _stall(kind)
+        if loop.time() - started < DURATION:
+            loop.call_later(STALL_EVERY, stall)
+
+    loop.call_later(STALL_EVERY, stall)
+    deadline = started
+    while loop.time() - started < DURATION:
+        await helper.set_channels({1: int((loop.time() - started) * 50) % 256})
+        deadline += period
+        await asyncio.sleep(max(deadline - loop.time(), 0.0))
+    if output is not None:
+        output.stop()
+    helper.close_socket()
+
+
+def main() -> None:
+    for kind in ("sleep", "spin"):
+        stall_ms, every_ms = STALL_FOR * 1000, STALL_EVERY * 1000
+        print(f"{stall_ms:.0f} ms {kind} stalls every {every_ms:.0f} ms:")
+        for label, threaded in (("loop", False), ("thread", True)):
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.bind(("127.0.0.1", 0))
+            sock.settimeout(0.1)
+            stats = JitterStats(1 / DEFAULT_OUTPUT_RATE)
+            stop = threading.Event()
+            receiver = threading.Thread(target=_receive, args=(sock, stats, stop))
+            receiver.start()
+            asyncio.run(_run(threaded, kind, sock.getsockname()[1]))
+            stop.set()
+            receiver.join()
+            sock.close()
+            result = stats.as_dict()
+            print(
+                f"{label:>8}: {result['cycles']} frames,"
+                f" jitter mean {result['mean_jitter_ms']:6.2f} ms,"
+                f" stdev {result['stdev_jitter_ms']:6.2f} ms,"
+                f" max {result['max_jitter_ms']:6.2f} ms,"
+                f" late {result['late']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
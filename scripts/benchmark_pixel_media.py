@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Time sampling images onto a pixel wall.
+
+Maps six 170-pixel RGB strips (one universe each) as the rows of a wall and
+times sampling a 360x640 RGB frame onto it and sending the result, for the
+NumPy and the pure-Python backend. Run from the repository root:
+
+    python scripts/benchmark_pixel_media.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import sys
+import timeit
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.artnet_dmx_controller import buffer  # noqa: E402
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper  # noqa: E402
+from custom_components.artnet_dmx_controller.compiled_fixture import (
+    compile_fixture,  # noqa: E402
+)
+from custom_components.artnet_dmx_controller.entry_fixtures import (
+    build_fixture_entry_data,  # noqa: E402
+)
+from custom_components.artnet_dmx_controller.fixture_mapping import (
+    load_fixture_mapping,  # noqa: E402
+)
+from custom_components.artnet_dmx_controller.pixel_media import (
+    ImageMapper,  # noqa: E402
+)
+from custom_components.artnet_dmx_controller.pixels import PixelMap  # noqa: E402
+
+STRIPS = 6
+HEIGHT, WIDTH = 360, 640
+REPEAT = 5
+
+
+async def _discard(_dmx_data: bytes) -> None:
+    return None
+
+
+def _mapper(use_numpy: bool) -> ImageMapper:
+    mapping = load_fixture_mapping()
+    strips = []
+    for universe in range(STRIPS):
+        helper = ArtNetDMXHelper(
+            hass=SimpleNamespace(), target_ip="127.0.0.1", universe=universe
+        )
+        helper.send_dmx_data = _discard
+        fixture = build_fixture_entry_data(
+            "127.0.0.1",
+            universe,
+            "pixel_strip_rgb_170",
+            1,
+            510,
+            fixture_id=f"row_{universe}",
+        )
+        strips.append((helper, compile_fixture(fixture, mapping)))
+    return ImageMapper(
+        PixelMap(strips, use_numpy=use_numpy), "serpentine", use_numpy=use_numpy
+    )
+
+
+def _frame(use_numpy: bool) -> object:
+    rows = [
+        [tuple(random.randrange(256) for _ in range(3)) for _ in range(WIDTH)]
+        for _ in range(HEIGHT)
+    ]
+    if use_numpy:
+        return buffer.np.asarray(rows, dtype=buffer.np.uint8)
+    return rows
+
+
+def main() -> None:
+    backends = [("python", False)] + ([("numpy", True)] if buffer.HAS_NUMPY else [])
+    print(f"{HEIGHT}x{WIDTH} frame onto {STRIPS * 170} pixels over {STRIPS} universes:")
+    loop = asyncio.new_event_loop()
+    for name, use_numpy in backends:
+        mapper = _mapper(use_numpy)
+        frame = _frame(use_numpy)
+        number = 50
+        best = min(
+            timeit.repeat(
+                lambda mapper=mapper, frame=frame: loop.run_until_complete(
+                    mapper.async_show(frame)
+                ),
+                number=number,
+                repeat=REPEAT,
+            )
+        )
+        print(f"{name:>8}: {best / number * 1e6:8.1f}us per frame")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Time writing a gradient across pixel fixtures.
+
+Maps six 170-pixel RGB strips (1020 pixels, one universe each) into one pixel
+array and times computing a two-colour gradient and sending it, for the NumPy
+and the pure-Python backend. Run from the repository root:
+
+    python scripts/benchmark_pixels.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import timeit
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.artnet_dmx_controller import buffer  # noqa: E402
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper  # noqa: E402
+from custom_components.artnet_dmx_controller.compiled_fixture import (
+    compile_fixture,  # noqa: E402
+)
+from custom_components.artnet_dmx_controller.entry_fixtures import (
+    build_fixture_entry_data,  # noqa: E402
+)
+from custom_components.artnet_dmx_controller.fixture_mapping import (
+    load_fixture_mapping,  # noqa: E402
+)
+from custom_components.artnet_dmx_controller.pixels import (  # noqa: E402
+    PixelMap,
+    pixel_pattern,
+)
+
+STRIPS = 6
+REPEAT = 5
+
+
+async def _discard(_dmx_data: bytes) -> None:
+    return None
+
+
+def _pixel_map(use_numpy: bool) -> PixelMap:
+    mapping = load_fixture_mapping()
+    strips = []
+    for universe in range(STRIPS):
+        helper = ArtNetDMXHelper(
+            hass=SimpleNamespace(), target_ip="127.0.0.1", universe=universe
+        )
+        helper.send_dmx_data = _discard
+        fixture = build_fixture_entry_data(
+            "127.0.0.1",
+            universe,
+            "pixel_strip_rgb_170",
+            1,
+            510,
+            fixture_id=f"strip_{universe}",
+        )
+        strips.append((helper, compile_fixture(fixture, mapping)))
+    return PixelMap(strips, use_numpy=use_numpy)
+
+
+def main() -> None:
+    backends = [("python", False)] + ([("numpy", True)] if buffer.HAS_NUMPY else [])
+    print(f"{STRIPS * 170} pixels over {STRIPS} universes, gradient + send:")
+    loop = asyncio.new_event_loop()
+    for name, use_numpy in backends:
+        pixels = _pixel_map(use_numpy)
+
+        def write(pixels: PixelMap = pixels, use_numpy: bool = use_numpy) -> None:
+            colors = pixel_pattern(
+                [(255, 0, 0), (0, 0, 255)], len(pixels), use_numpy=use_numpy
+            )
+            loop.run_until_complete(pixels.async_set_pixels(colors))
+
+        number = 200
+        best = min(timeit.repeat(write, number=number, repeat=REPEAT))
+        print(f"{name:>8}: {best / number * 1e6:8.1f}us per frame")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
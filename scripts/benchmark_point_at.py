@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Time aiming moving heads at a moving target.
+
+Compiles a point-at solver for 64 located moving heads and times solving a
+new (uncached) target per frame, as a follow-spot moving at frame rate does,
+for the NumPy and the pure-Python backend. Run from the repository root:
+
+    python scripts/benchmark_point_at.py
+"""
+
+from __future__ import annotations
+
+import itertools
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.artnet_dmx_controller import buffer  # noqa: E402
+from custom_components.artnet_dmx_controller.compiled_fixture import (
+    compile_fixture,  # noqa: E402
+)
+from custom_components.artnet_dmx_controller.entry_fixtures import (
+    build_fixture_entry_data,  # noqa: E402
+)
+from custom_components.artnet_dmx_controller.fixture_mapping import (
+    load_fixture_mapping,  # noqa: E402
+)
+from custom_components.artnet_dmx_controller.point_at import PointAtSolver  # noqa: E402
+
+HEADS = 64
+REPEAT = 5
+
+
+def _solver(use_numpy: bool) -> PointAtSolver:
+    mapping = load_fixture_mapping()
+    helper = object()
+    heads = []
+    for position in range(HEADS):
+        fixture = build_fixture_entry_data(
+            "127.0.0.1",
+            position // 56,
+            "head_el150",
+            1 + position % 56 * 9,
+            9,
+            fixture_id=f"head_{position}",
+            location={"x": position % 8, "y": position // 8, "z": 4.0},
+            orientation={"mount": "hanging", "rotation": 45 * (position % 8)},
+        )
+        heads.append((helper, compile_fixture(fixture, mapping)))
+    return PointAtSolver(heads, use_numpy=use_numpy)
+
+
+def main() -> None:
+    backends = [("python", False)] + ([("numpy", True)] if buffer.HAS_NUMPY else [])
+    print(f"{HEADS} heads, one uncached target per solve:")
+    for name, use_numpy in backends:
+        solver = _solver(use_numpy)
+        targets = itertools.count()
+        number = 500
+        best = min(
+            timeit.repeat(
+                lambda solver=solver, targets=targets: solver.solve(
+                    next(targets) * 0.001, 3.5, 0.0
+                ),
+                number=number,
+                repeat=REPEAT,
+            )
+        )
+        print(f"{name:>8}: {best / number * 1e6:8.1f}us per solve")
+
+
+if __name__ == "__main__":
+    main()
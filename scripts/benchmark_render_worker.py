@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Compare event-loop stalls of effect rendering inline and in the worker.
+
+Compiles a colour chase over 600 RGB parcans across six universes and a sine
+sweep over the same fixtures, then renders 200 ticks in the event loop and
+200 ticks through a `RenderWorker`, timing how long each tick keeps the
+event loop busy. With the worker the loop only sends tokens down the pipe
+and copies finished channels out of shared memory. Run from the repository
+root:
+
+    python scripts/benchmark_render_worker.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.artnet_dmx_controller import buffer  # noqa: E402
+from custom_components.artnet_dmx_controller.compiled_fixture import (
+    compile_fixture,  # noqa: E402
+)
+from custom_components.artnet_dmx_controller.effects import (  # noqa: E402
+    EFFECT_TICK_RATE,
+    Effect,
+)
+from custom_components.artnet_dmx_controller.entry_fixtures import (
+    build_fixture_entry_data,  # noqa: E402
+)
+from custom_components.artnet_dmx_controller.fixture_mapping import (
+    load_fixture_mapping,  # noqa: E402
+)
+from custom_components.artnet_dmx_controller.render_worker import (
+    RenderWorker,  # noqa: E402
+)
+
+TICKS = 200
+
+
+def _fixtures(count: int) -> list:
+    mapping = load_fixture_mapping()
+    helpers = [object() for _universe in range(count * 5 // 510 + 1)]
+    fixtures = []
+    for position in range(count):
+        fixture = build_fixture_entry_data(
+            "127.0.0.1",
+            position * 5 // 510,
+            "parcan_rgb_gen",
+            1 + position * 5 % 510,
+            5,
+            fixture_id=f"par_{position}",
+            location={"x": position / count, "y": position % 10 / 10, "z": 0.0},
+        )
+        fixtures.append(
+            (helpers[position * 5 // 510], compile_fixture(fixture, mapping))
+        )
+    return fixtures
+
+
+async def _measure(render, worker: RenderWorker | None = None) -> tuple[float, float]:
+    """
+    Return the mean tick latency and loop busy time per tick, in microseconds.
+
+    Time spent waiting for the worker's reply is free for everything else
+    Home Assistant runs; the rest of a tick holds the loop.
+    """
+    waiting = 0.0
+    if worker is not None:
+        request = worker._async_request
+
+        async def timed_request(message: tuple) -> None:
+            nonlocal waiting
+            sent = time.perf_counter()
+            await request(message)
+            waiting += time.perf_counter() - sent
+
+        worker._async_request = timed_request
+    await render(0.0)  # warm up: programs cross to the worker once
+    waiting = 0.0
+    started = time.perf_counter()
+    for tick in range(TICKS):
+        await render(tick / EFFECT_TICK_RATE)
+    elapsed = time.perf_counter() - started
+    return elapsed / TICKS * 1e6, (elapsed - waiting) / TICKS * 1e6
+
+
+async def _run(use_numpy: bool) -> None:
+    pars = _fixtures(600)
+    effects = [
+        Effect("chase", pars, use_numpy=use_numpy),
+        Effect("sine", pars, layout="sweep_x", use_numpy=use_numpy),
+    ]
+    channels = sum(effect.channel_count for effect in effects)
+
+    async def inline(elapsed: float) -> None:
+        for effect in effects:
+            effect.render(elapsed)
+
+    worker = await asyncio.get_running_loop().run_in_executor(
+        None, RenderWorker, 8, use_numpy
+    )
+    try:
+
+        async def offloaded(elapsed: float) -> None:
+            await worker.async_render([(effect, elapsed) for effect in effects])
+
+        for label, render, timed in (
+            ("inline", inline, None),
+            ("worker", offloaded, worker),
+        ):
+            per_tick, busy = await _measure(render, timed)
+            print(
+                f"{label:>8}: {channels} channels, {per_tick:8.1f}us per tick, "
+                f"loop busy {busy:8.1f}us per tick"
+            )
+    finally:
+        worker.close()
+
+
+def main() -> None:
+    backends = [("python", False)] + ([("numpy", True)] if buffer.HAS_NUMPY else [])
+    for name, use_numpy in backends:
+        print(f"{name}:")
+        asyncio.run(_run(use_numpy))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Compare setup cost of per-fixture entries against a single rig entry.
+
+Runs the integration's `async_setup_entry` and platform setup for synthetic
+parcan rigs of 50, 200 and 1000 fixtures (spread over as many universes as
+needed) against a lightweight Home Assistant stand-in, the same way the unit
+tests drive the platforms. It measures the integration's own share of startup
+time: helper acquisition, device registration and entity construction.
+
+Run from the repository root inside the development environment:
+
+    python scripts/benchmark_rig_setup.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import custom_components.artnet_dmx_controller as integration  # noqa: E402
+from custom_components.artnet_dmx_controller.const import DOMAIN  # noqa: E402
+from custom_components.artnet_dmx_controller.entry_fixtures import (  # noqa: E402
+    build_fixture_entry_data,
+    build_rig_entry_data,
+)
+from custom_components.artnet_dmx_controller.universe_store import (
+    UniverseStateStore,  # noqa: E402
+)
+
+FIXTURE_COUNTS = (50, 200, 1000)
+PARCAN_CHANNELS = 5
+FIXTURES_PER_UNIVERSE = 512 // PARCAN_CHANNELS
+NO_LINGER = {"helper_release_delay": 0}
+
+
+class _MemoryStore:
+    """In-memory replacement for the persistent universe store backend."""
+
+    async def async_load(self) -> None:
+        return None
+
+    def async_delay_save(self, _data_func, _delay) -> None:
+        return None
+
+
+class _ConfigEntries:
+    """Forward platform setup straight to the integration platform modules."""
+
+    def __init__(self, hass: SimpleNamespace) -> None:
+        self._hass = hass
+        self.entities = 0
+
+    async def async_forward_entry_setups(self, entry, platforms) -> None:
+        for platform in platforms:
+            module = importlib.import_module(
+                f"custom_components.artnet_dmx_controller.{platform.value}"
+            )
+            await module.async_setup_entry(self._hass, entry, self._add_entities)
+
+    async def async_unload_platforms(self, _entry, _platforms) -> bool:
+        return True
+
+    def _add_entities(self, entities) -> None:
+        self.entities += len(entities)
+
+
+def _fixtures(count: int) -> list[dict]:
+    return [
+        build_fixture_entry_data(
+            target_ip="127.0.0.1",
+            universe=idx // FIXTURES_PER_UNIVERSE,
+            fixture_type="parcan_rgb_gen",
+            start_channel=(idx % FIXTURES_PER_UNIVERSE) * PARCAN_CHANNELS + 1,
+            channel_count=PARCAN_CHANNELS,
+            name=f"Par {idx}",
+            fixture_id=f"par_{idx}",
+        )
+        for idx in range(count)
+    ]
+
+
+def _hass() -> SimpleNamespace:
+    hass = SimpleNamespace(data={})
+    hass.config_entries = _ConfigEntries(hass)
+    hass.data[DOMAIN] = {
+        "universe_store": UniverseStateStore(hass, store=_MemoryStore())
+    }
+    return hass
+
+
+async def _run(count: int, rig: bool) -> tuple[float, int]:
+    hass = _hass()
+    fixtures = _fixtures(count)
+    if rig:
+        entries = [
+            SimpleNamespace(
+                entry_id="rig",
+                title="Rig",
+                data=build_rig_entry_data("Rig", fixtures),
+                options=NO_LINGER,
+            )
+        ]
+    else:
+        entries = [
+            SimpleNamespace(
+                entry_id=f"entry_{idx}",
+                title=fixture["name"],
+                data=fixture,
+                options=NO_LINGER,
+            )
+            for idx, fixture in enumerate(fixtures)
+        ]
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(integration.async_setup_entry(hass, entry) for entry in entries)
+    )
+    elapsed = time.perf_counter() - started
+
+    for entry in entries:
+        await integration.async_unload_entry(hass, entry)
+    assert not hass.data[DOMAIN].get("shared_helpers")
+    return elapsed, hass.config_entries.entities
+
+
+def main() -> None:
+    print(
+        f"{'fixtures':>8} {'per-fixture ms':>15} {'rig ms':>10} "
+        f"{'speedup':>8} {'entities':>9}"
+    )
+    for count in FIXTURE_COUNTS:
+        per_fixture, entities = asyncio.run(_run(count, rig=False))
+        rig, rig_entities = asyncio.run(_run(count, rig=True))
+        assert entities == rig_entities
+        print(
+            f"{count:>8} {per_fixture * 1000:>15.1f} {rig * 1000:>10.1f} "
+            f"{per_fixture / rig:>7.1f}x {entities:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
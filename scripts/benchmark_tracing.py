@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Trace light writes end to end and measure what tracing costs.
+
+Drives an RGB light entity through its `DMXWriter` onto a helper sending to
+a local UDP socket, 2000 writes with tracing off and 2000 with tracing on.
+It prints the time per write in both runs and the per-stage latency
+percentiles the tracer collected. Run from the repository root:
+
+    python scripts/benchmark_tracing.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper  # noqa: E402
+from custom_components.artnet_dmx_controller.dmx_writer import DMXWriter  # noqa: E402
+from custom_components.artnet_dmx_controller.light import (
+    ArtNetDMXRGBLight,  # noqa: E402
+)
+from custom_components.artnet_dmx_controller.tracing import (
+    async_set_latency_tracing,  # noqa: E402
+)
+
+WRITES = 2000
+
+
+async def _run(
+    hass: SimpleNamespace,
+    light: ArtNetDMXRGBLight,
+    helper: ArtNetDMXHelper,
+    traced: bool,
+) -> float:
+    async_set_latency_tracing(hass, traced)
+    sent = helper.metrics.frames_sent
+    started = time.perf_counter()
+    for write in range(WRITES):
+        await light.async_turn_on(rgb_color=(write % 256, 0, 255 - write % 256))
+        # Let the writer flush and the frame leave before the next call.
+        while helper.metrics.frames_sent == sent + write:
+            await asyncio.sleep(0)
+    return (time.perf_counter() - started) / WRITES * 1e6
+
+
+async def main_async() -> None:
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    helper = ArtNetDMXHelper(
+        hass=SimpleNamespace(),
+        target_ip="127.0.0.1",
+        universe=0,
+        port=receiver.getsockname()[1],
+    )
+    hass = SimpleNamespace(
+        data={"artnet_dmx_controller": {"shared_helpers": {("127.0.0.1", 0): helper}}}
+    )
+    light = ArtNetDMXRGBLight(
+        helper,
+        1,
+        2,
+        3,
+        None,
+        entry_id="bench",
+        fixture_id="par",
+        dmx_writer=DMXWriter(helper),
+    )
+    light.async_write_throttled_state = lambda: None
+    try:
+        untraced = await _run(hass, light, helper, False)
+        traced = await _run(hass, light, helper, True)
+        stages = async_set_latency_tracing(hass, False)["stages"]
+    finally:
+        helper.close_socket()
+        receiver.close()
+    print(f"tracing off: {untraced:7.1f}us per write")
+    print(f"tracing on:  {traced:7.1f}us per write")
+    print(f"{'stage':>13} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for stage, histogram in stages.items():
+        print(
+            f"{stage:>13} {histogram['p50_ms']:8.3f} {histogram['p90_ms']:8.3f}"
+            f" {histogram['p99_ms']:8.3f} {histogram['max_ms']:8.3f}"
+        )
+
+
+def main() -> None:
+    asyncio.run(main_async())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Stand-ins for the Home Assistant objects the tests drive."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.artnet_dmx_controller import services
+from custom_components.artnet_dmx_controller.const import DOMAIN
+
+
+class FakeSocket:
+    """UDP socket stand-in recording every packet sent through it."""
+
+    def __init__(self, fail=False):
+        self.packets = []
+        self.fail = fail
+
+    def sendto(self, packet, _address):
+        if self.fail:
+            raise OSError("network unreachable")
+        self.packets.append(packet)
+
+    def close(self):
+        return None
+
+
+class FakeServices:
+    """Service registry keeping each handler with its schema."""
+
+    def __init__(self):
+        self.handlers = {}
+        self.schemas = {}
+
+    def has_service(self, domain, service):
+        return domain == DOMAIN and service in self.handlers
+
+    def async_register(self, _domain, service, handler, schema=None, **_kwargs):
+        self.handlers[service] = handler
+        self.schemas[service] = schema
+
+    async def async_call(self, _domain, service, service_data=None):
+        data = service_data or {}
+        schema = self.schemas[service]
+        return await self.handlers[service](
+            SimpleNamespace(data=schema(data) if schema is not None else data)
+        )
+
+
+@pytest.fixture
+def make_hass():
+    """Return a factory of hass stand-ins with the integration services set up."""
+
+    def factory(domain_data=None, **attributes):
+        async def async_add_executor_job(target, *args):
+            return target(*args)
+
+        defaults = {
+            "data": {DOMAIN: domain_data if domain_data is not None else {}},
+            "services": FakeServices(),
+            "async_add_executor_job": async_add_executor_job,
+            "verify_event_loop_thread": lambda _what: None,
+        }
+        hass = SimpleNamespace(**{**defaults, **attributes})
+        services.async_setup_services(hass)
+        return hass
+
+    return factory
@@ -0,0 +1,57 @@
+import asyncio
+from types import SimpleNamespace
+
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper
+from custom_components.artnet_dmx_controller.blackout import blackout_active
+from tests.conftest import FakeSocket
+
+HEADER_SIZE = 18
+
+
+def _helper(universe):
+    helper = ArtNetDMXHelper(
+        hass=SimpleNamespace(), target_ip="192.168.1.100", universe=universe
+    )
+    helper._socket = FakeSocket()
+    return helper
+
+
+def test_blackout_zeroes_every_universe_and_release_restores_it(make_hass):
+    helpers = [_helper(universe) for universe in range(8)]
+    hass = make_hass(
+        {"shared_helpers": {("192.168.1.100", h.universe): h for h in helpers}}
+    )
+    handlers = hass.services.handlers
+
+    async def scenario():
+        await helpers[0].set_channels({1: 255, 2: 128})
+        response = await handlers["blackout"](SimpleNamespace(data={}))
+        assert response["universes"] == 8
+        assert response["latency_ms"] >= 0
+        assert blackout_active(hass)
+        for helper in helpers:
+            assert helper._socket.packets[-1][HEADER_SIZE:] == bytes(512)
+
+        # Writes during a blackout land in the buffer but go out as zeros.
+        await helpers[0].set_channels({3: 64})
+        assert helpers[0]._socket.packets[-1][HEADER_SIZE:] == bytes(512)
+        assert helpers[0].get_channel_block(1, 3) == bytes([255, 128, 64])
+
+        await handlers["release_blackout"](SimpleNamespace(data={}))
+        assert not blackout_active(hass)
+        assert helpers[0]._socket.packets[-1][HEADER_SIZE : HEADER_SIZE + 3] == bytes(
+            [255, 128, 64]
+        )
+        assert helpers[1]._socket.packets[-1][HEADER_SIZE:] == bytes(512)
+
+    asyncio.run(scenario())
+
+
+def test_packets_queued_before_a_blackout_are_zeroed_on_send():
+    helper = _helper(0)
+    stale = helper.construct_artnet_packet(bytes([255]) * 512)
+
+    helper.blackout_now()
+    helper._sendto(stale)
+
+    assert helper._socket.packets[-1] == helper.construct_artnet_packet(bytes(512))
@@ -0,0 +1,83 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.artnet_dmx_controller import buffer
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper
+from custom_components.artnet_dmx_controller.compiled_fixture import compile_fixture
+from custom_components.artnet_dmx_controller.entry_fixtures import (
+    build_fixture_entry_data,
+)
+from custom_components.artnet_dmx_controller.fixture_mapping import load_fixture_mapping
+
+BACKENDS = [False, True] if buffer.HAS_NUMPY else [False]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_scatter_clamps_and_tiles_values(use_numpy):
+    data = buffer.new_universe_buffer(use_numpy)
+    indices = buffer.concat_indices(
+        [
+            buffer.channel_indices([1, 6], use_numpy),
+            buffer.channel_indices([2, 3, 4, 7, 8, 9], use_numpy),
+        ]
+    )
+
+    buffer.scatter(data, indices, buffer.tiled_values([((300,), 2), ((10, -5, 20), 2)]))
+
+    assert bytes(data[:9]) == bytes([255, 10, 0, 20, 0, 255, 10, 0, 20])
+
+    buffer.scatter(data, buffer.channel_indices([512], use_numpy), 7)
+    assert data[511] == 7
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_apply_channel_values_is_all_or_nothing(use_numpy):
+    data = buffer.new_universe_buffer(use_numpy)
+
+    with pytest.raises(ValueError, match="got 513"):
+        buffer.apply_channel_values(data, {1: 10, 513: 1})
+    with pytest.raises(ValueError, match="got 256"):
+        buffer.apply_channel_values(data, {1: 10, 2: 256})
+    assert bytes(data[:2]) == bytes(2)
+
+    buffer.apply_channel_values(data, {1: 10, 512: 20})
+    assert (data[0], data[511]) == (10, 20)
+
+    bulk = dict.fromkeys(range(1, 101), 9)
+    bulk[50] = 256
+    with pytest.raises(ValueError, match="got 256"):
+        buffer.apply_channel_values(data, bulk)
+    assert data[1] == 0
+    bulk[50] = 1
+    buffer.apply_channel_values(data, bulk)
+    assert (data[0], data[49], data[99]) == (9, 1, 9)
+
+
+def test_helper_indexed_write_sends_one_frame():
+    helper = ArtNetDMXHelper(
+        hass=SimpleNamespace(), target_ip="192.168.1.100", universe=0
+    )
+    sent = []
+
+    async def send_dmx_data(dmx_data):
+        sent.append(bytes(dmx_data))
+
+    helper.send_dmx_data = send_dmx_data
+    fixture = build_fixture_entry_data(
+        "192.168.1.100", 0, "parcan_rgb_gen", 11, 5, fixture_id="par"
+    )
+    compiled = compile_fixture(fixture, load_fixture_mapping())
+
+    asyncio.run(
+        helper.set_indexed(
+            compiled.indices("dim", "red", "green", "blue"), [255, 1, 2, 3]
+        )
+    )
+
+    assert len(sent) == 1
+    assert helper.get_channel_block(11, 5) == bytes([255, 1, 2, 3, 0])
+    assert compiled.indices("dim", "red", "green", "blue") is compiled.indices(
+        "dim", "red", "green", "blue"
+    )
@@ -0,0 +1,127 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.artnet_dmx_controller import buffer
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper
+from custom_components.artnet_dmx_controller.compiled_fixture import compile_fixture
+from custom_components.artnet_dmx_controller.compositor import UniverseCompositor
+from custom_components.artnet_dmx_controller.const import DOMAIN
+from custom_components.artnet_dmx_controller.entry_fixtures import (
+    build_fixture_entry_data,
+)
+from custom_components.artnet_dmx_controller.fixture_mapping import load_fixture_mapping
+
+BACKENDS = [False, True] if buffer.HAS_NUMPY else [False]
+
+
+def _base(use_numpy, values):
+    data = buffer.new_universe_buffer(use_numpy)
+    buffer.apply_channel_values(data, values)
+    return data
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_intensity_merges_htp_and_other_channels_ltp(use_numpy):
+    compositor = UniverseCompositor(use_numpy=use_numpy)
+    compositor.set_intensity_channels([1])
+    base = _base(use_numpy, {1: 100, 2: 100, 3: 50})
+
+    assert compositor.compose(base) is base
+
+    compositor.set_values("effects", {1: 80, 2: 10})
+    compositor.set_values("override", {1: 120, 2: 200})
+    frame = compositor.compose(base)
+    assert bytes(frame[:3]) == bytes([120, 200, 50])
+
+    compositor.set_values("effects", {2: 30})
+    assert bytes(compositor.compose(base)[:3]) == bytes([120, 30, 50])
+
+    compositor.release("override")
+    assert compositor.layers() == ["effects"]
+    assert bytes(compositor.compose(base)[:3]) == bytes([100, 30, 50])
+
+    compositor.release("effects", [1, 2])
+    assert not compositor.active
+    assert compositor.compose(base) is base
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_parked_channels_win_and_invalid_writes_are_rejected(use_numpy):
+    compositor = UniverseCompositor(max_layers=2, use_numpy=use_numpy)
+    compositor.set_intensity_channels([1])
+    base = _base(use_numpy, {1: 255, 2: 10})
+
+    compositor.park({1: 0, 2: 40})
+    compositor.scatter("effects", buffer.channel_indices([2], use_numpy), 90)
+    assert bytes(compositor.compose(base)[:2]) == bytes([0, 40])
+    assert compositor.parked() == {1: 0, 2: 40}
+
+    compositor.unpark([2])
+    assert bytes(compositor.compose(base)[:2]) == bytes([0, 90])
+
+    with pytest.raises(ValueError, match="got 256"):
+        compositor.set_values("override", {2: 256})
+    with pytest.raises(ValueError, match="base look"):
+        compositor.set_values("base", {2: 1})
+    compositor.set_values("override", {2: 1})
+    with pytest.raises(ValueError, match="No more than 2 layers"):
+        compositor.set_values("third", {2: 1})
+
+
+def test_helper_sends_composed_frames_and_keeps_base_buffer():
+    helper = ArtNetDMXHelper(
+        hass=SimpleNamespace(), target_ip="192.168.1.100", universe=0
+    )
+    sent = []
+
+    async def send_dmx_data(dmx_data):
+        sent.append(bytes(dmx_data))
+
+    helper.send_dmx_data = send_dmx_data
+    fixture = build_fixture_entry_data(
+        "192.168.1.100", 0, "mini_beam_prism", 1, 12, fixture_id="head"
+    )
+    compiled = compile_fixture(fixture, load_fixture_mapping())
+    helper.set_intensity_channels("head", compiled.intensity_channels)
+    dim, pan = compiled.channels["dim"], compiled.channels["pan_msb"]
+
+    asyncio.run(helper.set_channels({dim: 200, pan: 10}))
+    asyncio.run(helper.set_layer_channels("override", {dim: 50, pan: 99}))
+
+    assert (sent[-1][dim - 1], sent[-1][pan - 1]) == (200, 99)
+    assert helper.get_channel_value(pan) == 10
+
+    asyncio.run(helper.release_layer("override"))
+    assert (sent[-1][dim - 1], sent[-1][pan - 1]) == (200, 10)
+    assert helper.get_output_frame() == sent[-1]
+
+
+def test_set_channels_layer_and_release_layer_services(make_hass):
+    universe = ArtNetDMXHelper(
+        hass=SimpleNamespace(), target_ip="192.168.1.100", universe=0
+    )
+    sent = []
+
+    async def send_dmx_data(dmx_data):
+        sent.append(bytes(dmx_data))
+
+    universe.send_dmx_data = send_dmx_data
+    hass = make_hass({"shared_helpers": {("192.168.1.100", 0): universe}})
+
+    def call(service, data):
+        asyncio.run(hass.services.async_call(DOMAIN, service, data))
+
+    call("set_channels", {"target_ip": "192.168.1.100", "channels": {5: 30}})
+    call(
+        "set_channels",
+        {"target_ip": "192.168.1.100", "channels": {5: 70}, "layer": "override"},
+    )
+    assert sent[-1][4] == 70
+    assert universe.get_channel_value(5) == 30
+
+    call("release_layer", {"layer": "override", "target_ip": "10.0.0.1"})
+    assert sent[-1][4] == 70
+    call("release_layer", {"layer": "override"})
+    assert sent[-1][4] == 30
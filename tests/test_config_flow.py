@@ -3,7 +3,10 @@ from types import SimpleNamespace
 
 import custom_components.artnet_dmx_controller as integration_init
 import custom_components.artnet_dmx_controller.config_flow as cf_mod
-from custom_components.artnet_dmx_controller.config_flow import ArtNetDMXControllerConfigFlow, OptionsFlowHandler
+from custom_components.artnet_dmx_controller.config_flow import (
+    ArtNetDMXControllerConfigFlow,
+    OptionsFlowHandler,
+)
 
 
 def _mapping() -> dict:
@@ -247,7 +250,7 @@ def test_options_fixture_update_rewrites_entry():
             return [entry]
 
     handler = OptionsFlowHandler(entry)
-    handler.hass = SimpleNamespace(config_entries=FakeConfigEntries())
+    handler.hass = SimpleNamespace(data={}, config_entries=FakeConfigEntries())
     handler.async_show_form = lambda step_id, data_schema=None, errors=None: {"step_id": step_id, "errors": errors}
     handler.async_create_entry = lambda title, data: {"title": title, "data": data}
 
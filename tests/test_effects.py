@@ -0,0 +1,232 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.artnet_dmx_controller import buffer, effects
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper
+from custom_components.artnet_dmx_controller.compiled_fixture import compile_fixture
+from custom_components.artnet_dmx_controller.effects import (
+    Effect,
+    EffectEngine,
+    available_effects,
+    available_layouts,
+    spatial_phases,
+)
+from custom_components.artnet_dmx_controller.entry_fixtures import (
+    build_fixture_entry_data,
+)
+from custom_components.artnet_dmx_controller.fixture_mapping import load_fixture_mapping
+
+BACKENDS = [False, True] if buffer.HAS_NUMPY else [False]
+
+
+def _compile(fixture_type, start_channel, fixture_id):
+    fixture = build_fixture_entry_data(
+        "192.168.1.100", 0, fixture_type, start_channel, 12, fixture_id=fixture_id
+    )
+    return compile_fixture(fixture, load_fixture_mapping())
+
+
+def _pars(count):
+    return [
+        _compile("parcan_rgb_gen", 1 + 5 * position, f"par_{position}")
+        for position in range(count)
+    ]
+
+
+def _helper(universe=0):
+    helper = ArtNetDMXHelper(
+        hass=SimpleNamespace(), target_ip="192.168.1.100", universe=universe
+    )
+    helper.frames = []
+
+    async def send_dmx_data(dmx_data):
+        helper.frames.append(bytes(dmx_data))
+
+    helper.send_dmx_data = send_dmx_data
+    return helper
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+@pytest.mark.parametrize(
+    ("kind", "expected"),
+    [
+        ("sine", [0, 127, 255, 128]),
+        ("saw", [0, 64, 128, 191]),
+        ("square", [255, 255, 0, 0]),
+        ("strobe", [255, 0, 0, 0]),
+    ],
+)
+def test_waves_spread_fixture_phases_across_one_cycle(use_numpy, kind, expected):
+    helper = object()
+    effect = Effect(kind, [(helper, par) for par in _pars(4)], use_numpy=use_numpy)
+
+    [(target, indices, values)] = effect.render(0.0)
+
+    assert target is helper
+    assert [int(index) + 1 for index in indices] == [1, 6, 11, 16]
+    assert [int(value) for value in values] == expected
+    # A full cycle later the wave is back where it started.
+    assert [int(value) for value in effect.render(1.0)[0][2]] == expected
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_chase_steps_colours_and_circle_sweeps_pan_tilt(use_numpy):
+    helper = object()
+    chase = Effect(
+        "chase", [(helper, par) for par in _pars(2)], size=1.0, use_numpy=use_numpy
+    )
+    [(_target, indices, values)] = chase.render(0.0)
+    assert [int(index) + 1 for index in indices] == [2, 3, 4, 7, 8, 9, 1, 6]
+    assert [int(value) for value in values] == [255, 0, 0, 0, 255, 255, 255, 255]
+
+    head = _compile("head_el150", 20, "head")
+    circle = Effect("circle", [(helper, head)], use_numpy=use_numpy)
+    [(_target, indices, values)] = circle.render(0.0)
+    assert [int(index) + 1 for index in indices] == [20, 21, 22, 23]
+    assert [int(value) for value in values] == [255, 255, 128, 0]
+    assert [int(value) for value in circle.render(0.25)[0][2]] == [128, 0, 255, 255]
+
+
+def test_effects_skip_fixtures_without_the_driven_channels():
+    head = _compile("head_el150", 20, "head")
+    assert available_effects(_pars(1)) == ["sine", "saw", "square", "strobe", "chase"]
+    assert Effect("circle", [(object(), par) for par in _pars(2)]).channel_count == 0
+    assert Effect("sine", [(object(), head)]).channel_count == 1
+
+
+def test_engine_writes_one_frame_per_universe_and_releases_on_stop(monkeypatch):
+    tickers = []
+    monkeypatch.setattr(
+        effects,
+        "async_track_time_interval",
+        lambda hass, action, interval: (
+            tickers.append(interval) or (lambda: tickers.append("cancelled"))
+        ),
+    )
+    pars_universe, heads_universe = _helper(0), _helper(1)
+    head = _compile("head_el150", 20, "head")
+    engine = EffectEngine(SimpleNamespace())
+
+    async def scenario():
+        await pars_universe.set_channels({1: 40})
+        pars_universe.frames.clear()
+
+        pars = [(pars_universe, par) for par in _pars(2)]
+        await engine.async_start("pars", Effect("square", pars, speed=0, spread=0))
+        await engine.async_start(
+            "heads", Effect("circle", [(heads_universe, head)], speed=0)
+        )
+        assert engine.running
+        assert len(tickers) == 1
+
+        await engine.async_tick()
+        assert len(pars_universe.frames) == 1
+        assert len(heads_universe.frames) == 1
+        assert pars_universe.frames[-1][0] == 255
+        assert pars_universe.frames[-1][5] == 255
+        assert heads_universe.frames[-1][19:23] == bytes([255, 255, 128, 0])
+
+        # Replacing an effect releases only the channels it no longer drives.
+        await engine.async_start("pars", Effect("square", pars[:1], speed=0))
+        assert pars_universe.get_output_frame()[5] == 0
+
+        await engine.async_stop("pars")
+        await engine.async_stop("heads")
+        assert not engine.running
+        assert tickers[-1] == "cancelled"
+        assert pars_universe.get_output_frame()[0] == 40
+        assert heads_universe.get_output_frame()[19:23] == bytes(4)
+
+    asyncio.run(scenario())
+
+
+def test_group_controls_start_and_stop_the_effect(monkeypatch):
+    monkeypatch.setattr(
+        effects,
+        "async_track_time_interval",
+        lambda hass, action, interval: lambda: None,
+    )
+    universe = _helper(0)
+    engine = EffectEngine(SimpleNamespace())
+    controls = engine.controls("group", [(universe, par) for par in _pars(2)])
+    assert engine.controls("group", []) is controls
+
+    async def scenario():
+        await controls.async_update(kind="sine", speed=0.5, spread=0.0)
+        effect = engine.effect("group")
+        assert effect.kind == "sine"
+        assert effect.speed == 0.5
+
+        await controls.async_update(kind="off")
+        assert engine.effect("group") is None
+
+        await controls.async_update(kind="strobe")
+        await engine.async_remove("group")
+        assert engine.effect("group") is None
+        assert not engine.running
+
+    asyncio.run(scenario())
+
+
+def _located_pars(locations):
+    mapping = load_fixture_mapping()
+    return [
+        compile_fixture(
+            build_fixture_entry_data(
+                "192.168.1.100",
+                0,
+                "parcan_rgb_gen",
+                1 + 5 * position,
+                5,
+                fixture_id=f"par_{position}",
+                location=location,
+            ),
+            mapping,
+        )
+        for position, location in enumerate(locations)
+    ]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_spatial_layouts_derive_phases_from_locations(use_numpy):
+    pars = _located_pars(
+        [
+            {"x": 1.0, "y": 0.0, "z": 0.0},
+            {"x": 0.0, "y": 0.5},
+            {"x": 0.5, "y": 1.0, "z": 0.0},
+            None,
+        ]
+    )
+    assert pars[1].location == (0.0, 0.5, 0.0)
+    assert available_layouts(pars) == [
+        "order",
+        "sweep_x",
+        "sweep_y",
+        "sweep_z",
+        "radial",
+    ]
+    assert available_layouts(pars[3:]) == ["order"]
+
+    assert spatial_phases(pars, "sweep_x") == {
+        "par_0": -1.0,
+        "par_1": 0.0,
+        "par_2": -0.5,
+    }
+    assert spatial_phases(pars, "sweep_z") == {"par_0": 0.0, "par_1": 0.0, "par_2": 0.0}
+    radial = spatial_phases(pars, "radial", spread=0.5)
+    assert radial["par_0"] == -0.5
+    assert radial["par_1"] == radial["par_2"] == pytest.approx(-0.5 / 2**0.5)
+
+    # The sweep travels towards +x: the fixture at x=0 leads, x=1 lags half a cycle.
+    helper = object()
+    effect = Effect(
+        "square",
+        [(helper, par) for par in pars],
+        spread=0.5,
+        layout="sweep_x",
+        use_numpy=use_numpy,
+    )
+    assert [int(value) for value in effect.render(0.0)[0][2]] == [0, 255, 0, 255]
+    assert [int(value) for value in effect.render(0.3)[0][2]] == [0, 255, 255, 255]
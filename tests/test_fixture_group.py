@@ -0,0 +1,278 @@
+import asyncio
+from types import SimpleNamespace
+
+import custom_components.artnet_dmx_controller as integration_init
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper
+from custom_components.artnet_dmx_controller.dmx_writer import DMXWriter
+from custom_components.artnet_dmx_controller.entry_fixtures import (
+    build_fixture_entry_data,
+    build_group_entry_data,
+    build_rig_entry_data,
+    fixture_title,
+)
+from custom_components.artnet_dmx_controller.fixture_mapping import (
+    load_fixture_mapping,
+)
+from custom_components.artnet_dmx_controller.light import (
+    _fixture_light_entities,
+    _group_light_entities,
+)
+from custom_components.artnet_dmx_controller.light import (
+    async_setup_entry as light_setup_entry,
+)
+from custom_components.artnet_dmx_controller.number import (
+    _fixture_number_entities,
+    _group_number_entities,
+)
+from custom_components.artnet_dmx_controller.number import (
+    async_setup_entry as number_setup_entry,
+)
+from custom_components.artnet_dmx_controller.select import (
+    async_setup_entry as select_setup_entry,
+)
+from custom_components.artnet_dmx_controller.universe_store import UniverseStateStore
+
+
+class MemoryStore:
+    async def async_load(self):
+        return None
+
+    def async_delay_save(self, data_func, delay):
+        return None
+
+
+class FakeHelper:
+    def __init__(self, hass, target_ip, universe):
+        self.universe = universe
+        self.writes = []
+        self._dmx_data = bytearray(512)
+
+    def setup_socket(self):
+        return None
+
+    def restore_buffer(self, dmx_data):
+        self._dmx_data[: len(dmx_data)] = dmx_data
+
+    def get_buffer(self):
+        return bytes(self._dmx_data)
+
+    def close_socket(self):
+        return None
+
+    async def async_send_current_state(self):
+        return None
+
+    async def set_channels(self, channel_values):
+        self.writes.append(dict(channel_values))
+        for channel, value in channel_values.items():
+            self._dmx_data[channel - 1] = value
+
+    async def set_indexed(self, indices, values):
+        if not hasattr(values, "__len__"):
+            values = [values] * len(indices)
+        await self.set_channels(
+            {
+                int(index) + 1: int(value)
+                for index, value in zip(indices, values, strict=True)
+            }
+        )
+
+    def get_channel_value(self, channel):
+        return self._dmx_data[channel - 1]
+
+
+def _setup(monkeypatch):
+    monkeypatch.setattr(integration_init, "ArtNetDMXHelper", FakeHelper)
+    rig = SimpleNamespace(
+        entry_id="rig",
+        title="Rig",
+        options={},
+        data=build_rig_entry_data(
+            "Rig",
+            [
+                build_fixture_entry_data(
+                    "192.168.1.100", 0, "parcan_rgb_gen", 1, 5, fixture_id="par_a"
+                ),
+                build_fixture_entry_data(
+                    "192.168.1.100", 0, "parcan_rgb_gen", 6, 5, fixture_id="par_b"
+                ),
+                build_fixture_entry_data(
+                    "192.168.1.100", 1, "mini_beam_prism", 1, 12, fixture_id="head_a"
+                ),
+            ],
+        ),
+    )
+    head_b = SimpleNamespace(
+        entry_id="head-b",
+        title="Head B",
+        options={},
+        data=build_fixture_entry_data(
+            "192.168.1.100", 1, "head_el150", 20, 9, fixture_id="head_b"
+        ),
+    )
+    group = SimpleNamespace(
+        entry_id="group",
+        title="Everything",
+        options={"helper_release_delay": 0},
+        data=build_group_entry_data(
+            "Everything", ["par_a", "par_b", "head_a", "head_b", "gone"]
+        ),
+    )
+
+    class FakeConfigEntries:
+        def async_entries(self, domain):
+            return [rig, head_b, group]
+
+        async def async_forward_entry_setups(self, entry, platforms):
+            return None
+
+        async def async_unload_platforms(self, entry, platforms):
+            return True
+
+    hass = SimpleNamespace(data={}, config_entries=FakeConfigEntries())
+    hass.data["artnet_dmx_controller"] = {
+        "universe_store": UniverseStateStore(hass, store=MemoryStore())
+    }
+    asyncio.run(integration_init.async_setup_entry(hass, group))
+    return hass, group
+
+
+def test_group_title_counts_members():
+    assert (
+        fixture_title(build_group_entry_data("Heads", ["a", "b", "a"]))
+        == "Heads (group of 2)"
+    )
+
+
+def test_group_light_sends_one_write_per_universe(monkeypatch):
+    hass, group = _setup(monkeypatch)
+    helpers = hass.data["artnet_dmx_controller"]["shared_helpers"]
+    universe_0 = helpers[("192.168.1.100", 0)]
+    universe_1 = helpers[("192.168.1.100", 1)]
+
+    lights = []
+    asyncio.run(light_setup_entry(hass, group, lights.extend))
+    assert len(lights) == 1
+
+    async def turn_on():
+        await lights[0].async_turn_on(brightness=255, rgb_color=(255, 0, 128))
+        await asyncio.sleep(0.01)
+
+    asyncio.run(turn_on())
+
+    assert universe_0.writes == [
+        {1: 255, 2: 255, 3: 0, 4: 128, 6: 255, 7: 255, 8: 0, 9: 128}
+    ]
+    assert universe_1.writes == [{6: 255, 25: 255}]
+
+
+def test_group_numbers_cover_channels_shared_by_every_member(monkeypatch):
+    hass, group = _setup(monkeypatch)
+    universe_1 = hass.data["artnet_dmx_controller"]["shared_helpers"][
+        ("192.168.1.100", 1)
+    ]
+
+    # Parcans and moving heads share no channel besides the light channels;
+    # only the group effect controls are added.
+    numbers = []
+    asyncio.run(number_setup_entry(hass, group, numbers.extend))
+    assert {number.unique_id for number in numbers} == {
+        "group_effect_speed",
+        "group_effect_size",
+        "group_effect_spread",
+    }
+
+    selects = []
+    asyncio.run(select_setup_entry(hass, group, selects.extend))
+    assert [select.unique_id for select in selects] == ["group_effect"]
+
+    hass.data["artnet_dmx_controller"]["entry_group_members"]["group"] = [
+        member
+        for member in hass.data["artnet_dmx_controller"]["entry_group_members"]["group"]
+        if member[0]["id"].startswith("head")
+    ]
+    numbers = []
+    asyncio.run(number_setup_entry(hass, group, numbers.extend))
+    assert {number.unique_id for number in numbers} == {
+        "group_group_number_pan",
+        "group_group_number_tilt",
+        "group_group_number_speed",
+        "group_effect_speed",
+        "group_effect_size",
+        "group_effect_spread",
+    }
+    pan = next(
+        number for number in numbers if number.unique_id == "group_group_number_pan"
+    )
+    assert pan.native_max_value == 65535
+
+    async def set_pan():
+        await pan.async_set_native_value(0x1234)
+        await asyncio.sleep(0.01)
+
+    asyncio.run(set_pan())
+
+    assert universe_1.writes == [{1: 0x12, 2: 0x34, 20: 0x12, 21: 0x34}]
+
+
+def test_group_unload_releases_member_universes(monkeypatch):
+    hass, group = _setup(monkeypatch)
+
+    assert asyncio.run(integration_init.async_unload_entry(hass, group)) is True
+    assert hass.data["artnet_dmx_controller"]["shared_helpers"] == {}
+
+
+def test_group_writes_refresh_member_entities():
+    helper = ArtNetDMXHelper(
+        hass=SimpleNamespace(), target_ip="192.168.1.100", universe=0
+    )
+    helper._socket = SimpleNamespace(sendto=lambda _packet, _address: None)
+    mapping = load_fixture_mapping()
+    entry = SimpleNamespace(
+        entry_id="group", title="Pars", data={"name": "Pars", "members": ["a", "b"]}
+    )
+    fixtures = [
+        {"id": "par_a", "fixture_type": "parcan_rgb_gen", "start_channel": 1},
+        {"id": "par_b", "fixture_type": "parcan_rgb_gen", "start_channel": 6},
+    ]
+    writer = DMXWriter(helper)
+    members = []
+    for fixture in fixtures:
+        members += _fixture_light_entities(entry, fixture, mapping, helper, writer)
+        members += _fixture_number_entities(entry, fixture, mapping, helper, writer)
+    group_members = [(fixture, helper) for fixture in fixtures]
+    (group_light,) = _group_light_entities(entry, group_members, mapping)
+    (group_strobe,) = _group_number_entities(entry, group_members, mapping)
+    published = []
+    for entity in members:
+        entity.async_write_ha_state = lambda entity=entity: published.append(
+            entity.unique_id
+        )
+
+    async def scenario():
+        for entity in members:
+            await entity.async_added_to_hass()
+        await group_light.async_turn_on(brightness=128, rgb_color=(255, 0, 0))
+        await group_strobe.async_set_native_value(200)
+        await asyncio.sleep(0.01)
+        # A member's own write is published once, not re-read after the flush.
+        published.clear()
+        await members[0].async_turn_on(brightness=255, rgb_color=(0, 255, 0))
+        await asyncio.sleep(0.01)
+        return list(published)
+
+    own_write = asyncio.run(scenario())
+    light_a, strobe_a, light_b, strobe_b = members
+    assert own_write == ["group_par_a_rgb_2_3_4"]
+    assert (light_b.is_on, light_b.brightness, light_b.rgb_color) == (
+        True,
+        128,
+        (128, 0, 0),
+    )
+    assert strobe_a.native_value == strobe_b.native_value == 200.0
+    assert (light_a.brightness, light_a.rgb_color) == (255, (0, 255, 0))
+
+    for entity in members:
+        for remove in entity._on_remove or ():
+            remove()
+    assert helper._channel_listeners == {}
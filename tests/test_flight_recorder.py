@@ -0,0 +1,139 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper
+from custom_components.artnet_dmx_controller.const import DOMAIN
+from custom_components.artnet_dmx_controller.fixture_mapping import HomeAssistantError
+from custom_components.artnet_dmx_controller.flight_recorder import (
+    FlightRecorder,
+    attach_recorder,
+    read_flight_recording,
+)
+from custom_components.artnet_dmx_controller.output_thread import FrameSlot
+from tests.conftest import FakeSocket
+
+
+def _helper(universe=0):
+    helper = ArtNetDMXHelper(
+        hass=SimpleNamespace(), target_ip="10.0.0.5", universe=universe
+    )
+    helper._socket = FakeSocket()
+    return helper
+
+
+def _hass(make_hass, helpers, config_dir):
+    return make_hass(
+        {"shared_helpers": {("10.0.0.5", h.universe): h for h in helpers}},
+        config=SimpleNamespace(
+            path=lambda name: str(config_dir / name),
+            is_allowed_path=lambda path: path.startswith(str(config_dir)),
+        ),
+    )
+
+
+def test_ring_keeps_the_last_frames_oldest_first():
+    recorder = FlightRecorder(frames=3)
+    assert len(recorder) == 0
+    assert recorder.snapshot() == (b"", b"")
+
+    for value in range(5):
+        recorder.record(b"\xff" * 18 + bytes([value]) * 512, 18)
+
+    times, frames = recorder.snapshot()
+    assert len(recorder) == 3
+    assert recorder.recorded == 5
+    assert [frames[index * 512] for index in range(3)] == [2, 3, 4]
+    assert len(times) == 3 * 8
+    # The ring is written in place; recording never grows it.
+    assert len(recorder._frames) == 3 * 512
+
+
+def test_helper_records_frames_sent_from_the_loop_and_the_output_thread():
+    helper = _helper()
+    asyncio.run(helper.set_channels({1: 10}))
+    assert helper.recorder is None
+
+    helper.recorder = FlightRecorder(frames=8)
+
+    async def scenario():
+        await helper.set_channels({1: 20})
+        helper.attach_output(FrameSlot(("10.0.0.5", 6454)))
+        await helper.set_channels({1: 30})
+        helper.blackout_now()
+
+    asyncio.run(scenario())
+    _times, frames = helper.recorder.snapshot()
+    assert [frames[index * 512] for index in range(len(helper.recorder))] == [20, 30, 0]
+
+
+def test_helper_records_only_what_went_on_the_wire():
+    helper = _helper()
+    helper.recorder = FlightRecorder(frames=8)
+
+    async def scenario():
+        await helper.set_channels({1: 20})
+        helper._blackout = True
+        await helper.send_dmx_data(helper.get_channel_block(1, 512))
+        helper._blackout = False
+        helper._socket = FakeSocket(fail=True)
+        await helper.set_channels({1: 30})
+
+    asyncio.run(scenario())
+    _times, frames = helper.recorder.snapshot()
+    assert [frames[index * 512] for index in range(len(helper.recorder))] == [20, 0]
+    assert helper.metrics.send_errors == 1
+
+
+def test_services_record_and_dump_every_universe(make_hass, tmp_path):
+    helpers = [_helper(0), _helper(1)]
+    hass = _hass(make_hass, helpers, tmp_path)
+
+    async def scenario():
+        with pytest.raises(HomeAssistantError):
+            await hass.services.async_call(
+                DOMAIN, "dump_flight_recorder", {"file": "recording.bin"}
+            )
+
+        await hass.services.async_call(
+            DOMAIN, "set_flight_recorder", {"enabled": True, "frames": 2}
+        )
+        for value in (1, 2, 3):
+            await helpers[0].set_channels({1: value})
+        await helpers[1].set_channels({512: 99})
+
+        # Universes created while recording record too.
+        late = _helper(2)
+        attach_recorder(hass, late)
+        assert late.recorder.capacity == 2
+
+        with pytest.raises(HomeAssistantError):
+            await hass.services.async_call(
+                DOMAIN, "dump_flight_recorder", {"file": "/etc/recording.bin"}
+            )
+        return await hass.services.async_call(
+            DOMAIN, "dump_flight_recorder", {"file": "recording.bin"}
+        )
+
+    result = asyncio.run(scenario())
+    assert result == {
+        "file": str(tmp_path / "recording.bin"),
+        "universes": 2,
+        "frames": 3,
+    }
+
+    recording = read_flight_recording(result["file"])
+    assert list(recording) == [("10.0.0.5", 0), ("10.0.0.5", 1)]
+    assert [frame[0] for _timestamp, frame in recording[("10.0.0.5", 0)]] == [2, 3]
+    timestamp, frame = recording[("10.0.0.5", 1)][0]
+    assert frame[511] == 99
+    assert timestamp > 1e9
+    assert (tmp_path / "recording.bin").stat().st_size == 10 + 2 * 22 + 3 * (8 + 512)
+
+    asyncio.run(
+        hass.services.async_call(
+            DOMAIN, "set_flight_recorder", {"enabled": False, "frames": 2}
+        )
+    )
+    assert all(helper.recorder is None for helper in helpers)
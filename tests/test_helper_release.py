@@ -0,0 +1,116 @@
+import asyncio
+from types import SimpleNamespace
+
+import custom_components.artnet_dmx_controller as integration_init
+from custom_components.artnet_dmx_controller.universe_store import UniverseStateStore
+
+
+class MemoryStore:
+    async def async_load(self):
+        return None
+
+    def async_delay_save(self, data_func, delay):
+        return None
+
+
+class FakeHelper:
+    created = 0
+
+    def __init__(self, hass, target_ip, universe):
+        FakeHelper.created += 1
+        self.closed = False
+        self.frames = 0
+        self._dmx_data = bytearray(512)
+
+    def setup_socket(self):
+        return None
+
+    def restore_buffer(self, dmx_data):
+        self._dmx_data[: len(dmx_data)] = dmx_data
+
+    def get_buffer(self):
+        return bytes(self._dmx_data)
+
+    def close_socket(self):
+        self.closed = True
+
+    async def async_send_current_state(self):
+        self.frames += 1
+
+
+def _setup(monkeypatch):
+    timers = []
+
+    def fake_call_later(_hass, delay, action):
+        timer = {"delay": delay, "action": action, "cancelled": False}
+        timers.append(timer)
+
+        def cancel():
+            timer["cancelled"] = True
+
+        return cancel
+
+    monkeypatch.setattr(integration_init, "ArtNetDMXHelper", FakeHelper)
+    monkeypatch.setattr(integration_init, "async_call_later", fake_call_later)
+    FakeHelper.created = 0
+
+    class FakeConfigEntries:
+        async def async_forward_entry_setups(self, entry, platforms):
+            return None
+
+        async def async_unload_platforms(self, entry, platforms):
+            return True
+
+    hass = SimpleNamespace(data={}, config_entries=FakeConfigEntries())
+    hass.data["artnet_dmx_controller"] = {
+        "universe_store": UniverseStateStore(hass, store=MemoryStore())
+    }
+    entry = SimpleNamespace(
+        entry_id="entry-a",
+        title="A",
+        options={"helper_release_delay": 30},
+        data={
+            "id": "fixture-a",
+            "target_ip": "192.168.1.100",
+            "universe": 0,
+            "fixture_type": "parcan_rgb_gen",
+            "start_channel": 1,
+            "channel_count": 5,
+        },
+    )
+    return hass, entry, timers
+
+
+def test_reload_within_grace_period_reuses_helper(monkeypatch):
+    hass, entry, timers = _setup(monkeypatch)
+
+    asyncio.run(integration_init.async_setup_entry(hass, entry))
+    helper = hass.data["artnet_dmx_controller"]["entry-a"]
+    helper._dmx_data[0] = 123
+    asyncio.run(integration_init.async_unload_entry(hass, entry))
+
+    assert helper.closed is False
+    assert len(timers) == 1
+    assert timers[0]["delay"] == 30
+
+    asyncio.run(integration_init.async_setup_entry(hass, entry))
+
+    assert timers[0]["cancelled"] is True
+    assert FakeHelper.created == 1
+    assert hass.data["artnet_dmx_controller"]["entry-a"] is helper
+    assert helper.frames == 1
+    assert helper._dmx_data[0] == 123
+
+
+def test_released_helper_closes_after_grace_period(monkeypatch):
+    hass, entry, timers = _setup(monkeypatch)
+
+    asyncio.run(integration_init.async_setup_entry(hass, entry))
+    helper = hass.data["artnet_dmx_controller"]["entry-a"]
+    asyncio.run(integration_init.async_unload_entry(hass, entry))
+
+    timers[0]["action"](None)
+
+    assert helper.closed is True
+    assert hass.data["artnet_dmx_controller"]["shared_helpers"] == {}
+    assert hass.data["artnet_dmx_controller"]["helper_refcounts"] == {}
@@ -0,0 +1,289 @@
+import asyncio
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.artnet_dmx_controller import effects, sensor
+from custom_components.artnet_dmx_controller import loop_monitor as loop_monitor_module
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper
+from custom_components.artnet_dmx_controller.compiled_fixture import compile_fixture
+from custom_components.artnet_dmx_controller.effects import Effect, EffectEngine
+from custom_components.artnet_dmx_controller.entry_fixtures import (
+    build_fixture_entry_data,
+)
+from custom_components.artnet_dmx_controller.fixture_mapping import load_fixture_mapping
+from custom_components.artnet_dmx_controller.loop_monitor import (
+    LoopLagMonitor,
+    UniverseHealth,
+)
+from tests.conftest import FakeSocket
+
+# Periods of 1/32 s keep every clock value exact in binary floating point.
+RATE = 32
+PERIOD = 1 / RATE
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _helper(universe):
+    helper = ArtNetDMXHelper(
+        hass=SimpleNamespace(), target_ip="10.0.0.5", universe=universe
+    )
+    helper._socket = FakeSocket()
+    return helper
+
+
+def _hass(make_hass, helpers, stop_listeners, posted=None):
+    posted = [] if posted is None else posted
+    return make_hass(
+        {"shared_helpers": {("10.0.0.5", h.universe): h for h in helpers}},
+        bus=SimpleNamespace(
+            async_listen_once=lambda event, listener: (
+                stop_listeners.append(listener)
+                or (lambda: stop_listeners.remove(listener))
+            )
+        ),
+        loop=SimpleNamespace(
+            call_soon_threadsafe=lambda callback, *args: posted.append((callback, args))
+        ),
+    )
+
+
+def _hog_the_loop(clock, monitor, seconds):
+    clock.now += seconds
+    # The watchdog samples the loop thread while it is stuck.
+    monitor._sample_stall()
+
+
+def test_stalls_are_charged_to_the_universes_each_ticker_drives(
+    make_hass, monkeypatch, caplog
+):
+    published = []
+    monkeypatch.setattr(
+        loop_monitor_module,
+        "async_dispatcher_send",
+        lambda hass, signal: published.append(signal),
+    )
+    stop_listeners = []
+    clock = FakeClock()
+    monitor = LoopLagMonitor(_hass(make_hass, [], stop_listeners), clock=clock)
+    assert not monitor.running
+
+    monitor.async_add_ticker("effects", RATE, lambda: [("10.0.0.5", 0)])
+    monitor.async_add_ticker("motion", RATE, lambda: [("10.0.0.5", 0), ("10.0.0.5", 1)])
+    assert monitor.running
+    assert len(stop_listeners) == 1
+    for _tick in range(10):
+        clock.now += PERIOD
+        monitor.tick("effects")
+        monitor.tick("motion")
+    assert (monitor.stats.cycles, monitor.stats.late, monitor.stats.skipped) == (
+        18,
+        0,
+        0,
+    )
+    assert monitor.universes == {}
+
+    with caplog.at_level(logging.WARNING):
+        _hog_the_loop(clock, monitor, 8 * PERIOD)
+        monitor.tick("effects")
+        clock.now += PERIOD / 4
+        monitor.tick("motion")
+
+    # Both tickers missed the seven frames the stall swallowed and sent the eighth late.
+    assert (monitor.stats.cycles, monitor.stats.late, monitor.stats.skipped) == (
+        20,
+        2,
+        14,
+    )
+    assert monitor.stats.max_jitter == pytest.approx(7.25 * PERIOD)
+    # Universe 0 is driven by both tickers but charged for the stall once.
+    assert monitor.universes[("10.0.0.5", 0)].missed == 7
+    assert monitor.universes[("10.0.0.5", 0)].late == 1
+    assert monitor.universes[("10.0.0.5", 1)].missed == 7
+    assert monitor.universes[("10.0.0.5", 1)].late == 1
+    assert monitor.last_stall["ticker"] == "effects"
+    assert monitor.last_stall["universes"] == ["10.0.0.5/0"]
+    assert "_hog_the_loop" in monitor.last_stall["context"]
+    assert caplog.text.count("Event loop stalled for") == 1
+    assert "_hog_the_loop" in caplog.text
+
+    monitor.async_remove_ticker("effects")
+    assert monitor.running
+    monitor.async_remove_ticker("motion")
+    assert not monitor.running
+    assert stop_listeners == []
+    # Stopping publishes the last window; ticks of removed tickers are ignored.
+    assert published == ["artnet_dmx_controller_loop_health"]
+    assert monitor.last_window["cycles"] == 20
+    monitor.tick("effects")
+    assert monitor.stats.cycles == 20
+
+
+def test_output_thread_probes_post_one_tick_at_a_time(make_hass, monkeypatch):
+    monkeypatch.setattr(
+        loop_monitor_module, "async_dispatcher_send", lambda hass, signal: None
+    )
+    posted = []
+    clock = FakeClock()
+    monitor = LoopLagMonitor(_hass(make_hass, [], [], posted), clock=clock)
+    monitor.async_add_ticker("output", RATE)
+
+    for cycle in range(3):
+        clock.now += PERIOD if cycle < 2 else 4 * PERIOD
+        monitor.tick_threadsafe("output")
+        monitor.tick_threadsafe("output")
+        assert len(posted) == 1
+        callback, args = posted.pop()
+        callback(*args)
+
+    # The output thread keeps sending through a stall; no universe is charged.
+    assert (monitor.stats.cycles, monitor.stats.skipped) == (2, 3)
+    assert monitor.universes == {}
+    monitor.async_remove_ticker("output")
+    monitor.tick_threadsafe("output")
+    assert posted == []
+
+
+def test_monitor_runs_only_while_the_effect_ticker_runs(make_hass, monkeypatch):
+    monkeypatch.setattr(
+        loop_monitor_module, "async_dispatcher_send", lambda hass, signal: None
+    )
+    tickers = []
+    monkeypatch.setattr(
+        effects,
+        "async_track_time_interval",
+        lambda hass, action, interval: tickers.append(action) or (lambda: None),
+    )
+    universe = _helper(0)
+    universe.send_dmx_data = lambda dmx_data: asyncio.sleep(0)
+    hass = _hass(make_hass, [universe], [])
+    hass.async_create_task = lambda coro: coro.close()
+    clock = FakeClock()
+    monitor = LoopLagMonitor(hass, clock=clock)
+    engine = EffectEngine(hass, monitor)
+    fixture = build_fixture_entry_data(
+        "10.0.0.5", 0, "parcan_rgb_gen", 1, 5, fixture_id="par"
+    )
+    effect = Effect(
+        "sine", [(universe, compile_fixture(fixture, load_fixture_mapping()))]
+    )
+
+    async def scenario():
+        await engine.async_start("pars", effect)
+        assert monitor.as_dict()["tickers"] == ["effects"]
+        for _tick in range(2):
+            tickers[0](None)
+            clock.now += 3 * PERIOD
+        tickers[0](None)
+        await engine.async_stop("pars")
+
+    asyncio.run(scenario())
+    assert not monitor.running
+    assert monitor.universes[("10.0.0.5", 0)] == UniverseHealth(
+        missed=4, late=2, charged_until=clock.now
+    )
+
+
+def test_stall_warnings_are_rate_limited(make_hass, monkeypatch, caplog):
+    monkeypatch.setattr(
+        loop_monitor_module, "async_dispatcher_send", lambda hass, signal: None
+    )
+    clock = FakeClock()
+    monitor = LoopLagMonitor(_hass(make_hass, [], []), clock=clock)
+    with caplog.at_level(logging.WARNING):
+        for _stall in range(3):
+            clock.now += 1.0
+            monitor._report_stall("effects", clock.now - 0.2, 0.2, 7, [])
+    assert caplog.text.count("Event loop stalled for") == 1
+    assert monitor._unreported == 2
+    assert monitor.last_stall["context"] is None
+
+
+def test_sensors_belong_to_the_entries_driving_each_universe(make_hass, monkeypatch):
+    listeners = {}
+
+    def connect(_hass, signal, target):
+        listeners.setdefault(signal, []).append(target)
+        return lambda: listeners[signal].remove(target)
+
+    def send(_hass, signal):
+        for target in list(listeners.get(signal, [])):
+            target()
+
+    monkeypatch.setattr(sensor, "async_dispatcher_connect", connect)
+    monkeypatch.setattr(sensor, "async_dispatcher_send", send)
+    hass = _hass(make_hass, [_helper(0), _helper(7)], [])
+    monitor = LoopLagMonitor(hass)
+    hass.data["artnet_dmx_controller"]["loop_monitor"] = monitor
+    hass.data["artnet_dmx_controller"]["entry_helper_keys"] = {
+        "rig": [("10.0.0.5", 0)],
+        "par": [("10.0.0.5", 7), ("10.0.0.5", 0)],
+    }
+    unloads = {}
+    entities = {}
+
+    def set_up(entry_id):
+        entry = SimpleNamespace(
+            entry_id=entry_id, async_on_unload=unloads.setdefault(entry_id, []).append
+        )
+        asyncio.run(
+            sensor.async_setup_entry(
+                hass, entry, entities.setdefault(entry_id, []).extend
+            )
+        )
+
+    for entry_id in ("rig", "par", "gm"):
+        set_up(entry_id)
+    assert [entity.unique_id for entity in entities["rig"]] == [
+        "artnet_dmx_controller_loop_lag",
+        "universe_10.0.0.5_0_missed_frames",
+        "universe_10.0.0.5_0_late_frames",
+        "universe_10.0.0.5_0_frames_sent",
+        "universe_10.0.0.5_0_send_errors",
+        "universe_10.0.0.5_0_send_latency",
+    ]
+    assert [entity.unique_id for entity in entities["par"]][:2] == [
+        "universe_10.0.0.5_7_missed_frames",
+        "universe_10.0.0.5_7_late_frames",
+    ]
+    # Masters drive no universe of their own, so they carry no health sensors.
+    assert entities["gm"] == []
+
+    lag, missed, late = entities["rig"][:3]
+    assert lag.device_info["name"] == "Art-Net DMX output"
+    assert missed.device_info["name"] == "Universe 0 on 10.0.0.5"
+    assert missed.name == "Missed frames"
+    for interval in (0.025, 0.125):
+        monitor.window.record(interval)
+    monitor.last_window = monitor.window.as_dict()
+    monitor.universes[("10.0.0.5", 0)] = UniverseHealth(missed=4, late=1)
+    assert lag.native_value == 100.0
+    assert lag.extra_state_attributes["mean_lag_ms"] == 50.0
+    assert (missed.native_value, late.native_value) == (4, 1)
+
+    # When the rig unloads, the fixture still driving universe 0 takes its
+    # sensors over.
+    hass.data["artnet_dmx_controller"]["entry_helper_keys"].pop("rig")
+    for remove in reversed(unloads.pop("rig")):
+        remove()
+    assert [entity.unique_id for entity in entities["par"][5:]] == [
+        "artnet_dmx_controller_loop_lag",
+        "universe_10.0.0.5_0_missed_frames",
+        "universe_10.0.0.5_0_late_frames",
+        "universe_10.0.0.5_0_frames_sent",
+        "universe_10.0.0.5_0_send_errors",
+        "universe_10.0.0.5_0_send_latency",
+    ]
+    assert hass.data["artnet_dmx_controller"]["sensor_owners"] == {
+        "loop_lag": "par",
+        ("10.0.0.5", 7): "par",
+        ("10.0.0.5", 0): "par",
+    }
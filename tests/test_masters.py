@@ -0,0 +1,301 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import custom_components.artnet_dmx_controller as integration_init
+from custom_components.artnet_dmx_controller import buffer
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper
+from custom_components.artnet_dmx_controller.compiled_fixture import (
+    CompiledFixture,
+    compile_fixture,
+)
+from custom_components.artnet_dmx_controller.compositor import (
+    UniverseCompositor,
+    scale_table,
+)
+from custom_components.artnet_dmx_controller.entry_fixtures import (
+    build_fixture_entry_data,
+    build_master_entry_data,
+    build_rig_entry_data,
+    fixture_title,
+)
+from custom_components.artnet_dmx_controller.fixture_mapping import (
+    load_fixture_mapping,
+)
+from custom_components.artnet_dmx_controller.masters import MasterBoard
+from custom_components.artnet_dmx_controller.number import (
+    async_setup_entry as number_setup_entry,
+)
+from custom_components.artnet_dmx_controller.universe_store import UniverseStateStore
+
+BACKENDS = [False, True] if buffer.HAS_NUMPY else [False]
+
+
+class MemoryStore:
+    def __init__(self, data=None):
+        self.data = data
+        self.pending = None
+
+    async def async_load(self):
+        return self.data
+
+    def async_delay_save(self, data_func, delay):
+        self.pending = data_func
+
+
+def test_scale_tables_and_combined_levels():
+    assert scale_table(255) == bytes(range(256))
+    assert scale_table(0) == bytes(256)
+    assert scale_table(128)[255] == 128
+    assert scale_table(128) is scale_table(128)
+
+    board = MasterBoard()
+    board.add("grand", None)
+    board.add("sub", ["par_a"])
+    board.set_level("grand", 128)
+    assert board.set_level("sub", 128) == frozenset({"par_a"})
+    assert board.fixture_level("par_a") == 64
+    assert board.fixture_level("par_b") == 128
+    with pytest.raises(ValueError, match="got 256"):
+        board.set_level("sub", 256)
+    assert board.remove("grand") is None
+    assert board.fixture_level("par_b") == 255
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_levels_scale_after_merge_and_before_parking(use_numpy):
+    compositor = UniverseCompositor(use_numpy=use_numpy)
+    compositor.set_intensity_channels([1, 2])
+    base = buffer.new_universe_buffer(use_numpy)
+    buffer.apply_channel_values(base, {1: 200, 2: 100, 3: 90})
+
+    compositor.set_levels([1, 2], 128)
+    compositor.set_values("effects", {2: 250})
+    compositor.park({1: 10})
+    assert bytes(compositor.compose(base)[:3]) == bytes([10, 125, 90])
+
+    compositor.unpark()
+    compositor.release("effects")
+    assert bytes(compositor.compose(base)[:3]) == bytes([100, 50, 90])
+
+    compositor.set_levels([1, 2], 255)
+    assert compositor.compose(base) is base
+
+
+def test_half_master_gives_half_the_light_with_or_without_a_dimmer():
+    helper = ArtNetDMXHelper(
+        hass=SimpleNamespace(), target_ip="192.168.1.100", universe=0
+    )
+    sent = []
+
+    async def send_dmx_data(dmx_data):
+        sent.append(bytes(dmx_data))
+
+    helper.send_dmx_data = send_dmx_data
+    parcan = compile_fixture(
+        build_fixture_entry_data(
+            "192.168.1.100", 0, "parcan_rgb_gen", 1, 5, fixture_id="par"
+        ),
+        load_fixture_mapping(),
+    )
+    # A dimmerless RGB fixture on channels 11-13.
+    batten = CompiledFixture(
+        {"id": "batten", "fixture_type": "rgb_batten", "start_channel": 11},
+        {
+            "channels": [
+                {"name": "red", "offset": 1},
+                {"name": "green", "offset": 2},
+                {"name": "blue", "offset": 3},
+            ]
+        },
+    )
+    for fixture in (parcan, batten):
+        helper.set_intensity_channels(
+            fixture.fixture_id, fixture.intensity_channels, fixture.level_channels
+        )
+        helper.set_fixture_level(fixture.fixture_id, 128)
+
+    asyncio.run(helper.set_channels({1: 255, 2: 255, 3: 255, 4: 255, 11: 255}))
+
+    # The parcan's dimmer halves; its colour is not scaled a second time.
+    assert sent[-1][0:4] == bytes([128, 255, 255, 255])
+    assert sent[-1][0] / 255 * sent[-1][1] / 255 == pytest.approx(0.5, abs=0.01)
+    assert sent[-1][10:13] == bytes([128, 0, 0])
+
+
+def test_master_entities_scale_fixture_intensity(monkeypatch):
+    sent = {}
+
+    class RecordingHelper(integration_init.ArtNetDMXHelper):
+        def setup_socket(self):
+            return None
+
+        async def send_dmx_data(self, dmx_data):
+            sent[self.universe] = bytes(dmx_data)
+
+    monkeypatch.setattr(integration_init, "ArtNetDMXHelper", RecordingHelper)
+    rig = SimpleNamespace(
+        entry_id="rig",
+        title="Rig",
+        options={},
+        data=build_rig_entry_data(
+            "Rig",
+            [
+                build_fixture_entry_data(
+                    "192.168.1.100", 0, "parcan_rgb_gen", 1, 5, fixture_id="par_a"
+                ),
+                build_fixture_entry_data(
+                    "192.168.1.100", 0, "parcan_rgb_gen", 6, 5, fixture_id="par_b"
+                ),
+                build_fixture_entry_data(
+                    "192.168.1.100", 1, "mini_beam_prism", 1, 12, fixture_id="head"
+                ),
+            ],
+        ),
+    )
+    grand = SimpleNamespace(
+        entry_id="grand",
+        title="Grand",
+        options={},
+        data=build_master_entry_data("Grand"),
+    )
+    sub = SimpleNamespace(
+        entry_id="sub",
+        title="Pars",
+        options={},
+        data=build_master_entry_data("Pars", ["par_a"]),
+    )
+
+    class FakeConfigEntries:
+        async def async_forward_entry_setups(self, entry, platforms):
+            return None
+
+        async def async_unload_platforms(self, entry, platforms):
+            return True
+
+    hass = SimpleNamespace(data={}, config_entries=FakeConfigEntries())
+    hass.data["artnet_dmx_controller"] = {
+        "universe_store": UniverseStateStore(hass, store=MemoryStore())
+    }
+
+    async def scenario():
+        await integration_init.async_setup_entry(hass, grand)
+        await integration_init.async_setup_entry(hass, sub)
+        await integration_init.async_setup_entry(hass, rig)
+        helpers = hass.data["artnet_dmx_controller"]["shared_helpers"]
+        await helpers[("192.168.1.100", 0)].set_channels(
+            {1: 200, 2: 255, 5: 40, 6: 200}
+        )
+        await helpers[("192.168.1.100", 1)].set_channels({1: 77, 6: 200})
+
+        numbers = {}
+        for entry in (grand, sub):
+            entities = []
+            await number_setup_entry(hass, entry, entities.extend)
+            entity = entities[0]
+            entity.hass = hass
+            entity.async_write_ha_state = lambda: None
+            numbers[entry.entry_id] = entity
+        assert numbers["grand"].name == "Grand master"
+        assert numbers["sub"].name == "Submaster"
+
+        await numbers["grand"].async_set_native_value(128)
+        await numbers["sub"].async_set_native_value(128)
+
+        # par_a's dimmer at 128*128/255 and par_b's at 128/255; their colour
+        # channels and the head's pan are untouched.
+        assert sent[0][0:2] == bytes([50, 255])
+        assert sent[0][4] == 40
+        assert sent[0][5] == 100
+        assert (sent[1][0], sent[1][5]) == (77, 100)
+        assert helpers[("192.168.1.100", 0)].get_channel_value(1) == 200
+
+        await integration_init.async_unload_entry(hass, sub)
+        assert sent[0][0] == 100
+        await integration_init.async_unload_entry(hass, grand)
+        assert sent[0][0] == 200
+        assert sent[1][5] == 200
+
+    asyncio.run(scenario())
+
+
+def test_saved_master_levels_dim_the_first_frame_after_restart(monkeypatch):
+    sent = []
+
+    class RecordingHelper(integration_init.ArtNetDMXHelper):
+        def setup_socket(self):
+            return None
+
+        async def send_dmx_data(self, dmx_data):
+            sent.append(bytes(dmx_data))
+
+    saved = bytearray(512)
+    saved[0] = 200
+    backend = MemoryStore(
+        {
+            "universes": {"192.168.1.100/0": bytes(saved).hex()},
+            "masters": {"grand": 128},
+        }
+    )
+    monkeypatch.setattr(integration_init, "ArtNetDMXHelper", RecordingHelper)
+    monkeypatch.setattr(
+        integration_init,
+        "UniverseStateStore",
+        lambda hass: UniverseStateStore(hass, store=backend),
+    )
+    rig = SimpleNamespace(
+        entry_id="rig",
+        title="Rig",
+        options={},
+        data=build_rig_entry_data(
+            "Rig",
+            [
+                build_fixture_entry_data(
+                    "192.168.1.100", 0, "parcan_rgb_gen", 1, 5, fixture_id="par_a"
+                )
+            ],
+        ),
+    )
+    grand = SimpleNamespace(
+        entry_id="grand",
+        title="Grand",
+        options={},
+        data=build_master_entry_data("Grand"),
+    )
+
+    class FakeConfigEntries:
+        def async_entries(self, domain):
+            return [rig, grand]
+
+        async def async_forward_entry_setups(self, entry, platforms):
+            return None
+
+    hass = SimpleNamespace(data={}, config_entries=FakeConfigEntries())
+
+    async def scenario():
+        # The rig loads before its grand master, yet its first frame is already dimmed.
+        await integration_init.async_setup_entry(hass, rig)
+        assert [frame[0] for frame in sent] == [100]
+        await integration_init.async_setup_entry(hass, grand)
+        assert len(sent) == 1
+
+        entities = []
+        await number_setup_entry(hass, grand, entities.extend)
+        number = entities[0]
+        number.hass = hass
+        number.async_write_ha_state = lambda: None
+        assert number.native_value == 128
+        await number.async_set_native_value(51)
+        assert sent[-1][0] == 40
+
+    asyncio.run(scenario())
+    assert backend.pending()["masters"] == {"grand": 51}
+
+
+def test_master_titles():
+    assert fixture_title(build_master_entry_data("Main")) == "Main (grand master)"
+    assert (
+        fixture_title(build_master_entry_data("Pars", ["a", "b"]))
+        == "Pars (submaster of 2)"
+    )
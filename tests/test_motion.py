@@ -0,0 +1,281 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import custom_components.artnet_dmx_controller as integration_init
+from custom_components.artnet_dmx_controller import buffer, motion
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper
+from custom_components.artnet_dmx_controller.compiled_fixture import compile_fixture
+from custom_components.artnet_dmx_controller.compositor import (
+    UniverseCompositor,
+    scale_table,
+)
+from custom_components.artnet_dmx_controller.entry_fixtures import (
+    build_fixture_entry_data,
+    build_rig_entry_data,
+    extract_fixture_records,
+)
+from custom_components.artnet_dmx_controller.fixture_mapping import load_fixture_mapping
+from custom_components.artnet_dmx_controller.motion import (
+    MotionFilter,
+    motion_filter,
+    motion_pairs,
+)
+from custom_components.artnet_dmx_controller.number import (
+    ArtNetDMXMotionSmoothingNumber,
+)
+from custom_components.artnet_dmx_controller.number import (
+    async_setup_entry as number_setup_entry,
+)
+
+BACKENDS = [False, True] if buffer.HAS_NUMPY else [False]
+
+
+def _head(start_channel, fixture_id, fixture_type="head_el150"):
+    fixture = build_fixture_entry_data(
+        "192.168.1.100", 0, fixture_type, start_channel, 9, fixture_id=fixture_id
+    )
+    return compile_fixture(fixture, load_fixture_mapping())
+
+
+def _helper(universe=0):
+    helper = ArtNetDMXHelper(
+        hass=SimpleNamespace(), target_ip="192.168.1.100", universe=universe
+    )
+    helper.frames = []
+
+    async def send_dmx_data(dmx_data):
+        helper.frames.append(bytes(dmx_data))
+
+    helper.send_dmx_data = send_dmx_data
+    return helper
+
+
+def _pan(frame, start_channel=1):
+    return frame[start_channel - 1] << 8 | frame[start_channel]
+
+
+@pytest.fixture
+def tickers(monkeypatch):
+    started = []
+    monkeypatch.setattr(
+        motion,
+        "async_track_time_interval",
+        lambda hass, action, interval: (
+            started.append(interval) or (lambda: started.append("cancelled"))
+        ),
+    )
+    return started
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_compositor_motion_stage_substitutes_filtered_values(use_numpy):
+    compositor = UniverseCompositor(use_numpy=use_numpy)
+    base = bytearray(512)
+    base[0:2] = bytes([10, 20])
+    compositor.set_motion_indices(buffer.channel_indices([1, 2], use_numpy))
+    compositor.set_motion_values([1, 2])
+
+    frame = compositor.compose(base)
+    assert bytes(frame[0:2]) == bytes([1, 2])
+    assert [int(value) for value in compositor.motion_targets()] == [10, 20]
+
+    compositor.park({1: 99})
+    assert bytes(compositor.compose(base)[0:2]) == bytes([99, 2])
+
+    compositor.unpark()
+    compositor.set_motion_indices(())
+    assert not compositor.active
+    assert compositor.motion_targets() == []
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_parking_wins_over_motion_until_unparked(use_numpy):
+    compositor = UniverseCompositor(use_numpy=use_numpy)
+    base = bytearray(512)
+    base[0:2] = bytes([10, 20])
+    compositor.set_motion_indices(buffer.channel_indices([1, 2], use_numpy))
+    compositor.set_levels([2], 128)
+
+    compositor.park({1: 99, 2: 98})
+    compositor.set_motion_values([1, 2])
+    assert bytes(compositor.compose(base)[0:2]) == bytes([99, 98])
+    # The filter keeps tracking the scaled, unparked values underneath.
+    assert [int(value) for value in compositor.motion_targets()] == [
+        10,
+        scale_table(128)[20],
+    ]
+
+    compositor.unpark([1, 2])
+    compositor.set_motion_values([3, 4])
+    assert bytes(compositor.compose(base)[0:2]) == bytes([3, 4])
+
+
+def test_motion_pairs_cover_pan_and_tilt_only():
+    head = _head(1, "head")
+    assert motion_pairs(head) == [(1, 2), (3, 4)]
+    par = compile_fixture(
+        build_fixture_entry_data(
+            "192.168.1.100", 0, "parcan_rgb_gen", 20, 5, fixture_id="par"
+        ),
+        load_fixture_mapping(),
+    )
+    assert motion_pairs(par) == []
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_filter_eases_every_head_towards_its_target(tickers, use_numpy):
+    universe = _helper()
+    heads = [_head(1 + 9 * position, f"head_{position}") for position in range(3)]
+    motion_filter = MotionFilter(SimpleNamespace(), use_numpy=use_numpy)
+
+    async def scenario():
+        await universe.set_channels({1: 0x40, 2: 0x00})
+        for head in heads:
+            motion_filter.set_smoothing(universe, head, 0.5)
+        assert motion_filter.running
+        assert len(tickers) == 1
+        assert motion_filter.smoothing("head_0") == 0.5
+
+        # Enabling the filter does not move anything.
+        universe.frames.clear()
+        await motion_filter.async_tick(0.0)
+        assert universe.frames == []
+
+        await universe.set_channels({1: 0xC0, 2: 0x00, 10: 0x80, 11: 0x00})
+        assert _pan(universe.frames[-1]) == 0x4000
+
+        pans = []
+        for tick in range(1, 81):
+            await motion_filter.async_tick(tick * 0.025)
+            pans.append((_pan(universe.frames[-1]), _pan(universe.frames[-1], 10)))
+        # Critically damped: monotonic, no overshoot, settled within a few
+        # smoothing times.
+        assert [pan for pan, _other in pans] == sorted(pan for pan, _other in pans)
+        assert 0x4000 < pans[0][0] < 0x6000
+        assert pans[-1] == (0xC000, 0x8000)
+
+        # Settled universes do not send again.
+        sent = len(universe.frames)
+        await motion_filter.async_tick(2.1)
+        assert len(universe.frames) == sent
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.usefixtures("tickers")
+def test_filter_sends_only_universes_that_moved_and_parking_wins():
+    moving, still = _helper(0), _helper(1)
+    motion_filter = MotionFilter(SimpleNamespace())
+
+    async def scenario():
+        motion_filter.set_smoothing(moving, _head(1, "moving"), 1.0)
+        motion_filter.set_smoothing(still, _head(1, "still"), 1.0)
+        await moving.set_channels({1: 255})
+        moving.frames.clear()
+        still.frames.clear()
+
+        await motion_filter.async_tick(0.0)
+        await motion_filter.async_tick(0.05)
+        assert len(moving.frames) == 1
+        assert still.frames == []
+
+        await moving.park_channels({1: 7})
+        await motion_filter.async_tick(0.1)
+        assert moving.frames[-1][0] == 7
+
+    asyncio.run(scenario())
+
+
+def test_removing_fixtures_restores_unfiltered_output_and_stops_the_ticker(tickers):
+    universe = _helper()
+    motion_filter = MotionFilter(SimpleNamespace())
+
+    async def scenario():
+        motion_filter.set_smoothing(universe, _head(1, "head"), 2.0)
+        await universe.set_channels({1: 200})
+        assert universe.frames[-1][0] == 0
+
+        motion_filter.set_smoothing(universe, _head(1, "head"), 0)
+        assert not motion_filter.running
+        assert tickers[-1] == "cancelled"
+        assert universe.get_output_frame()[0] == 200
+
+        motion_filter.set_smoothing(universe, _head(1, "head"), 2.0)
+        motion_filter.remove(["head", "unknown"])
+        assert motion_filter.smoothing("head") == 0.0
+        assert not universe.compositor.active
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.usefixtures("tickers")
+def test_smoothing_number_is_saved_and_applied_after_restart():
+    entry = SimpleNamespace(
+        entry_id="rig",
+        title="Rig",
+        options={},
+        data=build_rig_entry_data(
+            "Rig",
+            [
+                build_fixture_entry_data(
+                    "192.168.1.100", 0, "parcan_rgb_gen", 20, 5, fixture_id="par"
+                ),
+                build_fixture_entry_data(
+                    "192.168.1.100", 0, "head_el150", 1, 9, fixture_id="head"
+                ),
+            ],
+        ),
+    )
+
+    def _hass():
+        return SimpleNamespace(
+            data={},
+            loop=SimpleNamespace(),
+            verify_event_loop_thread=lambda _what: None,
+            bus=SimpleNamespace(async_listen_once=lambda event, listener: lambda: None),
+            config_entries=SimpleNamespace(
+                async_update_entry=lambda config_entry, data: setattr(
+                    config_entry, "data", data
+                )
+            ),
+        )
+
+    hass = _hass()
+    universe = _helper()
+    hass.data["artnet_dmx_controller"] = {
+        "entry_fixtures": {
+            "rig": [(fixture, universe) for fixture in extract_fixture_records(entry)]
+        }
+    }
+    entities = []
+    asyncio.run(number_setup_entry(hass, entry, entities.extend))
+    (smoothing,) = [
+        entity
+        for entity in entities
+        if isinstance(entity, ArtNetDMXMotionSmoothingNumber)
+    ]
+    smoothing.hass = hass
+    smoothing.async_write_ha_state = lambda: None
+
+    asyncio.run(smoothing.async_set_native_value(0.5))
+    assert smoothing.native_value == 0.5
+    par, head = extract_fixture_records(entry)
+    assert head["smoothing"] == 0.5
+    assert "smoothing" not in par
+
+    # After a restart, setup applies the saved time when it registers the
+    # fixture's channels.
+    restarted = _hass()
+    restarted_universe = _helper()
+    integration_init._register_channel_roles(
+        restarted,
+        [(fixture, restarted_universe) for fixture in extract_fixture_records(entry)],
+    )
+    assert motion_filter(restarted).smoothing("head") == 0.5
+
+    asyncio.run(smoothing.async_set_native_value(0))
+    assert "smoothing" not in extract_fixture_records(entry)[1]
+    motion_filter(restarted).remove(["head"])
+    assert not motion_filter(hass).running
@@ -0,0 +1,182 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper
+from custom_components.artnet_dmx_controller.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.artnet_dmx_controller.dmx_writer import DMXWriter
+from custom_components.artnet_dmx_controller.output_metrics import OutputMetrics
+from custom_components.artnet_dmx_controller.output_thread import OutputThread
+from custom_components.artnet_dmx_controller.sensor import (
+    ArtNetDMXFramesSentSensor,
+    ArtNetDMXSendLatencySensor,
+    universe_device,
+)
+from tests.conftest import FakeSocket
+
+PACKET_SIZE = 530
+
+
+def _helper(universe=0, fail=False):
+    helper = ArtNetDMXHelper(
+        hass=SimpleNamespace(), target_ip="10.0.0.5", universe=universe
+    )
+    helper._socket = FakeSocket(fail)
+    return helper
+
+
+def test_latency_percentiles_come_from_the_fixed_histogram():
+    metrics = OutputMetrics()
+    assert metrics.as_dict()["p50_latency_ms"] is None
+    for _frame in range(90):
+        metrics.record_send(PACKET_SIZE, 0.0001)
+    for _frame in range(10):
+        metrics.record_send(PACKET_SIZE, 0.005)
+
+    counters = metrics.as_dict()
+    assert counters["frames_sent"] == 100
+    assert counters["bytes_sent"] == 100 * PACKET_SIZE
+    assert counters["last_latency_ms"] == 5.0
+    # Buckets are a quarter octave wide: within 19% above the true value.
+    assert 0.1 <= counters["p50_latency_ms"] <= 0.119
+    assert 5.0 <= counters["p99_latency_ms"] <= 5.95
+
+    metrics.reset()
+    assert metrics.as_dict()["frames_sent"] == 0
+    assert metrics.latency_percentile(0.5) is None
+
+
+def test_helper_counts_sent_and_failed_frames():
+    helper = _helper()
+
+    async def scenario():
+        await helper.set_channels({1: 255})
+        await helper.set_channels({2: 128})
+        helper.blackout_now()
+        await helper.set_channels({3: 64})
+        await helper.release_blackout()
+        helper._socket.fail = True
+        await helper.set_channels({4: 32})
+
+    asyncio.run(scenario())
+    metrics = helper.metrics
+    # Blackout frames go out as zeros and count as sent.
+    assert metrics.frames_sent == 5
+    assert metrics.bytes_sent == 5 * PACKET_SIZE
+    assert metrics.frames_suppressed == 0
+    assert metrics.send_errors == 1
+    assert metrics.last_latency is not None
+
+
+def test_blackout_frames_count_once_as_sent_or_coalesced():
+    helper = _helper()
+    output = OutputThread()
+
+    async def scenario():
+        helper.blackout_now()
+        await helper.set_channels({1: 255})
+        assert (helper.metrics.frames_sent, helper.metrics.frames_coalesced) == (2, 0)
+
+        await helper.release_blackout()
+        output.attach(helper)
+        output._socket = FakeSocket()
+        await helper.set_channels({2: 128})
+        # The zero frame replaces the lit one still waiting for the thread.
+        helper.blackout_now()
+        output._transmit()
+        assert output._socket.packets[-1] == helper._zero_packet
+
+    asyncio.run(scenario())
+    metrics = helper.metrics
+    assert metrics.frames_sent == 5
+    assert metrics.frames_coalesced == 1
+    assert metrics.frames_suppressed == 0
+
+
+def test_frames_without_a_socket_are_suppressed(monkeypatch):
+    helper = _helper()
+    helper._socket = None
+    monkeypatch.setattr(helper, "setup_socket", lambda: None)
+
+    asyncio.run(helper.set_channels({1: 255}))
+    helper.blackout_now()
+
+    assert helper.metrics.frames_suppressed == 2
+    assert helper.metrics.frames_sent == 0
+
+
+def test_writer_and_output_thread_count_coalesced_frames():
+    helper = _helper()
+    writer = DMXWriter(helper)
+
+    async def scenario():
+        await writer.set_channel(1, 10)
+        await writer.set_channel(2, 20)
+        await writer.set_channels({3: 30, 4: 40})
+        await asyncio.sleep(0.05)
+
+    asyncio.run(scenario())
+    assert helper.metrics.frames_sent == 1
+    assert helper.metrics.frames_coalesced == 2
+
+    output = OutputThread()
+    output.attach(helper)
+    output._socket = FakeSocket()
+    asyncio.run(helper.set_channels({1: 50}))
+    asyncio.run(helper.set_channels({1: 60}))
+    assert helper.metrics.frames_coalesced == 3
+    output._transmit()
+    output._transmit()
+    assert helper.metrics.frames_sent == 3
+    assert output._socket.packets[-1][18] == 60
+
+
+def test_diagnostics_and_sensors_report_the_counters(make_hass):
+    helpers = {("10.0.0.5", 0): _helper(0), ("10.0.0.5", 1): _helper(1)}
+    hass = make_hass(
+        {
+            "shared_helpers": helpers,
+            "entry_helper_keys": {"rig": [("10.0.0.5", 1)]},
+        }
+    )
+    asyncio.run(helpers[("10.0.0.5", 1)].set_channels({1: 255}))
+    rig = SimpleNamespace(
+        entry_id="rig", title="Rig", data={"fixtures": []}, options={}
+    )
+    master = SimpleNamespace(
+        entry_id="gm", title="Grand master", data={"entry_type": "master"}, options={}
+    )
+
+    diagnostics = asyncio.run(async_get_config_entry_diagnostics(hass, rig))
+    assert list(diagnostics["universes"]) == ["10.0.0.5/1"]
+    assert diagnostics["universes"]["10.0.0.5/1"]["frames_sent"] == 1
+    assert diagnostics["universes"]["10.0.0.5/1"]["blackout"] is False
+    assert diagnostics["event_loop"]["cycles"] == 0
+    assert diagnostics["output_thread"] is None
+    assert diagnostics["render_worker"] is False
+    assert list(
+        asyncio.run(async_get_config_entry_diagnostics(hass, master))["universes"]
+    ) == [
+        "10.0.0.5/0",
+        "10.0.0.5/1",
+    ]
+
+    device_info = universe_device(("10.0.0.5", 1))
+    sent = ArtNetDMXFramesSentSensor(None, device_info, ("10.0.0.5", 1))
+    latency = ArtNetDMXSendLatencySensor(None, device_info, ("10.0.0.5", 1))
+    gone = ArtNetDMXFramesSentSensor(
+        None, universe_device(("10.0.0.5", 9)), ("10.0.0.5", 9)
+    )
+    for entity in (sent, latency, gone):
+        entity.hass = hass
+    assert sent.name == "Frames sent"
+    assert sent.should_poll
+    assert sent.native_value == 1
+    assert sent.extra_state_attributes["bytes_sent"] == PACKET_SIZE
+    assert latency.native_value == pytest.approx(
+        latency.extra_state_attributes["p50_latency_ms"]
+    )
+    assert gone.native_value is None
@@ -0,0 +1,177 @@
+import asyncio
+import socket
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper
+from custom_components.artnet_dmx_controller.jitter import JitterStats
+from custom_components.artnet_dmx_controller.loop_monitor import lag_monitor
+from custom_components.artnet_dmx_controller.output_thread import (
+    FrameSlot,
+    OutputThread,
+    async_set_output_thread,
+    output_thread,
+)
+
+
+@pytest.fixture
+def receiver():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.settimeout(1.0)
+    yield sock
+    sock.close()
+
+
+def _packets(sock):
+    packets = []
+    sock.setblocking(False)
+    try:
+        while True:
+            packets.append(sock.recv(1024))
+    except BlockingIOError:
+        pass
+    sock.settimeout(1.0)
+    return packets
+
+
+def test_frame_slot_hands_over_the_latest_complete_packet():
+    slot = FrameSlot(("127.0.0.1", 6454))
+    assert slot.take() is None
+
+    packet = bytearray(b"first")
+    slot.publish(packet)
+    packet[:] = b"xxxxx"
+    slot.publish(b"second")
+    assert slot.take() == b"second"
+    # Without a new packet the latest one is sent again.
+    assert slot.take() == b"second"
+
+    front = slot.take()
+    slot.publish(b"third")
+    assert front == b"second"
+    assert slot.take() == b"third"
+
+
+def test_jitter_stats_measure_deviation_from_the_period():
+    stats = JitterStats(0.025)
+    for interval in (0.025, 0.026, 0.024, 0.060):
+        stats.record(interval)
+    result = stats.as_dict()
+    assert result["cycles"] == 4
+    assert result["late"] == 1
+    assert result["max_jitter_ms"] == 35.0
+    assert result["mean_jitter_ms"] == 9.25
+    stats.reset()
+    assert stats.as_dict()["cycles"] == 0
+
+
+def test_thread_keeps_transmitting_through_event_loop_stalls(receiver):
+    helper = ArtNetDMXHelper(
+        hass=SimpleNamespace(),
+        target_ip="127.0.0.1",
+        universe=3,
+        port=receiver.getsockname()[1],
+    )
+    output = OutputThread(rate=100)
+    output.attach(helper)
+    output.start()
+    try:
+
+        async def scenario():
+            await helper.set_channels({1: 10})
+            await helper.set_channels({1: 20, 2: 30})
+            # A synthetic stall: the loop spins for 200 ms without yielding.
+            stalled_until = time.monotonic() + 0.2
+            while time.monotonic() < stalled_until:
+                pass
+
+        asyncio.run(scenario())
+    finally:
+        output.stop()
+    packets = _packets(receiver)
+    assert len(packets) >= 10
+    assert packets[-1] == helper.construct_artnet_packet(helper.get_output_frame())
+    assert packets[-1][18:20] == bytes([20, 30])
+    assert output.stats.cycles >= 10
+    assert output.stats.as_dict()["period_ms"] == 10.0
+
+
+def test_blackout_reaches_the_thread_and_detaching_sends_directly(receiver):
+    helper = ArtNetDMXHelper(
+        hass=SimpleNamespace(),
+        target_ip="127.0.0.1",
+        universe=0,
+        port=receiver.getsockname()[1],
+    )
+    output = OutputThread()
+    slot = output.attach(helper)
+
+    asyncio.run(helper.set_channels({1: 255}))
+    assert slot.take()[18] == 255
+    assert _packets(receiver) == []
+
+    helper.blackout_now()
+    assert not any(slot.take()[18:])
+    asyncio.run(helper.set_channels({1: 128}))
+    assert not any(slot.take()[18:])
+
+    output.detach(helper)
+    asyncio.run(helper.release_blackout())
+    assert _packets(receiver)[-1][18] == 128
+    helper.close_socket()
+
+
+def test_service_toggles_the_thread_for_every_universe(make_hass, receiver):
+    helpers = {
+        ("127.0.0.1", universe): ArtNetDMXHelper(
+            hass=SimpleNamespace(),
+            target_ip="127.0.0.1",
+            universe=universe,
+            port=receiver.getsockname()[1],
+        )
+        for universe in (0, 1)
+    }
+    stop_listeners = []
+
+    async def scenario():
+        hass = make_hass(
+            {"shared_helpers": helpers},
+            bus=SimpleNamespace(
+                async_listen_once=lambda event, listener: (
+                    stop_listeners.append(listener)
+                    or (lambda: stop_listeners.remove(listener))
+                )
+            ),
+            async_add_executor_job=lambda func, *args: (
+                asyncio.get_running_loop().run_in_executor(None, func, *args)
+            ),
+            loop=asyncio.get_running_loop(),
+        )
+        assert await async_set_output_thread(hass, True, 50) == {}
+        running = output_thread(hass)
+        assert running.rate == 50
+        assert all(helper._output_slot is not None for helper in helpers.values())
+        await asyncio.sleep(0.1)
+
+        # A new rate restarts the thread.
+        await async_set_output_thread(hass, True, 25)
+        assert output_thread(hass) is not running
+        # One for the thread, one for the loop lag monitor its probes feed.
+        assert len(stop_listeners) == 2
+        assert lag_monitor(hass).as_dict()["tickers"] == ["output"]
+
+        stats = await async_set_output_thread(hass, False)
+        assert stats["period_ms"] == 40.0
+        assert output_thread(hass) is None
+        assert stop_listeners == []
+        assert not lag_monitor(hass).running
+        assert all(helper._output_slot is None for helper in helpers.values())
+
+    asyncio.run(scenario())
+    universes = {packet[14] for packet in _packets(receiver)}
+    assert universes == {0, 1}
+    for helper in helpers.values():
+        helper.close_socket()
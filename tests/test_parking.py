@@ -0,0 +1,100 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper
+from custom_components.artnet_dmx_controller.const import DOMAIN
+from custom_components.artnet_dmx_controller.dmx_writer import DMXWriter
+from custom_components.artnet_dmx_controller.entry_fixtures import (
+    build_fixture_entry_data,
+)
+from custom_components.artnet_dmx_controller.fixture_mapping import HomeAssistantError
+
+
+def _helper(universe, sent):
+    helper = ArtNetDMXHelper(
+        hass=SimpleNamespace(), target_ip="192.168.1.100", universe=universe
+    )
+
+    async def send_dmx_data(dmx_data):
+        sent[universe] = bytes(dmx_data)
+
+    helper.send_dmx_data = send_dmx_data
+    return helper
+
+
+def _rig(make_hass):
+    sent = {}
+    universe_0 = _helper(0, sent)
+    universe_1 = _helper(1, sent)
+    par = build_fixture_entry_data(
+        "192.168.1.100", 1, "parcan_rgb_gen", 11, 5, fixture_id="par"
+    )
+    hass = make_hass(
+        {
+            "shared_helpers": {
+                ("192.168.1.100", 0): universe_0,
+                ("192.168.1.100", 1): universe_1,
+            },
+            "entry_fixtures": {"rig": [(par, universe_1)]},
+        }
+    )
+
+    def call(service, data):
+        asyncio.run(hass.services.async_call(DOMAIN, service, data))
+
+    return call, universe_0, universe_1, sent
+
+
+def test_parked_channels_win_over_every_write_path(make_hass):
+    call, universe_0, universe_1, sent = _rig(make_hass)
+
+    call(
+        "park",
+        {
+            "target_ip": "192.168.1.100",
+            "channels": {500: 255},
+            "fixtures": {"par": {"dim": 40}},
+        },
+    )
+    assert sent[0][499] == 255
+    assert sent[1][10] == 40
+
+    async def writes():
+        await DMXWriter(universe_0).set_channel(500, 10)
+        await asyncio.sleep(0.01)
+        await universe_1.set_layer_channels("override", {11: 255})
+
+    asyncio.run(writes())
+    asyncio.run(universe_1.set_channels({11: 0, 12: 99}))
+    assert sent[0][499] == 255
+    assert sent[1][10:12] == bytes([40, 99])
+    assert universe_0.get_channel_value(500) == 10
+
+    call("unpark", {"fixtures": ["par"]})
+    assert sent[1][10] == 255
+    assert universe_0.get_parked() == {500: 255}
+
+    call("unpark", {"target_ip": "192.168.1.100"})
+    assert sent[0][499] == 10
+    assert universe_0.get_parked() == {}
+
+
+def test_park_validates_before_pinning_anything(make_hass):
+    call, universe_0, universe_1, _sent = _rig(make_hass)
+
+    with pytest.raises(HomeAssistantError):
+        call(
+            "park",
+            {
+                "target_ip": "192.168.1.100",
+                "channels": {1: 10},
+                "fixtures": {"par": {"red": 300}},
+            },
+        )
+    with pytest.raises(HomeAssistantError):
+        call("unpark", {"target_ip": "10.0.0.1", "channels": [1]})
+
+    assert universe_0.get_parked() == {}
+    assert universe_1.get_parked() == {}
@@ -0,0 +1,123 @@
+import asyncio
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.artnet_dmx_controller.config_flow import (
+    ArtNetDMXControllerConfigFlow,
+)
+from custom_components.artnet_dmx_controller.fixture_mapping import (
+    HomeAssistantError,
+    load_fixture_mapping,
+)
+from custom_components.artnet_dmx_controller.patch_import import (
+    build_patch_entries,
+    load_patch_file,
+)
+
+DOCS_PATCH = Path(__file__).resolve().parent.parent / "docs" / "fixtures.json"
+
+
+def test_docs_patch_file_builds_entries():
+    records = load_patch_file(str(DOCS_PATCH))
+    entries = build_patch_entries(
+        records, load_fixture_mapping(), target_ip="192.168.1.100", universe=0
+    )
+
+    assert len(entries) == len(records)
+    by_id = {entry["id"]: entry for entry in entries}
+    assert by_id["parcan_l"]["start_channel"] == 16
+    assert by_id["parcan_l"]["channel_count"] == 5
+    assert by_id["parcan_l"]["name"] == "ParCan L"
+    assert by_id["parcan_l"]["location"] == {"x": 0.25, "y": 0.0, "z": 0.0}
+
+
+def test_patch_reports_all_problems_at_once():
+    records = [
+        {"id": "a", "fixture": "parcan_rgb_gen", "base_channel": 1},
+        {"id": "b", "fixture": "parcan_rgb_gen", "base_channel": 3},
+        {"id": "c", "fixture": "does_not_exist", "base_channel": 20},
+        {"id": "a", "fixture": "parcan_rgb_gen", "base_channel": 510},
+    ]
+
+    with pytest.raises(HomeAssistantError) as err:
+        build_patch_entries(records, load_fixture_mapping(), target_ip="192.168.1.100")
+
+    message = str(err.value)
+    assert "'b' overlaps 'a'" in message
+    assert "unknown fixture type 'does_not_exist'" in message
+    assert "exceed the universe" in message
+
+
+def test_patch_detects_overlap_with_existing_entries_only_on_same_universe():
+    existing = [
+        SimpleNamespace(
+            entry_id="existing",
+            data={
+                "id": "existing-fixture",
+                "target_ip": "192.168.1.100",
+                "universe": 0,
+                "fixture_type": "parcan_rgb_gen",
+                "start_channel": 10,
+                "channel_count": 5,
+            },
+        )
+    ]
+    mapping = load_fixture_mapping()
+
+    entries = build_patch_entries(
+        [{"id": "new", "fixture": "parcan_rgb_gen", "base_channel": 10}],
+        mapping,
+        target_ip="192.168.1.100",
+        universe=1,
+        existing_entries=existing,
+    )
+    assert entries[0]["universe"] == 1
+
+    with pytest.raises(HomeAssistantError, match="overlaps 'existing-fixture'"):
+        build_patch_entries(
+            [{"id": "new", "fixture": "parcan_rgb_gen", "base_channel": 12}],
+            mapping,
+            target_ip="192.168.1.100",
+            universe=0,
+            existing_entries=existing,
+        )
+
+
+def test_load_patch_file_rejects_non_list(tmp_path):
+    path = tmp_path / "patch.json"
+    path.write_text(json.dumps({"fixtures": []}), encoding="utf-8")
+
+    with pytest.raises(HomeAssistantError, match="JSON list"):
+        load_patch_file(str(path))
+
+
+def test_import_step_creates_entry_from_patch_record():
+    flow = ArtNetDMXControllerConfigFlow()
+    unique_ids = []
+
+    async def _set_uid(uid):
+        unique_ids.append(uid)
+
+    flow.async_set_unique_id = _set_uid
+    flow._abort_if_unique_id_configured = lambda: None
+    flow.async_create_entry = lambda title, data: {"title": title, "data": data}
+
+    result = asyncio.run(
+        flow.async_step_import(
+            {
+                "id": "parcan_l",
+                "target_ip": "192.168.1.100",
+                "universe": 0,
+                "fixture_type": "parcan_rgb_gen",
+                "start_channel": 16,
+                "channel_count": 5,
+                "name": "ParCan L",
+            }
+        )
+    )
+
+    assert unique_ids == ["parcan_l"]
+    assert result["title"] == "ParCan L (192.168.1.100 U:0 CH:16)"
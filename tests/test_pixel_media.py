@@ -0,0 +1,168 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.artnet_dmx_controller import buffer, pixel_media
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper
+from custom_components.artnet_dmx_controller.compiled_fixture import compile_fixture
+from custom_components.artnet_dmx_controller.const import DOMAIN
+from custom_components.artnet_dmx_controller.entry_fixtures import (
+    build_fixture_entry_data,
+)
+from custom_components.artnet_dmx_controller.fixture_mapping import (
+    HomeAssistantError,
+    load_fixture_mapping,
+)
+from custom_components.artnet_dmx_controller.pixel_media import ImageMapper, open_frames
+from custom_components.artnet_dmx_controller.pixels import PixelMap
+
+BACKENDS = [False, True] if buffer.HAS_NUMPY else [False]
+needs_numpy = pytest.mark.skipif(not buffer.HAS_NUMPY, reason="NumPy not installed")
+
+
+def _strip(fixture_id, universe):
+    return build_fixture_entry_data(
+        "192.168.1.100", universe, "pixel_strip_grb_50", 1, 150, fixture_id=fixture_id
+    )
+
+
+def _helper(universe=0):
+    helper = ArtNetDMXHelper(
+        hass=SimpleNamespace(), target_ip="192.168.1.100", universe=universe
+    )
+    helper.frames = []
+
+    async def send_dmx_data(dmx_data):
+        helper.frames.append(bytes(dmx_data))
+
+    helper.send_dmx_data = send_dmx_data
+    return helper
+
+
+def _wall(universes, use_numpy=buffer.HAS_NUMPY):
+    mapping = load_fixture_mapping()
+    strips = [
+        (helper, compile_fixture(_strip(f"row_{universe}", universe), mapping))
+        for universe, helper in enumerate(universes)
+    ]
+    return PixelMap(strips, use_numpy=use_numpy)
+
+
+def _image(height, width, use_numpy):
+    rows = [[(row, column, 0) for column in range(width)] for row in range(height)]
+    if use_numpy:
+        import numpy as np
+
+        return np.asarray(rows, dtype=np.uint8)
+    return rows
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_mapper_samples_images_onto_rows_of_strips(use_numpy):
+    universes = [_helper(0), _helper(1)]
+    wall = _wall(universes, use_numpy)
+
+    mapper = ImageMapper(wall, use_numpy=use_numpy)
+    asyncio.run(mapper.async_show(_image(2, 50, use_numpy)))
+    # One frame per universe; GRB strips, so (row, column, 0) arrives as
+    # (column, row, 0).
+    assert [len(helper.frames) for helper in universes] == [1, 1]
+    assert universes[0].frames[-1][0:6] == bytes([0, 0, 0, 1, 0, 0])
+    assert universes[1].frames[-1][147:150] == bytes([49, 1, 0])
+
+    # Larger images are sampled nearest-neighbour; serpentine reverses every
+    # other strip.
+    serpentine = ImageMapper(wall, "serpentine", use_numpy=use_numpy)
+    sampled = [
+        [int(value) for value in pixel]
+        for pixel in serpentine.sample(_image(4, 100, use_numpy))
+    ]
+    assert sampled[0] == [1, 1, 0]
+    assert sampled[49] == [1, 99, 0]
+    assert sampled[50] == [3, 99, 0]
+    assert sampled[99] == [3, 1, 0]
+    assert len(serpentine._lookups) == 1
+
+
+@needs_numpy
+def test_npy_stacks_are_memory_mapped_and_read_frame_by_frame(tmp_path):
+    import numpy as np
+
+    stack = np.arange(3 * 2 * 4 * 3, dtype=np.uint8).reshape(3, 2, 4, 3)
+    np.save(tmp_path / "stack.npy", stack)
+    np.save(tmp_path / "still.npy", stack[1])
+
+    frames = open_frames(str(tmp_path / "stack.npy"))
+    assert isinstance(frames._array, np.memmap)
+    assert frames.frame_count == 3
+    assert np.array_equal(frames.frame(2), stack[2])
+    assert frames.duration(0) is None
+    still = open_frames(str(tmp_path / "still.npy"))
+    assert still.frame_count == 1
+    assert np.array_equal(still.frame(0), stack[1])
+
+    with pytest.raises(HomeAssistantError, match="not found"):
+        open_frames(str(tmp_path / "missing.npy"))
+
+
+def test_image_files_need_pillow(monkeypatch, tmp_path):
+    monkeypatch.setattr(pixel_media, "Image", None)
+    with pytest.raises(HomeAssistantError, match="Pillow"):
+        open_frames(str(tmp_path / "wall.gif"))
+
+
+@needs_numpy
+def test_play_pixels_streams_frames_and_stops(make_hass, tmp_path):
+    import numpy as np
+
+    universes = [_helper(0), _helper(1)]
+    np.save(
+        tmp_path / "stack.npy",
+        np.full((3, 2, 50, 3), [[[[10]]], [[[20]]], [[[30]]]], dtype=np.uint8),
+    )
+
+    async def scenario():
+        tasks = []
+        hass = make_hass(
+            {
+                "entry_fixtures": {
+                    "rig": [
+                        (_strip("row_0", 0), universes[0]),
+                        (_strip("row_1", 1), universes[1]),
+                    ]
+                }
+            },
+            config=SimpleNamespace(
+                path=lambda name: str(tmp_path / name),
+                is_allowed_path=lambda path: path.startswith(str(tmp_path)),
+            ),
+            async_create_background_task=lambda coro, name: (
+                tasks.append(asyncio.ensure_future(coro)) or tasks[-1]
+            ),
+        )
+
+        async def call(service, data):
+            await hass.services.async_call(DOMAIN, service, data)
+
+        await call("play_pixels", {"file": "stack.npy", "fps": 100})
+        await tasks[-1]
+        assert [frame[0] for frame in universes[0].frames] == [10, 20, 30]
+        assert len(universes[1].frames) == 3
+
+        await call(
+            "play_pixels",
+            {"file": "stack.npy", "fps": 100, "loop": True, "fixtures": ["row_1"]},
+        )
+        await asyncio.sleep(0.2)
+        assert len(universes[1].frames) > 6
+        assert len(universes[0].frames) == 3
+        await call("stop_pixels", {"fixtures": ["row_1"]})
+        with pytest.raises(asyncio.CancelledError):
+            await tasks[-1]
+        assert hass.data["artnet_dmx_controller"]["pixel_players"] == {}
+
+        with pytest.raises(HomeAssistantError, match="not allowed"):
+            await call("play_pixels", {"file": "/etc/passwd"})
+
+    asyncio.run(scenario())
@@ -0,0 +1,251 @@
+import asyncio
+import json
+import os
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.artnet_dmx_controller import buffer
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper
+from custom_components.artnet_dmx_controller.compiled_fixture import compile_fixture
+from custom_components.artnet_dmx_controller.const import DOMAIN
+from custom_components.artnet_dmx_controller.entry_fixtures import (
+    build_fixture_entry_data,
+)
+from custom_components.artnet_dmx_controller.fixture_mapping import (
+    HomeAssistantError,
+    clear_fixture_mapping_cache,
+    load_fixture_mapping,
+)
+from custom_components.artnet_dmx_controller.light import ArtNetDMXPixelLight
+from custom_components.artnet_dmx_controller.pixels import PixelMap, pixel_pattern
+
+BACKENDS = [False, True] if buffer.HAS_NUMPY else [False]
+
+
+def _strip(fixture_type, start_channel, fixture_id, universe=0):
+    fixture_def = load_fixture_mapping()["fixtures"][fixture_type]
+    return build_fixture_entry_data(
+        "192.168.1.100",
+        universe,
+        fixture_type,
+        start_channel,
+        fixture_def["channel_count"],
+        fixture_id=fixture_id,
+    )
+
+
+def _helper(universe=0):
+    helper = ArtNetDMXHelper(
+        hass=SimpleNamespace(), target_ip="192.168.1.100", universe=universe
+    )
+    helper.frames = []
+
+    async def send_dmx_data(dmx_data):
+        helper.frames.append(bytes(dmx_data))
+
+    helper.send_dmx_data = send_dmx_data
+    return helper
+
+
+def _rows(pixels):
+    return [[int(value) for value in row] for row in pixels]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_pixel_pattern_blends_or_repeats_colours(use_numpy):
+    gradient = pixel_pattern([(0, 0, 0), (255, 100, 0, 50)], 5, use_numpy=use_numpy)
+    assert _rows(gradient) == [
+        [0, 0, 0, 0],
+        [64, 25, 0, 12],
+        [128, 50, 0, 25],
+        [191, 75, 0, 38],
+        [255, 100, 0, 50],
+    ]
+    three_stops = pixel_pattern(
+        [(0, 0, 0), (200, 0, 0), (0, 0, 200)], 5, use_numpy=use_numpy
+    )
+    assert _rows(three_stops)[1:4] == [[100, 0, 0, 0], [200, 0, 0, 0], [100, 0, 100, 0]]
+    assert _rows(pixel_pattern([(1, 2, 3), (4, 5, 6)], 3, "repeat", use_numpy)) == [
+        [1, 2, 3, 0],
+        [4, 5, 6, 0],
+        [1, 2, 3, 0],
+    ]
+    assert _rows(pixel_pattern([(300, -1, 7)], 1, use_numpy=use_numpy)) == [
+        [255, 0, 7, 0]
+    ]
+
+
+def test_profiles_compile_pixel_blocks():
+    mapping = load_fixture_mapping()
+    bar = compile_fixture(_strip("pixel_bar_rgbw_32", 10, "bar"), mapping)
+    assert bar.pixel_count == 32
+    assert bar.pixel_order == "rgbw"
+    assert bar.pixel_channels[0] == 11
+    assert bar.pixel_channels[-1] == 138
+    assert bar.channels == {"strobe": 10}
+    assert bar.intensity_channels == bar.pixel_channels
+    par = compile_fixture(
+        build_fixture_entry_data("192.168.1.100", 0, "parcan_rgb_gen", 1, 5), mapping
+    )
+    assert par.pixel_count == 0
+    assert par.pixel_channels == []
+
+
+@pytest.mark.parametrize(
+    ("pixels", "message"),
+    [
+        ({"pixel_count": 0, "pixel_order": "rgb"}, "pixel_count"),
+        ({"pixel_count": 2, "pixel_order": "rbb"}, "pixel_order"),
+        ({"pixel_count": 2, "pixel_order": "rgba"}, "pixel_order"),
+        ({"pixel_count": 3, "pixel_order": "rgb"}, "do not fit"),
+        ({"pixel_count": 2, "pixel_order": "rgb", "pixel_offset": 3}, "do not fit"),
+    ],
+)
+def test_invalid_pixel_profiles_raise(pixels, message):
+    data = {
+        "fixtures": {
+            "strip": {
+                "fixture_specie": "pixel",
+                "channel_count": 7,
+                "channels": [{"name": "dim", "offset": 7, "description": "Dimmer"}],
+                **pixels,
+            }
+        }
+    }
+    fd, path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    Path(path).write_text(json.dumps(data), encoding="utf-8")
+    try:
+        with pytest.raises(HomeAssistantError, match=message):
+            load_fixture_mapping(path)
+        data["fixtures"]["strip"].update(
+            pixel_count=2, pixel_order="rgb", pixel_offset=2
+        )
+        Path(path).write_text(json.dumps(data), encoding="utf-8")
+        with pytest.raises(HomeAssistantError, match="overlaps"):
+            load_fixture_mapping(path)
+    finally:
+        Path(path).unlink()
+        clear_fixture_mapping_cache()
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_pixel_map_lays_fixtures_end_to_end_across_universes(use_numpy):
+    mapping = load_fixture_mapping()
+    universes = [_helper(0), _helper(1)]
+    strips = [
+        (
+            universes[0],
+            compile_fixture(_strip("pixel_strip_grb_50", 1, "grb"), mapping),
+        ),
+        (
+            universes[0],
+            compile_fixture(
+                build_fixture_entry_data("192.168.1.100", 0, "parcan_rgb_gen", 200, 5),
+                mapping,
+            ),
+        ),
+        (
+            universes[1],
+            compile_fixture(
+                _strip("pixel_bar_rgbw_32", 1, "rgbw", universe=1), mapping
+            ),
+        ),
+    ]
+    pixels = PixelMap(strips, use_numpy=use_numpy)
+    assert pixels.fixture_ids == ["grb", "rgbw"]
+    assert len(pixels) == 82
+
+    pixels.set_pixels([(1, 2, 3), (4, 5, 6)], start=49)
+    pixels.set_pixels([(7, 8, 9, 10)], start=81)
+    pixels.set_pixels([(0, 0, 0)] * 5, start=80)
+    assert pixels.pixel(49) == (1, 2, 3, 0)
+    assert pixels.pixel(81) == (0, 0, 0, 0)
+    pixels.set_pixels([(7, 8, 9, 10)], start=81)
+    with pytest.raises(ValueError):
+        pixels.set_pixels([(1, 2)])
+
+    asyncio.run(pixels.async_write())
+    assert [len(helper.frames) for helper in universes] == [1, 1]
+    # GRB strip: pixel 49 at channels 148-150.
+    assert universes[0].frames[-1][147:150] == bytes([2, 1, 3])
+    # RGBW bar behind the strobe channel: pixel 0 at channels 2-5, pixel 31 at 126-129.
+    assert universes[1].frames[-1][1:5] == bytes([4, 5, 6, 0])
+    assert universes[1].frames[-1][125:129] == bytes([7, 8, 9, 10])
+
+    asyncio.run(pixels.async_set_pixels([(9, 9, 9)], layer="override"))
+    assert universes[0].compositor.layers() == ["override"]
+    assert universes[0].frames[-1][0:3] == bytes([9, 9, 9])
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_gradient_across_a_thousand_pixels_is_one_write_per_universe(use_numpy):
+    mapping = load_fixture_mapping()
+    universes = [_helper(universe) for universe in range(6)]
+    strips = [
+        (
+            helper,
+            compile_fixture(
+                _strip("pixel_strip_rgb_170", 1, f"strip_{universe}", universe), mapping
+            ),
+        )
+        for universe, helper in enumerate(universes)
+    ]
+    pixels = PixelMap(strips, use_numpy=use_numpy)
+    assert len(pixels) == 1020
+
+    asyncio.run(
+        pixels.async_set_pixels(
+            pixel_pattern([(255, 0, 0), (0, 0, 255)], len(pixels), use_numpy=use_numpy)
+        )
+    )
+
+    assert [len(helper.frames) for helper in universes] == [1] * 6
+    assert universes[0].frames[-1][0:3] == bytes([255, 0, 0])
+    assert universes[5].frames[-1][507:510] == bytes([0, 0, 255])
+    middle = universes[2].frames[-1][510 // 2 - 3 : 510 // 2 + 3]
+    assert 100 < middle[0] < 160
+
+
+def test_set_pixels_service_and_pixel_light(make_hass):
+    universe = _helper(0)
+    strip = _strip("pixel_strip_grb_50", 1, "strip")
+    par = build_fixture_entry_data(
+        "192.168.1.100", 0, "parcan_rgb_gen", 200, 5, fixture_id="par"
+    )
+    hass = make_hass({"entry_fixtures": {"rig": [(strip, universe), (par, universe)]}})
+
+    def call(data):
+        asyncio.run(hass.services.async_call(DOMAIN, "set_pixels", data))
+
+    call({"colors": [[10, 20, 30], [40, 50, 60]], "mode": "repeat"})
+    assert len(universe.frames) == 1
+    assert universe.frames[-1][0:6] == bytes([20, 10, 30, 50, 40, 60])
+
+    with pytest.raises(HomeAssistantError, match="par"):
+        call({"colors": [[1, 2, 3]], "fixtures": ["strip", "par"]})
+    with pytest.raises(HomeAssistantError, match="Unknown fixtures: ghost"):
+        call({"colors": [[1, 2, 3]], "fixtures": ["ghost"]})
+
+    compiled = compile_fixture(strip, load_fixture_mapping())
+    light = ArtNetDMXPixelLight(
+        PixelMap([(universe, compiled)]), universe, compiled, "entry", "device", "Strip"
+    )
+    light.async_write_throttled_state = lambda: None
+    assert light.is_on
+    assert light.rgb_color == (10, 20, 30)
+
+    asyncio.run(light.async_turn_on(rgb_color=(255, 0, 0), brightness=128))
+    assert universe.frames[-1][0:3] == bytes([0, 128, 0])
+    assert universe.frames[-1][147:150] == bytes([0, 128, 0])
+    asyncio.run(light.async_turn_off())
+    assert not any(universe.frames[-1][0:150])
+
+    # The light follows what set_pixels writes under it.
+    asyncio.run(light.async_added_to_hass())
+    call({"colors": [[10, 20, 30]], "fixtures": ["strip"]})
+    assert light.is_on
+    assert (light.rgb_color, light.brightness) == ((10, 20, 30), 30)
@@ -0,0 +1,177 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.artnet_dmx_controller import buffer
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper
+from custom_components.artnet_dmx_controller.compiled_fixture import (
+    CompiledFixture,
+    compile_fixture,
+)
+from custom_components.artnet_dmx_controller.const import DOMAIN
+from custom_components.artnet_dmx_controller.entry_fixtures import (
+    build_fixture_entry_data,
+)
+from custom_components.artnet_dmx_controller.fixture_mapping import (
+    HomeAssistantError,
+    load_fixture_mapping,
+)
+from custom_components.artnet_dmx_controller.number import ArtNetDMX16BitNumber
+from custom_components.artnet_dmx_controller.point_at import PointAtSolver
+
+BACKENDS = [False, True] if buffer.HAS_NUMPY else [False]
+
+
+def _head(start_channel, fixture_id, location, orientation=None, universe=0):
+    return build_fixture_entry_data(
+        "192.168.1.100",
+        universe,
+        "head_el150",
+        start_channel,
+        9,
+        fixture_id=fixture_id,
+        location=location,
+        orientation=orientation,
+    )
+
+
+def _pan_tilt(values):
+    values = [int(value) for value in values]
+    return [
+        (values[i] << 8 | values[i + 1], values[i + 2] << 8 | values[i + 3])
+        for i in range(0, len(values), 4)
+    ]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_solver_aims_every_head_with_its_calibration(use_numpy):
+    mapping = load_fixture_mapping()
+    helper = object()
+    heads = [
+        _head(1, "floor", {"x": 0, "y": 0, "z": 0}),
+        _head(
+            10,
+            "inverted",
+            {"x": 0, "y": 0, "z": 0},
+            {"invert_pan": True, "tilt_offset": -45},
+        ),
+        _head(
+            19,
+            "hanging",
+            {"x": 0, "y": -1, "z": 2},
+            {"mount": "hanging", "rotation": 90},
+        ),
+        _head(28, "unlocated", None),
+    ]
+    solver = PointAtSolver(
+        [(helper, compile_fixture(head, mapping)) for head in heads],
+        use_numpy=use_numpy,
+    )
+    assert solver.fixture_ids == ["floor", "inverted", "hanging"]
+
+    [(target, indices, values)] = solver.solve(0, 1, 1)
+    assert target is helper
+    assert [int(index) + 1 for index in indices] == [
+        1,
+        2,
+        3,
+        4,
+        10,
+        11,
+        12,
+        13,
+        19,
+        20,
+        21,
+        22,
+    ]
+    # 540 degrees of pan and 270 of tilt: 90 and 45 degrees are 10923 steps from centre.
+    assert _pan_tilt(values) == [(43691, 43691), (21845, 32768), (32768, 48165)]
+    assert solver.solve(0.0, 1.0, 1.0)[0][2] is values
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_solver_swings_through_the_other_side_and_clamps_to_the_travel(use_numpy):
+    fixture_def = dict(load_fixture_mapping()["fixtures"]["head_el150"], pan_range=180)
+    head = CompiledFixture(_head(1, "narrow", {"x": 0, "y": 0, "z": 0}), fixture_def)
+    solver = PointAtSolver([(object(), head)], use_numpy=use_numpy)
+
+    # Straight behind the pan centre: pan 180 is out of travel, so tilt the other way.
+    assert _pan_tilt(solver.solve(-1, 0, 1)[0][2]) == [(32768, 21845)]
+    # Below the base plane: tilt is clamped at the end of its travel.
+    assert _pan_tilt(solver.solve(1, 0, -10)[0][2])[0][1] == 65535
+
+
+def _rig(make_hass):
+    sent = {}
+    helpers = {}
+    for universe in (0, 1):
+        helper = ArtNetDMXHelper(
+            hass=SimpleNamespace(), target_ip="192.168.1.100", universe=universe
+        )
+
+        async def send_dmx_data(dmx_data, universe=universe):
+            sent.setdefault(universe, []).append(bytes(dmx_data))
+
+        helper.send_dmx_data = send_dmx_data
+        helpers[universe] = helper
+    left = _head(1, "left", {"x": 0, "y": 0, "z": 0})
+    right = _head(1, "right", {"x": 2, "y": 0, "z": 0}, {"rotation": 180}, universe=1)
+    par = build_fixture_entry_data(
+        "192.168.1.100", 0, "parcan_rgb_gen", 20, 5, fixture_id="par"
+    )
+    hass = make_hass(
+        {
+            "entry_fixtures": {
+                "rig": [(left, helpers[0]), (right, helpers[1]), (par, helpers[0])]
+            },
+        }
+    )
+
+    def call(data):
+        asyncio.run(hass.services.async_call(DOMAIN, "point_at", data))
+
+    return call, helpers, sent
+
+
+def test_point_at_service_scatters_one_frame_per_universe(make_hass):
+    call, helpers, sent = _rig(make_hass)
+
+    call({"x": 1, "y": 0, "z": 1})
+    assert [len(frames) for frames in sent.values()] == [1, 1]
+    assert _pan_tilt(sent[0][-1][:4]) == [(32768, 43691)]
+    assert _pan_tilt(sent[1][-1][:4]) == [(32768, 43691)]
+
+    call({"x": 1, "y": 0, "z": 1, "fixtures": ["left"], "layer": "override"})
+    assert len(sent[0]) == 2
+    assert len(sent[1]) == 1
+    assert helpers[0].compositor.layers() == ["override"]
+
+    with pytest.raises(HomeAssistantError, match="par"):
+        call({"x": 0, "y": 0, "z": 0, "fixtures": ["left", "par"]})
+    with pytest.raises(HomeAssistantError, match="Unknown fixtures: ghost"):
+        call({"x": 0, "y": 0, "z": 0, "fixtures": ["ghost"]})
+
+
+def test_point_at_refreshes_the_aimed_heads_pan_and_tilt_numbers(make_hass):
+    call, helpers, _sent = _rig(make_hass)
+    pan = ArtNetDMX16BitNumber(
+        helpers[0], None, 1, 2, entry_id="rig", fixture_id="left"
+    )
+    tilt = ArtNetDMX16BitNumber(
+        helpers[0], None, 3, 4, entry_id="rig", fixture_id="left"
+    )
+    writes = []
+    for entity in (pan, tilt):
+        entity.async_write_ha_state = lambda entity=entity: writes.append(entity)
+        asyncio.run(entity.async_added_to_hass())
+
+    call({"x": 1, "y": 0, "z": 1})
+    assert (pan.native_value, tilt.native_value) == (32768, 43691)
+    assert writes == [pan, tilt]
+
+    # Layer aims leave the base look, and so the entities, alone.
+    call({"x": 0, "y": 0, "z": 0, "fixtures": ["left"], "layer": "override"})
+    assert (pan.native_value, tilt.native_value) == (32768, 43691)
+    assert writes == [pan, tilt]
@@ -0,0 +1,198 @@
+import asyncio
+from multiprocessing.shared_memory import SharedMemory
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.artnet_dmx_controller import buffer, effects, render_worker
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper
+from custom_components.artnet_dmx_controller.compiled_fixture import compile_fixture
+from custom_components.artnet_dmx_controller.effects import Effect, EffectEngine
+from custom_components.artnet_dmx_controller.entry_fixtures import (
+    build_fixture_entry_data,
+)
+from custom_components.artnet_dmx_controller.fixture_mapping import load_fixture_mapping
+from custom_components.artnet_dmx_controller.render_worker import (
+    RenderWorker,
+    RenderWorkerError,
+    render_frames,
+)
+
+BACKENDS = [False, True] if buffer.HAS_NUMPY else [False]
+
+
+def _pars(universe, count):
+    mapping = load_fixture_mapping()
+    return [
+        (
+            universe,
+            compile_fixture(
+                build_fixture_entry_data(
+                    "192.168.1.100",
+                    universe.universe,
+                    "parcan_rgb_gen",
+                    1 + 5 * position,
+                    5,
+                    fixture_id=f"par_{universe.universe}_{position}",
+                ),
+                mapping,
+            ),
+        )
+        for position in range(count)
+    ]
+
+
+def _helper(universe=0):
+    helper = ArtNetDMXHelper(
+        hass=SimpleNamespace(), target_ip="192.168.1.100", universe=universe
+    )
+    helper.frames = []
+
+    async def send_dmx_data(dmx_data):
+        helper.frames.append(bytes(dmx_data))
+
+    helper.send_dmx_data = send_dmx_data
+    return helper
+
+
+def _hass():
+    return SimpleNamespace(
+        async_add_executor_job=lambda func, *args: (
+            asyncio.get_running_loop().run_in_executor(None, func, *args)
+        ),
+        async_create_task=lambda coro: None,
+        bus=SimpleNamespace(async_listen_once=lambda event, listener: lambda: None),
+    )
+
+
+@pytest.fixture
+def tickers(monkeypatch):
+    monkeypatch.setattr(
+        effects,
+        "async_track_time_interval",
+        lambda hass, action, interval: lambda: None,
+    )
+    # Effects start at 0 s, so ticks render the same phase in every engine.
+    monkeypatch.setattr(effects, "time", SimpleNamespace(monotonic=lambda: 0.0))
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_programs_render_into_shared_universe_slots(use_numpy, monkeypatch):
+    monkeypatch.setattr(render_worker, "_attached", [])
+    monkeypatch.setattr(render_worker, "_programs", {})
+    universes = [_helper(0), _helper(1)]
+    effect = Effect(
+        "chase",
+        _pars(universes[0], 3) + _pars(universes[1], 2),
+        size=0.5,
+        use_numpy=use_numpy,
+    )
+    program = effect.program({id(universes[0]): 1, id(universes[1]): 0})
+    assert [slot for slot, _indices, _values in program.render(0.3)] == [1, 0]
+
+    block = SharedMemory(create=True, size=2 * 512)
+    try:
+        render_frames(block.name, 2, {7: program}, [], [(7, 0.3)])
+        for artnet_helper, indices, values in effect.render(0.3):
+            slot = 1 if artnet_helper is universes[0] else 0
+            assert [block.buf[slot * 512 + int(index)] for index in indices] == [
+                int(value) for value in values
+            ]
+        assert not any(block.buf[1 * 512 + 15 : 2 * 512])
+        # Later frames only name the program.
+        render_frames(block.name, 2, {}, [], [(7, 0.8)])
+        _universe, indices, values = effect.render(0.8)[0]
+        assert block.buf[512 + int(indices[0])] == int(values[0])
+        render_frames(block.name, 2, {}, [7], [])
+        assert render_worker._programs == {}
+    finally:
+        render_worker._attached.clear()
+        block.close()
+        block.unlink()
+
+
+@pytest.mark.usefixtures("tickers")
+def test_worker_process_renders_the_same_frames_as_the_event_loop():
+    universes = [_helper(universe) for universe in range(3)]
+    inline, offloaded = EffectEngine(_hass()), EffectEngine(_hass())
+
+    async def scenario():
+        await offloaded.async_set_render_worker(True)
+        assert offloaded.render_worker
+        try:
+            for engine in (inline, offloaded):
+                await engine.async_start(
+                    "wave",
+                    Effect("sine", _pars(universes[0], 50) + _pars(universes[2], 20)),
+                )
+                await engine.async_start(
+                    "chase", Effect("chase", _pars(universes[1], 100))
+                )
+            for now in (0.1, 0.35, 0.8):
+                await inline.async_tick(now)
+                expected = [helper.get_output_frame() for helper in universes]
+                await offloaded.async_tick(now)
+                assert [helper.get_output_frame() for helper in universes] == expected
+            # Nine universes outgrow the default eight slots.
+            many = [_helper(universe) for universe in range(3, 12)]
+            await offloaded.async_start(
+                "many",
+                Effect(
+                    "saw",
+                    [par for helper in many for par in _pars(helper, 1)],
+                    spread=0,
+                ),
+            )
+            await offloaded.async_tick(0.5)
+            assert offloaded._render_worker.slot_count == 16
+            assert many[-1].get_output_frame()[0] == round(0.5 * 255)
+        finally:
+            await offloaded.async_set_render_worker(False)
+        assert not offloaded.render_worker
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.usefixtures("tickers")
+def test_engine_falls_back_to_the_event_loop_when_the_worker_dies():
+    universe = _helper()
+    engine = EffectEngine(_hass())
+    closed = []
+
+    async def async_render(_running):
+        raise RenderWorkerError("exited")
+
+    engine._render_worker = SimpleNamespace(
+        async_render=async_render, close=lambda: closed.append(True)
+    )
+
+    async def scenario():
+        await engine.async_start("wave", Effect("saw", _pars(universe, 2)))
+        await engine.async_tick(0.25)
+
+    asyncio.run(scenario())
+    assert not engine.render_worker
+    assert closed == [True]
+    assert universe.get_output_frame()[0] == round(0.25 * 255)
+
+
+def test_python_backend_worker_renders_and_frees_its_block():
+    universes = [_helper(universe) for universe in range(3)]
+    effect = Effect(
+        "saw",
+        [par for helper in universes for par in _pars(helper, 1)],
+        spread=0,
+        use_numpy=False,
+    )
+    worker = RenderWorker(slots=2, use_numpy=False)
+    try:
+        writes = asyncio.run(worker.async_render([(effect, 0.5)]))
+        assert worker.slot_count == 4
+        name = worker._block.name
+        assert [(helper, list(values)) for helper, _indices, values in writes] == [
+            (helper, [round(0.5 * 255)]) for helper in universes
+        ]
+    finally:
+        worker.close()
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=name)
@@ -0,0 +1,155 @@
+import asyncio
+from types import SimpleNamespace
+
+import custom_components.artnet_dmx_controller as integration_init
+from custom_components.artnet_dmx_controller.universe_store import UniverseStateStore
+
+
+class MemoryStore:
+    def __init__(self):
+        self.pending = None
+
+    async def async_load(self):
+        return None
+
+    def async_delay_save(self, data_func, delay):
+        self.pending = data_func
+
+
+class FakeHelper:
+    created = []
+
+    def __init__(self, hass, target_ip, universe):
+        FakeHelper.created.append((target_ip, universe))
+        self.closed = False
+        self.frames = 0
+        self._dmx_data = bytearray(512)
+
+    def setup_socket(self):
+        return None
+
+    def restore_buffer(self, dmx_data):
+        self._dmx_data[: len(dmx_data)] = dmx_data
+
+    def get_buffer(self):
+        return bytes(self._dmx_data)
+
+    def close_socket(self):
+        self.closed = True
+
+    async def async_send_current_state(self):
+        self.frames += 1
+
+    async def set_channels(self, channel_values):
+        for channel, value in channel_values.items():
+            self._dmx_data[channel - 1] = value
+        self.frames += 1
+
+    async def move_channels(self, source_start, target_start, count):
+        block = self._dmx_data[source_start - 1 : source_start - 1 + count]
+        self._dmx_data[source_start - 1 : source_start - 1 + count] = bytes(count)
+        self._dmx_data[target_start - 1 : target_start - 1 + count] = block
+        self.frames += 1
+
+    def get_channel_block(self, start_channel, count):
+        return bytes(self._dmx_data[start_channel - 1 : start_channel - 1 + count])
+
+
+def _fixture(start_channel, universe=0, fixture_id="fixture-a"):
+    return {
+        "id": fixture_id,
+        "target_ip": "192.168.1.100",
+        "universe": universe,
+        "fixture_type": "parcan_rgb_gen",
+        "start_channel": start_channel,
+        "channel_count": 5,
+    }
+
+
+def _hass():
+    class FakeConfigEntries:
+        def __init__(self):
+            self.entries = {}
+
+        async def async_forward_entry_setups(self, entry, platforms):
+            return None
+
+        async def async_unload_platforms(self, entry, platforms):
+            return True
+
+        def async_update_entry(self, entry, data=None, title=None):
+            entry.data = data
+
+        async def async_reload(self, entry_id):
+            entry = self.entries[entry_id]
+            await integration_init.async_unload_entry(hass, entry)
+            await integration_init.async_setup_entry(hass, entry)
+
+    hass = SimpleNamespace(data={}, config_entries=FakeConfigEntries())
+    hass.data["artnet_dmx_controller"] = {
+        "universe_store": UniverseStateStore(hass, store=MemoryStore())
+    }
+    return hass
+
+
+def _setup(hass, entry):
+    hass.config_entries.entries[entry.entry_id] = entry
+    asyncio.run(integration_init.async_setup_entry(hass, entry))
+
+
+def test_repatch_moves_values_and_keeps_helper(monkeypatch):
+    monkeypatch.setattr(integration_init, "ArtNetDMXHelper", FakeHelper)
+    FakeHelper.created = []
+    hass = _hass()
+    entry = SimpleNamespace(
+        entry_id="entry-a", title="A", data=_fixture(10), options={}
+    )
+    _setup(hass, entry)
+
+    helper = hass.data["artnet_dmx_controller"]["entry-a"]
+    helper._dmx_data[9:14] = bytes([255, 10, 20, 30, 0])
+    helper._dmx_data[99] = 77  # channel owned by another fixture
+
+    asyncio.run(integration_init.async_repatch_fixture(hass, entry, _fixture(40)))
+
+    assert FakeHelper.created == [("192.168.1.100", 0)]
+    assert helper.closed is False
+    assert hass.data["artnet_dmx_controller"]["entry-a"] is helper
+    assert helper.get_channel_block(10, 5) == bytes(5)
+    assert helper.get_channel_block(40, 5) == bytes([255, 10, 20, 30, 0])
+    assert helper._dmx_data[99] == 77
+    assert hass.data["artnet_dmx_controller"]["helper_refcounts"] == {
+        ("192.168.1.100", 0): 1
+    }
+
+
+def test_repatch_to_other_universe_copies_values(monkeypatch):
+    monkeypatch.setattr(integration_init, "ArtNetDMXHelper", FakeHelper)
+    FakeHelper.created = []
+    hass = _hass()
+    entry = SimpleNamespace(
+        entry_id="entry-a", title="A", data=_fixture(10), options={}
+    )
+    other = SimpleNamespace(
+        entry_id="entry-b",
+        title="B",
+        data=_fixture(1, fixture_id="fixture-b"),
+        options={},
+    )
+    _setup(hass, entry)
+    _setup(hass, other)
+
+    old_helper = hass.data["artnet_dmx_controller"]["entry-a"]
+    old_helper._dmx_data[0] = 99
+    old_helper._dmx_data[9:14] = bytes([1, 2, 3, 4, 5])
+
+    asyncio.run(
+        integration_init.async_repatch_fixture(hass, entry, _fixture(10, universe=1))
+    )
+
+    new_helper = hass.data["artnet_dmx_controller"]["entry-a"]
+    assert new_helper is not old_helper
+    assert new_helper.get_channel_block(10, 5) == bytes([1, 2, 3, 4, 5])
+    assert old_helper.get_channel_block(10, 5) == bytes(5)
+    assert old_helper._dmx_data[0] == 99
+    assert old_helper.closed is False
@@ -0,0 +1,266 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import custom_components.artnet_dmx_controller as integration_init
+from custom_components.artnet_dmx_controller import services
+from custom_components.artnet_dmx_controller.config_flow import (
+    ArtNetDMXControllerConfigFlow,
+)
+from custom_components.artnet_dmx_controller.entry_fixtures import (
+    build_fixture_entry_data,
+    build_rig_entry_data,
+    extract_fixture_records,
+    fixture_title,
+    validate_fixture_overlap,
+)
+from custom_components.artnet_dmx_controller.fixture_mapping import HomeAssistantError
+from custom_components.artnet_dmx_controller.light import (
+    async_setup_entry as light_setup_entry,
+)
+from custom_components.artnet_dmx_controller.universe_store import UniverseStateStore
+
+
+def _rig_data():
+    return build_rig_entry_data(
+        "Main Stage",
+        [
+            build_fixture_entry_data(
+                "192.168.1.100",
+                0,
+                "parcan_rgb_gen",
+                1,
+                5,
+                name="Par A",
+                fixture_id="par_a",
+            ),
+            build_fixture_entry_data(
+                "192.168.1.100",
+                0,
+                "parcan_rgb_gen",
+                6,
+                5,
+                name="Par B",
+                fixture_id="par_b",
+            ),
+            build_fixture_entry_data(
+                "192.168.1.100",
+                1,
+                "parcan_rgb_gen",
+                1,
+                5,
+                name="Par C",
+                fixture_id="par_c",
+            ),
+        ],
+    )
+
+
+class MemoryStore:
+    def __init__(self):
+        self.pending = None
+
+    async def async_load(self):
+        return None
+
+    def async_delay_save(self, data_func, delay):
+        self.pending = data_func
+
+
+class FakeHelper:
+    created = 0
+
+    def __init__(self, hass, target_ip, universe):
+        FakeHelper.created += 1
+        self.target_ip = target_ip
+        self.universe = universe
+        self.closed = False
+        self._dmx_data = bytearray(512)
+
+    def setup_socket(self):
+        return None
+
+    def restore_buffer(self, dmx_data):
+        self._dmx_data[: len(dmx_data)] = dmx_data
+
+    def get_buffer(self):
+        return bytes(self._dmx_data)
+
+    def close_socket(self):
+        self.closed = True
+
+    async def async_send_current_state(self):
+        return None
+
+    async def set_channels(self, channel_values):
+        for channel, value in channel_values.items():
+            self._dmx_data[channel - 1] = value
+
+    def get_channel_value(self, channel):
+        return self._dmx_data[channel - 1]
+
+
+def test_rig_records_and_title():
+    data = _rig_data()
+
+    records = extract_fixture_records(data)
+
+    assert [record["id"] for record in records] == ["par_a", "par_b", "par_c"]
+    assert records[2]["universe"] == 1
+    assert fixture_title(data) == "Main Stage (3 fixtures)"
+
+
+def test_single_fixture_overlap_checks_rig_fixtures():
+    rig_entry = SimpleNamespace(entry_id="rig", data=_rig_data())
+    candidate = build_fixture_entry_data("192.168.1.100", 0, "parcan_rgb_gen", 8, 5)
+
+    with pytest.raises(HomeAssistantError):
+        validate_fixture_overlap([rig_entry], candidate)
+
+    validate_fixture_overlap(
+        [rig_entry],
+        build_fixture_entry_data("192.168.1.100", 0, "parcan_rgb_gen", 11, 5),
+    )
+
+
+def test_rig_setup_acquires_each_universe_once_and_forwards_once(monkeypatch):
+    monkeypatch.setattr(integration_init, "ArtNetDMXHelper", FakeHelper)
+    FakeHelper.created = 0
+    forwarded = []
+
+    class FakeConfigEntries:
+        async def async_forward_entry_setups(self, entry, platforms):
+            forwarded.append(entry.entry_id)
+
+        async def async_unload_platforms(self, entry, platforms):
+            return True
+
+    hass = SimpleNamespace(data={}, config_entries=FakeConfigEntries())
+    hass.data["artnet_dmx_controller"] = {
+        "universe_store": UniverseStateStore(hass, store=MemoryStore())
+    }
+    entry = SimpleNamespace(
+        entry_id="rig",
+        title="Main Stage",
+        data=_rig_data(),
+        options={"helper_release_delay": 0},
+    )
+
+    assert asyncio.run(integration_init.async_setup_entry(hass, entry)) is True
+    assert forwarded == ["rig"]
+    assert FakeHelper.created == 2
+
+    domain_data = hass.data["artnet_dmx_controller"]
+    assert domain_data["helper_refcounts"] == {
+        ("192.168.1.100", 0): 1,
+        ("192.168.1.100", 1): 1,
+    }
+    assert len(domain_data["entry_fixtures"]["rig"]) == 3
+
+    added = []
+    asyncio.run(light_setup_entry(hass, entry, added.extend))
+    assert len(added) == 3
+    identifiers = {
+        next(iter(entity._attr_device_info["identifiers"]))[1] for entity in added
+    }
+    assert identifiers == {"rig_par_a", "rig_par_b", "rig_par_c"}
+
+    assert asyncio.run(integration_init.async_unload_entry(hass, entry)) is True
+    assert domain_data["shared_helpers"] == {}
+
+
+def test_reimporting_a_rig_repatches_it(tmp_path):
+    rig_entry = SimpleNamespace(
+        entry_id="rig", unique_id="rig_main_stage", data=_rig_data()
+    )
+    # The updated patch moves par B and keeps the other fixtures where they are.
+    patch = [
+        {"id": "par_a", "fixture": "parcan_rgb_gen", "base_channel": 1},
+        {"id": "par_b", "fixture": "parcan_rgb_gen", "base_channel": 11},
+        {"id": "par_c", "fixture": "parcan_rgb_gen", "base_channel": 1, "universe": 1},
+    ]
+    (tmp_path / "patch.json").write_text(json.dumps(patch), encoding="utf-8")
+    handlers = {}
+    updated = []
+
+    async def async_add_executor_job(target, *args):
+        return target(*args)
+
+    async def async_init(_domain, context, data):
+        # Run the import step as the flow manager would.
+        flow = ArtNetDMXControllerConfigFlow()
+        flow.hass = hass
+        flow.context = dict(context)
+
+        async def async_set_unique_id(unique_id):
+            flow.context["unique_id"] = unique_id
+
+        def async_update_reload_and_abort(entry, title, data, reason):
+            updated.append((entry.entry_id, title, data))
+            return {"type": "abort", "reason": reason}
+
+        flow.async_set_unique_id = async_set_unique_id
+        flow.async_update_reload_and_abort = async_update_reload_and_abort
+        return await flow.async_step_import(data)
+
+    hass = SimpleNamespace(
+        config=SimpleNamespace(
+            path=lambda name: str(tmp_path / name),
+            is_allowed_path=lambda path: True,
+        ),
+        async_add_executor_job=async_add_executor_job,
+        config_entries=SimpleNamespace(
+            async_entries=lambda domain: [rig_entry],
+            async_entry_for_domain_unique_id=lambda domain, unique_id: (
+                rig_entry if unique_id == rig_entry.unique_id else None
+            ),
+            flow=SimpleNamespace(async_init=async_init),
+        ),
+        services=SimpleNamespace(
+            has_service=lambda domain, service: False,
+            async_register=lambda domain, service, handler, **kwargs: (
+                handlers.__setitem__(service, handler)
+            ),
+        ),
+    )
+    services.async_setup_services(hass)
+
+    # The rig's own fixtures neither duplicate nor overlap the patch replacing them.
+    response = asyncio.run(
+        handlers["import_patch"](
+            SimpleNamespace(
+                data={
+                    "file": "patch.json",
+                    "target_ip": "192.168.1.100",
+                    "universe": 0,
+                    "rig_name": "Main Stage",
+                }
+            )
+        )
+    )
+
+    assert response == {"created": [], "updated": ["par_a", "par_b", "par_c"]}
+    [(entry_id, title, data)] = updated
+    assert (entry_id, title) == ("rig", "Main Stage (3 fixtures)")
+    assert [record["start_channel"] for record in extract_fixture_records(data)] == [
+        1,
+        11,
+        1,
+    ]
+
+    # Any other name still sees the rig's fixtures as taken.
+    with pytest.raises(HomeAssistantError, match="duplicate fixture id 'par_a'"):
+        asyncio.run(
+            handlers["import_patch"](
+                SimpleNamespace(
+                    data={
+                        "file": "patch.json",
+                        "target_ip": "192.168.1.100",
+                        "universe": 0,
+                        "rig_name": "Side Stage",
+                    }
+                )
+            )
+        )
@@ -0,0 +1,153 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper
+from custom_components.artnet_dmx_controller.const import DOMAIN
+from custom_components.artnet_dmx_controller.entry_fixtures import (
+    build_fixture_entry_data,
+    resolve_fixture_channel_values,
+)
+from custom_components.artnet_dmx_controller.fixture_mapping import (
+    HomeAssistantError,
+    load_fixture_mapping,
+)
+from custom_components.artnet_dmx_controller.light import ArtNetDMXRGBLight
+from custom_components.artnet_dmx_controller.number import ArtNetDMX16BitNumber
+
+
+class FakeHelper:
+    def __init__(self):
+        self._dmx_data = bytearray(512)
+        self.frames = 0
+
+    async def set_channels(self, channel_values):
+        for channel, value in channel_values.items():
+            self._dmx_data[channel - 1] = value
+        self.frames += 1
+
+
+@pytest.fixture
+def rig(make_hass):
+    """Return a hass stand-in with a head and two parcans on two universes."""
+
+    def build(universe_0=None):
+        universe_0 = universe_0 or FakeHelper()
+        universe_1 = FakeHelper()
+        head = build_fixture_entry_data(
+            "192.168.1.100", 0, "mini_beam_prism", 20, 12, fixture_id="head"
+        )
+        par_a = build_fixture_entry_data(
+            "192.168.1.100", 0, "parcan_rgb_gen", 1, 5, fixture_id="par_a"
+        )
+        par_b = build_fixture_entry_data(
+            "192.168.1.100", 1, "parcan_rgb_gen", 1, 5, fixture_id="par_b"
+        )
+        hass = make_hass(
+            {
+                "shared_helpers": {
+                    ("192.168.1.100", 0): universe_0,
+                    ("192.168.1.100", 1): universe_1,
+                },
+                "entry_data": {"head-entry": head},
+                "head-entry": universe_0,
+                "entry_fixtures": {"rig": [(par_a, universe_0), (par_b, universe_1)]},
+            }
+        )
+        return hass, universe_0, universe_1
+
+    return build
+
+
+def _call(hass, data):
+    asyncio.run(hass.services.async_call(DOMAIN, "set_channels", data))
+
+
+def test_resolve_names_offsets_labels_and_16bit_pairs():
+    mapping = load_fixture_mapping()
+    fixture = build_fixture_entry_data(
+        "192.168.1.100", 0, "mini_beam_prism", 20, 12, fixture_id="head"
+    )
+
+    resolved = resolve_fixture_channel_values(
+        fixture,
+        mapping["fixtures"]["mini_beam_prism"],
+        {"pan": 0x1234, "dim": 200, "color": "Red", 12: 7},
+    )
+
+    assert resolved == {20: 0x12, 21: 0x34, 25: 200, 27: 15, 31: 7}
+
+
+def test_raw_and_fixture_writes_send_one_frame_per_universe(rig):
+    hass, universe_0, universe_1 = rig()
+
+    _call(
+        hass,
+        {
+            "target_ip": "192.168.1.100",
+            "universe": 0,
+            "channels": {"100": "10", 101: 11},
+            "fixtures": {
+                "par_a": {"dim": 255, "red": 128},
+                "par_b": {"blue": 64},
+                "head": {"tilt": 65535},
+            },
+        },
+    )
+
+    assert universe_0.frames == 1
+    assert universe_1.frames == 1
+    assert universe_0._dmx_data[99:101] == bytes([10, 11])
+    assert universe_0._dmx_data[0:2] == bytes([255, 128])
+    assert universe_0._dmx_data[21:23] == bytes([255, 255])
+    assert universe_1._dmx_data[3] == 64
+
+
+def test_invalid_fixture_value_leaves_every_universe_untouched(rig):
+    hass, universe_0, universe_1 = rig()
+
+    with pytest.raises(HomeAssistantError):
+        _call(hass, {"fixtures": {"par_a": {"dim": 255}, "par_b": {"red": 300}}})
+    with pytest.raises(HomeAssistantError):
+        _call(hass, {"fixtures": {"missing": {"dim": 255}}})
+    with pytest.raises(HomeAssistantError):
+        _call(hass, {"target_ip": "10.0.0.1", "channels": {1: 255}})
+
+    assert universe_0.frames == 0
+    assert universe_1.frames == 0
+
+
+def test_fixture_writes_refresh_the_fixture_entities(rig):
+    universe_0 = ArtNetDMXHelper(
+        hass=SimpleNamespace(), target_ip="192.168.1.100", universe=0
+    )
+
+    async def send_dmx_data(_dmx_data):
+        return None
+
+    universe_0.send_dmx_data = send_dmx_data
+    hass, _universe_0, _universe_1 = rig(universe_0)
+    light = ArtNetDMXRGBLight(
+        universe_0, 2, 3, 4, 1, entry_id="rig", fixture_id="par_a"
+    )
+    tilt = ArtNetDMX16BitNumber(
+        universe_0, None, 22, 23, entry_id="head-entry", fixture_id="head"
+    )
+    # The pan number shares the universe but none of the written channels.
+    pan = ArtNetDMX16BitNumber(
+        universe_0, None, 20, 21, entry_id="head-entry", fixture_id="head"
+    )
+    writes = []
+    for entity in (light, tilt, pan):
+        entity.async_write_ha_state = lambda entity=entity: writes.append(entity)
+        asyncio.run(entity.async_added_to_hass())
+    assert not light.is_on
+
+    _call(
+        hass, {"fixtures": {"par_a": {"dim": 255, "red": 128}, "head": {"tilt": 65535}}}
+    )
+
+    assert (light.is_on, light.brightness, light.rgb_color) == (True, 255, (128, 0, 0))
+    assert tilt.native_value == 65535
+    assert writes == [light, tilt]
@@ -0,0 +1,92 @@
+import asyncio
+
+from custom_components.artnet_dmx_controller import state_throttle
+from custom_components.artnet_dmx_controller.number import ArtNetDMXNumber
+from custom_components.artnet_dmx_controller.state_throttle import ThrottledStateMixin
+
+
+class FakeEntity:
+    def __init__(self):
+        self.hass = object()
+        self.writes = 0
+        self.removed = False
+
+    def async_write_ha_state(self):
+        self.writes += 1
+
+    async def async_will_remove_from_hass(self):
+        self.removed = True
+
+
+class ThrottledEntity(ThrottledStateMixin, FakeEntity):
+    pass
+
+
+def _patch(monkeypatch):
+    clock = {"now": 100.0}
+    timers = []
+
+    def fake_call_later(_hass, delay, action):
+        timer = {"delay": delay, "action": action, "cancelled": False}
+        timers.append(timer)
+
+        def cancel():
+            timer["cancelled"] = True
+
+        return cancel
+
+    monkeypatch.setattr(state_throttle.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(state_throttle, "async_call_later", fake_call_later)
+    return clock, timers
+
+
+def test_bursts_publish_first_and_final_state_only(monkeypatch):
+    clock, timers = _patch(monkeypatch)
+    entity = ThrottledEntity()
+
+    entity.async_write_throttled_state()
+    assert entity.writes == 1
+
+    for _ in range(50):
+        clock["now"] += 0.001
+        entity.async_write_throttled_state()
+    assert entity.writes == 1
+    assert len(timers) == 1
+    assert 0 < timers[0]["delay"] <= state_throttle.STATE_WRITE_INTERVAL
+
+    clock["now"] += 0.25
+    timers[0]["action"](None)
+    assert entity.writes == 2
+
+    clock["now"] += 1
+    entity.async_write_throttled_state()
+    assert entity.writes == 3
+    assert len(timers) == 1
+
+
+def test_pending_write_is_cancelled_on_removal(monkeypatch):
+    _clock, timers = _patch(monkeypatch)
+    entity = ThrottledEntity()
+    entity.async_write_throttled_state()
+    entity.async_write_throttled_state()
+
+    asyncio.run(entity.async_will_remove_from_hass())
+
+    assert timers[0]["cancelled"] is True
+    assert entity.removed is True
+
+
+def test_entity_without_hass_still_updates_value():
+    entity = ArtNetDMXNumber(
+        artnet_helper=object(), dmx_writer=None, channel=1, entry_id="e", fixture_id="f"
+    )
+
+    class Helper:
+        async def set_channel(self, channel, value):
+            self.value = value
+
+    entity._artnet_helper = Helper()
+    for value in (10, 20, 30):
+        asyncio.run(entity.async_set_native_value(value))
+
+    assert entity.native_value == 30
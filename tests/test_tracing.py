@@ -0,0 +1,136 @@
+import asyncio
+from types import SimpleNamespace
+
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper
+from custom_components.artnet_dmx_controller.const import DOMAIN
+from custom_components.artnet_dmx_controller.dmx_writer import DMXWriter
+from custom_components.artnet_dmx_controller.light import ArtNetDMXRGBLight
+from custom_components.artnet_dmx_controller.output_thread import OutputThread
+from custom_components.artnet_dmx_controller.tracing import (
+    LatencyTracer,
+    Trace,
+    latency_tracer,
+)
+from tests.conftest import FakeSocket
+
+
+def _helper(universe=0):
+    helper = ArtNetDMXHelper(
+        hass=SimpleNamespace(), target_ip="10.0.0.5", universe=universe
+    )
+    helper._socket = FakeSocket()
+    return helper
+
+
+def _light(helper):
+    light = ArtNetDMXRGBLight(
+        helper,
+        red_channel=1,
+        green_channel=2,
+        blue_channel=3,
+        dim_channel=None,
+        entry_id="entry",
+        fixture_id="par",
+        dmx_writer=DMXWriter(helper),
+    )
+    light.async_write_throttled_state = lambda: None
+    return light
+
+
+def _hass(make_hass, helpers):
+    return make_hass({"shared_helpers": {("10.0.0.5", h.universe): h for h in helpers}})
+
+
+def test_tracer_splits_a_trace_into_stages():
+    tracer = LatencyTracer()
+    trace = Trace(origin=1.0, enqueued=1.001)
+    trace.flushed = 1.003
+    trace.locked = 1.003
+    trace.handed_over = 1.0035
+    trace.executor_started = 1.005
+    trace.sent = 1.0051
+    trace.resumed = 1.006
+    tracer.finish(trace)
+
+    stages = tracer.as_dict()["stages"]
+    assert list(stages) == [
+        "call",
+        "debounce",
+        "lock_wait",
+        "compose",
+        "executor_hop",
+        "socket_send",
+        "resume",
+        "total",
+    ]
+    assert stages["debounce"]["max_ms"] == 2.0
+    assert stages["total"]["max_ms"] == 5.1
+    assert stages["lock_wait"]["count"] == 1
+
+    # A trace ending at the output thread hand-over has no executor stages.
+    handed_over = Trace(origin=2.0, enqueued=2.0)
+    handed_over.flushed = handed_over.locked = handed_over.handed_over = 2.001
+    tracer.finish(handed_over)
+    stages = tracer.as_dict()["stages"]
+    assert stages["compose"]["count"] == 2
+    assert stages["executor_hop"]["count"] == 1
+    assert stages["total"]["count"] == 1
+
+
+def test_light_writes_are_traced_only_while_enabled(make_hass):
+    helper = _helper()
+    light = _light(helper)
+    hass = _hass(make_hass, [helper])
+
+    async def scenario():
+        await light.async_turn_on(rgb_color=(255, 0, 0))
+        await asyncio.sleep(0.05)
+        assert helper.tracer is None
+        assert latency_tracer(hass) is None
+
+        assert (
+            await hass.services.async_call(
+                DOMAIN, "set_latency_tracing", {"enabled": True}
+            )
+            == {}
+        )
+        assert helper.tracer is latency_tracer(hass)
+        await light.async_turn_on(rgb_color=(0, 255, 0))
+        await asyncio.sleep(0.05)
+        # Writes batched into one frame make one trace, timed from the first call.
+        await light.async_turn_on(brightness=128)
+        await light.async_turn_off()
+        await asyncio.sleep(0.05)
+
+        traced = await hass.services.async_call(
+            DOMAIN, "set_latency_tracing", {"enabled": False}
+        )
+        assert helper.tracer is None
+        assert latency_tracer(hass) is None
+        return traced["stages"]
+
+    stages = asyncio.run(scenario())
+    assert stages["total"]["count"] == 2
+    assert stages["executor_hop"]["count"] == 2
+    for stage in stages.values():
+        assert stage["p50_ms"] <= stage["p99_ms"] <= 1000
+    assert helper.metrics.frames_sent == 3
+
+
+def test_writes_to_the_output_thread_are_traced_to_the_hand_over(make_hass):
+    helper = _helper()
+    hass = _hass(make_hass, [helper])
+    OutputThread().attach(helper)
+    asyncio.run(
+        hass.services.async_call(DOMAIN, "set_latency_tracing", {"enabled": True})
+    )
+    writer = DMXWriter(helper)
+
+    async def write():
+        await writer.set_channels({1: 255}, traced_at=0.0)
+        await asyncio.sleep(0.01)
+
+    asyncio.run(write())
+    stages = latency_tracer(hass).as_dict()["stages"]
+    assert stages["compose"]["count"] == 1
+    assert stages["total"]["count"] == 0
@@ -0,0 +1,126 @@
+import asyncio
+from types import SimpleNamespace
+
+from custom_components.artnet_dmx_controller.artnet import ArtNetDMXHelper
+from custom_components.artnet_dmx_controller.masters import MasterBoard
+from custom_components.artnet_dmx_controller.universe_store import UniverseStateStore
+
+
+class MemoryStore:
+    def __init__(self, data=None):
+        self.data = data
+        self.schedules = 0
+        self.pending = None
+
+    async def async_load(self):
+        return self.data
+
+    def async_delay_save(self, data_func, delay):
+        self.schedules += 1
+        self.pending = data_func
+
+    def flush(self):
+        self.data = self.pending()
+        self.pending = None
+
+
+def _helper():
+    helper = ArtNetDMXHelper(
+        hass=SimpleNamespace(), target_ip="192.168.1.100", universe=0
+    )
+    sent = []
+
+    async def send_dmx_data(dmx_data):
+        sent.append(bytes(dmx_data))
+
+    helper.send_dmx_data = send_dmx_data
+    return helper, sent
+
+
+def test_changes_are_coalesced_into_one_pending_write():
+    backend = MemoryStore()
+    store = UniverseStateStore(SimpleNamespace(), store=backend)
+    helper, _sent = _helper()
+    store.track(("192.168.1.100", 0), helper)
+
+    asyncio.run(helper.set_channel(1, 10))
+    asyncio.run(helper.set_channels({2: 20, 3: 30}))
+    asyncio.run(helper.set_channel(4, 40))
+
+    assert backend.schedules == 1
+    backend.flush()
+    saved = bytes.fromhex(backend.data["universes"]["192.168.1.100/0"])
+    assert saved[:4] == bytes([10, 20, 30, 40])
+
+    asyncio.run(helper.set_channel(5, 50))
+    assert backend.schedules == 2
+
+
+def test_saved_buffer_is_restored_before_first_frame():
+    buffer = bytearray(512)
+    buffer[9] = 200
+    backend = MemoryStore({"universes": {"192.168.1.100/0": bytes(buffer).hex()}})
+    store = UniverseStateStore(SimpleNamespace(), store=backend)
+    asyncio.run(store.async_load())
+    helper, sent = _helper()
+
+    assert store.restore(("192.168.1.100", 0), helper) is True
+    assert store.restore(("192.168.1.100", 1), helper) is False
+    asyncio.run(helper.async_send_current_state())
+
+    assert helper.get_channel_value(10) == 200
+    assert sent[0][9] == 200
+
+
+def test_untracked_helper_keeps_its_last_buffer():
+    backend = MemoryStore()
+    store = UniverseStateStore(SimpleNamespace(), store=backend)
+    helper, _sent = _helper()
+    store.track(("192.168.1.100", 0), helper)
+    asyncio.run(helper.set_channel(7, 70))
+
+    store.untrack(("192.168.1.100", 0))
+    asyncio.run(helper.set_channel(7, 1))
+    backend.flush()
+
+    assert bytes.fromhex(backend.data["universes"]["192.168.1.100/0"])[6] == 70
+
+
+def test_master_levels_are_saved_and_restored():
+    backend = MemoryStore()
+    store = UniverseStateStore(SimpleNamespace(), store=backend)
+    board = MasterBoard()
+    board.add("grand", None)
+    store.track_masters(board)
+
+    board.set_level("grand", 64)
+    backend.flush()
+    assert backend.data["masters"] == {"grand": 64}
+
+    restored_store = UniverseStateStore(
+        SimpleNamespace(), store=MemoryStore(backend.data)
+    )
+    asyncio.run(restored_store.async_load())
+    assert restored_store.master_level("grand") == 64
+    assert restored_store.master_level("sub") == 255
+
+
+def test_parked_channels_are_saved_and_re_parked():
+    backend = MemoryStore()
+    store = UniverseStateStore(SimpleNamespace(), store=backend)
+    helper, _sent = _helper()
+    store.track(("192.168.1.100", 0), helper)
+
+    asyncio.run(helper.park_channels({500: 255}))
+    backend.flush()
+    assert backend.data["parked"] == {"192.168.1.100/0": {"500": 255}}
+
+    restored_store = UniverseStateStore(
+        SimpleNamespace(), store=MemoryStore(backend.data)
+    )
+    asyncio.run(restored_store.async_load())
+    restored, sent = _helper()
+    restored_store.restore(("192.168.1.100", 0), restored)
+    asyncio.run(restored.async_send_current_state())
+    assert restored.get_parked() == {500: 255}
+    assert sent[-1][499] == 255